@@ -48,6 +48,7 @@ set(MICROPY_SOURCE_EXTMOD
     ${MICROPY_EXTMOD_DIR}/vfs_posix_file.c
     ${MICROPY_EXTMOD_DIR}/vfs_reader.c
     ${MICROPY_EXTMOD_DIR}/virtpin.c
+    ${MICROPY_EXTMOD_DIR}/webusb_fs.c
     ${MICROPY_EXTMOD_DIR}/nimble/modbluetooth_nimble.c
 )
 
@@ -26,8 +26,10 @@
 
 #include "py/runtime.h"
 #include "py/smallint.h"
+#include "py/objgenerator.h"
 #include "py/pairheap.h"
 #include "py/mphal.h"
+#include "py/stream.h"
 
 #if MICROPY_PY_UASYNCIO
 
@@ -153,6 +155,285 @@ STATIC const mp_obj_type_t task_queue_type = {
     .locals_dict = (mp_obj_dict_t *)&task_queue_locals_dict,
 };
 
+#if MICROPY_PY_UASYNCIO_TIMER_WHEEL
+
+/******************************************************************************/
+// TimerWheel class
+
+// A hashed timing wheel, which can be used instead of a TaskQueue as the main
+// run queue.  Tasks that are due are on a FIFO ready list, and tasks scheduled
+// in the future are on the list of the slot that covers their ph_key, so pushing
+// and removing a task is O(1).  A slot is only moved to the ready list once its
+// time has fully passed, so while other tasks are running a task may be
+// scheduled up to slot_ms late.  Slots are reused every nslots slots, so a slot
+// can also hold tasks due in later rotations.
+//
+// The lists are doubly linked through the pairheap next and child pointers of
+// the tasks, which are otherwise unused while a task is in a TimerWheel.
+
+#define TASK_NEXT(task) ((mp_obj_task_t *)(task)->pairheap.next)
+#define TASK_PREV(task) ((mp_obj_task_t *)(task)->pairheap.child)
+#define TASK_SET_NEXT(task, n) ((task)->pairheap.next = TASK_PAIRHEAP(n))
+#define TASK_SET_PREV(task, p) ((task)->pairheap.child = TASK_PAIRHEAP(p))
+
+typedef struct _mp_obj_timer_wheel_t {
+    mp_obj_base_t base;
+    mp_obj_task_t *ready_head;
+    mp_obj_task_t *ready_tail;
+    mp_obj_t cursor; // ticks at the start of the first slot that hasn't passed
+    size_t cursor_idx; // index of that slot
+    mp_uint_t slot_ms;
+    size_t nslots;
+    // The earliest task in the slots, when first_known, so finding the first task
+    // doesn't have to search the slots again until that task leaves them.
+    mp_obj_task_t *first;
+    bool first_known;
+    mp_obj_task_t *slots[];
+} mp_obj_timer_wheel_t;
+
+STATIC mp_obj_t ticks_add_ms(mp_obj_t t, mp_uint_t delta) {
+    return MP_OBJ_NEW_SMALL_INT((MP_OBJ_SMALL_INT_VALUE(t) + delta) & (MICROPY_PY_UTIME_TICKS_PERIOD - 1));
+}
+
+STATIC mp_obj_t timer_wheel_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *args) {
+    mp_arg_check_num(n_args, n_kw, 1, 2, false);
+    mp_int_t slot_ms = mp_obj_get_int(args[0]);
+    mp_int_t nslots = n_args == 2 ? mp_obj_get_int(args[1]) : 64;
+    if (slot_ms <= 0 || nslots <= 0) {
+        mp_raise_ValueError(NULL);
+    }
+    mp_obj_timer_wheel_t *self = m_new_obj_var(mp_obj_timer_wheel_t, mp_obj_task_t *, nslots);
+    self->base.type = type;
+    self->ready_head = NULL;
+    self->ready_tail = NULL;
+    self->cursor = ticks();
+    self->cursor_idx = 0;
+    self->slot_ms = slot_ms;
+    self->nslots = nslots;
+    self->first = NULL;
+    self->first_known = true;
+    for (size_t i = 0; i < self->nslots; ++i) {
+        self->slots[i] = NULL;
+    }
+    return MP_OBJ_FROM_PTR(self);
+}
+
+// Index of the slot for a task that's due at or after the cursor.
+STATIC size_t timer_wheel_slot(mp_obj_timer_wheel_t *self, mp_obj_task_t *task) {
+    return (self->cursor_idx + ticks_diff(task->ph_key, self->cursor) / self->slot_ms) % self->nslots;
+}
+
+// Append a task to the ready list.  Every task in it is already due, so it's a
+// FIFO rather than sorted, which keeps expiring a slot of many tasks O(1) per task.
+STATIC void timer_wheel_ready(mp_obj_timer_wheel_t *self, mp_obj_task_t *task) {
+    mp_obj_task_t *prev = self->ready_tail;
+    TASK_SET_PREV(task, prev);
+    task->pairheap.next = NULL;
+    if (prev == NULL) {
+        self->ready_head = task;
+    } else {
+        TASK_SET_NEXT(prev, task);
+    }
+    self->ready_tail = task;
+}
+
+STATIC void timer_wheel_unlink(mp_obj_timer_wheel_t *self, mp_obj_task_t *task) {
+    if (task == self->first) {
+        self->first = NULL;
+        self->first_known = false;
+    }
+    mp_obj_task_t *prev = TASK_PREV(task);
+    mp_obj_task_t *next = TASK_NEXT(task);
+    if (prev != NULL) {
+        TASK_SET_NEXT(prev, next);
+    } else if (task == self->ready_head) {
+        self->ready_head = next;
+    } else {
+        self->slots[timer_wheel_slot(self, task)] = next;
+    }
+    if (next != NULL) {
+        TASK_SET_PREV(next, prev);
+    } else if (task == self->ready_tail) {
+        self->ready_tail = prev;
+    }
+    mp_pairheap_init_node(task_lt, &task->pairheap);
+}
+
+// Move the tasks in a slot that are due before the given time to the ready list.
+// New tasks are pushed on the front of a slot, so go from the back to keep tasks
+// with the same ph_key in the order they were pushed.
+STATIC void timer_wheel_expire(mp_obj_timer_wheel_t *self, size_t idx, mp_obj_t end) {
+    mp_obj_task_t *task = self->slots[idx];
+    while (task != NULL && TASK_NEXT(task) != NULL) {
+        task = TASK_NEXT(task);
+    }
+    while (task != NULL) {
+        mp_obj_task_t *prev = TASK_PREV(task);
+        if (ticks_diff(task->ph_key, end) < 0) {
+            timer_wheel_unlink(self, task);
+            timer_wheel_ready(self, task);
+        }
+        task = prev;
+    }
+}
+
+// Move the cursor past all the slots whose time has passed.
+STATIC void timer_wheel_advance(mp_obj_timer_wheel_t *self) {
+    mp_int_t dt = ticks_diff(ticks(), self->cursor);
+    if (dt < (mp_int_t)self->slot_ms) {
+        return;
+    }
+    mp_uint_t n = dt / self->slot_ms;
+    if (n >= self->nslots) {
+        // Every slot has passed at least once, so check all of them.
+        mp_obj_t end = ticks_add_ms(self->cursor, n * self->slot_ms);
+        for (size_t i = 0; i < self->nslots; ++i) {
+            timer_wheel_expire(self, i, end);
+        }
+    } else {
+        for (mp_uint_t i = 0; i < n; ++i) {
+            size_t idx = (self->cursor_idx + i) % self->nslots;
+            timer_wheel_expire(self, idx, ticks_add_ms(self->cursor, (i + 1) * self->slot_ms));
+        }
+    }
+    self->cursor = ticks_add_ms(self->cursor, n * self->slot_ms);
+    self->cursor_idx = (self->cursor_idx + n) % self->nslots;
+}
+
+// Return the task that's due first, or NULL if there are no tasks.
+STATIC mp_obj_task_t *timer_wheel_first(mp_obj_timer_wheel_t *self) {
+    timer_wheel_advance(self);
+    if (self->ready_head != NULL) {
+        return self->ready_head;
+    }
+    if (self->first_known) {
+        return self->first;
+    }
+    // Find the first slot with a task due in this rotation, then the earliest task in
+    // it.  Slots are in reverse order of pushing, so prefer later tasks on a tie.
+    mp_obj_task_t *first = NULL;
+    for (size_t i = 0; i < self->nslots && first == NULL; ++i) {
+        mp_obj_t end = ticks_add_ms(self->cursor, (i + 1) * self->slot_ms);
+        mp_obj_task_t *task = self->slots[(self->cursor_idx + i) % self->nslots];
+        for (; task != NULL; task = TASK_NEXT(task)) {
+            if (ticks_diff(task->ph_key, end) < 0
+                && (first == NULL || ticks_diff(task->ph_key, first->ph_key) <= 0)) {
+                first = task;
+            }
+        }
+    }
+    if (first == NULL) {
+        // Any remaining tasks are due after a full rotation.
+        for (size_t i = 0; i < self->nslots; ++i) {
+            for (mp_obj_task_t *task = self->slots[i]; task != NULL; task = TASK_NEXT(task)) {
+                if (first == NULL || ticks_diff(task->ph_key, first->ph_key) <= 0) {
+                    first = task;
+                }
+            }
+        }
+    }
+    self->first = first;
+    self->first_known = true;
+    return first;
+}
+
+STATIC mp_obj_t timer_wheel_peek(mp_obj_t self_in) {
+    mp_obj_task_t *task = timer_wheel_first(MP_OBJ_TO_PTR(self_in));
+    return task == NULL ? mp_const_none : MP_OBJ_FROM_PTR(task);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_1(timer_wheel_peek_obj, timer_wheel_peek);
+
+STATIC mp_obj_t timer_wheel_push_sorted(size_t n_args, const mp_obj_t *args) {
+    mp_obj_timer_wheel_t *self = MP_OBJ_TO_PTR(args[0]);
+    mp_obj_task_t *task = MP_OBJ_TO_PTR(args[1]);
+    task->data = mp_const_none;
+    mp_obj_t now = ticks();
+    if (n_args == 2) {
+        task->ph_key = now;
+    } else {
+        assert(mp_obj_is_small_int(args[2]));
+        task->ph_key = args[2];
+    }
+    if (ticks_diff(task->ph_key, now) <= 0 || ticks_diff(task->ph_key, self->cursor) < 0) {
+        timer_wheel_ready(self, task);
+    } else {
+        size_t idx = timer_wheel_slot(self, task);
+        mp_obj_task_t *next = self->slots[idx];
+        task->pairheap.child = NULL;
+        TASK_SET_NEXT(task, next);
+        if (next != NULL) {
+            TASK_SET_PREV(next, task);
+        }
+        self->slots[idx] = task;
+        if (self->first_known
+            && (self->first == NULL || ticks_diff(task->ph_key, self->first->ph_key) < 0)) {
+            self->first = task;
+        }
+    }
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(timer_wheel_push_sorted_obj, 2, 3, timer_wheel_push_sorted);
+
+STATIC mp_obj_t timer_wheel_pop_head(mp_obj_t self_in) {
+    mp_obj_timer_wheel_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_obj_task_t *task = timer_wheel_first(self);
+    if (task == NULL) {
+        mp_raise_msg(&mp_type_IndexError, MP_ERROR_TEXT("empty heap"));
+    }
+    timer_wheel_unlink(self, task);
+    return MP_OBJ_FROM_PTR(task);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_1(timer_wheel_pop_head_obj, timer_wheel_pop_head);
+
+STATIC mp_obj_t timer_wheel_remove(mp_obj_t self_in, mp_obj_t task_in) {
+    timer_wheel_unlink(MP_OBJ_TO_PTR(self_in), MP_OBJ_TO_PTR(task_in));
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(timer_wheel_remove_obj, timer_wheel_remove);
+
+STATIC const mp_rom_map_elem_t timer_wheel_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR_peek), MP_ROM_PTR(&timer_wheel_peek_obj) },
+    { MP_ROM_QSTR(MP_QSTR_push_sorted), MP_ROM_PTR(&timer_wheel_push_sorted_obj) },
+    { MP_ROM_QSTR(MP_QSTR_push_head), MP_ROM_PTR(&timer_wheel_push_sorted_obj) },
+    { MP_ROM_QSTR(MP_QSTR_pop_head), MP_ROM_PTR(&timer_wheel_pop_head_obj) },
+    { MP_ROM_QSTR(MP_QSTR_remove), MP_ROM_PTR(&timer_wheel_remove_obj) },
+};
+STATIC MP_DEFINE_CONST_DICT(timer_wheel_locals_dict, timer_wheel_locals_dict_table);
+
+STATIC const mp_obj_type_t timer_wheel_type = {
+    { &mp_type_type },
+    .name = MP_QSTR_TimerWheel,
+    .make_new = timer_wheel_make_new,
+    .locals_dict = (mp_obj_dict_t *)&timer_wheel_locals_dict,
+};
+
+#endif // MICROPY_PY_UASYNCIO_TIMER_WHEEL
+
+/******************************************************************************/
+// Main run queue, which is either a TaskQueue or a TimerWheel
+
+// Push a task on to the run queue, at the given ticks or now if key is MP_OBJ_NULL.
+STATIC void run_queue_push(mp_obj_t q, mp_obj_t task, mp_obj_t key) {
+    mp_obj_t args[3] = { q, task, key };
+    #if MICROPY_PY_UASYNCIO_TIMER_WHEEL
+    if (mp_obj_is_type(q, &timer_wheel_type)) {
+        timer_wheel_push_sorted(key == MP_OBJ_NULL ? 2 : 3, args);
+        return;
+    }
+    #endif
+    task_queue_push_sorted(key == MP_OBJ_NULL ? 2 : 3, args);
+}
+
+STATIC void run_queue_remove(mp_obj_t q, mp_obj_t task) {
+    #if MICROPY_PY_UASYNCIO_TIMER_WHEEL
+    if (mp_obj_is_type(q, &timer_wheel_type)) {
+        timer_wheel_remove(q, task);
+        return;
+    }
+    #endif
+    task_queue_remove(q, task);
+}
+
 /******************************************************************************/
 // Task class
 
@@ -206,17 +487,13 @@ STATIC mp_obj_t task_cancel(mp_obj_t self_in) {
         dest[2] = MP_OBJ_FROM_PTR(self);
         mp_call_method_n_kw(1, 0, dest);
         // _task_queue.push_head(self)
-        dest[0] = _task_queue;
-        dest[1] = MP_OBJ_FROM_PTR(self);
-        task_queue_push_sorted(2, dest);
+        run_queue_push(_task_queue, MP_OBJ_FROM_PTR(self), MP_OBJ_NULL);
     } else if (ticks_diff(self->ph_key, ticks()) > 0) {
         // On the main running queue but scheduled in the future, so bring it forward to now.
         // _task_queue.remove(self)
-        task_queue_remove(_task_queue, MP_OBJ_FROM_PTR(self));
+        run_queue_remove(_task_queue, MP_OBJ_FROM_PTR(self));
         // _task_queue.push_head(self)
-        dest[0] = _task_queue;
-        dest[1] = MP_OBJ_FROM_PTR(self);
-        task_queue_push_sorted(2, dest);
+        run_queue_push(_task_queue, MP_OBJ_FROM_PTR(self), MP_OBJ_NULL);
     }
 
     self->data = mp_obj_dict_get(uasyncio_context, MP_OBJ_NEW_QSTR(MP_QSTR_CancelledError));
@@ -265,6 +542,9 @@ STATIC mp_obj_t task_getiter(mp_obj_t self_in, mp_obj_iter_buf_t *iter_buf) {
     } else if (self->state == TASK_STATE_RUNNING_NOT_WAITED_ON) {
         // Allocate the waiting queue.
         self->state = task_queue_make_new(&task_queue_type, 0, 0, NULL);
+    } else if (!mp_obj_is_type(self->state, &task_queue_type)) {
+        // Task has state used for another purpose, so can't also wait on it.
+        mp_raise_msg(&mp_type_RuntimeError, MP_ERROR_TEXT("can't wait"));
     }
     return self_in;
 }
@@ -294,6 +574,513 @@ STATIC const mp_obj_type_t task_type = {
     .iternext = task_iternext,
 };
 
+#if MICROPY_PY_UASYNCIO_LOOP
+
+STATIC mp_obj_t uasyncio_context_get(qstr name) {
+    return mp_obj_dict_get(uasyncio_context, MP_OBJ_NEW_QSTR(name));
+}
+
+/******************************************************************************/
+// SingletonGenerator class
+
+// "Yield" once, then raise StopIteration; used by sleep_ms so it doesn't
+// allocate on the heap.
+typedef struct _mp_obj_singleton_gen_t {
+    mp_obj_base_t base;
+    mp_obj_t state;
+} mp_obj_singleton_gen_t;
+
+STATIC mp_obj_t singleton_gen_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *args) {
+    (void)args;
+    mp_arg_check_num(n_args, n_kw, 0, 0, false);
+    mp_obj_singleton_gen_t *self = m_new_obj(mp_obj_singleton_gen_t);
+    self->base.type = type;
+    self->state = mp_const_none;
+    return MP_OBJ_FROM_PTR(self);
+}
+
+STATIC void singleton_gen_attr(mp_obj_t self_in, qstr attr, mp_obj_t *dest) {
+    mp_obj_singleton_gen_t *self = MP_OBJ_TO_PTR(self_in);
+    if (attr == MP_QSTR_state) {
+        if (dest[0] == MP_OBJ_NULL) {
+            dest[0] = self->state;
+        } else if (dest[1] != MP_OBJ_NULL) {
+            self->state = dest[1];
+            dest[0] = MP_OBJ_NULL;
+        }
+    }
+}
+
+STATIC mp_obj_t singleton_gen_iternext(mp_obj_t self_in) {
+    mp_obj_singleton_gen_t *self = MP_OBJ_TO_PTR(self_in);
+    if (self->state != mp_const_none) {
+        // _task_queue.push_sorted(cur_task, self.state)
+        run_queue_push(uasyncio_context_get(MP_QSTR__task_queue), uasyncio_context_get(MP_QSTR_cur_task), self->state);
+        self->state = mp_const_none;
+        return mp_const_none;
+    }
+    return MP_OBJ_STOP_ITERATION;
+}
+
+STATIC const mp_obj_type_t singleton_gen_type = {
+    { &mp_type_type },
+    .name = MP_QSTR_SingletonGenerator,
+    .make_new = singleton_gen_make_new,
+    .attr = singleton_gen_attr,
+    .getiter = mp_identity_getiter,
+    .iternext = singleton_gen_iternext,
+};
+
+/******************************************************************************/
+// IOEntry and IOQueue classes
+
+// A stream in the IOQueue and the tasks waiting to read from and write to it.
+typedef struct _mp_obj_io_entry_t {
+    mp_obj_base_t base;
+    mp_obj_t queue;
+    mp_obj_t stream;
+    mp_obj_t rd;
+    mp_obj_t wr;
+    mp_uint_t ev; // events the stream is registered with the poller for, 0 if it isn't
+    bool keep; // whether the stream stays in the IOQueue until discarded
+} mp_obj_io_entry_t;
+
+typedef struct _mp_obj_io_queue_t {
+    mp_obj_base_t base;
+    mp_obj_t poller;
+    mp_obj_t map; // maps id(stream) to IOEntry
+    mp_int_t nwait; // number of tasks waiting on streams
+} mp_obj_io_queue_t;
+
+STATIC const mp_obj_type_t io_entry_type;
+STATIC const mp_obj_type_t io_queue_type;
+
+STATIC void io_queue_poller_call(mp_obj_io_queue_t *self, qstr meth, mp_obj_t s, mp_uint_t flags) {
+    mp_obj_t dest[4];
+    mp_load_method(self->poller, meth, dest);
+    dest[2] = s;
+    dest[3] = MP_OBJ_NEW_SMALL_INT(flags);
+    mp_call_method_n_kw(meth == MP_QSTR_unregister ? 1 : 2, 0, dest);
+}
+
+STATIC mp_obj_io_entry_t *io_entry_new(mp_obj_io_queue_t *queue, mp_obj_t s, bool keep) {
+    mp_obj_io_entry_t *entry = m_new_obj(mp_obj_io_entry_t);
+    entry->base.type = &io_entry_type;
+    entry->queue = MP_OBJ_FROM_PTR(queue);
+    entry->stream = s;
+    entry->rd = mp_const_none;
+    entry->wr = mp_const_none;
+    entry->ev = 0;
+    entry->keep = keep;
+    mp_obj_dict_store(queue->map, mp_obj_id(s), MP_OBJ_FROM_PTR(entry));
+    return entry;
+}
+
+// Poll the entry's stream for just what its tasks are waiting on, and if there are
+// none then stop polling it, and remove it from the IOQueue if it's not kept.
+STATIC void io_queue_update(mp_obj_io_queue_t *self, mp_obj_io_entry_t *entry) {
+    mp_uint_t ev = (entry->rd == mp_const_none ? 0 : MP_STREAM_POLL_RD)
+        | (entry->wr == mp_const_none ? 0 : MP_STREAM_POLL_WR);
+    if (ev != entry->ev) {
+        if (ev) {
+            io_queue_poller_call(self, MP_QSTR_modify, entry->stream, ev);
+        } else {
+            io_queue_poller_call(self, MP_QSTR_unregister, entry->stream, 0);
+        }
+        entry->ev = ev;
+    }
+    if (!ev && !entry->keep) {
+        mp_obj_dict_delete(self->map, mp_obj_id(entry->stream));
+    }
+}
+
+STATIC mp_obj_t io_entry_remove(mp_obj_t self_in, mp_obj_t task_in) {
+    mp_obj_io_entry_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_obj_io_queue_t *queue = MP_OBJ_TO_PTR(self->queue);
+    if (self->rd == task_in) {
+        self->rd = mp_const_none;
+        queue->nwait -= 1;
+    }
+    if (self->wr == task_in) {
+        self->wr = mp_const_none;
+        queue->nwait -= 1;
+    }
+    if (!self->keep) {
+        io_queue_update(queue, self);
+    }
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(io_entry_remove_obj, io_entry_remove);
+
+STATIC const mp_rom_map_elem_t io_entry_locals_dict_table[] = {
+    { MP_ROM_QSTR(MP_QSTR_remove), MP_ROM_PTR(&io_entry_remove_obj) },
+};
+STATIC MP_DEFINE_CONST_DICT(io_entry_locals_dict, io_entry_locals_dict_table);
+
+STATIC const mp_obj_type_t io_entry_type = {
+    { &mp_type_type },
+    .name = MP_QSTR_IOEntry,
+    .locals_dict = (mp_obj_dict_t *)&io_entry_locals_dict,
+};
+
+STATIC mp_obj_t io_queue_make_new(const mp_obj_type_t *type, size_t n_args, size_t n_kw, const mp_obj_t *args) {
+    (void)args;
+    mp_arg_check_num(n_args, n_kw, 0, 0, false);
+    mp_obj_io_queue_t *self = m_new_obj(mp_obj_io_queue_t);
+    self->base.type = type;
+    // self.poller = select.poll()
+    mp_obj_t select = mp_import_name(MP_QSTR_uselect, mp_const_none, MP_OBJ_NEW_SMALL_INT(0));
+    self->poller = mp_call_function_0(mp_load_attr(select, MP_QSTR_poll));
+    self->map = mp_obj_new_dict(0);
+    self->nwait = 0;
+    return MP_OBJ_FROM_PTR(self);
+}
+
+// Keep the stream in the IOQueue until it's discarded, so it stays registered
+// with the poller across waits instead of being unregistered after each one.
+STATIC mp_obj_t io_queue_keep(mp_obj_t self_in, mp_obj_t s) {
+    mp_obj_io_queue_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_map_elem_t *elem = mp_map_lookup(mp_obj_dict_get_map(self->map), mp_obj_id(s), MP_MAP_LOOKUP);
+    if (elem == NULL) {
+        io_entry_new(self, s, true);
+    } else {
+        ((mp_obj_io_entry_t *)MP_OBJ_TO_PTR(elem->value))->keep = true;
+    }
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(io_queue_keep_obj, io_queue_keep);
+
+// Remove the stream from the IOQueue, eg before it's closed, waking any tasks
+// that are waiting on it.
+STATIC mp_obj_t io_queue_discard(mp_obj_t self_in, mp_obj_t s) {
+    mp_obj_io_queue_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_map_elem_t *elem = mp_map_lookup(mp_obj_dict_get_map(self->map), mp_obj_id(s), MP_MAP_LOOKUP_REMOVE_IF_FOUND);
+    if (elem != NULL) {
+        mp_obj_io_entry_t *entry = MP_OBJ_TO_PTR(elem->value);
+        mp_obj_t task_queue = uasyncio_context_get(MP_QSTR__task_queue);
+        if (entry->rd != mp_const_none) {
+            run_queue_push(task_queue, entry->rd, MP_OBJ_NULL);
+            self->nwait -= 1;
+        }
+        if (entry->wr != mp_const_none) {
+            run_queue_push(task_queue, entry->wr, MP_OBJ_NULL);
+            self->nwait -= 1;
+        }
+        if (entry->ev) {
+            io_queue_poller_call(self, MP_QSTR_unregister, s, 0);
+        }
+    }
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(io_queue_discard_obj, io_queue_discard);
+
+STATIC void io_queue_enqueue(mp_obj_io_queue_t *self, mp_obj_t s, bool write) {
+    mp_map_elem_t *elem = mp_map_lookup(mp_obj_dict_get_map(self->map), mp_obj_id(s), MP_MAP_LOOKUP);
+    mp_obj_io_entry_t *entry;
+    if (elem == NULL) {
+        entry = io_entry_new(self, s, false);
+    } else {
+        entry = MP_OBJ_TO_PTR(elem->value);
+    }
+    mp_obj_t cur_task = uasyncio_context_get(MP_QSTR_cur_task);
+    mp_uint_t ev;
+    if (write) {
+        assert(entry->wr == mp_const_none);
+        entry->wr = cur_task;
+        ev = MP_STREAM_POLL_WR;
+    } else {
+        assert(entry->rd == mp_const_none);
+        entry->rd = cur_task;
+        ev = MP_STREAM_POLL_RD;
+    }
+    self->nwait += 1;
+    if (!entry->ev) {
+        io_queue_poller_call(self, MP_QSTR_register, s, ev);
+        entry->ev = ev;
+    } else if (!(entry->ev & ev)) {
+        entry->ev |= ev;
+        io_queue_poller_call(self, MP_QSTR_modify, s, entry->ev);
+    }
+    // Link task to the entry so it can be removed if needed.
+    ((mp_obj_task_t *)MP_OBJ_TO_PTR(cur_task))->data = MP_OBJ_FROM_PTR(entry);
+}
+
+STATIC mp_obj_t io_queue_queue_read(mp_obj_t self_in, mp_obj_t s) {
+    io_queue_enqueue(MP_OBJ_TO_PTR(self_in), s, false);
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(io_queue_queue_read_obj, io_queue_queue_read);
+
+STATIC mp_obj_t io_queue_queue_write(mp_obj_t self_in, mp_obj_t s) {
+    io_queue_enqueue(MP_OBJ_TO_PTR(self_in), s, true);
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(io_queue_queue_write_obj, io_queue_queue_write);
+
+STATIC mp_obj_t io_queue_remove(mp_obj_t self_in, mp_obj_t task_in) {
+    (void)self_in;
+    mp_obj_t data = ((mp_obj_task_t *)MP_OBJ_TO_PTR(task_in))->data;
+    if (mp_obj_is_type(data, &io_entry_type)) {
+        io_entry_remove(data, task_in);
+    }
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(io_queue_remove_obj, io_queue_remove);
+
+STATIC void io_queue_wait_io_event(mp_obj_io_queue_t *self, mp_int_t dt) {
+    mp_obj_t task_queue = uasyncio_context_get(MP_QSTR__task_queue);
+    mp_obj_t dest[3];
+    mp_load_method(self->poller, MP_QSTR_ipoll, dest);
+    dest[2] = MP_OBJ_NEW_SMALL_INT(dt);
+    mp_obj_t iter = mp_getiter(mp_call_method_n_kw(1, 0, dest), NULL);
+    mp_obj_t item;
+    while ((item = mp_iternext(iter)) != MP_OBJ_STOP_ITERATION) {
+        mp_obj_t *s_ev;
+        mp_obj_get_array_fixed_n(item, 2, &s_ev);
+        mp_uint_t ev = mp_obj_get_int(s_ev[1]);
+        mp_obj_io_entry_t *entry = MP_OBJ_TO_PTR(mp_obj_dict_get(self->map, mp_obj_id(s_ev[0])));
+        bool woke = false;
+        if ((ev & ~MP_STREAM_POLL_WR) && entry->rd != mp_const_none) {
+            // POLLIN or error
+            run_queue_push(task_queue, entry->rd, MP_OBJ_NULL);
+            entry->rd = mp_const_none;
+            self->nwait -= 1;
+            woke = true;
+        }
+        if ((ev & ~MP_STREAM_POLL_RD) && entry->wr != mp_const_none) {
+            // POLLOUT or error
+            run_queue_push(task_queue, entry->wr, MP_OBJ_NULL);
+            entry->wr = mp_const_none;
+            self->nwait -= 1;
+            woke = true;
+        }
+        if (!woke || !entry->keep) {
+            // A kept stream stays registered for the events that woke its tasks,
+            // as they usually wait for them again, and is only updated once there
+            // is an event that no task is waiting for.
+            io_queue_update(self, entry);
+        }
+    }
+}
+
+STATIC mp_obj_t io_queue_wait_io_event_meth(mp_obj_t self_in, mp_obj_t dt_in) {
+    io_queue_wait_io_event(MP_OBJ_TO_PTR(self_in), mp_obj_get_int(dt_in));
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_2(io_queue_wait_io_event_obj, io_queue_wait_io_event_meth);
+
+STATIC void io_queue_attr(mp_obj_t self_in, qstr attr, mp_obj_t *dest) {
+    mp_obj_io_queue_t *self = MP_OBJ_TO_PTR(self_in);
+    if (dest[0] == MP_OBJ_NULL) {
+        // Load
+        if (attr == MP_QSTR_map) {
+            dest[0] = self->map;
+        } else if (attr == MP_QSTR_nwait) {
+            dest[0] = MP_OBJ_NEW_SMALL_INT(self->nwait);
+        } else if (attr == MP_QSTR_poller) {
+            dest[0] = self->poller;
+        } else {
+            if (attr == MP_QSTR_queue_read) {
+                dest[0] = MP_OBJ_FROM_PTR(&io_queue_queue_read_obj);
+            } else if (attr == MP_QSTR_queue_write) {
+                dest[0] = MP_OBJ_FROM_PTR(&io_queue_queue_write_obj);
+            } else if (attr == MP_QSTR_keep) {
+                dest[0] = MP_OBJ_FROM_PTR(&io_queue_keep_obj);
+            } else if (attr == MP_QSTR_discard) {
+                dest[0] = MP_OBJ_FROM_PTR(&io_queue_discard_obj);
+            } else if (attr == MP_QSTR_remove) {
+                dest[0] = MP_OBJ_FROM_PTR(&io_queue_remove_obj);
+            } else if (attr == MP_QSTR_wait_io_event) {
+                dest[0] = MP_OBJ_FROM_PTR(&io_queue_wait_io_event_obj);
+            } else {
+                return;
+            }
+            dest[1] = self_in;
+        }
+    }
+}
+
+STATIC const mp_obj_type_t io_queue_type = {
+    { &mp_type_type },
+    .name = MP_QSTR_IOQueue,
+    .make_new = io_queue_make_new,
+    .attr = io_queue_attr,
+};
+
+/******************************************************************************/
+// Main run loop
+
+STATIC mp_obj_task_t *run_queue_peek(mp_obj_t q) {
+    #if MICROPY_PY_UASYNCIO_TIMER_WHEEL
+    if (mp_obj_is_type(q, &timer_wheel_type)) {
+        return timer_wheel_first(MP_OBJ_TO_PTR(q));
+    }
+    #endif
+    return ((mp_obj_task_queue_t *)MP_OBJ_TO_PTR(q))->heap;
+}
+
+STATIC mp_obj_t run_queue_pop_head(mp_obj_t q) {
+    #if MICROPY_PY_UASYNCIO_TIMER_WHEEL
+    if (mp_obj_is_type(q, &timer_wheel_type)) {
+        return timer_wheel_pop_head(q);
+    }
+    #endif
+    return task_queue_pop_head(q);
+}
+
+// Keep scheduling tasks until there are none left to schedule.
+// This has the same semantics as run_until_complete in core.py.
+STATIC mp_obj_t uasyncio_run_until_complete(size_t n_args, const mp_obj_t *args) {
+    mp_obj_t main_task = n_args == 0 ? mp_const_none : args[0];
+    if (uasyncio_context == MP_OBJ_NULL) {
+        // No Task has been created yet, so there is nothing to run.
+        return mp_const_none;
+    }
+    mp_obj_t cancelled_error = uasyncio_context_get(MP_QSTR_CancelledError);
+    for (;;) {
+        mp_obj_t task_queue = uasyncio_context_get(MP_QSTR__task_queue);
+        mp_obj_t io_queue = uasyncio_context_get(MP_QSTR__io_queue);
+
+        // Wait until the head of _task_queue is ready to run.
+        mp_int_t dt = 1;
+        while (dt > 0) {
+            dt = -1;
+            mp_obj_task_t *head = run_queue_peek(task_queue);
+            if (head != NULL) {
+                // A task waiting on _task_queue; "ph_key" is time to schedule task at.
+                dt = ticks_diff(head->ph_key, ticks());
+                if (dt < 0) {
+                    dt = 0;
+                }
+            } else if (!mp_obj_is_true(mp_load_attr(io_queue, MP_QSTR_nwait))) {
+                // No tasks can be woken so finished running.
+                return mp_const_none;
+            }
+            if (mp_obj_is_type(io_queue, &io_queue_type)) {
+                io_queue_wait_io_event(MP_OBJ_TO_PTR(io_queue), dt);
+            } else {
+                mp_obj_t dest[3];
+                mp_load_method(io_queue, MP_QSTR_wait_io_event, dest);
+                dest[2] = MP_OBJ_NEW_SMALL_INT(dt);
+                mp_call_method_n_kw(1, 0, dest);
+            }
+            if (dt < 0 && run_queue_peek(task_queue) == NULL) {
+                // Woken by an event on a kept stream that no task was waiting for.
+                dt = 1;
+            }
+        }
+
+        // Get next task to run and continue it.
+        mp_obj_task_t *t = MP_OBJ_TO_PTR(run_queue_pop_head(task_queue));
+        mp_obj_dict_store(uasyncio_context, MP_OBJ_NEW_QSTR(MP_QSTR_cur_task), MP_OBJ_FROM_PTR(t));
+        mp_obj_t exc = t->data;
+        mp_obj_t ret;
+        mp_vm_return_kind_t ret_kind;
+        nlr_buf_t nlr;
+        if (nlr_push(&nlr) == 0) {
+            // Continue running the coroutine, it's responsible for rescheduling itself.
+            mp_obj_t throw_value = MP_OBJ_NULL;
+            if (mp_obj_is_true(exc)) {
+                // If the task is finished and on the run queue and gets here, then it
+                // had an exception and was not await'ed on.  Throwing into it now will
+                // finish with StopIteration and the code below will handle this and
+                // run the call_exception_handler function.
+                t->data = mp_const_none;
+                throw_value = exc;
+            }
+            if (mp_obj_is_type(t->coro, &mp_type_gen_instance)) {
+                // Equivalent to t.coro.send(None) or t.coro.throw(exc).
+                ret_kind = mp_obj_gen_resume(t->coro, mp_const_none, throw_value, &ret);
+            } else if (throw_value == MP_OBJ_NULL) {
+                ret_kind = mp_resume(t->coro, mp_const_none, MP_OBJ_NULL, &ret);
+            } else {
+                ret_kind = mp_resume(t->coro, MP_OBJ_NULL, mp_make_raise_obj(throw_value), &ret);
+            }
+            nlr_pop();
+        } else {
+            ret_kind = MP_VM_RETURN_EXCEPTION;
+            ret = MP_OBJ_FROM_PTR(nlr.ret_val);
+        }
+
+        if (ret_kind == MP_VM_RETURN_YIELD) {
+            continue;
+        }
+
+        // This task is done, get its StopIteration or exception as "er".
+        mp_obj_t er;
+        bool er_stop;
+        if (ret_kind == MP_VM_RETURN_NORMAL) {
+            if (ret == MP_OBJ_STOP_ITERATION) {
+                ret = mp_const_none;
+            }
+            if (MP_OBJ_FROM_PTR(t) == main_task) {
+                return ret;
+            }
+            er = mp_obj_new_exception_arg1(&mp_type_StopIteration, ret);
+            er_stop = true;
+        } else {
+            er = ret;
+            const mp_obj_type_t *er_type = mp_obj_get_type(er);
+            er_stop = mp_obj_is_subclass_fast(MP_OBJ_FROM_PTR(er_type), cancelled_error);
+            if (!er_stop && !mp_obj_is_subclass_fast(MP_OBJ_FROM_PTR(er_type), MP_OBJ_FROM_PTR(&mp_type_Exception))) {
+                // Only CancelledError and Exception are handled by the loop.
+                nlr_raise(er);
+            }
+            er_stop |= er_type == &mp_type_StopIteration;
+            if (MP_OBJ_FROM_PTR(t) == main_task) {
+                if (er_type == &mp_type_StopIteration) {
+                    return mp_obj_exception_get_value(er);
+                }
+                nlr_raise(er);
+            }
+        }
+
+        if (mp_obj_is_true(t->state)) {
+            // Task was running but is now finished.
+            bool waiting = false;
+            if (t->state == TASK_STATE_RUNNING_NOT_WAITED_ON) {
+                // "None" indicates that the task is complete and not await'ed on (yet).
+                t->state = TASK_STATE_DONE_NOT_WAITED_ON;
+            } else if (!mp_obj_is_type(t->state, &task_queue_type)) {
+                // The task has a callback registered to be called on completion.
+                mp_call_function_2(t->state, MP_OBJ_FROM_PTR(t), er);
+                t->state = TASK_STATE_DONE_WAS_WAITED_ON;
+                waiting = true;
+            } else {
+                // Schedule any other tasks waiting on the completion of this task.
+                mp_obj_task_queue_t *waitq = MP_OBJ_TO_PTR(t->state);
+                while (waitq->heap != NULL) {
+                    run_queue_push(task_queue, task_queue_pop_head(MP_OBJ_FROM_PTR(waitq)), MP_OBJ_NULL);
+                    waiting = true;
+                }
+                // "False" indicates that the task is complete and has been await'ed on.
+                t->state = TASK_STATE_DONE_WAS_WAITED_ON;
+            }
+            if (!waiting && !er_stop) {
+                // An exception ended this detached task, so queue it for later
+                // execution to handle the uncaught exception if no other task retrieves
+                // the exception in the meantime (this is handled by Task.throw).
+                run_queue_push(task_queue, MP_OBJ_FROM_PTR(t), MP_OBJ_NULL);
+            }
+            // Save return value of coro to pass up to caller.
+            t->data = er;
+        } else if (t->state == TASK_STATE_DONE_NOT_WAITED_ON) {
+            // Task is already finished and nothing await'ed on the task,
+            // so call the exception handler.
+            mp_obj_t exc_context = uasyncio_context_get(MP_QSTR__exc_context);
+            mp_obj_dict_store(exc_context, MP_OBJ_NEW_QSTR(MP_QSTR_exception), exc);
+            mp_obj_dict_store(exc_context, MP_OBJ_NEW_QSTR(MP_QSTR_future), MP_OBJ_FROM_PTR(t));
+            mp_obj_t dest[3];
+            mp_load_method(uasyncio_context_get(MP_QSTR_Loop), MP_QSTR_call_exception_handler, dest);
+            dest[2] = exc_context;
+            mp_call_method_n_kw(1, 0, dest);
+        }
+    }
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(uasyncio_run_until_complete_obj, 0, 1, uasyncio_run_until_complete);
+
+#endif // MICROPY_PY_UASYNCIO_LOOP
+
 /******************************************************************************/
 // C-level uasyncio module
 
@@ -301,6 +1088,14 @@ STATIC const mp_rom_map_elem_t mp_module_uasyncio_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR__uasyncio) },
     { MP_ROM_QSTR(MP_QSTR_TaskQueue), MP_ROM_PTR(&task_queue_type) },
     { MP_ROM_QSTR(MP_QSTR_Task), MP_ROM_PTR(&task_type) },
+    #if MICROPY_PY_UASYNCIO_TIMER_WHEEL
+    { MP_ROM_QSTR(MP_QSTR_TimerWheel), MP_ROM_PTR(&timer_wheel_type) },
+    #endif
+    #if MICROPY_PY_UASYNCIO_LOOP
+    { MP_ROM_QSTR(MP_QSTR_SingletonGenerator), MP_ROM_PTR(&singleton_gen_type) },
+    { MP_ROM_QSTR(MP_QSTR_IOQueue), MP_ROM_PTR(&io_queue_type) },
+    { MP_ROM_QSTR(MP_QSTR_run_until_complete), MP_ROM_PTR(&uasyncio_run_until_complete_obj) },
+    #endif
 };
 STATIC MP_DEFINE_CONST_DICT(mp_module_uasyncio_globals, mp_module_uasyncio_globals_table);
 
@@ -12,10 +12,19 @@ _attrs = {
     "Event": "event",
     "ThreadSafeFlag": "event",
     "Lock": "lock",
+    "Queue": "queue",
+    "LifoQueue": "queue",
+    "QueueEmpty": "queue",
+    "QueueFull": "queue",
+    "Executor": "executor",
+    "run_in_executor": "executor",
+    "getaddrinfo": "dns",
     "open_connection": "stream",
     "start_server": "stream",
     "StreamReader": "stream",
     "StreamWriter": "stream",
+    "open_datagram_endpoint": "datagram",
+    "DatagramStream": "datagram",
 }
 
 # Lazy loader, effectively does:
@@ -7,8 +7,14 @@ import sys, select
 # Import TaskQueue and Task, preferring built-in C code over Python code
 try:
     from _uasyncio import TaskQueue, Task
+
+    # TimerWheel is optional in the C code, and must match the Task implementation
+    try:
+        from _uasyncio import TimerWheel
+    except ImportError:
+        TimerWheel = None
 except:
-    from .task import TaskQueue, Task
+    from .task import TaskQueue, Task, TimerWheel
 
 
 ################################################################################
@@ -49,46 +55,96 @@ class SingletonGenerator:
             raise self.exc
 
 
-# Pause task execution for the given time (integer in milliseconds, uPy extension)
-# Use a SingletonGenerator to do it without allocating on the heap
-def sleep_ms(t, sgen=SingletonGenerator()):
-    assert sgen.state is None
-    sgen.state = ticks_add(ticks(), max(0, t))
-    return sgen
-
+################################################################################
+# Queue and poller for stream IO
 
-# Pause task execution for the given time (in seconds)
-def sleep(t):
-    return sleep_ms(int(t * 1000))
 
+# A stream in the IOQueue and the tasks waiting to read from and write to it.  A
+# waiting task's data is set to this so it can be removed directly if cancelled.
+class IOEntry:
+    def __init__(self, q, s, keep):
+        self.q = q
+        self.s = s
+        self.rd = None
+        self.wr = None
+        self.ev = 0  # Events the stream is registered with the poller for, 0 if it isn't
+        self.keep = keep  # Whether the stream stays in the IOQueue until discarded
 
-################################################################################
-# Queue and poller for stream IO
+    def remove(self, task):
+        if self.rd is task:
+            self.rd = None
+            self.q.nwait -= 1
+        if self.wr is task:
+            self.wr = None
+            self.q.nwait -= 1
+        if not self.keep:
+            self.q._update(self)
 
 
 class IOQueue:
     def __init__(self):
         self.poller = select.poll()
-        self.map = {}  # maps id(stream) to [task_waiting_read, task_waiting_write, stream]
+        self.map = {}  # maps id(stream) to IOEntry
+        self.nwait = 0  # number of tasks waiting on streams
+
+    # Keep the stream in the IOQueue until it's discarded, so it stays registered
+    # with the poller across waits instead of being unregistered after each one
+    def keep(self, s):
+        entry = self.map.get(id(s))
+        if entry is None:
+            self.map[id(s)] = IOEntry(self, s, True)
+        else:
+            entry.keep = True
+
+    # Remove the stream from the IOQueue, eg before it's closed, waking any tasks
+    # that are waiting on it
+    def discard(self, s):
+        entry = self.map.pop(id(s), None)
+        if entry is not None:
+            for t in (entry.rd, entry.wr):
+                if t is not None:
+                    _task_queue.push_head(t)
+                    self.nwait -= 1
+            if entry.ev:
+                self.poller.unregister(s)
 
     def _enqueue(self, s, idx):
-        if id(s) not in self.map:
-            entry = [None, None, s]
-            entry[idx] = cur_task
+        entry = self.map.get(id(s))
+        if entry is None:
+            entry = IOEntry(self, s, False)
             self.map[id(s)] = entry
-            self.poller.register(s, select.POLLIN if idx == 0 else select.POLLOUT)
+        if idx == 0:
+            assert entry.rd is None
+            entry.rd = cur_task
+            ev = select.POLLIN
         else:
-            sm = self.map[id(s)]
-            assert sm[idx] is None
-            assert sm[1 - idx] is not None
-            sm[idx] = cur_task
-            self.poller.modify(s, select.POLLIN | select.POLLOUT)
-        # Link task to this IOQueue so it can be removed if needed
-        cur_task.data = self
-
-    def _dequeue(self, s):
-        del self.map[id(s)]
-        self.poller.unregister(s)
+            assert entry.wr is None
+            entry.wr = cur_task
+            ev = select.POLLOUT
+        self.nwait += 1
+        if not entry.ev:
+            self.poller.register(s, ev)
+            entry.ev = ev
+        elif not entry.ev & ev:
+            entry.ev |= ev
+            self.poller.modify(s, entry.ev)
+        # Link task to the entry so it can be removed if needed
+        cur_task.data = entry
+
+    # Poll the entry's stream for just what its tasks are waiting on, and if there are
+    # none then stop polling it, and remove it from the IOQueue if it's not kept
+    def _update(self, entry):
+        ev = (0 if entry.rd is None else select.POLLIN) | (
+            0 if entry.wr is None else select.POLLOUT
+        )
+        if ev != entry.ev:
+            if ev:
+                self.poller.modify(entry.s, ev)
+            else:
+                self.poller.unregister(entry.s)
+            entry.ev = ev
+        if not ev and not entry.keep:
+            del self.map[id(entry.s)]
 
     def queue_read(self, s):
         self._enqueue(s, 0)
@@ -97,36 +153,31 @@ class IOQueue:
         self._enqueue(s, 1)
 
     def remove(self, task):
-        while True:
-            del_s = None
-            for k in self.map:  # Iterate without allocating on the heap
-                q0, q1, s = self.map[k]
-                if q0 is task or q1 is task:
-                    del_s = s
-                    break
-            if del_s is not None:
-                self._dequeue(s)
-            else:
-                break
+        if isinstance(task.data, IOEntry):
+            task.data.remove(task)
 
     def wait_io_event(self, dt):
         for s, ev in self.poller.ipoll(dt):
-            sm = self.map[id(s)]
-            # print('poll', s, sm, ev)
-            if ev & ~select.POLLOUT and sm[0] is not None:
+            entry = self.map[id(s)]
+            # print('poll', s, entry, ev)
+            woke = False
+            if ev & ~select.POLLOUT and entry.rd is not None:
                 # POLLIN or error
-                _task_queue.push_head(sm[0])
-                sm[0] = None
-            if ev & ~select.POLLIN and sm[1] is not None:
+                _task_queue.push_head(entry.rd)
+                entry.rd = None
+                self.nwait -= 1
+                woke = True
+            if ev & ~select.POLLIN and entry.wr is not None:
                 # POLLOUT or error
-                _task_queue.push_head(sm[1])
-                sm[1] = None
-            if sm[0] is None and sm[1] is None:
-                self._dequeue(s)
-            elif sm[0] is None:
-                self.poller.modify(s, select.POLLOUT)
-            else:
-                self.poller.modify(s, select.POLLIN)
+                _task_queue.push_head(entry.wr)
+                entry.wr = None
+                self.nwait -= 1
+                woke = True
+            if not woke or not entry.keep:
+                # A kept stream stays registered for the events that woke its tasks,
+                # as they usually wait for them again, and is only updated once there
+                # is an event that no task is waiting for.
+                self._update(entry)
 
 
 ################################################################################
@@ -160,11 +211,14 @@ def run_until_complete(main_task=None):
             if t:
                 # A task waiting on _task_queue; "ph_key" is time to schedule task at
                 dt = max(0, ticks_diff(t.ph_key, ticks()))
-            elif not _io_queue.map:
+            elif not _io_queue.nwait:
                 # No tasks can be woken so finished running
                 return
-            # print('(poll {})'.format(dt), len(_io_queue.map))
+            # print('(poll {})'.format(dt), _io_queue.nwait)
             _io_queue.wait_io_event(dt)
+            if dt < 0 and not _task_queue.peek():
+                # Woken by an event on a kept stream that no task was waiting for
+                dt = 1
 
         # Get next task to run and continue it
         t = _task_queue.pop_head()
@@ -195,6 +249,11 @@ def run_until_complete(main_task=None):
                 if t.state is True:
                     # "None" indicates that the task is complete and not await'ed on (yet).
                     t.state = None
+                elif callable(t.state):
+                    # The task has a callback registered to be called on completion.
+                    t.state(t, er)
+                    t.state = False
+                    waiting = True
                 else:
                     # Schedule any other tasks waiting on the completion of this task.
                     while t.state.peek():
@@ -222,6 +281,27 @@ def run(coro):
     return run_until_complete(create_task(coro))
 
 
+# Replace SingletonGenerator, IOQueue and run_until_complete with built-in C code
+# if it's available (it can only be used along with the built-in Task)
+try:
+    from _uasyncio import SingletonGenerator, IOQueue, run_until_complete
+except ImportError:
+    pass
+
+
+# Pause task execution for the given time (integer in milliseconds, uPy extension)
+# Use a SingletonGenerator to do it without allocating on the heap
+def sleep_ms(t, sgen=SingletonGenerator()):
+    assert sgen.state is None
+    sgen.state = ticks_add(ticks(), max(0, t))
+    return sgen
+
+
+# Pause task execution for the given time (in seconds)
+def sleep(t):
+    return sleep_ms(int(t * 1000))
+
+
 ################################################################################
 # Event loop wrapper
 
@@ -282,10 +362,15 @@ def current_task():
     return cur_task
 
 
-def new_event_loop():
+# If wheel_ms is non-zero then scheduled tasks are kept in a TimerWheel (if supported)
+# with wheel_slots slots of wheel_ms each, instead of a TaskQueue
+def new_event_loop(wheel_ms=0, wheel_slots=64):
     global _task_queue, _io_queue
-    # TaskQueue of Task instances
-    _task_queue = TaskQueue()
+    # TaskQueue (or TimerWheel) of Task instances
+    if wheel_ms and TimerWheel:
+        _task_queue = TimerWheel(wheel_ms, wheel_slots)
+    else:
+        _task_queue = TaskQueue()
     # Task queue and poller for stream IO
     _io_queue = IOQueue()
     return Loop
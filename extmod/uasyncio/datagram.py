@@ -0,0 +1,181 @@
+# MicroPython uasyncio module
+# MIT license; Copyright (c) 2026 agent
+
+from uerrno import EAGAIN
+from . import core
+
+
+# Awaitable returned by DatagramStream.sendto, which is reused so that sending doesn't
+# allocate.  Each step tries to send the datagram, and waits for the socket to be
+# writable if it can't take it yet.
+class _Send:
+    def __init__(self, s):
+        self.s = s
+        self.buf = None  # Datagram to send, or None if not in use
+        self.addr = None
+        self.exc = StopIteration()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            if self.addr is None:
+                self.s.send(self.buf)
+            else:
+                self.s.sendto(self.buf, self.addr)
+        except OSError as er:
+            if er.errno == EAGAIN:
+                core._io_queue.queue_write(self.s)
+                return None
+            self.buf = None
+            raise er
+        self.buf = None
+        self.exc.__traceback__ = None
+        raise self.exc
+
+    # The task waiting to send was cancelled, or the send abandoned, so drop the
+    # datagram and leave this free for the next send
+    def throw(self, exc):
+        self.buf = None
+        raise exc
+
+    def close(self):
+        self.buf = None
+
+
+# Class representing a UDP socket, can be closed and used in "async with".  Receiving
+# tries the socket first and only waits on it when no datagram is queued, so that all
+# the datagrams that arrive together are received with one wait.
+class DatagramStream:
+    def __init__(self, s):
+        self.s = s
+        # Socket methods to receive a datagram into a buffer, if the port has them
+        # (otherwise recv and recvfrom are used, which allocate)
+        self._ri = getattr(s, "recv_into", None)
+        self._rfi = getattr(s, "recvfrom_into", None)
+        self._send = _Send(s)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.wait_closed()
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        core._io_queue.discard(self.s)
+        self.s.close()
+
+    # Receive a datagram into buf, returning its size, or None if there's no datagram
+    # queued
+    def _recv_into(self, buf):
+        try:
+            if self._ri:
+                return self._ri(buf)
+            data = self.s.recv(len(buf))
+        except OSError as er:
+            if er.errno == EAGAIN:
+                return None
+            raise er
+        buf[: len(data)] = data
+        return len(data)
+
+    # Like _recv_into, but returns (nbytes, address)
+    def _recvfrom_into(self, buf):
+        try:
+            if self._rfi:
+                return self._rfi(buf)
+            data, addr = self.s.recvfrom(len(buf))
+        except OSError as er:
+            if er.errno == EAGAIN:
+                return None
+            raise er
+        buf[: len(data)] = data
+        return len(data), addr
+
+    # Receive a datagram into buf, truncating it if it doesn't fit, and return its size
+    async def recv_into(self, buf):
+        while True:
+            n = self._recv_into(buf)
+            if n is not None:
+                return n
+            yield core._io_queue.queue_read(self.s)
+
+    # Receive a datagram into buf, returning (nbytes, address)
+    async def recvfrom_into(self, buf):
+        while True:
+            r = self._recvfrom_into(buf)
+            if r is not None:
+                return r
+            yield core._io_queue.queue_read(self.s)
+
+    # Receive a datagram of up to n bytes, returning (data, address)
+    async def recvfrom(self, n):
+        buf = bytearray(n)
+        n, addr = await self.recvfrom_into(buf)
+        return bytes(buf[:n]), addr
+
+    # Wait for datagrams, then receive all that are queued, up to one into each of the
+    # buffers in bufs, storing their sizes in sizes and, if addrs is given, their
+    # addresses in addrs.  Returns the number of datagrams received.  (uPy extension)
+    async def recv_into_many(self, bufs, sizes, addrs=None):
+        s = self.s
+        n = 0
+        while True:
+            while n < len(bufs):
+                if addrs is None:
+                    m = self._recv_into(bufs[n])
+                    if m is None:
+                        break
+                else:
+                    r = self._recvfrom_into(bufs[n])
+                    if r is None:
+                        break
+                    m, addrs[n] = r
+                sizes[n] = m
+                n += 1
+            if n:
+                return n
+            yield core._io_queue.queue_read(s)
+
+    # Send a datagram to addr, or to the remote address of the endpoint if addr is None,
+    # waiting while the socket can't take it.  This is a coroutine.
+    def sendto(self, buf, addr=None):
+        op = self._send
+        if op.buf is not None:
+            # Another task is waiting to send with it
+            op = _Send(self.s)
+        op.buf = buf
+        op.addr = addr
+        return op
+
+
+# Create a UDP endpoint, bound to local_addr and/or connected to remote_addr, which
+# are (host, port) tuples
+async def open_datagram_endpoint(local_addr=None, remote_addr=None):
+    import usocket as socket
+    from .dns import getaddrinfo
+
+    family = socket.AF_INET
+    if remote_addr:
+        remote = (await getaddrinfo(remote_addr[0], remote_addr[1], 0, socket.SOCK_DGRAM))[0]
+        family = remote[0]
+    if local_addr:
+        local = (await getaddrinfo(local_addr[0], local_addr[1], 0, socket.SOCK_DGRAM))[0]
+        family = local[0]
+    s = socket.socket(family, socket.SOCK_DGRAM)
+    try:
+        s.setblocking(False)
+        if local_addr:
+            s.bind(local[-1])
+        if remote_addr:
+            s.connect(remote[-1])
+    except:
+        s.close()
+        raise
+    # Keep the socket registered with the poller until the endpoint is closed
+    core._io_queue.keep(s)
+    return DatagramStream(s)
@@ -0,0 +1,197 @@
+# MicroPython uasyncio module
+# MIT license; Copyright (c) 2026 agent
+
+from time import ticks_ms as ticks, ticks_diff, ticks_add
+from uerrno import ETIMEDOUT
+from urandom import getrandbits
+import ustruct as struct
+import usocket as socket
+from . import core
+from .funcs import wait_for_ms
+
+# Address of the DNS server as a numeric IPv4 string, "" if there isn't one,
+# or None if it hasn't been looked for yet
+_server = None
+_port = 53
+
+# Maps a host name to (expiry ticks, [address, ...]), for at most CACHE_MAX names;
+# a name the DNS server has no address for is cached with no addresses
+_cache = {}
+
+HOSTS = "/etc/hosts"
+CACHE_MAX = 8
+NEGATIVE_TTL = 10  # seconds to remember that DNS has no address for a name
+TIMEOUT_MS = 2000
+RETRIES = 3
+
+
+# Set the DNS server to use, eg with the one given by network.WLAN.ifconfig()
+def set_server(addr, port=53):
+    global _server, _port
+    _server = addr
+    _port = port
+
+
+# On unix the DNS server comes from resolv.conf; elsewhere it's given by set_server
+def _find_server():
+    try:
+        with open("/etc/resolv.conf") as f:
+            for l in f:
+                l = l.split()
+                if len(l) >= 2 and l[0] == "nameserver" and ":" not in l[1]:
+                    return l[1]
+    except OSError:
+        pass
+    return ""
+
+
+# Numeric addresses, which getaddrinfo converts without a lookup, so without blocking
+def _is_numeric(host):
+    parts = host.split(".")
+    return len(parts) == 4 and all(p.isdigit() for p in parts)
+
+
+# The IPv4 addresses given for host in the hosts file, if there is one
+def _hosts(host):
+    addrs = []
+    try:
+        with open(HOSTS) as f:
+            for l in f:
+                l = l.split("#", 1)[0].split()
+                if len(l) >= 2 and ":" not in l[0] and host in l[1:]:
+                    addrs.append(l[0])
+    except OSError:
+        pass
+    return addrs
+
+
+def _cache_get(host):
+    e = _cache.get(host)
+    if e is not None:
+        if ticks_diff(e[0], ticks()) > 0:
+            return e[1]
+        del _cache[host]
+    return None
+
+
+def _cache_put(host, ttl, addrs):
+    if not ttl:
+        return
+    if host not in _cache and len(_cache) >= CACHE_MAX:
+        for h in list(_cache):
+            _cache_get(h)
+        if len(_cache) >= CACHE_MAX:
+            del _cache[next(iter(_cache))]
+    # Limit the TTL so the expiry time stays well within the range of ticks.
+    _cache[host] = (ticks_add(ticks(), min(ttl, 3600) * 1000), addrs)
+
+
+# Make a recursive query for the A records of host
+def _query(id, host):
+    q = bytearray(struct.pack(">HHHHHH", id, 0x0100, 1, 0, 0, 0))
+    for label in host.split("."):
+        if label:
+            q.append(len(label))
+            q += label.encode()
+    q += b"\x00\x00\x01\x00\x01"
+    return q
+
+
+def _skip_name(r, i):
+    while r[i]:
+        if r[i] & 0xC0:
+            # Compressed, the rest of the name is elsewhere
+            return i + 2
+        i += r[i] + 1
+    return i + 1
+
+
+# Parse a response to the query with the given id, returning (ttl, [address, ...]),
+# or None if it's not that response
+def _parse(r, id):
+    if len(r) < 12:
+        return None
+    rid, flags, qd, an = struct.unpack_from(">HHHH", r, 0)
+    if rid != id or not flags & 0x8000:
+        return None
+    if flags & 0x000F:
+        # Error (eg no such name), which is reported the same as no addresses
+        return 0, []
+    i = 12
+    for _ in range(qd):
+        i = _skip_name(r, i) + 4
+    ttl = 0
+    addrs = []
+    for _ in range(an):
+        i = _skip_name(r, i)
+        typ, cls, t, n = struct.unpack_from(">HHIH", r, i)
+        i += 10
+        if typ == 1 and cls == 1 and n == 4:
+            addrs.append("%d.%d.%d.%d" % (r[i], r[i + 1], r[i + 2], r[i + 3]))
+            ttl = t if len(addrs) == 1 else min(ttl, t)
+        i += n
+    return ttl, addrs
+
+
+async def _recv(s, id):
+    while True:
+        yield core._io_queue.queue_read(s)
+        try:
+            res = _parse(s.recv(512), id)
+        except (OSError, IndexError, ValueError):
+            # Receive error or malformed response, keep waiting for a good one
+            res = None
+        if res is not None:
+            return res
+
+
+# Look up host with DNS, returning its addresses, or None if DNS can't be used;
+# raises OSError if the DNS server doesn't respond
+async def _resolve(host):
+    global _server
+    if _server is None:
+        _server = _find_server()
+    if not _server:
+        return None
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    except OSError:
+        return None
+    try:
+        s.setblocking(False)
+        addr = socket.getaddrinfo(_server, _port)[0][-1]
+        # A random id, so responses to the query are hard to forge
+        id = getrandbits(16)
+        q = _query(id, host)
+        for _ in range(RETRIES):
+            s.sendto(q, addr)
+            try:
+                ttl, addrs = await wait_for_ms(_recv(s, id), TIMEOUT_MS)
+                break
+            except core.TimeoutError:
+                pass
+        else:
+            raise OSError(ETIMEDOUT)
+    finally:
+        s.close()
+    _cache_put(host, ttl if addrs else NEGATIVE_TTL, addrs)
+    return addrs
+
+
+# Like usocket.getaddrinfo, but resolves host from the hosts file or with a DNS
+# query over UDP that waits for the response without blocking other tasks.  Falls
+# back to usocket.getaddrinfo (which may block) for IPv6 lookups, if there's no DNS
+# server or UDP socket, or if DNS has no address for host, as the system resolver
+# may know it by other means (eg search domains or mDNS).
+async def getaddrinfo(host, port, af=0, type=0):
+    addrs = None
+    if not _is_numeric(host) and af in (0, socket.AF_INET):
+        addrs = _hosts(host) or _cache_get(host)
+        if addrs is None:
+            addrs = await _resolve(host)
+    if not addrs:
+        return socket.getaddrinfo(host, port, af, type)
+    ai = []
+    for a in addrs:
+        ai.extend(socket.getaddrinfo(a, port, af, type))
+    return ai
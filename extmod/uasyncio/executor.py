@@ -0,0 +1,162 @@
+# MicroPython uasyncio module
+# MIT license; Copyright (c) 2026 agent
+
+import _thread
+from . import core
+
+try:
+    from uos import pipe
+except ImportError:
+    pipe = None
+
+if pipe:
+    # Used by worker threads to wake the asyncio loop.  This is a pipe rather than a
+    # ThreadSafeFlag because ports with pipes (ie unix) can't poll a ThreadSafeFlag.
+    class _Wake:
+        def __init__(self):
+            r, w = pipe()
+            self._r = open(r, "rb")
+            self._w = open(w, "wb")
+            core._io_queue.keep(self._r)
+
+        def set(self):
+            self._w.write(b"\x00")
+
+        async def wait(self):
+            yield core._io_queue.queue_read(self._r)
+            self._r.read(1)
+
+        def close(self):
+            core._io_queue.discard(self._r)
+            self._r.close()
+            self._w.close()
+
+else:
+    from .event import ThreadSafeFlag
+
+    class _Wake(ThreadSafeFlag):
+        def close(self):
+            pass
+
+
+# A call of fn(*args) to be made by a worker thread
+class _Job:
+    def __init__(self, fn, args):
+        self.fn = fn
+        self.args = args
+        self.ret = None
+        self.exc = None
+        self.waiter = None  # Task waiting for the result
+
+    def remove(self, task):
+        # The waiting task was cancelled, so there's no one to pass the result to
+        self.waiter = None
+
+
+class _Worker:
+    def __init__(self, job):
+        self.job = job
+        # Released to give the worker thread a new job (or None to stop it)
+        self.lock = _thread.allocate_lock()
+
+
+# Executor class, which runs blocking calls on a fixed-size pool of worker threads
+# so they don't stall the asyncio loop.  Worker threads are started as needed, up to
+# the given number, and then kept to run later calls.
+class Executor:
+    def __init__(self, workers=2):
+        self._workers = workers
+        self._nthreads = 0
+        self._mutex = _thread.allocate_lock()  # Protects the lists below
+        self._idle = []  # Workers waiting for a job
+        self._pending = []  # Jobs waiting for a worker
+        self._done = []  # Jobs finished by a worker, to be passed back to the loop
+        self._nrun = 0  # Number of jobs not yet passed back to the loop
+        self._wake = None
+        self._reader = None
+
+    # Runs in a worker thread
+    def _work(self, w):
+        while True:
+            w.lock.acquire()
+            job = w.job
+            if job is None:
+                return
+            while job:
+                try:
+                    job.ret = job.fn(*job.args)
+                except BaseException as er:
+                    job.exc = er
+                with self._mutex:
+                    self._done.append(job)
+                    if self._pending:
+                        job = self._pending.pop(0)
+                    else:
+                        job = None
+                        self._idle.append(w)
+                self._wake.set()
+
+    # Task that passes the results of finished jobs back to their waiting tasks
+    async def _read(self):
+        while self._nrun:
+            await self._wake.wait()
+            with self._mutex:
+                done = self._done
+                self._done = []
+            for job in done:
+                self._nrun -= 1
+                if job.waiter:
+                    core._task_queue.push_head(job.waiter)
+        self._reader = None
+
+    def _submit(self, job):
+        self._nrun += 1
+        if self._reader is None:
+            if self._wake is None:
+                self._wake = _Wake()
+            self._reader = core.create_task(self._read())
+        with self._mutex:
+            if self._idle:
+                w = self._idle.pop()
+                w.job = job
+                w.lock.release()
+                return
+            if self._nthreads == self._workers:
+                self._pending.append(job)
+                return
+            self._nthreads += 1
+        _thread.start_new_thread(self._work, (_Worker(job),))
+
+    async def run(self, fn, *args):
+        job = _Job(fn, args)
+        self._submit(job)
+        # Wait for the job to finish, with data set so the wait can be cancelled
+        job.waiter = core.cur_task
+        core.cur_task.data = job
+        yield
+        if job.exc:
+            raise job.exc
+        return job.ret
+
+    def shutdown(self):
+        if self._nrun:
+            raise RuntimeError("jobs running")
+        with self._mutex:
+            for w in self._idle:
+                w.job = None
+                w.lock.release()
+            self._idle = []
+            self._nthreads = 0
+        if self._wake:
+            self._wake.close()
+            self._wake = None
+
+
+_executor = None
+
+
+def run_in_executor(fn, *args):
+    global _executor
+    if _executor is None:
+        _executor = Executor()
+    return _executor.run(fn, *args)
@@ -53,22 +53,81 @@ def wait_for_ms(aw, timeout):
     return wait_for(aw, timeout, core.sleep_ms)
 
 
+# Stands in for the queue that a task waiting in gather is on, so that cancelling the
+# task (which removes it from that queue) works
+class _Remove:
+    @staticmethod
+    def remove(t):
+        pass
+
+
 async def gather(*aws, return_exceptions=False):
+    def done(t, er):
+        # Sub-task "t" has finished, "er" is its StopIteration or exception.
+        nonlocal n, err
+        if return_exceptions or type(er) is StopIteration:
+            n -= 1
+            if n:
+                # Still some sub-tasks running.
+                return
+        elif err is None:
+            # First sub-task to raise an exception, pass it to the gather task.
+            err = er
+        else:
+            return
+        if gather_task.data is _Remove:
+            # Schedule the gather task, unless it was cancelled or already scheduled.
+            core._task_queue.push_head(gather_task)
+
     ts = [core._promote_to_task(aw) for aw in aws]
-    for i in range(len(ts)):
+    gather_task = core.cur_task
+    n = len(ts)
+    err = None
+    for t in ts:
+        s = t.state
+        if s is True:
+            # Sub-task is running, register the callback to call when it's done.
+            t.state = done
+        elif not s:
+            # Sub-task already finished, signal that it has been await'ed on.
+            t.state = False
+            if not return_exceptions and type(t.data) is not StopIteration:
+                err = t.data
+                break
+            n -= 1
+        else:
+            # Sub-task is already being await'ed on by another task.
+            err = RuntimeError("can't gather")
+            break
+
+    # Wait for all sub-tasks to finish, or for the first one to raise an exception.
+    # Each sub-task calls done when it finishes, and only the last one (or the first
+    # to raise) schedules this task, so it is woken once.
+    if err is None and n:
+        gather_task.data = _Remove
         try:
-            # TODO handle cancel of gather itself
-            # if ts[i].coro:
-            #    iter(ts[i]).waiting.push_head(cur_task)
-            #    try:
-            #        yield
-            #    except CancelledError as er:
-            #        # cancel all waiting tasks
-            #        raise er
-            ts[i] = await ts[i]
-        except Exception as er:
-            if return_exceptions:
-                ts[i] = er
-            else:
-                raise er
+            yield
+        except core.CancelledError as er:
+            # This gather was cancelled, cancel all sub-tasks still running.
+            err = er
+
+    # Clean up sub-tasks and collect their results.
+    for i in range(len(ts)):
+        t = ts[i]
+        s = t.state
+        if s is done or s is True:
+            # Sub-task is still running, deregister any callback and cancel it.
+            t.state = True
+            t.cancel()
+        else:
+            # Sub-task finished, get its return value, or its exception (which is only
+            # returned with return_exceptions==True).
+            er = t.data
+            ts[i] = er.value if type(er) is StopIteration else er
+
+    if err is not None:
+        # This gather was cancelled, or a sub-task raised an exception with
+        # return_exceptions==False, so raise that exception here.
+        raise err
+
     return ts
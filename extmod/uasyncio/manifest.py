@@ -4,9 +4,13 @@ freeze(
     (
         "uasyncio/__init__.py",
         "uasyncio/core.py",
+        "uasyncio/datagram.py",
+        "uasyncio/dns.py",
         "uasyncio/event.py",
+        "uasyncio/executor.py",
         "uasyncio/funcs.py",
         "uasyncio/lock.py",
+        "uasyncio/queue.py",
         "uasyncio/stream.py",
     ),
     opt=3,
@@ -0,0 +1,133 @@
+# MicroPython uasyncio module
+# MIT license; Copyright (c) 2026 agent
+
+from . import core
+
+
+# Raised by Queue.get_nowait when the queue is empty
+class QueueEmpty(Exception):
+    pass
+
+
+# Raised by Queue.put_nowait when the queue is full
+class QueueFull(Exception):
+    pass
+
+
+# Queue class for passing items between tasks, in FIFO order.  The items are kept
+# in a ring buffer, which for a bounded queue is allocated up front so that putting
+# and getting items doesn't allocate.  When the TaskQueue is provided by the C module
+# put_nowait and get_nowait are therefore safe to call from a scheduled callback, but
+# not from a hard IRQ or another thread.
+class Queue:
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self._buf = [None] * (maxsize if maxsize > 0 else 4)
+        self._head = 0  # Index in _buf of the next item to get
+        self._n = 0  # Number of items in the queue
+        self._unfinished = 0  # Number of items not yet marked as done by task_done
+        self._getters = core.TaskQueue()  # Queue of Tasks waiting for an item
+        self._putters = core.TaskQueue()  # Queue of Tasks waiting for a free slot
+        self._joiners = core.TaskQueue()  # Queue of Tasks waiting in join
+
+    def qsize(self):
+        return self._n
+
+    def empty(self):
+        return not self._n
+
+    def full(self):
+        return 0 < self.maxsize <= self._n
+
+    def put_nowait(self, item):
+        buf = self._buf
+        n = self._n
+        if n == len(buf):
+            if self.maxsize > 0:
+                raise QueueFull
+            # Unbounded queue has filled the ring buffer, so double its size
+            buf = self._buf = buf[self._head :] + buf[: self._head] + [None] * n
+            self._head = 0
+        buf[(self._head + n) % len(buf)] = item
+        self._n = n + 1
+        self._unfinished += 1
+        if self._getters.peek():
+            # Schedule one task waiting to get an item
+            core._task_queue.push_head(self._getters.pop_head())
+
+    def get_nowait(self):
+        if not self._n:
+            raise QueueEmpty
+        buf = self._buf
+        i = self._head
+        item = buf[i]
+        buf[i] = None
+        self._head = (i + 1) % len(buf)
+        self._n -= 1
+        if self._putters.peek():
+            # Schedule one task waiting for a free slot
+            core._task_queue.push_head(self._putters.pop_head())
+        return item
+
+    async def put(self, item):
+        while 0 < self.maxsize <= self._n:
+            # Queue full, put the calling task on the queue of waiting putters
+            self._putters.push_head(core.cur_task)
+            # Set calling task's data to the queue of putters so it can be removed if needed
+            core.cur_task.data = self._putters
+            try:
+                yield
+            except core.CancelledError as er:
+                # This task may have been scheduled for a free slot, so pass that on
+                if not self.full() and self._putters.peek():
+                    core._task_queue.push_head(self._putters.pop_head())
+                raise er
+        self.put_nowait(item)
+
+    async def get(self):
+        while not self._n:
+            # Queue empty, put the calling task on the queue of waiting getters
+            self._getters.push_head(core.cur_task)
+            # Set calling task's data to the queue of getters so it can be removed if needed
+            core.cur_task.data = self._getters
+            try:
+                yield
+            except core.CancelledError as er:
+                # This task may have been scheduled for an item, so pass that on
+                if self._n and self._getters.peek():
+                    core._task_queue.push_head(self._getters.pop_head())
+                raise er
+        return self.get_nowait()
+
+    def task_done(self):
+        if not self._unfinished:
+            raise ValueError("task_done() called too many times")
+        self._unfinished -= 1
+        if not self._unfinished:
+            # All items are done, schedule all tasks waiting in join
+            while self._joiners.peek():
+                core._task_queue.push_head(self._joiners.pop_head())
+
+    async def join(self):
+        if self._unfinished:
+            # Put the calling task on the queue of joiners
+            self._joiners.push_head(core.cur_task)
+            # Set calling task's data to the queue of joiners so it can be removed if needed
+            core.cur_task.data = self._joiners
+            yield
+
+
+# LifoQueue class, a Queue that gets the most recently put item first
+class LifoQueue(Queue):
+    def get_nowait(self):
+        if not self._n:
+            raise QueueEmpty
+        self._n -= 1
+        buf = self._buf
+        i = (self._head + self._n) % len(buf)
+        item = buf[i]
+        buf[i] = None
+        if self._putters.peek():
+            # Schedule one task waiting for a free slot
+            core._task_queue.push_head(self._putters.pop_head())
+        return item
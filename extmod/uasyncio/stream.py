@@ -1,14 +1,31 @@
 # MicroPython uasyncio module
 # MIT license; Copyright (c) 2019-2020 Damien P. George
 
+from uerrno import EAGAIN, ECONNABORTED
 from . import core
 
+# Bytes of the read-ahead buffer searched at a time for a separator, so that a
+# line is found by copying about as much as the line rather than all of the buffer
+_SCAN = 64
+
+# Time a Server waits before accepting again after an accept fails for lack of
+# resources (eg EMFILE), when the listening socket stays readable
+_BACKOFF_MS = 100
+
 
 class Stream:
-    def __init__(self, s, e={}):
+    def __init__(self, s, e={}, bufsize=0):
         self.s = s
         self.e = e
-        self.out_buf = b""
+        # Pending output, which keeps its memory when emptied by drain so that
+        # in steady state writing doesn't allocate
+        self.out_buf = bytearray()
+        # Optional read-ahead buffer, so reads can be served without a poll and
+        # system call each; data from rpos to rend hasn't been returned yet
+        self.rbuf = None
+        self.rpos = self.rend = 0
+        if bufsize:
+            self.set_buffer(bufsize)
 
     def get_extra_info(self, v):
         return self.e[v]
@@ -17,24 +34,107 @@ class Stream:
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.close()
+        self.close()
+        await self.wait_closed()
 
     def close(self):
         pass
 
     async def wait_closed(self):
         # TODO yield?
+        core._io_queue.discard(self.s)
         self.s.close()
 
+    # Read ahead into a buffer of the given size from now on (uPy extension)
+    def set_buffer(self, bufsize):
+        if self.rbuf is None:
+            self.rbuf = memoryview(bytearray(bufsize))
+
+    # Read more data into the read-ahead buffer, returning the amount read (0 at EOF)
+    async def _fill(self):
+        buf = self.rbuf
+        if self.rpos == self.rend:
+            self.rpos = self.rend = 0
+        elif self.rend == len(buf):
+            # Move the unread data to the start, to make room after it
+            n = self.rend - self.rpos
+            buf[:n] = buf[self.rpos : self.rend]
+            self.rpos = 0
+            self.rend = n
+        while True:
+            yield core._io_queue.queue_read(self.s)
+            n = self.s.readinto(buf[self.rend :])
+            if n is not None:
+                self.rend += n
+                return n
+
+    # Take up to n bytes from the read-ahead buffer
+    def _take(self, n):
+        n = min(n, self.rend - self.rpos)
+        data = bytes(self.rbuf[self.rpos : self.rpos + n])
+        self.rpos += n
+        return data
+
+    async def _readuntil(self, sep):
+        buf = self.rbuf
+        l = b""
+        # Data from rpos up to this offset from it is known not to contain sep
+        scanned = 0
+        while True:
+            start = self.rpos + scanned
+            end = min(start + _SCAN + len(sep), self.rend)
+            i = bytes(buf[start:end]).find(sep)
+            if i >= 0:
+                return l + self._take(scanned + i + len(sep))
+            scanned = max(scanned, end - self.rpos - len(sep) + 1)
+            if end < self.rend:
+                continue
+            if self.rpos == 0 and self.rend == len(buf):
+                # Buffer is full without sep, so move it out to make room
+                l += self._take(scanned)
+                scanned = 0
+            if not await self._fill():
+                return l + self._take(self.rend - self.rpos)
+
     async def read(self, n):
+        if self.rbuf is not None:
+            if self.rpos < self.rend or 0 <= n < len(self.rbuf) and await self._fill():
+                return self._take(n if n >= 0 else self.rend - self.rpos)
         yield core._io_queue.queue_read(self.s)
         return self.s.read(n)
 
     async def readinto(self, buf):
+        if self.rbuf is not None:
+            if self.rpos < self.rend or len(buf) < len(self.rbuf) and await self._fill():
+                n = min(len(buf), self.rend - self.rpos)
+                buf[:n] = self.rbuf[self.rpos : self.rpos + n]
+                self.rpos += n
+                return n
         yield core._io_queue.queue_read(self.s)
         return self.s.readinto(buf)
 
     async def readexactly(self, n):
+        if self.rbuf is not None:
+            r = bytearray(n)
+            mv = memoryview(r)
+            k = 0
+            while k < n:
+                if self.rpos == self.rend and n - k >= len(self.rbuf):
+                    # Large read, straight into the result
+                    yield core._io_queue.queue_read(self.s)
+                    m = self.s.readinto(mv[k:])
+                    if m is None:
+                        continue
+                elif self.rpos < self.rend or await self._fill():
+                    m = min(n - k, self.rend - self.rpos)
+                    mv[k : k + m] = self.rbuf[self.rpos : self.rpos + m]
+                    self.rpos += m
+                else:
+                    m = 0
+                if not m:
+                    raise EOFError
+                k += m
+            return bytes(r)
         r = b""
         while n:
             yield core._io_queue.queue_read(self.s)
@@ -47,6 +147,8 @@ class Stream:
         return r
 
     async def readline(self):
+        if self.rbuf is not None:
+            return await self._readuntil(b"\n")
         l = b""
         while True:
             yield core._io_queue.queue_read(self.s)
@@ -55,18 +157,51 @@ class Stream:
             if not l2 or l[-1] == 10:  # \n (check l in case l2 is str)
                 return l
 
+    # Read up to and including sep, raising EOFError if the stream ends first
+    async def readuntil(self, sep=b"\n"):
+        if self.rbuf is not None:
+            l = await self._readuntil(sep)
+        else:
+            # Without a read-ahead buffer, read a byte at a time so as not to read
+            # past sep, but only wait for the stream when it has nothing to read
+            l = bytearray()
+            c = None
+            while l[-len(sep) :] != sep:
+                if c is None:
+                    yield core._io_queue.queue_read(self.s)
+                c = self.s.read(1)
+                if c is not None:
+                    if not c:
+                        break
+                    l += c
+            l = bytes(l)
+        if not l.endswith(sep):
+            raise EOFError
+        return l
+
     def write(self, buf):
-        self.out_buf += buf
+        self.out_buf.extend(buf)
+
+    def writelines(self, bufs):
+        for buf in bufs:
+            self.out_buf.extend(buf)
 
     async def drain(self):
-        mv = memoryview(self.out_buf)
+        buf = self.out_buf
         off = 0
-        while off < len(mv):
-            yield core._io_queue.queue_write(self.s)
-            ret = self.s.write(mv[off:])
-            if ret is not None:
+        waited = False
+        while off < len(buf):
+            # Only wait for the stream if it can't take the data straight away
+            ret = self.s.write(memoryview(buf)[off:] if off else buf)
+            if ret is None:
+                yield core._io_queue.queue_write(self.s)
+                waited = True
+            else:
                 off += ret
-        self.out_buf = b""
+        buf[:] = b""
+        # Always yield, so a task that writes in a loop doesn't starve the others
+        if not waited:
+            await core.sleep_ms(0)
 
 
 # Stream can be used for both reading and writing to save code size
@@ -74,21 +209,31 @@ StreamReader = Stream
 StreamWriter = Stream
 
 
-# Create a TCP stream connection to a remote host
-async def open_connection(host, port):
+# Create a TCP stream connection to a remote host, reading ahead into a buffer
+# of size bufsize if it's non-zero
+async def open_connection(host, port, bufsize=0):
     from uerrno import EINPROGRESS
     import usocket as socket
+    from .dns import getaddrinfo
 
-    ai = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)[0]  # TODO this is blocking!
+    ai = (await getaddrinfo(host, port, 0, socket.SOCK_STREAM))[0]
     s = socket.socket(ai[0], ai[1], ai[2])
     s.setblocking(False)
-    ss = Stream(s)
     try:
-        s.connect(ai[-1])
-    except OSError as er:
-        if er.errno != EINPROGRESS:
-            raise er
-    yield core._io_queue.queue_write(s)
+        try:
+            s.connect(ai[-1])
+        except OSError as er:
+            if er.errno != EINPROGRESS:
+                raise er
+        yield core._io_queue.queue_write(s)
+    except:
+        # Failed or cancelled (eg by wait_for) while connecting
+        core._io_queue.discard(s)
+        s.close()
+        raise
+    # Keep the socket registered with the poller until the stream is closed
+    ss = Stream(s, {}, bufsize)
+    core._io_queue.keep(s)
     return ss, ss
 
 
@@ -107,41 +252,145 @@ class Server:
     async def wait_closed(self):
         await self.task
 
-    async def _serve(self, s, cb):
+    async def _serve(self, s, cb, backlog, bufsize, pool):
+        self._idle = []  # Handlers in the pool waiting for a connection
+        nhandlers = 0
+        backoff = False
         # Accept incoming connections
         while True:
             try:
+                if backoff:
+                    backoff = False
+                    await core.sleep_ms(_BACKOFF_MS)
                 yield core._io_queue.queue_read(s)
             except core.CancelledError:
-                # Shutdown server
+                # Shutdown server, and the handlers that are waiting for a connection
+                core._io_queue.discard(s)
                 s.close()
+                idle = self._idle
+                self._idle = None
+                for h in idle:
+                    h.task.cancel()
                 return
+            # Accept all the connections that are waiting, up to the size of the backlog
+            for _ in range(backlog):
+                try:
+                    s2, addr = s.accept()
+                except OSError as er:
+                    if er.errno == EAGAIN:
+                        # No more connections waiting
+                        break
+                    if er.errno == ECONNABORTED:
+                        # The client went away, which is ignored
+                        continue
+                    # Out of file descriptors or memory, so wait for some to be freed
+                    # rather than spin on the socket
+                    backoff = True
+                    break
+                s2.setblocking(False)
+                if self._idle:
+                    self._idle.pop().start(s2, addr)
+                elif nhandlers < pool:
+                    nhandlers += 1
+                    _Handler(self, cb, bufsize).start(s2, addr)
+                else:
+                    core.create_task(_serve_one(cb, Stream(s2, {"peername": addr}, bufsize)))
+
+
+# Run the callback for a connection that has a Stream of its own, keeping the socket
+# in the IOQueue while the callback runs.  The socket is discarded when the callback
+# finishes, in case it didn't call wait_closed.
+async def _serve_one(cb, ss):
+    s = ss.s
+    core._io_queue.keep(s)
+    try:
+        await cb(ss, ss)
+    finally:
+        core._io_queue.discard(s)
+
+
+# Stream for a connection handled by the pool of a Server, which is reused for the
+# next connection once this one is closed
+class _PoolStream(Stream):
+    async def wait_closed(self):
+        # The stream may be closed by both the callback and the handler, so only close
+        # the socket once; its fd may already have been reused.
+        if self.s is not None:
+            core._io_queue.discard(self.s)
+            self.s.close()
+            self.s = None
+
+    aclose = wait_closed
+
+
+# Connection-handler task in the pool of a Server, which calls the server's callback
+# for one connection after another with the same Stream
+class _Handler:
+    def __init__(self, srv, cb, bufsize):
+        self.srv = srv
+        self.ss = _PoolStream(None, {"peername": None}, bufsize)
+        self.task = core.create_task(self._run(cb))
+
+    # Give this handler a connection, waking its task if it's waiting for one
+    def start(self, s, addr):
+        ss = self.ss
+        ss.s = s
+        ss.e["peername"] = addr
+        core._io_queue.keep(s)
+        if self.task.data is self:
+            core._task_queue.push_head(self.task)
+
+    def remove(self, task):
+        # Cancelled while waiting for a connection, which the Server only does when
+        # it's closed and no longer has this handler in its list of idle ones
+        pass
+
+    async def _run(self, cb):
+        ss = self.ss
+        while True:
             try:
-                s2, addr = s.accept()
-            except:
-                # Ignore a failed accept
-                continue
-            s2.setblocking(False)
-            s2s = Stream(s2, {"peername": addr})
-            core.create_task(cb(s2s, s2s))
+                await cb(ss, ss)
+            except Exception as er:
+                # Report the error the same way as for a callback run in its own task
+                core._exc_context["exception"] = er
+                core._exc_context["future"] = core.cur_task
+                core.Loop.call_exception_handler(core._exc_context)
+            # Close the connection if the callback didn't, and reset the Stream
+            if ss.s is not None:
+                core._io_queue.discard(ss.s)
+                ss.s.close()
+                ss.s = None
+            if ss.out_buf:
+                ss.out_buf[:] = b""
+            ss.rpos = ss.rend = 0
+            if self.srv._idle is None:
+                # Server was closed while handling this connection
+                return
+            self.srv._idle.append(self)
+            # Wait for the next connection, with data set so the wait can be cancelled
+            core.cur_task.data = self
+            yield
 
 
-# Helper function to start a TCP stream server, running as a new task
-# TODO could use an accept-callback on socket read activity instead of creating a task
-async def start_server(cb, host, port, backlog=5):
+# Helper function to start a TCP stream server, running as a new task.  If pool is
+# non-zero then up to that many connections at a time are handled by a pool of tasks
+# that each reuse a Stream, rather than by a new task and Stream per connection.
+async def start_server(cb, host, port, backlog=5, bufsize=0, pool=0):
     import usocket as socket
+    from .dns import getaddrinfo
 
     # Create and bind server socket.
-    host = socket.getaddrinfo(host, port)[0]  # TODO this is blocking!
+    host = (await getaddrinfo(host, port))[0]
     s = socket.socket()
     s.setblocking(False)
     s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     s.bind(host[-1])
     s.listen(backlog)
+    core._io_queue.keep(s)
 
     # Create and return server object and task.
     srv = Server()
-    srv.task = core.create_task(srv._serve(s, cb))
+    srv.task = core.create_task(srv._serve(s, cb, backlog, bufsize, pool))
     return srv
 
 
@@ -118,12 +118,165 @@ class TaskQueue:
         self.heap = ph_delete(self.heap, v)
 
 
+# TimerWheel class, a hashed timing wheel that can be used instead of a TaskQueue as
+# the main run queue.  Tasks that are due are on a FIFO ready list, and tasks scheduled
+# in the future are on the list of the slot that covers their ph_key, so pushing and
+# removing a task is O(1).  A slot is only moved to the ready list once its time has
+# fully passed, so while other tasks are running a task may be scheduled up to
+# slot_ms late.  The lists are doubly linked through ph_next and ph_child.
+class TimerWheel:
+    def __init__(self, slot_ms, nslots=64):
+        if slot_ms <= 0 or nslots <= 0:
+            raise ValueError
+        self.ready_head = None
+        self.ready_tail = None
+        self.cursor = core.ticks()  # Start of the first slot that hasn't passed
+        self.cursor_idx = 0
+        self.slot_ms = slot_ms
+        self.slots = [None] * nslots
+        # The earliest task in the slots, when first_known, so peek doesn't have to
+        # search the slots again until that task leaves them
+        self.first = None
+        self.first_known = True
+
+    def _slot(self, v):
+        return (self.cursor_idx + core.ticks_diff(v.ph_key, self.cursor) // self.slot_ms) % len(
+            self.slots
+        )
+
+    # Append to the ready list.  Every task in it is already due, so it's a FIFO
+    # rather than sorted, which keeps expiring a slot of many tasks O(1) per task.
+    def _ready(self, v):
+        prev = self.ready_tail
+        v.ph_child = prev
+        v.ph_next = None
+        if prev is None:
+            self.ready_head = v
+        else:
+            prev.ph_next = v
+        self.ready_tail = v
+
+    def _unlink(self, v):
+        if v is self.first:
+            self.first = None
+            self.first_known = False
+        prev = v.ph_child
+        next = v.ph_next
+        if prev is not None:
+            prev.ph_next = next
+        elif v is self.ready_head:
+            self.ready_head = next
+        else:
+            self.slots[self._slot(v)] = next
+        if next is not None:
+            next.ph_child = prev
+        elif v is self.ready_tail:
+            self.ready_tail = prev
+        v.ph_child = None
+        v.ph_next = None
+
+    # Move the tasks in a slot that are due before end to the ready list.  New tasks
+    # are pushed on the front of a slot, so go from the back to keep tasks with the
+    # same ph_key in the order they were pushed.
+    def _expire(self, idx, end):
+        v = self.slots[idx]
+        while v is not None and v.ph_next is not None:
+            v = v.ph_next
+        while v is not None:
+            prev = v.ph_child
+            if core.ticks_diff(v.ph_key, end) < 0:
+                self._unlink(v)
+                self._ready(v)
+            v = prev
+
+    # Move the cursor past all the slots whose time has passed
+    def _advance(self):
+        n = core.ticks_diff(core.ticks(), self.cursor) // self.slot_ms
+        if n <= 0:
+            return
+        nslots = len(self.slots)
+        if n >= nslots:
+            # Every slot has passed at least once, so check all of them
+            end = core.ticks_add(self.cursor, n * self.slot_ms)
+            for i in range(nslots):
+                self._expire(i, end)
+        else:
+            for i in range(n):
+                idx = (self.cursor_idx + i) % nslots
+                self._expire(idx, core.ticks_add(self.cursor, (i + 1) * self.slot_ms))
+        self.cursor = core.ticks_add(self.cursor, n * self.slot_ms)
+        self.cursor_idx = (self.cursor_idx + n) % nslots
+
+    def peek(self):
+        self._advance()
+        if self.ready_head is not None:
+            return self.ready_head
+        if self.first_known:
+            return self.first
+        # Find the first slot with a task due in this rotation, then the earliest task in
+        # it.  Slots are in reverse order of pushing, so prefer later tasks on a tie.
+        nslots = len(self.slots)
+        first = None
+        for i in range(nslots):
+            end = core.ticks_add(self.cursor, (i + 1) * self.slot_ms)
+            v = self.slots[(self.cursor_idx + i) % nslots]
+            while v is not None:
+                if core.ticks_diff(v.ph_key, end) < 0 and (
+                    first is None or core.ticks_diff(v.ph_key, first.ph_key) <= 0
+                ):
+                    first = v
+                v = v.ph_next
+            if first is not None:
+                break
+        else:
+            # Any remaining tasks are due after a full rotation
+            for v in self.slots:
+                while v is not None:
+                    if first is None or core.ticks_diff(v.ph_key, first.ph_key) <= 0:
+                        first = v
+                    v = v.ph_next
+        self.first = first
+        self.first_known = True
+        return first
+
+    def push_sorted(self, v, key):
+        v.data = None
+        v.ph_key = key
+        if core.ticks_diff(key, core.ticks()) <= 0 or core.ticks_diff(key, self.cursor) < 0:
+            self._ready(v)
+        else:
+            idx = self._slot(v)
+            next = self.slots[idx]
+            v.ph_child = None
+            v.ph_next = next
+            if next is not None:
+                next.ph_child = v
+            self.slots[idx] = v
+            if self.first_known and (
+                self.first is None or core.ticks_diff(key, self.first.ph_key) < 0
+            ):
+                self.first = v
+
+    def push_head(self, v):
+        self.push_sorted(v, core.ticks())
+
+    def pop_head(self):
+        v = self.peek()
+        if v is None:
+            raise IndexError("empty heap")
+        self._unlink(v)
+        return v
+
+    def remove(self, v):
+        self._unlink(v)
+
+
 # Task class representing a coroutine, can be waited on and cancelled.
 class Task:
     def __init__(self, coro, globals=None):
         self.coro = coro  # Coroutine of this Task
         self.data = None  # General data for queue it is waiting on
-        self.state = True  # None, False, True or a TaskQueue instance
+        self.state = True  # None, False, True, a callable or a TaskQueue instance
         self.ph_key = 0  # Pairing heap
         self.ph_child = None  # Paring heap
         self.ph_child_last = None  # Paring heap
@@ -137,6 +290,9 @@ class Task:
         elif self.state is True:
             # Allocated head of linked list of Tasks waiting on completion of this task.
             self.state = TaskQueue()
+        elif type(self.state) is not TaskQueue:
+            # Task has state used for another purpose, so can't also wait on it.
+            raise RuntimeError("can't wait")
         return self
 
     def __next__(self):
@@ -0,0 +1,430 @@
+/*
+ * This file is part of the MicroPython project, http://micropython.org/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2026 agent
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include <string.h>
+
+#include "py/runtime.h"
+#include "py/stream.h"
+#include "py/mperrno.h"
+#include "py/unicode.h"
+#include "extmod/vfs.h"
+#include "extmod/webusb_fs.h"
+
+#if MICROPY_PY_WEBUSB_FS
+
+// The webusb filesystem protocol, spoken by the host over a vendor interface.  Each
+// request and response starts with a 12-byte header, packed as "<HIHI": the command,
+// the size of the payload that follows, 0xADDE as a check, and an id that the
+// response repeats.
+//
+// webusb.fs_poll() feeds this state machine from the vendor interface.  It handles
+// the file commands itself, going straight to the VFS, and passes other commands to
+// Python handlers set with webusb.fs_hook(), which are called as
+// handler(data, command, id, size, received, length) with a memoryview of the payload
+// received so far.  A handler returns True if it used the data, or False to be
+// called again with more of the payload appended (eg to get the rest of a name).
+
+#define HEADER_SIZE (12)
+#define HEADER_CHECK (0xADDE)
+#define BUFSIZE (MICROPY_PY_WEBUSB_FS_BUFSIZE)
+
+enum {
+    CMD_HEARTBEAT = 1,
+    CMD_READFILE = 4097,
+    CMD_WRITEFILE = 4098,
+    CMD_DELFILE = 4099,
+    CMD_DUPLFILE = 4100,
+    CMD_MVFILE = 4101,
+    CMD_MKDIR = 4102,
+};
+
+enum {
+    STATE_HEADER,
+    STATE_PAYLOAD,
+    STATE_SEND, // Sending a file for CMD_READFILE
+};
+
+typedef struct _webusb_fs_t {
+    mp_obj_t hooks; // dict mapping commands to Python handlers
+    mp_obj_t file; // File being sent, written or copied by the current request
+    mp_obj_t file2; // Destination of a copy
+    uint8_t state;
+    bool failed; // Whether the current CMD_WRITEFILE has failed
+    uint16_t command;
+    uint32_t size; // Payload size of the current request
+    uint32_t id;
+    uint32_t received; // Bytes of payload received
+    size_t hdr_len; // Bytes of hdr received
+    size_t pos; // Bytes of payload in buf
+    size_t out_pos; // Bytes of out sent
+    size_t out_len;
+    size_t tx_pos; // Bytes of buf sent, while sending a file
+    size_t tx_len;
+    uint8_t hdr[HEADER_SIZE];
+    uint8_t out[HEADER_SIZE + 16]; // A short response, sent before anything else
+    uint8_t buf[BUFSIZE];
+} webusb_fs_t;
+
+STATIC webusb_fs_t *webusb_fs_get(void) {
+    webusb_fs_t *fs = MP_STATE_VM(webusb_fs);
+    if (fs == NULL) {
+        fs = m_new0(webusb_fs_t, 1);
+        MP_STATE_VM(webusb_fs) = fs;
+    }
+    return fs;
+}
+
+STATIC uint32_t webusb_fs_get_u32(const uint8_t *p) {
+    return p[0] | p[1] << 8 | p[2] << 16 | (uint32_t)p[3] << 24;
+}
+
+STATIC void webusb_fs_put_u32(uint8_t *p, uint32_t v) {
+    p[0] = v;
+    p[1] = v >> 8;
+    p[2] = v >> 16;
+    p[3] = v >> 24;
+}
+
+// Queue the header of the response to the current request
+STATIC void webusb_fs_respond(webusb_fs_t *fs, uint32_t size) {
+    uint8_t *p = fs->out;
+    p[0] = fs->command;
+    p[1] = fs->command >> 8;
+    webusb_fs_put_u32(p + 2, size);
+    p[6] = HEADER_CHECK & 0xff;
+    p[7] = HEADER_CHECK >> 8;
+    webusb_fs_put_u32(p + 8, fs->id);
+    fs->out_pos = 0;
+    fs->out_len = HEADER_SIZE;
+}
+
+// Queue a response with a short payload, eg "ok" or "er" with its terminating zero
+STATIC void webusb_fs_respond_str(webusb_fs_t *fs, const char *str, size_t len) {
+    webusb_fs_respond(fs, len);
+    memcpy(fs->out + HEADER_SIZE, str, len);
+    fs->out_len += len;
+}
+
+#define webusb_fs_respond_status(fs, status) webusb_fs_respond_str((fs), (status), 3)
+
+// Send as much as possible of buf[*pos:len], returning whether all of it is sent
+STATIC bool webusb_fs_flush(const uint8_t *buf, size_t *pos, size_t len) {
+    while (*pos < len) {
+        mp_uint_t n = webusb_fs_tx(buf + *pos, len - *pos);
+        if (n == 0) {
+            return false;
+        }
+        *pos += n;
+    }
+    return true;
+}
+
+// Make a str of the name at the start of buf[:len], which ends at a zero byte
+STATIC mp_obj_t webusb_fs_name(const uint8_t *buf, size_t len) {
+    const uint8_t *end = memchr(buf, 0, len);
+    if (end != NULL) {
+        len = end - buf;
+    }
+    #if MICROPY_PY_BUILTINS_STR_UNICODE_CHECK
+    if (!utf8_check(buf, len)) {
+        mp_raise_msg(&mp_type_UnicodeError, NULL);
+    }
+    #endif
+    return mp_obj_new_str((const char *)buf, len);
+}
+
+STATIC mp_obj_t webusb_fs_open(mp_obj_t name, qstr mode) {
+    mp_obj_t args[2] = { name, MP_OBJ_NEW_QSTR(mode) };
+    return mp_vfs_open(2, args, (mp_map_t *)&mp_const_empty_map);
+}
+
+// Close the files of the current request, ignoring any errors
+STATIC void webusb_fs_close(webusb_fs_t *fs) {
+    mp_obj_t files[2] = { fs->file, fs->file2 };
+    fs->file = MP_OBJ_NULL;
+    fs->file2 = MP_OBJ_NULL;
+    for (size_t i = 0; i < 2; ++i) {
+        if (files[i] != MP_OBJ_NULL) {
+            nlr_buf_t nlr;
+            if (nlr_push(&nlr) == 0) {
+                mp_stream_close(files[i]);
+                nlr_pop();
+            }
+        }
+    }
+}
+
+STATIC void webusb_fs_readfile(webusb_fs_t *fs) {
+    nlr_buf_t nlr;
+    if (nlr_push(&nlr) == 0) {
+        mp_obj_t name = webusb_fs_name(fs->buf, fs->pos);
+        mp_obj_t *st;
+        mp_obj_get_array_fixed_n(mp_vfs_stat(name), 10, &st);
+        mp_uint_t size = mp_obj_get_int_truncated(st[6]);
+        fs->file = webusb_fs_open(name, MP_QSTR_rb);
+        nlr_pop();
+        webusb_fs_respond(fs, size);
+        fs->tx_pos = 0;
+        fs->tx_len = 0;
+        fs->state = STATE_SEND;
+    } else {
+        static const char msg[] = "Can't open file";
+        webusb_fs_respond_str(fs, msg, sizeof(msg) - 1);
+    }
+}
+
+// Called with each part of the payload, returns whether it was used
+STATIC bool webusb_fs_writefile(webusb_fs_t *fs, bool first, bool last) {
+    if (first) {
+        webusb_fs_close(fs);
+        fs->failed = false;
+    }
+    bool used = true;
+    nlr_buf_t nlr;
+    if (nlr_push(&nlr) == 0) {
+        if (fs->file != MP_OBJ_NULL) {
+            mp_stream_write(fs->file, fs->buf, fs->pos, MP_STREAM_RW_WRITE);
+        } else if (!fs->failed) {
+            // The payload starts with the file name, terminated by a zero byte
+            uint8_t *end = memchr(fs->buf, 0, fs->pos);
+            if (end == NULL) {
+                if (!last && fs->pos < BUFSIZE) {
+                    // Wait for the rest of the name
+                    used = false;
+                } else {
+                    fs->failed = true;
+                }
+            } else {
+                fs->file = webusb_fs_open(webusb_fs_name(fs->buf, fs->pos), MP_QSTR_wb);
+                ++end;
+                mp_stream_write(fs->file, end, fs->buf + fs->pos - end, MP_STREAM_RW_WRITE);
+            }
+        }
+        if (last && fs->file != MP_OBJ_NULL) {
+            mp_stream_close(fs->file);
+            fs->file = MP_OBJ_NULL;
+        }
+        nlr_pop();
+    } else {
+        used = true;
+        fs->failed = true;
+        webusb_fs_close(fs);
+    }
+    if (last) {
+        webusb_fs_respond_status(fs, fs->failed ? "er" : "ok");
+    }
+    return used;
+}
+
+// Copy a file, using buf
+STATIC void webusb_fs_copy(webusb_fs_t *fs, mp_obj_t source, mp_obj_t dest) {
+    fs->file = webusb_fs_open(source, MP_QSTR_rb);
+    fs->file2 = webusb_fs_open(dest, MP_QSTR_wb);
+    for (;;) {
+        int errcode;
+        mp_uint_t n = mp_stream_rw(fs->file, fs->buf, BUFSIZE, &errcode, MP_STREAM_RW_READ);
+        if (errcode != 0) {
+            mp_raise_OSError(errcode);
+        }
+        if (n == 0) {
+            break;
+        }
+        mp_stream_write(fs->file2, fs->buf, n, MP_STREAM_RW_WRITE);
+    }
+    mp_stream_close(fs->file2);
+    fs->file2 = MP_OBJ_NULL;
+    webusb_fs_close(fs);
+}
+
+// Commands that act on one or two names once the whole payload has arrived
+STATIC void webusb_fs_namecmd(webusb_fs_t *fs) {
+    nlr_buf_t nlr;
+    if (nlr_push(&nlr) == 0) {
+        mp_obj_t name = webusb_fs_name(fs->buf, fs->pos);
+        if (fs->command == CMD_DELFILE) {
+            mp_vfs_remove(name);
+        } else if (fs->command == CMD_MKDIR) {
+            mp_vfs_mkdir(name);
+        } else {
+            // The two names are separated by a zero byte
+            uint8_t *end = memchr(fs->buf, 0, fs->pos);
+            if (end == NULL || end == fs->buf || end + 1 == fs->buf + fs->pos || end[1] == 0) {
+                mp_raise_OSError(MP_EINVAL);
+            }
+            ++end;
+            mp_obj_t name2 = webusb_fs_name(end, fs->buf + fs->pos - end);
+            if (fs->command == CMD_MVFILE) {
+                mp_vfs_rename(name, name2);
+            } else {
+                webusb_fs_copy(fs, name, name2);
+            }
+        }
+        nlr_pop();
+        webusb_fs_respond_status(fs, "ok");
+    } else {
+        webusb_fs_close(fs);
+        webusb_fs_respond_status(fs, "er");
+    }
+}
+
+// Pass the payload in buf to the handler for the current command
+STATIC void webusb_fs_dispatch(webusb_fs_t *fs) {
+    bool first = fs->received == fs->pos;
+    bool last = fs->received == fs->size;
+    bool used = true;
+
+    mp_map_elem_t *hook = NULL;
+    if (fs->hooks != MP_OBJ_NULL) {
+        hook = mp_map_lookup(mp_obj_dict_get_map(fs->hooks), MP_OBJ_NEW_SMALL_INT(fs->command), MP_MAP_LOOKUP);
+    }
+    if (hook != NULL) {
+        mp_obj_t args[6] = {
+            mp_obj_new_memoryview('B', fs->pos, fs->buf),
+            MP_OBJ_NEW_SMALL_INT(fs->command),
+            mp_obj_new_int_from_uint(fs->id),
+            mp_obj_new_int_from_uint(fs->size),
+            mp_obj_new_int_from_uint(fs->received),
+            MP_OBJ_NEW_SMALL_INT(fs->pos),
+        };
+        nlr_buf_t nlr;
+        if (nlr_push(&nlr) == 0) {
+            used = mp_obj_is_true(mp_call_function_n_kw(hook->value, 6, 0, args));
+            nlr_pop();
+        } else {
+            // Drop the rest of the request and pass on the exception
+            fs->state = STATE_HEADER;
+            fs->pos = 0;
+            nlr_jump(nlr.ret_val);
+        }
+    } else if (fs->command == CMD_WRITEFILE) {
+        used = webusb_fs_writefile(fs, first, last);
+    } else if (!last) {
+        // The other commands need the whole payload
+        used = false;
+    } else if (fs->command == CMD_HEARTBEAT) {
+        webusb_fs_respond_status(fs, "ok");
+    } else if (fs->command == CMD_READFILE) {
+        webusb_fs_readfile(fs);
+    } else if (fs->command >= CMD_DELFILE && fs->command <= CMD_MKDIR) {
+        webusb_fs_namecmd(fs);
+    }
+
+    if (used || fs->pos == BUFSIZE) {
+        fs->pos = 0;
+    }
+    if (last && fs->state == STATE_PAYLOAD) {
+        fs->state = STATE_HEADER;
+    }
+}
+
+// Do one step of handling requests, returning false if it has to wait for the host
+STATIC bool webusb_fs_step(webusb_fs_t *fs) {
+    if (!webusb_fs_flush(fs->out, &fs->out_pos, fs->out_len)) {
+        return false;
+    }
+
+    if (fs->state == STATE_SEND) {
+        if (fs->tx_pos == fs->tx_len) {
+            int errcode;
+            fs->tx_pos = 0;
+            fs->tx_len = mp_stream_rw(fs->file, fs->buf, BUFSIZE, &errcode, MP_STREAM_RW_READ);
+            if (errcode != 0 || fs->tx_len == 0) {
+                fs->tx_len = 0;
+                webusb_fs_close(fs);
+                fs->state = STATE_HEADER;
+            }
+            return true;
+        }
+        return webusb_fs_flush(fs->buf, &fs->tx_pos, fs->tx_len);
+    }
+
+    if (fs->state == STATE_HEADER) {
+        mp_uint_t n = webusb_fs_rx(fs->hdr + fs->hdr_len, HEADER_SIZE - fs->hdr_len);
+        if (n == 0) {
+            return false;
+        }
+        fs->hdr_len += n;
+        if (fs->hdr_len < HEADER_SIZE) {
+            return true;
+        }
+        fs->hdr_len = 0;
+        if ((fs->hdr[6] | fs->hdr[7] << 8) != HEADER_CHECK) {
+            // Lost track of the requests, drop whatever has arrived
+            while (webusb_fs_rx(fs->buf, BUFSIZE)) {
+            }
+            return true;
+        }
+        fs->command = fs->hdr[0] | fs->hdr[1] << 8;
+        fs->size = webusb_fs_get_u32(fs->hdr + 2);
+        fs->id = webusb_fs_get_u32(fs->hdr + 8);
+        fs->received = 0;
+        fs->pos = 0;
+        fs->state = STATE_PAYLOAD;
+        if (fs->size == 0) {
+            webusb_fs_dispatch(fs);
+        }
+        return true;
+    }
+
+    // Receive as much of the payload as fits in buf before passing it on
+    mp_uint_t n = webusb_fs_rx(fs->buf + fs->pos, MIN(BUFSIZE - fs->pos, fs->size - fs->received));
+    if (n == 0) {
+        return false;
+    }
+    fs->pos += n;
+    fs->received += n;
+    if (fs->pos == BUFSIZE || fs->received == fs->size) {
+        webusb_fs_dispatch(fs);
+    }
+    return true;
+}
+
+STATIC mp_obj_t webusb_fs_poll(void) {
+    webusb_fs_t *fs = webusb_fs_get();
+    while (webusb_fs_step(fs)) {
+    }
+    // Return whether a request is still being handled
+    return mp_obj_new_bool(fs->state != STATE_HEADER || fs->hdr_len != 0 || fs->out_pos < fs->out_len);
+}
+MP_DEFINE_CONST_FUN_OBJ_0(webusb_fs_poll_obj, webusb_fs_poll);
+
+// Set the Python handler for a command, or remove it if handler is None
+STATIC mp_obj_t webusb_fs_hook(mp_obj_t command_in, mp_obj_t handler_in) {
+    webusb_fs_t *fs = webusb_fs_get();
+    if (fs->hooks == MP_OBJ_NULL) {
+        fs->hooks = mp_obj_new_dict(0);
+    }
+    mp_obj_t command = MP_OBJ_NEW_SMALL_INT(mp_obj_get_int(command_in));
+    if (handler_in == mp_const_none) {
+        mp_map_lookup(mp_obj_dict_get_map(fs->hooks), command, MP_MAP_LOOKUP_REMOVE_IF_FOUND);
+    } else {
+        mp_obj_dict_store(fs->hooks, command, handler_in);
+    }
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_2(webusb_fs_hook_obj, webusb_fs_hook);
+
+#endif // MICROPY_PY_WEBUSB_FS
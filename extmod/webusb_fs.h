@@ -0,0 +1,46 @@
+/*
+ * This file is part of the MicroPython project, http://micropython.org/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2026 agent
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+#ifndef MICROPY_INCLUDED_EXTMOD_WEBUSB_FS_H
+#define MICROPY_INCLUDED_EXTMOD_WEBUSB_FS_H
+
+#include "py/obj.h"
+
+// Size of the buffer that request payloads and file data go through, which should
+// match the vendor interface FIFOs
+#ifndef MICROPY_PY_WEBUSB_FS_BUFSIZE
+#define MICROPY_PY_WEBUSB_FS_BUFSIZE (512)
+#endif
+
+// Provided by the port to move data over the vendor interface.  Neither may block:
+// they return the number of bytes moved, which is 0 if none can be.
+mp_uint_t webusb_fs_rx(uint8_t *buf, mp_uint_t len);
+mp_uint_t webusb_fs_tx(const uint8_t *buf, mp_uint_t len);
+
+// For the port's webusb module
+MP_DECLARE_CONST_FUN_OBJ_0(webusb_fs_poll_obj);
+MP_DECLARE_CONST_FUN_OBJ_2(webusb_fs_hook_obj);
+
+#endif // MICROPY_INCLUDED_EXTMOD_WEBUSB_FS_H
@@ -0,0 +1,1073 @@
+Q(ArithmeticError)
+
+Q(ArithmeticError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AttributeError)
+
+Q(AttributeError)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(EOFError)
+
+Q(EOFError)
+
+Q(Ellipsis)
+
+Q(Ellipsis)
+
+Q(Exception)
+
+Q(Exception)
+
+Q(GeneratorExit)
+
+Q(GeneratorExit)
+
+Q(ImportError)
+
+Q(ImportError)
+
+Q(IndentationError)
+
+Q(IndentationError)
+
+Q(IndexError)
+
+Q(IndexError)
+
+Q(KeyError)
+
+Q(KeyError)
+
+Q(KeyboardInterrupt)
+
+Q(KeyboardInterrupt)
+
+Q(LookupError)
+
+Q(LookupError)
+
+Q(MemoryError)
+
+Q(MemoryError)
+
+Q(NameError)
+
+Q(NameError)
+
+Q(None)
+
+Q(NoneType)
+
+Q(NotImplementedError)
+
+Q(NotImplementedError)
+
+Q(OSError)
+
+Q(OSError)
+
+Q(OverflowError)
+
+Q(OverflowError)
+
+Q(RuntimeError)
+
+Q(RuntimeError)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopIteration)
+
+Q(StopIteration)
+
+Q(SyntaxError)
+
+Q(SyntaxError)
+
+Q(SystemExit)
+
+Q(SystemExit)
+
+Q(TypeError)
+
+Q(TypeError)
+
+Q(UnicodeError)
+
+Q(UnicodeError)
+
+Q(ValueError)
+
+Q(ValueError)
+
+Q(ViperTypeError)
+
+Q(ViperTypeError)
+
+Q(ZeroDivisionError)
+
+Q(ZeroDivisionError)
+
+Q(_0x0a_)
+
+Q(__add__)
+
+Q(__aenter__)
+
+Q(__aenter__)
+
+Q(__aexit__)
+
+Q(__aexit__)
+
+Q(__aiter__)
+
+Q(__anext__)
+
+Q(__bases__)
+
+Q(__bool__)
+
+Q(__build_class__)
+
+Q(__call__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__contains__)
+
+Q(__contains__)
+
+Q(__delitem__)
+
+Q(__delitem__)
+
+Q(__dict__)
+
+Q(__dict__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__eq__)
+
+Q(__eq__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__ge__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__gt__)
+
+Q(__hash__)
+
+Q(__iadd__)
+
+Q(__import__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__int__)
+
+Q(__isub__)
+
+Q(__iter__)
+
+Q(__le__)
+
+Q(__len__)
+
+Q(__lt__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__module__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__ne__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__qualname__)
+
+Q(__repl_print__)
+
+Q(__repl_print__)
+
+Q(__repr__)
+
+Q(__repr__)
+
+Q(__reversed__)
+
+Q(__setitem__)
+
+Q(__setitem__)
+
+Q(__str__)
+
+Q(__sub__)
+
+Q(__traceback__)
+
+Q(_brace_open__colon__hash_b_brace_close_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_string_gt_)
+
+Q(_percent__hash_o)
+
+Q(_percent__hash_x)
+
+Q(_space_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(abs)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(addi)
+
+Q(align)
+
+Q(all)
+
+Q(and_)
+
+Q(and_)
+
+Q(any)
+
+Q(append)
+
+Q(append)
+
+Q(args)
+
+Q(asm_thumb)
+
+Q(asm_xtensa)
+
+Q(asr)
+
+Q(b)
+
+Q(ball)
+
+Q(bany)
+
+Q(bbc)
+
+Q(bbs)
+
+Q(beq)
+
+Q(beqz)
+
+Q(bge)
+
+Q(bgeu)
+
+Q(bin)
+
+Q(bl)
+
+Q(blt)
+
+Q(bnall)
+
+Q(bne)
+
+Q(bnez)
+
+Q(bnone)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bound_method)
+
+Q(builtins)
+
+Q(builtins)
+
+Q(bx)
+
+Q(bytearray)
+
+Q(bytearray)
+
+Q(bytecode)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(calcsize)
+
+Q(callable)
+
+Q(callx0)
+
+Q(chr)
+
+Q(classmethod)
+
+Q(classmethod)
+
+Q(clear)
+
+Q(clear)
+
+Q(clear)
+
+Q(close)
+
+Q(close)
+
+Q(closure)
+
+Q(clz)
+
+Q(cmp)
+
+Q(complex)
+
+Q(complex)
+
+Q(const)
+
+Q(const)
+
+Q(copy)
+
+Q(copy)
+
+Q(copy)
+
+Q(count)
+
+Q(count)
+
+Q(count)
+
+Q(count)
+
+Q(cpsid)
+
+Q(cpsie)
+
+Q(data)
+
+Q(decode)
+
+Q(decode)
+
+Q(default)
+
+Q(delattr)
+
+Q(deleter)
+
+Q(dict)
+
+Q(dict)
+
+Q(dict_view)
+
+Q(difference)
+
+Q(difference_update)
+
+Q(dir)
+
+Q(discard)
+
+Q(divmod)
+
+Q(doc)
+
+Q(encode)
+
+Q(end)
+
+Q(endswith)
+
+Q(endswith)
+
+Q(enumerate)
+
+Q(enumerate)
+
+Q(errno)
+
+Q(eval)
+
+Q(exec)
+
+Q(extend)
+
+Q(extend)
+
+Q(filter)
+
+Q(filter)
+
+Q(find)
+
+Q(find)
+
+Q(float)
+
+Q(float)
+
+Q(format)
+
+Q(format)
+
+Q(from_bytes)
+
+Q(fromkeys)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(generator)
+
+Q(generator)
+
+Q(generator)
+
+Q(get)
+
+Q(getattr)
+
+Q(getter)
+
+Q(globals)
+
+Q(hasattr)
+
+Q(hash)
+
+Q(heap_lock)
+
+Q(heap_unlock)
+
+Q(hex)
+
+Q(id)
+
+Q(imag)
+
+Q(index)
+
+Q(index)
+
+Q(index)
+
+Q(index)
+
+Q(insert)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(intersection)
+
+Q(intersection_update)
+
+Q(isalpha)
+
+Q(isalpha)
+
+Q(isdigit)
+
+Q(isdigit)
+
+Q(isdisjoint)
+
+Q(isinstance)
+
+Q(islower)
+
+Q(islower)
+
+Q(isspace)
+
+Q(isspace)
+
+Q(issubclass)
+
+Q(issubset)
+
+Q(issuperset)
+
+Q(isupper)
+
+Q(isupper)
+
+Q(items)
+
+Q(iter)
+
+Q(iterable)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(j)
+
+Q(join)
+
+Q(join)
+
+Q(jx)
+
+Q(key)
+
+Q(key)
+
+Q(keys)
+
+Q(keys)
+
+Q(l16si)
+
+Q(l16ui)
+
+Q(l32i)
+
+Q(l8ui)
+
+Q(label)
+
+Q(ldr)
+
+Q(ldrb)
+
+Q(ldrex)
+
+Q(ldrh)
+
+Q(len)
+
+Q(list)
+
+Q(list)
+
+Q(little)
+
+Q(little)
+
+Q(little)
+
+Q(locals)
+
+Q(lower)
+
+Q(lower)
+
+Q(lsl)
+
+Q(lsr)
+
+Q(lstrip)
+
+Q(lstrip)
+
+Q(map)
+
+Q(map)
+
+Q(max)
+
+Q(maximum_space_recursion_space_depth_space_exceeded)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(min)
+
+Q(module)
+
+Q(mov)
+
+Q(mov)
+
+Q(mov)
+
+Q(mov_n)
+
+Q(movi)
+
+Q(movt)
+
+Q(movw)
+
+Q(movwt)
+
+Q(mrs)
+
+Q(mull)
+
+Q(native)
+
+Q(next)
+
+Q(nop)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(oct)
+
+Q(opt_level)
+
+Q(or_)
+
+Q(ord)
+
+Q(pack)
+
+Q(pack_into)
+
+Q(pend_throw)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(popitem)
+
+Q(pow)
+
+Q(print)
+
+Q(property)
+
+Q(property)
+
+Q(ptr)
+
+Q(ptr)
+
+Q(ptr16)
+
+Q(ptr16)
+
+Q(ptr32)
+
+Q(ptr32)
+
+Q(ptr8)
+
+Q(ptr8)
+
+Q(push)
+
+Q(range)
+
+Q(range)
+
+Q(range)
+
+Q(rbit)
+
+Q(real)
+
+Q(remove)
+
+Q(remove)
+
+Q(replace)
+
+Q(replace)
+
+Q(repr)
+
+Q(ret_n)
+
+Q(reverse)
+
+Q(reverse)
+
+Q(reversed)
+
+Q(reversed)
+
+Q(rfind)
+
+Q(rfind)
+
+Q(rindex)
+
+Q(rindex)
+
+Q(round)
+
+Q(rsplit)
+
+Q(rsplit)
+
+Q(rstrip)
+
+Q(rstrip)
+
+Q(s16i)
+
+Q(s32i)
+
+Q(s8i)
+
+Q(sdiv)
+
+Q(send)
+
+Q(send)
+
+Q(sep)
+
+Q(set)
+
+Q(set)
+
+Q(setattr)
+
+Q(setdefault)
+
+Q(setter)
+
+Q(slice)
+
+Q(slice)
+
+Q(sort)
+
+Q(sorted)
+
+Q(split)
+
+Q(split)
+
+Q(start)
+
+Q(start)
+
+Q(startswith)
+
+Q(startswith)
+
+Q(staticmethod)
+
+Q(staticmethod)
+
+Q(step)
+
+Q(stop)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(strb)
+
+Q(strex)
+
+Q(strh)
+
+Q(strip)
+
+Q(strip)
+
+Q(sub)
+
+Q(sub)
+
+Q(sub)
+
+Q(sum)
+
+Q(super)
+
+Q(super)
+
+Q(super)
+
+Q(symmetric_difference)
+
+Q(symmetric_difference_update)
+
+Q(throw)
+
+Q(throw)
+
+Q(to_bytes)
+
+Q(tuple)
+
+Q(tuple)
+
+Q(type)
+
+Q(type)
+
+Q(udiv)
+
+Q(uint)
+
+Q(uint)
+
+Q(uint)
+
+Q(union)
+
+Q(unpack)
+
+Q(unpack_from)
+
+Q(update)
+
+Q(update)
+
+Q(upper)
+
+Q(upper)
+
+Q(ustruct)
+
+Q(ustruct)
+
+Q(utf_hyphen_8)
+
+Q(utf_hyphen_8)
+
+Q(value)
+
+Q(values)
+
+Q(vcmp)
+
+Q(vcvt_f32_s32)
+
+Q(vcvt_s32_f32)
+
+Q(viper)
+
+Q(vldr)
+
+Q(vmov)
+
+Q(vmrs)
+
+Q(vneg)
+
+Q(vsqrt)
+
+Q(vstr)
+
+Q(wfi)
+
+Q(xor)
+
+Q(zip)
+
+Q(zip)
+
+Q(zip)
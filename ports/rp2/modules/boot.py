@@ -7,6 +7,7 @@ micropython.alloc_emergency_exception_buf(100)
 if webusb.mode() == 1:
     print("launching webusb_fs")
     import webusb_fs
+    webusb_fs.main()
 elif webusb.mode() == 2:
     print("Starting app")
     try:
@@ -16,5 +17,6 @@ elif webusb.mode() == 2:
         os.remove("/startup.txt")        
     except:
         import webusb_fs
+        webusb_fs.main()
     finally:
         __import__(mod)
@@ -1,28 +1,36 @@
 import webusb
 import struct
 import os
-import gc
-from time import sleep
-import time
+import utime
 import machine
+import uio
+import uzlib
+from micropython import const
 
-rwbuf = bytearray(32)
-rwbuf_mv = memoryview(rwbuf)
+# The framing of the protocol, and the heartbeat and file commands, are handled in C
+# by webusb.fs_poll().  The commands below are passed to Python with webusb.fs_hook.
+
+header = bytearray(12)
+header_mv = memoryview(header)
 
 def sendpayload(payload):
-    mv = memoryview(payload)
-    size = len(payload)
-    pos = 0
-    while pos < size:
-        pos += webusb.send(mv[pos:])
+    n = webusb.send(payload)
+    if n < len(payload):
+        # The FIFO is full, wait for it to take the rest
+        mv = memoryview(payload)
+        while n < len(mv):
+            n += webusb.send(mv[n:])
 
 def createheader(mv, command, size, id):
-    mv[0:12] = struct.pack("<HIHI", command, size, 0xADDE, id)
+    struct.pack_into("<HIHI", mv, 0, command, size, 0xADDE, id)
 
 def sendheader(command, id, size):
-    payload = bytearray(12)
-    createheader(memoryview(payload), command, size, id)
-    sendpayload(payload)
+    createheader(header_mv, command, size, id)
+    sendpayload(header)
+
+# Decode a file name from a request payload, dropping any terminating zero bytes
+def getstr(data):
+    return str(data, "utf-8").replace("\x00", "")
 
 def sender(command, id):
     payload = bytearray(12+3)
@@ -54,247 +62,241 @@ def sendstr(command, id, data):
     payload[12:] = data.encode()
     sendpayload(payload)
 
-def heartbeat(data, command, id, size, received, length):
-    if size != received:
-        return 0
-    sendok(command, id)
-    return 1
+# Directory listings are streamed through this buffer, a FIFO's worth at a time,
+# rather than being built up in memory
+out = bytearray(512)
+out_mv = memoryview(out)
+out_len = 0
+out_left = 0
+
+def flush():
+    global out_len
+    sendpayload(out_mv[:out_len])
+    out_len = 0
+
+# Add data to the response being streamed, up to the size given in its header
+def put(data):
+    global out_len, out_left
+    mv = memoryview(data)[:out_left]
+    out_left -= len(mv)
+    while len(mv):
+        n = min(len(mv), len(out) - out_len)
+        out_mv[out_len : out_len + n] = mv[:n]
+        out_len += n
+        mv = mv[n:]
+        if out_len == len(out):
+            flush()
+
+# Start streaming a response with a payload of the given size
+def startstream(command, id, size):
+    global out_left
+    sendheader(command, id, size)
+    out_left = size
+
+# Finish the response, padding it if the directory shrank since it was measured
+def endstream():
+    while out_left:
+        put(b"\n")
+    flush()
+
+def joinpath(dir, name):
+    if dir.endswith(b"/"):
+        return dir + name
+    return dir + b"/" + name
+
+# Call fn(path, name, type) for each entry of dir, and of its subdirectories if
+# recursive is set, using the entry types given by ilistdir rather than stat
+def walk(dir, recursive, fn):
+    for entry in os.ilistdir(dir):
+        path = joinpath(dir, entry[0])
+        fn(path, entry[0], entry[1])
+        if recursive and entry[1] == 0x4000:
+            walk(path, True, fn)
+
+# A listing of dir, for getdir, is the name of dir and then a line for each entry,
+# of "d" or "f" and its name.  A recursive listing, for gettree, is the name of dir
+# and then a line for every entry below it, of "d" or "f", its size and mtime as
+# 8 hex digits each, and its path, eg "f 000004d2 2a3b4c5d /lib/module.py".  Both
+# are measured before being sent, so that the size can go in the header.
+TREE_FIELDS = const(20)
+
+def listdir(command, id, dir, recursive):
+    size = len(dir)
+
+    def measure(path, name, type):
+        nonlocal size
+        if recursive:
+            size += 1 + TREE_FIELDS + len(path)
+        else:
+            size += 2 + len(name)
+
+    walk(dir, recursive, measure)
+
+    def send(path, name, type):
+        put(b"\nd" if type == 0x4000 else b"\nf")
+        if recursive:
+            st = os.stat(path)
+            put((" %08x %08x " % (st[6], st[8] & 0xFFFFFFFF)).encode())
+            put(path)
+        else:
+            put(name)
+
+    startstream(command, id, size)
+    put(dir)
+    walk(dir, recursive, send)
+    endstream()
 
 def getdir(data, command, id, size, received, length):
     if size != received:
         return 0
-    
-    if size == 0 or size == 1 or size == 2:
-        response = "/\n"
-        for f in os.listdir("/"):
-            if os.stat("/"+f)[0] == 16384:
-                response += "d"
-            else:
-                response += "f"
-            response += f
-            response += "\n"
-        sendstr(command, id, response[:-1])
-    else:
-        dir = str(data,'utf-8').replace("\x00", "")
-        rootdir = dir
-        for f in os.listdir(dir):
-            if not f:
-                break
-            dir += "\n"
-            if os.stat(rootdir+"/"+f)[0] == 16384:
-                dir += "d"
-            else:
-                dir += "f"
-            dir += f
-            
-        sendstr(command, id, dir)
-
+    dir = bytes(data).replace(b"\x00", b"") if size > 2 else b""
+    listdir(command, id, dir or b"/", False)
     return 1
 
-def readfile(data, command, id, size, received, length):
-    global rwbuf_mv
-    if size != received:
-        return 0
-
-    try:
-        filename = str(data, "utf-8").replace("\x00", "")
-        filesize = os.stat(filename)[6]        
-        f = open(str(data, "utf-8"), "rb")
-        sendheader(command, id, filesize)
-        while True:
-            num = f.readinto(rwbuf_mv)
-            if not num:
-                break
-            sendpayload(rwbuf_mv[:num])
-            gc.collect()
-        f.close()
-    except:
-        sendstr(command, id, "Can't open file")
-
-write_obj = None
-write_failed = 0
-def writefile(data, command, id, size, received, length):
-    global write_obj, write_failed
-    
-    if received == length:
-        if write_obj:
-            write_obj.close()
-            write_obj = None
-        write_failed = 0
-
-    if write_obj == None and write_failed == 0:
-        for i in range(0, received):
-            if data[i] == 0x00:
-                filename = str(data[0:i], "utf-8").replace("\x00", "")
-                try:
-                    write_obj = open(filename, "wb")
-                    if received > i:
-                        write_obj.write(data[i+1:received])
-                        print("writing")
-                except:
-                    write_failed = 1
-
-                if received == size:
-                    if write_obj:
-                        sendok(command, id)
-                        write_obj.close()
-                        write_obj = None
-                    else:
-                        sender(command, id)
-
-                return 1
-        return 0
-    elif write_obj:
-        print("writing_start")
-        write_obj.write(data)
-        print("writing")
-        if received == size:
-            write_obj.close()
-            sendok(command, id)
-            write_obj = None
-        return 1
-    else:
-        if received == size:
-            sender(command, id)
-        return 1
-
-
-def delfile(data, command, id, size, received, length):
+def gettree(data, command, id, size, received, length):
     if size != received:
         return 0
-
-    try:
-        os.remove(str(data, "utf-8").replace("\x00", ""))
-        sendok(command, id)
-    except:
-        sender(command, id)
+    dir = bytes(data).replace(b"\x00", b"")
+    listdir(command, id, dir or b"/", True)
     return 1
 
-def duplfile(data, command, id, size, received, length):
+def runfile(data, command, id, size, received, length):
     if size != received:
         return 0
-    
-    source = ""
-    dest = ""
-    for i in range(0, size):
-        if data[i] == 0x00:
-            source = str(data[0:i], "utf-8").replace("\x00", "")
-            dest = str(data[(i+1):], "utf-8").replace("\x00", "")
-    
-    if source == "" or dest == "":
-        sender(command, id)
-        return 1
-    
-    try:
-        fsource = open(source, "rb")
-        fdest = open(dest, "wb")
-        while True:
-            data = fsource.read(32)
-            if not data:
-                break
-            fdest.write(data)
-        fsource.close()
-        fdest.close()
-        sendok(command, id)
-    except:
-        sender(command, id)
+    f = open("/startup.txt", "w")
+    f.write(getstr(data))
+    f.close()
+    sendok(command, id)
 
-    return 1
+# Capabilities that a host can ask for by sending a heartbeat with a payload, of the
+# names of the capabilities it has, each followed by a zero byte.  The reply is "ok"
+# and its zero byte, followed by those of the names that are supported here.  A
+# heartbeat without a payload is answered with "ok" alone, as it always has been.
+CAPS = (b"deflate",)
 
-def mvfile(data, command, id, size, received, length):
+def heartbeat(data, command, id, size, received, length):
     if size != received:
         return 0
-    
-    source = ""
-    dest = ""
-    for i in range(0, size):
-        if data[i] == 0:
-            source = str(data[0:i], "utf-8").replace("\x00", "")
-            dest = str(data[(i+1):], "utf-8").replace("\x00", "")
-            break
-    if source == "" or dest == "":
-        sender(command, id)
-        return 1
-
-    try:
-        os.rename(source, dest)
-        sendok(command, id)
-    except:
-        sender(command, id)
-
+    response = b"ok\x00"
+    if size:
+        for cap in bytes(data).split(b"\x00"):
+            if cap in CAPS:
+                response += cap + b"\x00"
+    sendheader(command, id, len(response))
+    sendpayload(response)
     return 1
 
-def mkdir(data, command, id, size, received, length):
-    if size != received:
-        return 0
+# With the "deflate" capability, writefile_deflate (4104) writes a file like
+# writefile (4098), but its payload is the name and its zero byte followed by
+# frames, each a little-endian 16-bit length and then that many bytes, at most
+# DEFLATE_FRAME, of raw DEFLATE data with a window of 2**DEFLATE_WBITS bytes.  The
+# frames are compressed independently, so each can be inflated into the file as soon
+# as it has arrived; tools/webusb_fs.py makes them on the host.
+DEFLATE_WBITS = const(11)
+DEFLATE_FRAME = const(2048)
+
+# The frame being received goes into frame_src, to be inflated from there
+frame_src = uio.BytesIO(DEFLATE_FRAME)
+frame_len = bytearray(2)
+inflated = bytearray(512)
+inflated_mv = memoryview(inflated)
+
+deflate_file = None
+deflate_failed = False
+deflate_have = 0  # Bytes of the current frame received, including its length
+deflate_need = 2  # Bytes of the current frame, once its length is known
+
+def inflateframe():
+    frame_src.seek(0)
+    d = uzlib.DecompIO(frame_src, -DEFLATE_WBITS)
+    while True:
+        k = d.readinto(inflated_mv)
+        if not k:
+            break
+        deflate_file.write(inflated_mv[:k])
 
-    try:
-        os.mkdir(str(data, "utf-8").replace("\x00", ""))
-        sendok(command, id)
-    except:
-        sender(command, id)
+def writedeflate(data, command, id, size, received, length):
+    global deflate_file, deflate_failed, deflate_have, deflate_need
+    start = 0
+    if received == length:
+        # First data of the request, which starts with the name.  This is a full
+        # buffer unless it is the whole request, so a name without its zero byte
+        # here is too long and the rest of the request is dropped.
+        if deflate_file:
+            deflate_file.close()
+            deflate_file = None
+        frame_src.seek(0)
+        deflate_have = 0
+        deflate_need = 2
+        deflate_failed = True
+        for start in range(length):
+            if data[start] == 0:
+                break
+        else:
+            start = length
+            if received < size:
+                return 1
+        try:
+            deflate_file = open(getstr(data[:start]), "wb")
+            deflate_failed = False
+        except (OSError, ValueError):
+            pass
+        start += 1
+
+    while start < length and deflate_file is not None and not deflate_failed:
+        n = min(deflate_need - deflate_have, length - start)
+        if deflate_have < 2:
+            frame_len[deflate_have : deflate_have + n] = data[start : start + n]
+        else:
+            frame_src.write(data[start : start + n])
+        deflate_have += n
+        start += n
+        if deflate_have < deflate_need:
+            break
+        if deflate_need == 2:
+            n = frame_len[0] | frame_len[1] << 8
+            deflate_need += n
+            if n == 0 or n > DEFLATE_FRAME:
+                deflate_failed = True
+            continue
+        try:
+            inflateframe()
+        except (OSError, ValueError, EOFError):
+            deflate_failed = True
+        frame_src.seek(0)
+        deflate_have = 0
+        deflate_need = 2
+
+    if received == size:
+        if deflate_file:
+            deflate_file.close()
+            deflate_file = None
+        if deflate_failed or deflate_have:
+            sender(command, id)
+        else:
+            sendok(command, id)
     return 1
 
-def runfile(data, command, id, size, received, length):
-    if size != received:
-        return 0
-    f = open("/startup.txt", "w")
-    f.write(str(data, "utf-8").replace("\x00", ""))
-    f.close()
-    sendok(command, id)
+webusb.fs_hook(0, runfile)
+webusb.fs_hook(1, heartbeat)
+webusb.fs_hook(4096, getdir)
+webusb.fs_hook(4103, gettree)
+webusb.fs_hook(4104, writedeflate)
 
 def main_app():
-    commands = dict()
-    commands[0] = runfile
-    commands[1] = heartbeat
-    commands[4096] = getdir
-    commands[4097] = readfile
-    commands[4098] = writefile
-    commands[4099] = delfile
-    commands[4100] = duplfile
-    commands[4101] = mvfile
-    commands[4102] = mkdir
-
-    header = bytearray(12)
-
     #Clear webusb buffer
-    while webusb.read(memoryview(header)):
+    while webusb.read(header_mv):
         pass
 
-    payload = bytearray(1024)
-    payload_mv = memoryview(payload)
     lastmessage = 0
     while True:
-        if time.time() - lastmessage > 30:
+        if utime.time() - lastmessage > 30:
             print("In FS mode, reboot badge to switch to repl mode")
-            lastmessage = time.time()
+            lastmessage = utime.time()
         if webusb.reboot():
             machine.soft_reset()
-        if webusb.available() >= 12:
-            gc.collect()
-            #print(gc.mem_free())
-            webusb.read(memoryview(header))
-            [command, size, check, id] = struct.unpack("<HIHI", memoryview(header))
-            if check == 0xADDE:
-                pos = 0
-                received = 0
-                if size == 0:
-                    if command in commands:
-                        commands[command](payload_mv, command, id, size, 0, 0)
-                else:
-                    while received < size:
-                        endbuf = min(256, size - (received-pos))
-                        delta = webusb.read(payload_mv[pos:endbuf])
-                        received += delta
-                        pos += delta                
-                        if command in commands:
-                            #print(str(command)+".."+str(pos)+".."+str(received)+".."+str(size))
-                            if commands[command](payload_mv[:pos], command, id, size, received, pos):
-                                pos = 0
-                        gc.collect()
-                
-            else:   #Check failed clearing buffer
-                while webusb.read(memoryview(header)):
-                    pass
-webusb.setmode(1)
-main_app()
\ No newline at end of file
+        webusb.fs_poll()
+
+def main():
+    webusb.setmode(1)
+    main_app()
@@ -2,15 +2,24 @@ import webusb
 import struct
 import os
 import uasyncio
-import io
+import uio
+from micropython import const
 
 MP_STREAM_POLL_RD = const(1)
 MP_STREAM_POLL_WR = const(4)
 MP_STREAM_POLL = const(3)
 MP_STREAM_ERROR = const(-1)
 
-class WebUSBFS(io.IOBase):
-    def __init__(self):        
+# Size of the vendor interface FIFOs, and so of the chunks that file data is moved in
+CHUNK = const(512)
+
+# The webusb filesystem server, as a uasyncio task.  Reads and writes of the vendor
+# interface go through the stream below, so the task only runs when the poller says
+# webusb can take or give data: it waits rather than spinning while the host is slow,
+# and sends only as fast as the FIFO drains, leaving the CPU to other tasks.  Data
+# moves through buffers allocated up front, so a transfer doesn't allocate per chunk.
+class WebUSBFS(uio.IOBase):
+    def __init__(self):
         self.commands = dict()
         self.commands[1] = self.heartbeat
         self.commands[4096] = self.getdir
@@ -28,15 +37,23 @@ class WebUSBFS(io.IOBase):
 
         self.header = bytearray(12)
         self.header_mv = memoryview(self.header)
+        # Short responses, eg "ok" with its terminating zero
+        self.status = bytearray(12 + 3)
+        self.status_mv = memoryview(self.status)
         #Clear webusb buffer
-        while webusb.read(memoryview(self.header)):
+        while webusb.read(self.header_mv):
             pass
 
         self.payload = bytearray(1024)
         self.payload_mv = memoryview(self.payload)
+        # File data and directory listings go through here
+        self.chunk = bytearray(CHUNK)
+        self.chunk_mv = memoryview(self.chunk)
+        self.out_len = 0
+        self.out_left = 0
 
     def run_async(self):
-        uasyncio.create_task(self.run())
+        return uasyncio.create_task(self.run())
 
     def ioctl(self, req, arg):
         ret = MP_STREAM_ERROR
@@ -49,86 +66,104 @@ class WebUSBFS(io.IOBase):
                 if webusb.write_available():
                     ret |= MP_STREAM_POLL_WR
         return ret
-    
-    def read(self, len):
-        buf = bytearray(min(webusb.available(), len))
-        webusb.read(memoryview(buf))
-        return buf
+
+    # Non-blocking stream methods, which return None when webusb isn't ready so that
+    # the uasyncio stream waits on ioctl for it
+    def readinto(self, buf):
+        return webusb.read(buf) or None
 
     def write(self, buf):
+        if not webusb.write_available():
+            return None
         return webusb.send(buf)
 
+    # Read into buf until it is full
+    async def readexactly(self, buf):
+        pos = 0
+        while pos < len(buf):
+            n = await self.reader.readinto(buf[pos:])
+            if n:
+                pos += n
+
     async def run(self):
-        print(self.commands)
         while True:
-            print("Starting")
-            self.header_mv = await self.reader.read(12)
-            [command, size, check, id] = struct.unpack("<HIHI", self.header_mv)
-            print([command, size, check, id])
+            await self.readexactly(self.header_mv)
+            [command, size, check, id] = struct.unpack("<HIHI", self.header)
             if check == 0xADDE:
+                handler = self.commands.get(command)
                 pos = 0
                 received = 0
                 if size == 0:
-                    if command in self.commands:
-                        await self.commands[command](self.payload_mv, command, id, size, 0, 0)
+                    if handler:
+                        await handler(self.payload_mv[:0], command, id, size, 0, 0)
                 else:
                     while received < size:
-                        endbuf = min(1024, size - (received-pos))
-                        delta = webusb.read(self.payload_mv[pos:endbuf])  #Maybe make this async
+                        if pos == len(self.payload):
+                            # The handler can't use this much at once, so drop it
+                            pos = 0
+                        end = min(len(self.payload), pos + size - received)
+                        delta = await self.reader.readinto(self.payload_mv[pos:end])
+                        if not delta:
+                            continue
                         received += delta
-                        pos += delta                
-                        if command in self.commands:
-                            if await self.commands[command](self.payload_mv[:pos], command, id, size, received, pos):
-                                pos = 0
-                
+                        pos += delta
+                        if not handler or await handler(
+                            self.payload_mv[:pos], command, id, size, received, pos
+                        ):
+                            pos = 0
+
             else:   #Check failed clearing buffer
-                while webusb.read(self.header_mv):
+                while webusb.read(self.payload_mv):
                     pass
 
     def createheader(self, mv, command, size, id):
-        mv[0:12] = struct.pack("<HIHI", command, size, 0xADDE, id)
+        struct.pack_into("<HIHI", mv, 0, command, size, 0xADDE, id)
 
-    async def sendheader(self, command, id, size):
-        payload = bytearray(12)
-        self.createheader(memoryview(payload), command, size, id)
-        self.writer.write(payload)
+    # Send data, waiting for the FIFO to take it all
+    async def send(self, data):
+        self.writer.write(data)
         await self.writer.drain()
 
+    async def sendheader(self, command, id, size):
+        self.createheader(self.header_mv, command, size, id)
+        await self.send(self.header)
+
+    async def sendstatus(self, command, id, status):
+        self.createheader(self.status_mv, command, 3, id)
+        self.status[12:14] = status
+        await self.send(self.status)
+
     async def sender(self, command, id):
-        payload = bytearray(12+3)
-        self.createheader(memoryview(payload), command, 3, id)
-        payload[12:14] = b"er"
-        self.writer.write(payload)
-        await self.writer.drain()
+        await self.sendstatus(command, id, b"er")
 
     async def sendok(self, command, id):
-        payload = bytearray(12+3)
-        self.createheader(memoryview(payload), command, 3, id)
-        payload[12:14] = b"ok"
-        self.writer.write(payload)
-        await self.writer.drain()
+        await self.sendstatus(command, id, b"ok")
 
     async def sendte(self, command, id):
-        payload = bytearray(12+3)
-        self.createheader(memoryview(payload), command, 3, id)
-        payload[12:14] = b"te"
-        self.writer.write(payload)
-        await self.writer.drain()
+        await self.sendstatus(command, id, b"te")
 
     async def sendto(self, command, id):
-        payload = bytearray(12+3)
-        self.createheader(memoryview(payload), command, 3, id)
-        payload[12:14] = b"to"
-        self.writer.write(payload)
-        await self.writer.drain()
+        await self.sendstatus(command, id, b"to")
 
     async def sendstr(self, command, id, data):
-        print(data)
-        payload = bytearray(12+len(data))
-        self.createheader(memoryview(payload), command, len(data), id)
-        payload[12:] = data.encode()
-        self.writer.write(payload)
-        await self.writer.drain()
+        data = data.encode()
+        await self.sendheader(command, id, len(data))
+        await self.send(data)
+
+    # Decode a file name from a request payload, dropping any terminating zero bytes
+    def getstr(self, data):
+        return str(data, "utf-8").replace("\x00", "")
+
+    # Split a payload of two names separated by a zero byte, giving empty names if
+    # it isn't two names
+    def getnames(self, data):
+        for i in range(0, len(data)):
+            if data[i] == 0:
+                try:
+                    return self.getstr(data[:i]), self.getstr(data[i + 1 :])
+                except ValueError:
+                    break
+        return "", ""
 
     async def heartbeat(self, data, command, id, size, received, length):
         if size != received:
@@ -136,38 +171,46 @@ class WebUSBFS(io.IOBase):
         await self.sendok(command, id)
         return 1
 
+    # Add data to a response being streamed through chunk, which is sent as it fills,
+    # up to the size given in the response's header
+    async def put(self, data):
+        mv = memoryview(data)[: self.out_left]
+        self.out_left -= len(mv)
+        while len(mv):
+            n = min(len(mv), CHUNK - self.out_len)
+            self.chunk_mv[self.out_len : self.out_len + n] = mv[:n]
+            self.out_len += n
+            mv = mv[n:]
+            if self.out_len == CHUNK:
+                await self.send(self.chunk_mv)
+                self.out_len = 0
+
+    # The listing is measured with ilistdir before it is streamed, so that large
+    # directories don't have to fit in memory, and padded if the directory shrank
+    # in between; see getdir in webusb_fs
     async def getdir(self, data, command, id, size, received, length):
         if size != received:
             return 0
-        
-        if size == 0 or size == 1 or size == 2:
-            response = "/\n"
-            print("Listing: /")
-            for f in os.listdir("/"):
-                if os.stat("/"+f)[0] == 16384:
-                    response += "d"
-                else:
-                    response += "f"
-                response += f
-                response += "\n"
-            await self.sendstr(command, id, response[:-1])
-        else:
-            dir = str(data,'utf-8').replace("\x00", "")
-            rootdir = dir
-            print("Listing: "+dir)
-            for f in os.listdir(dir):
-                if not f:
-                    break
-                print(f)
-                dir += "\n"
-                if os.stat(rootdir+"/"+f)[0] == 16384:
-                    dir += "d"
-                else:
-                    dir += "f"
-                dir += f
-                
-            await self.sendstr(command, id, dir)
 
+        dir = bytes(data).replace(b"\x00", b"") if size > 2 else b""
+        dir = dir or b"/"
+        total = len(dir)
+        try:
+            for entry in os.ilistdir(dir):
+                total += 2 + len(entry[0])
+        except OSError:
+            await self.sender(command, id)
+            return 1
+        await self.sendheader(command, id, total)
+        self.out_len = 0
+        self.out_left = total
+        await self.put(dir)
+        for entry in os.ilistdir(dir):
+            await self.put(b"\nd" if entry[1] == 0x4000 else b"\nf")
+            await self.put(entry[0])
+        while self.out_left:
+            await self.put(b"\n")
+        await self.send(self.chunk_mv[: self.out_len])
         return 1
 
     async def readfile(self, data, command, id, size, received, length):
@@ -175,104 +218,100 @@ class WebUSBFS(io.IOBase):
             return 0
 
         try:
-            filename = str(data, "utf-8").replace("\x00", "")
-            print("Reading: "+filename)
-            filesize = os.stat(filename)[6]        
-            f = open(str(data, "utf-8"), "rb")
-            await self.sendheader(command, id, filesize)
-            while True:
-                data = f.read(32)
-                if not data:
-                    break
-                self.writer.write(data)
-                await self.writer.drain()
-            f.close()
-        except:
-            print("Problem reading file")
-            self.sendstr(command, id, "Can't open file")
-
+            filename = self.getstr(data)
+            filesize = os.stat(filename)[6]
+            f = open(filename, "rb")
+        except (OSError, ValueError):
+            await self.sendstr(command, id, "Can't open file")
+            return 1
+        await self.sendheader(command, id, filesize)
+        left = filesize
+        while left:
+            n = f.readinto(self.chunk_mv[: min(left, CHUNK)])
+            if not n:
+                # The file shrank, so end the response short rather than send the
+                # host data that isn't in the file
+                break
+            await self.send(self.chunk_mv[:n])
+            left -= n
+        f.close()
+        return 1
 
     async def writefile(self, data, command, id, size, received, length):
-        global write_obj, write_failed
-        
         if received == length:
+            # First data of the request
             if self.write_obj:
                 self.write_obj.close()
-            write_failed = 0
+                self.write_obj = None
+            self.write_failed = 0
 
-        if self.write_obj == None and write_failed == 0:
-            for i in range(0, received):
+            for i in range(0, length):
                 if data[i] == 0x00:
-                    filename = str(data[0:i], "utf-8").replace("\x00", "")
-                    try:
-                        write_obj = open(filename, "wb")
-                        if received > i:
-                            write_obj.write(data[i+1:received])
-                    except:
-                        write_failed = 1
-                        print("opening file: "+filename+" failed")
-
-                    if received == size:
-                        if write_obj:
-                            await self.sendok(command, id)
-                            write_obj.close()
-                            write_obj = None
-                        else:
-                            await self.sender(command, id)
-
+                    break
+            else:
+                if received < size:
+                    if length < len(self.payload):
+                        # Wait for the rest of the name
+                        return 0
+                    # The name doesn't fit in the buffer, so the request fails
+                    self.write_failed = 1
                     return 1
-            return 0
+                i = length
+            try:
+                self.write_obj = open(self.getstr(data[:i]), "wb")
+                self.write_obj.write(data[i + 1 : length])
+            except (OSError, ValueError):
+                self.write_failed = 1
         elif self.write_obj:
-            self.write_obj.write(data[0:length])
-            if received == size:
+            try:
+                self.write_obj.write(data[:length])
+            except OSError:
+                self.write_failed = 1
+
+        if received == size:
+            if self.write_obj:
                 self.write_obj.close()
-                await self.sendok(command, id)
-                write_obj = None
-            return 1
-        else:
-            if received == size:
+                self.write_obj = None
+            if self.write_failed:
                 await self.sender(command, id)
-            return 1
-
+            else:
+                await self.sendok(command, id)
+        return 1
 
     async def delfile(self, data, command, id, size, received, length):
         if size != received:
             return 0
 
         try:
-            os.remove(str(data, "utf-8").replace("\x00", ""))
+            os.remove(self.getstr(data))
             await self.sendok(command, id)
-        except:
+        except (OSError, ValueError):
             await self.sender(command, id)
         return 1
 
     async def duplfile(self, data, command, id, size, received, length):
         if size != received:
             return 0
-        
-        source = ""
-        dest = ""
-        for i in range(0, size):
-            if data[i] == 0x00:
-                source = str(data[0:i], "utf-8").replace("\x00", "")
-                dest = str(data[(i+1):], "utf-8").replace("\x00", "")
-        
+
+        source, dest = self.getnames(data)
         if source == "" or dest == "":
             await self.sender(command, id)
             return 1
-        
+
         try:
             fsource = open(source, "rb")
             fdest = open(dest, "wb")
             while True:
-                data = fsource.read(32)
-                if not data:
+                n = fsource.readinto(self.chunk_mv)
+                if not n:
                     break
-                fdest.write(data)
+                fdest.write(self.chunk_mv[:n])
+                # Let other tasks run between chunks
+                await uasyncio.sleep_ms(0)
             fsource.close()
             fdest.close()
             await self.sendok(command, id)
-        except:
+        except OSError:
             await self.sender(command, id)
 
         return 1
@@ -280,16 +319,8 @@ class WebUSBFS(io.IOBase):
     async def mvfile(self, data, command, id, size, received, length):
         if size != received:
             return 0
-        
-        source = ""
-        dest = ""
-        for i in range(0, size):
-            print(data[i])
-            if data[i] == 0:
-                source = str(data[0:i], "utf-8").replace("\x00", "")
-                dest = str(data[(i+1):], "utf-8").replace("\x00", "")
-                break
-        print("renaming: "+source +" to: "+dest)
+
+        source, dest = self.getnames(data)
         if source == "" or dest == "":
             await self.sender(command, id)
             return 1
@@ -297,7 +328,7 @@ class WebUSBFS(io.IOBase):
         try:
             os.rename(source, dest)
             await self.sendok(command, id)
-        except:
+        except OSError:
             await self.sender(command, id)
 
         return 1
@@ -307,9 +338,9 @@ class WebUSBFS(io.IOBase):
             return 0
 
         try:
-            os.mkdir(str(data, "utf-8").replace("\x00", ""))
+            os.mkdir(self.getstr(data))
             await self.sendok(command, id)
-        except:
+        except (OSError, ValueError):
             await self.sender(command, id)
         return 1
 
@@ -323,12 +354,12 @@ def set_global_exception():
 
 async def main():
     set_global_exception()  # Debug aid
-    my_class = WebUSBFS()  # Constructor might create tasks
-    uasyncio.sleep(0.1)
+    await WebUSBFS().run()
 
 def startwebusb():
-    print("Test")
     uasyncio.run(main())
 
-import _thread
-_thread.start_new_thread(startwebusb, ())
\ No newline at end of file
+# Run the server in a thread of its own, alongside the badge app
+def start():
+    import _thread
+    _thread.start_new_thread(startwebusb, ())
@@ -1,6 +1,7 @@
 
 #include "py/objstr.h"
 #include "py/runtime.h"
+#include "extmod/webusb_fs.h"
 
 #ifndef NO_QSTR
 #include "tusb.h"
@@ -19,6 +20,11 @@ static mp_obj_t webusb_setmode(mp_obj_t data){
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(webusb_setmode_obj, webusb_setmode);
 
+static mp_obj_t webusb_reboot(){
+    return mp_obj_new_int(usb_reboot);
+}
+static MP_DEFINE_CONST_FUN_OBJ_0(webusb_reboot_obj, webusb_reboot);
+
 static mp_obj_t webusb_send(mp_obj_t data) {
     mp_buffer_info_t bufinfo;
     mp_get_buffer_raise(data, &bufinfo, MP_BUFFER_READ);
@@ -87,9 +93,27 @@ static mp_obj_t webusb_secretread(mp_obj_t data) {
 }
 static MP_DEFINE_CONST_FUN_OBJ_1(webusb_secretread_obj, webusb_secretread);
 
+#if MICROPY_PY_WEBUSB_FS
+// The vendor interface for the filesystem protocol in extmod/webusb_fs.c
+mp_uint_t webusb_fs_rx(uint8_t *buf, mp_uint_t len) {
+    tud_task();
+    if (tud_vendor_n_available(1) == 0) {
+        return 0;
+    }
+    return tud_vendor_n_read(1, buf, len);
+}
+
+mp_uint_t webusb_fs_tx(const uint8_t *buf, mp_uint_t len) {
+    uint32_t written = tud_vendor_n_write(1, buf, len);
+    tud_task();
+    return written;
+}
+#endif
+
 static const mp_rom_map_elem_t webusb_module_globals_table[] = {
     {MP_OBJ_NEW_QSTR(MP_QSTR_setmode), (mp_obj_t)&webusb_setmode_obj},
     {MP_OBJ_NEW_QSTR(MP_QSTR_mode), (mp_obj_t)&webusb_mode_obj},
+    {MP_OBJ_NEW_QSTR(MP_QSTR_reboot), (mp_obj_t)&webusb_reboot_obj},
 	{MP_OBJ_NEW_QSTR(MP_QSTR_read), (mp_obj_t)&webusb_read_obj},
     {MP_OBJ_NEW_QSTR(MP_QSTR_available), (mp_obj_t)&webusb_available_obj},
     {MP_OBJ_NEW_QSTR(MP_QSTR_write_available), (mp_obj_t)&webusb_write_available_obj},
@@ -98,6 +122,10 @@ static const mp_rom_map_elem_t webusb_module_globals_table[] = {
     {MP_OBJ_NEW_QSTR(MP_QSTR_secretavailable), (mp_obj_t)&webusb_secretavailable_obj},
     {MP_OBJ_NEW_QSTR(MP_QSTR_secretwrite_available), (mp_obj_t)&webusb_secretwrite_available_obj},
 	{MP_OBJ_NEW_QSTR(MP_QSTR_secretsend), (mp_obj_t)&webusb_secretsend_obj},
+    #if MICROPY_PY_WEBUSB_FS
+    {MP_OBJ_NEW_QSTR(MP_QSTR_fs_poll), (mp_obj_t)&webusb_fs_poll_obj},
+    {MP_OBJ_NEW_QSTR(MP_QSTR_fs_hook), (mp_obj_t)&webusb_fs_hook_obj},
+    #endif
 };
 
 static MP_DEFINE_CONST_DICT(webusb_module_globals, webusb_module_globals_table);
@@ -53,5 +53,6 @@ enum
 };
 
 extern volatile int usb_mode;
+extern volatile int usb_reboot;
 
 #endif // MICROPY_INCLUDED_RP2_TUSB_CONFIG_H
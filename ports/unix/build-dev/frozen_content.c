@@ -0,0 +1,18599 @@
+//
+// Content for MICROPY_MODULE_FROZEN_STR
+//
+#include <stdint.h>
+const char mp_frozen_str_names[] = {
+"\0"};
+const uint32_t mp_frozen_str_sizes[] = {
+0};
+const char mp_frozen_str_content[] = {
+"\0"};
+//
+// Content for MICROPY_MODULE_FROZEN_MPY
+//
+#include "py/mpconfig.h"
+#include "py/objint.h"
+#include "py/objstr.h"
+#include "py/emitglue.h"
+#include "py/nativeglue.h"
+
+#if MICROPY_LONGINT_IMPL != 2
+#error "incompatible MICROPY_LONGINT_IMPL"
+#endif
+
+#if MPZ_DIG_SIZE != 16
+#error "incompatible MPZ_DIG_SIZE"
+#endif
+
+#if MICROPY_PY_BUILTINS_FLOAT
+typedef struct _mp_obj_float_t {
+    mp_obj_base_t base;
+    mp_float_t value;
+} mp_obj_float_t;
+#endif
+
+#if MICROPY_PY_BUILTINS_COMPLEX
+typedef struct _mp_obj_complex_t {
+    mp_obj_base_t base;
+    mp_float_t real;
+    mp_float_t imag;
+} mp_obj_complex_t;
+#endif
+
+enum {
+    MP_QSTR_upip_dot_py = MP_QSTRnumber_of,
+    MP_QSTR_os,
+    MP_QSTR_json,
+    MP_QSTR_upip_utarfile,
+    MP_QSTR_tarfile,
+    MP_QSTR_debug,
+    MP_QSTR_index_urls,
+    MP_QSTR_install_path,
+    MP_QSTR_cleanup_files,
+    MP_QSTR_gzdict_sz,
+    MP_QSTR_file_buf,
+    MP_QSTR_NotFoundError,
+    MP_QSTR_op_split,
+    MP_QSTR_op_basename,
+    MP_QSTR__makedirs,
+    MP_QSTR_save_file,
+    MP_QSTR_install_tar,
+    MP_QSTR_expandhome,
+    MP_QSTR_ussl,
+    MP_QSTR_warn_ussl,
+    MP_QSTR_url_open,
+    MP_QSTR_get_pkg_metadata,
+    MP_QSTR_fatal,
+    MP_QSTR_install_pkg,
+    MP_QSTR_install,
+    MP_QSTR_get_install_path,
+    MP_QSTR_cleanup,
+    MP_QSTR_fname,
+    MP_QSTR_subf,
+    MP_QSTR_setup_dot_,
+    MP_QSTR_PKG_hyphen_INFO,
+    MP_QSTR_README,
+    MP_QSTR__dot_egg_hyphen_info,
+    MP_QSTR_extractfile,
+    MP_QSTR_deps,
+    MP_QSTR_Skipping,
+    MP_QSTR_DIRTYPE,
+    MP_QSTR_f,
+    MP_QSTR_prefix,
+    MP_QSTR__tilde__slash_,
+    MP_QSTR_HOME,
+    MP_QSTR_s,
+    MP_QSTR__colon_,
+    MP_QSTR_https_colon_,
+    MP_QSTR_wrap_socket,
+    MP_QSTR_server_hostname,
+    MP_QSTR_url,
+    MP_QSTR__percent_s_slash__percent_s_slash_json,
+    MP_QSTR_Error_colon_,
+    MP_QSTR_msg,
+    MP_QSTR_exc,
+    MP_QSTR_info,
+    MP_QSTR_releases,
+    MP_QSTR_TarFile,
+    MP_QSTR_fileobj,
+    MP_QSTR_pkg_spec,
+    MP_QSTR_Queue_colon_,
+    MP_QSTR_to_install,
+    MP_QSTR__hyphen_h,
+    MP_QSTR__hyphen__hyphen_help,
+    MP_QSTR__hyphen_p,
+    MP_QSTR__hyphen_r,
+    MP_QSTR__hash_,
+    MP_QSTR__hyphen_i,
+    MP_QSTR__hyphen__hyphen_debug,
+    MP_QSTR__hyphen_,
+    MP_QSTR_upip_utarfile_dot_py,
+    MP_QSTR_size,
+    MP_QSTR_TAR_HEADER,
+    MP_QSTR_REGTYPE,
+    MP_QSTR_roundup,
+    MP_QSTR_FileSection,
+    MP_QSTR_TarInfo,
+    MP_QSTR_val,
+    MP_QSTR_align,
+    MP_QSTR_skip,
+    MP_QSTR_content_len,
+    MP_QSTR_aligned_len,
+    MP_QSTR_sz,
+    MP_QSTR_buf,
+    MP_QSTR__0x00_,
+    MP_QSTR_tarinfo,
+    MP_QSTR_uasyncio_slash___init___dot_py,
+    MP_QSTR_core,
+    MP_QSTR___version__,
+    MP_QSTR_funcs,
+    MP_QSTR_wait_for,
+    MP_QSTR_gather,
+    MP_QSTR_event,
+    MP_QSTR_Event,
+    MP_QSTR_Lock,
+    MP_QSTR_queue,
+    MP_QSTR_Queue,
+    MP_QSTR_LifoQueue,
+    MP_QSTR_QueueEmpty,
+    MP_QSTR_QueueFull,
+    MP_QSTR_executor,
+    MP_QSTR_Executor,
+    MP_QSTR_dns,
+    MP_QSTR_stream,
+    MP_QSTR_datagram,
+    MP_QSTR__attrs,
+    MP_QSTR_attr,
+    MP_QSTR_uasyncio_slash_core_dot_py,
+    MP_QSTR_ticks,
+    MP_QSTR_select,
+    MP_QSTR_task,
+    MP_QSTR_TimeoutError,
+    MP_QSTR_message,
+    MP_QSTR__promote_to_task,
+    MP_QSTR_create_task,
+    MP_QSTR_run,
+    MP_QSTR__stopper,
+    MP_QSTR__stop_task,
+    MP_QSTR_get_event_loop,
+    MP_QSTR_current_task,
+    MP_QSTR_new_event_loop,
+    MP_QSTR_q,
+    MP_QSTR_rd,
+    MP_QSTR_wr,
+    MP_QSTR_ev,
+    MP_QSTR__update,
+    MP_QSTR__enqueue,
+    MP_QSTR_idx,
+    MP_QSTR_entry,
+    MP_QSTR_dt,
+    MP_QSTR_aw,
+    MP_QSTR_main_task,
+    MP_QSTR_t,
+    MP_QSTR_sgen,
+    MP_QSTR__exc_handler,
+    MP_QSTR_run_forever,
+    MP_QSTR_set_exception_handler,
+    MP_QSTR_get_exception_handler,
+    MP_QSTR_default_exception_handler,
+    MP_QSTR_handler,
+    MP_QSTR_future_colon_,
+    MP_QSTR_coro_equals_,
+    MP_QSTR_loop,
+    MP_QSTR_context,
+    MP_QSTR_runq_len,
+    MP_QSTR_waitq_len,
+    MP_QSTR_wheel_ms,
+    MP_QSTR_wheel_slots,
+    MP_QSTR_uasyncio_slash_datagram_dot_py,
+    MP_QSTR__Send,
+    MP_QSTR_DatagramStream,
+    MP_QSTR_open_datagram_endpoint,
+    MP_QSTR_addr,
+    MP_QSTR_wait_closed,
+    MP_QSTR__recv_into,
+    MP_QSTR__recvfrom_into,
+    MP_QSTR_recv_into_many,
+    MP_QSTR__ri,
+    MP_QSTR__rfi,
+    MP_QSTR__send,
+    MP_QSTR_exc_type,
+    MP_QSTR_tb,
+    MP_QSTR_n,
+    MP_QSTR_bufs,
+    MP_QSTR_sizes,
+    MP_QSTR_addrs,
+    MP_QSTR_local_addr,
+    MP_QSTR_remote_addr,
+    MP_QSTR_uasyncio_slash_dns_dot_py,
+    MP_QSTR_wait_for_ms,
+    MP_QSTR__server,
+    MP_QSTR__port,
+    MP_QSTR__cache,
+    MP_QSTR__slash_etc_slash_hosts,
+    MP_QSTR_HOSTS,
+    MP_QSTR_CACHE_MAX,
+    MP_QSTR_NEGATIVE_TTL,
+    MP_QSTR_TIMEOUT_MS,
+    MP_QSTR_RETRIES,
+    MP_QSTR_set_server,
+    MP_QSTR__find_server,
+    MP_QSTR__is_numeric,
+    MP_QSTR__hosts,
+    MP_QSTR__cache_get,
+    MP_QSTR__cache_put,
+    MP_QSTR__query,
+    MP_QSTR__skip_name,
+    MP_QSTR__parse,
+    MP_QSTR__recv,
+    MP_QSTR__resolve,
+    MP_QSTR_port,
+    MP_QSTR_nameserver,
+    MP_QSTR__dot_,
+    MP_QSTR_host,
+    MP_QSTR_ttl,
+    MP_QSTR__gt_HHHHHH,
+    MP_QSTR_i,
+    MP_QSTR__gt_HHHH,
+    MP_QSTR__gt_HHIH,
+    MP_QSTR_af,
+    MP_QSTR_uasyncio_slash_event_dot_py,
+    MP_QSTR_ThreadSafeFlag,
+    MP_QSTR_is_set,
+    MP_QSTR_wait,
+    MP_QSTR_waiting,
+    MP_QSTR__flag,
+    MP_QSTR_req,
+    MP_QSTR_flags,
+    MP_QSTR_uasyncio_slash_executor_dot_py,
+    MP_QSTR__Wake,
+    MP_QSTR__Job,
+    MP_QSTR__Worker,
+    MP_QSTR__executor,
+    MP_QSTR_run_in_executor,
+    MP_QSTR__r,
+    MP_QSTR__w,
+    MP_QSTR_fn,
+    MP_QSTR_ret,
+    MP_QSTR_waiter,
+    MP_QSTR_job,
+    MP_QSTR__work,
+    MP_QSTR__read,
+    MP_QSTR__submit,
+    MP_QSTR_shutdown,
+    MP_QSTR__workers,
+    MP_QSTR__nthreads,
+    MP_QSTR__mutex,
+    MP_QSTR__idle,
+    MP_QSTR__pending,
+    MP_QSTR__done,
+    MP_QSTR__nrun,
+    MP_QSTR__wake,
+    MP_QSTR__reader,
+    MP_QSTR_workers,
+    MP_QSTR_w,
+    MP_QSTR_uasyncio_slash_funcs_dot_py,
+    MP_QSTR__Remove,
+    MP_QSTR_return_exceptions,
+    MP_QSTR_timeout,
+    MP_QSTR_runner,
+    MP_QSTR_er,
+    MP_QSTR_uasyncio_slash_lock_dot_py,
+    MP_QSTR_uasyncio_slash_queue_dot_py,
+    MP_QSTR_qsize,
+    MP_QSTR_empty,
+    MP_QSTR_full,
+    MP_QSTR_put_nowait,
+    MP_QSTR_get_nowait,
+    MP_QSTR_put,
+    MP_QSTR_task_done,
+    MP_QSTR__buf,
+    MP_QSTR__head,
+    MP_QSTR__n,
+    MP_QSTR__unfinished,
+    MP_QSTR__getters,
+    MP_QSTR__putters,
+    MP_QSTR__joiners,
+    MP_QSTR_item,
+    MP_QSTR_uasyncio_slash_stream_dot_py,
+    MP_QSTR__SCAN,
+    MP_QSTR__BACKOFF_MS,
+    MP_QSTR_Stream,
+    MP_QSTR_StreamReader,
+    MP_QSTR_StreamWriter,
+    MP_QSTR_open_connection,
+    MP_QSTR_Server,
+    MP_QSTR__serve_one,
+    MP_QSTR__PoolStream,
+    MP_QSTR__Handler,
+    MP_QSTR_start_server,
+    MP_QSTR_stream_awrite,
+    MP_QSTR_aclose,
+    MP_QSTR_awrite,
+    MP_QSTR_awritestr,
+    MP_QSTR_get_extra_info,
+    MP_QSTR_set_buffer,
+    MP_QSTR__fill,
+    MP_QSTR__take,
+    MP_QSTR__readuntil,
+    MP_QSTR_readexactly,
+    MP_QSTR_readuntil,
+    MP_QSTR_writelines,
+    MP_QSTR_drain,
+    MP_QSTR_out_buf,
+    MP_QSTR_rbuf,
+    MP_QSTR_rpos,
+    MP_QSTR_rend,
+    MP_QSTR_bufsize,
+    MP_QSTR_v,
+    MP_QSTR__serve,
+    MP_QSTR_peername,
+    MP_QSTR_cb,
+    MP_QSTR_backlog,
+    MP_QSTR_pool,
+    MP_QSTR_ss,
+    MP_QSTR__run,
+    MP_QSTR_srv,
+};
+
+#if MICROPY_OPT_QSTR_HASH_INDEX
+static const uint16_t mp_qstr_frozen_const_hash_index[] = {
+    164,
+    175,
+    100,
+    255,
+    104,
+    87,
+    7,
+    269,
+    261,
+    271,
+    116,
+    238,
+    201,
+    91,
+    92,
+    9,
+    132,
+    10,
+    113,
+    36,
+    264,
+    11,
+    263,
+    153,
+    272,
+    98,
+    8,
+    286,
+    253,
+    115,
+    138,
+    50,
+    197,
+    246,
+    237,
+    143,
+    26,
+    142,
+    28,
+    112,
+    189,
+    152,
+    146,
+    70,
+    245,
+    170,
+    151,
+    47,
+    38,
+    270,
+    243,
+    105,
+    222,
+    277,
+    68,
+    77,
+    49,
+    17,
+    160,
+    79,
+    278,
+    124,
+    107,
+    208,
+    54,
+    251,
+    48,
+    114,
+    225,
+    137,
+    110,
+    234,
+    123,
+    71,
+    141,
+    199,
+    5,
+    27,
+    103,
+    93,
+    13,
+    184,
+    136,
+    217,
+    29,
+    235,
+    72,
+    275,
+    179,
+    135,
+    101,
+    231,
+    81,
+    190,
+    267,
+    32,
+    109,
+    165,
+    131,
+    46,
+    260,
+    58,
+    63,
+    60,
+    61,
+    215,
+    122,
+    241,
+    56,
+    88,
+    85,
+    125,
+    236,
+    120,
+    195,
+    126,
+    59,
+    212,
+    287,
+    147,
+    1,
+    157,
+    119,
+    244,
+    118,
+    290,
+    78,
+    39,
+    249,
+    191,
+    149,
+    210,
+    211,
+    76,
+    248,
+    279,
+    223,
+    40,
+    159,
+    21,
+    6,
+    185,
+    200,
+    167,
+    148,
+    73,
+    127,
+    129,
+    162,
+    145,
+    3,
+    219,
+    182,
+    206,
+    66,
+    276,
+    204,
+    111,
+    89,
+    173,
+    259,
+    202,
+    213,
+    187,
+    292,
+    52,
+    239,
+    96,
+    203,
+    232,
+    180,
+    97,
+    226,
+    94,
+    84,
+    55,
+    258,
+    64,
+    174,
+    33,
+    106,
+    86,
+    181,
+    121,
+    283,
+    15,
+    205,
+    0,
+    224,
+    67,
+    144,
+    288,
+    14,
+    95,
+    30,
+    176,
+    19,
+    262,
+    75,
+    273,
+    274,
+    134,
+    51,
+    62,
+    65,
+    188,
+    42,
+    80,
+    37,
+    158,
+    192,
+    128,
+    230,
+    284,
+    117,
+    41,
+    23,
+    233,
+    12,
+    177,
+    171,
+    108,
+    102,
+    4,
+    268,
+    281,
+    216,
+    82,
+    228,
+    193,
+    194,
+    16,
+    156,
+    130,
+    140,
+    172,
+    35,
+    22,
+    161,
+    221,
+    69,
+    2,
+    99,
+    257,
+    186,
+    285,
+    139,
+    178,
+    289,
+    24,
+    83,
+    155,
+    254,
+    240,
+    163,
+    154,
+    198,
+    196,
+    291,
+    218,
+    183,
+    266,
+    90,
+    168,
+    31,
+    280,
+    34,
+    133,
+    242,
+    214,
+    166,
+    45,
+    209,
+    207,
+    18,
+    250,
+    44,
+    247,
+    57,
+    265,
+    25,
+    43,
+    220,
+    282,
+    20,
+    74,
+    256,
+    229,
+    227,
+    53,
+    150,
+    169,
+    252,
+};
+#endif
+
+extern const qstr_pool_t mp_qstr_const_pool;
+const qstr_pool_t mp_qstr_frozen_const_pool = {
+    (qstr_pool_t*)&mp_qstr_const_pool, // previous pool
+    MP_QSTRnumber_of, // previous pool size
+    10, // allocated entries
+    293, // used entries
+    #if MICROPY_OPT_QSTR_HASH_INDEX
+    0, // hash index is sorted
+    mp_qstr_frozen_const_hash_index,
+    #endif
+    {
+        (const byte*)"\x9e\xa2\x07" "upip.py",
+        (const byte*)"\x79\x6f\x02" "os",
+        (const byte*)"\xfd\xd1\x04" "json",
+        (const byte*)"\x32\x80\x0d" "upip_utarfile",
+        (const byte*)"\x24\xc0\x07" "tarfile",
+        (const byte*)"\xd4\x55\x05" "debug",
+        (const byte*)"\x7c\x79\x0a" "index_urls",
+        (const byte*)"\x56\x0a\x0c" "install_path",
+        (const byte*)"\x8f\x1f\x0d" "cleanup_files",
+        (const byte*)"\x34\x14\x09" "gzdict_sz",
+        (const byte*)"\xed\x15\x08" "file_buf",
+        (const byte*)"\x9e\x1a\x0d" "NotFoundError",
+        (const byte*)"\xd7\xb9\x08" "op_split",
+        (const byte*)"\xb7\x56\x0b" "op_basename",
+        (const byte*)"\xb4\xa9\x09" "_makedirs",
+        (const byte*)"\xbd\xa0\x09" "save_file",
+        (const byte*)"\x7c\xcb\x0b" "install_tar",
+        (const byte*)"\x4c\x47\x0a" "expandhome",
+        (const byte*)"\x1c\xf2\x04" "ussl",
+        (const byte*)"\x49\xae\x09" "warn_ussl",
+        (const byte*)"\xc5\xfa\x08" "url_open",
+        (const byte*)"\xa2\x78\x10" "get_pkg_metadata",
+        (const byte*)"\xdb\xd0\x05" "fatal",
+        (const byte*)"\xa7\xb8\x0b" "install_pkg",
+        (const byte*)"\x04\xdb\x07" "install",
+        (const byte*)"\xdf\xf8\x10" "get_install_path",
+        (const byte*)"\xc5\x2e\x07" "cleanup",
+        (const byte*)"\xe4\x55\x05" "fname",
+        (const byte*)"\x27\x31\x04" "subf",
+        (const byte*)"\x2c\x5b\x06" "setup.",
+        (const byte*)"\xfa\xaa\x08" "PKG-INFO",
+        (const byte*)"\x5f\xeb\x06" "README",
+        (const byte*)"\x2d\x61\x09" ".egg-info",
+        (const byte*)"\xae\x9d\x0b" "extractfile",
+        (const byte*)"\x87\xec\x04" "deps",
+        (const byte*)"\x34\xd0\x08" "Skipping",
+        (const byte*)"\x42\x17\x07" "DIRTYPE",
+        (const byte*)"\xc3\xb5\x01" "f",
+        (const byte*)"\x95\x3e\x06" "prefix",
+        (const byte*)"\x14\x71\x02" "~/",
+        (const byte*)"\x6a\x76\x04" "HOME",
+        (const byte*)"\xd6\xb5\x01" "s",
+        (const byte*)"\x9f\xb5\x01" ":",
+        (const byte*)"\x34\xf9\x06" "https:",
+        (const byte*)"\xcb\xf3\x0b" "wrap_socket",
+        (const byte*)"\x58\xef\x0f" "server_hostname",
+        (const byte*)"\x8e\x63\x03" "url",
+        (const byte*)"\xdd\x3c\x0a" "%s/%s/json",
+        (const byte*)"\x47\x4d\x06" "Error:",
+        (const byte*)"\x7c\x46\x03" "msg",
+        (const byte*)"\xdb\x24\x03" "exc",
+        (const byte*)"\xeb\xb3\x04" "info",
+        (const byte*)"\x1f\x8d\x08" "releases",
+        (const byte*)"\x64\xfd\x07" "TarFile",
+        (const byte*)"\x04\x4c\x07" "fileobj",
+        (const byte*)"\x43\x9a\x08" "pkg_spec",
+        (const byte*)"\x0e\x69\x06" "Queue:",
+        (const byte*)"\x80\xf8\x0a" "to_install",
+        (const byte*)"\xe0\x66\x02" "-h",
+        (const byte*)"\x34\x6e\x06" "--help",
+        (const byte*)"\xf8\x66\x02" "-p",
+        (const byte*)"\xfa\x66\x02" "-r",
+        (const byte*)"\x86\xb5\x01" "#",
+        (const byte*)"\xe1\x66\x02" "-i",
+        (const byte*)"\x34\x9b\x07" "--debug",
+        (const byte*)"\x88\xb5\x01" "-",
+        (const byte*)"\x55\x87\x10" "upip_utarfile.py",
+        (const byte*)"\x20\xa5\x04" "size",
+        (const byte*)"\x82\x45\x0a" "TAR_HEADER",
+        (const byte*)"\xcd\xd1\x07" "REGTYPE",
+        (const byte*)"\x82\x38\x07" "roundup",
+        (const byte*)"\x0a\x55\x0b" "FileSection",
+        (const byte*)"\x4c\x5c\x07" "TarInfo",
+        (const byte*)"\xfe\x7a\x03" "val",
+        (const byte*)"\xa8\xfb\x05" "align",
+        (const byte*)"\x04\xaf\x04" "skip",
+        (const byte*)"\x54\x75\x0b" "content_len",
+        (const byte*)"\xb1\x45\x0b" "aligned_len",
+        (const byte*)"\xec\x70\x02" "sz",
+        (const byte*)"\x74\x49\x03" "buf",
+        (const byte*)"\xa5\xb5\x01" "\x00",
+        (const byte*)"\x0c\x60\x07" "tarinfo",
+        (const byte*)"\xc2\xc5\x14" "uasyncio/__init__.py",
+        (const byte*)"\xbe\xdb\x04" "core",
+        (const byte*)"\x3f\x98\x0b" "__version__",
+        (const byte*)"\x08\x6b\x05" "funcs",
+        (const byte*)"\x2a\x9f\x08" "wait_for",
+        (const byte*)"\x88\x08\x06" "gather",
+        (const byte*)"\xc9\x69\x05" "event",
+        (const byte*)"\xe9\x8a\x05" "Event",
+        (const byte*)"\x8e\xe8\x04" "Lock",
+        (const byte*)"\x94\x12\x05" "queue",
+        (const byte*)"\xb4\x12\x05" "Queue",
+        (const byte*)"\x58\x56\x09" "LifoQueue",
+        (const byte*)"\x81\x97\x0a" "QueueEmpty",
+        (const byte*)"\x47\xaa\x09" "QueueFull",
+        (const byte*)"\x42\x8f\x08" "executor",
+        (const byte*)"\x22\x94\x08" "Executor",
+        (const byte*)"\x1c\x1f\x03" "dns",
+        (const byte*)"\x59\xd4\x06" "stream",
+        (const byte*)"\x4c\x05\x08" "datagram",
+        (const byte*)"\x1a\x5f\x06" "_attrs",
+        (const byte*)"\xb6\xbc\x04" "attr",
+        (const byte*)"\x03\x56\x10" "uasyncio/core.py",
+        (const byte*)"\x43\x08\x05" "ticks",
+        (const byte*)"\x8d\x41\x06" "select",
+        (const byte*)"\x28\x9e\x04" "task",
+        (const byte*)"\x66\x4b\x0c" "TimeoutError",
+        (const byte*)"\x6e\xbc\x07" "message",
+        (const byte*)"\x52\x61\x10" "_promote_to_task",
+        (const byte*)"\x93\x52\x0b" "create_task",
+        (const byte*)"\x6c\x89\x03" "run",
+        (const byte*)"\x25\x32\x08" "_stopper",
+        (const byte*)"\x10\x16\x0a" "_stop_task",
+        (const byte*)"\x03\x4e\x0e" "get_event_loop",
+        (const byte*)"\x1e\x22\x0c" "current_task",
+        (const byte*)"\x89\x0c\x0e" "new_event_loop",
+        (const byte*)"\xd4\xb5\x01" "q",
+        (const byte*)"\xd3\x70\x02" "rd",
+        (const byte*)"\x60\x70\x02" "wr",
+        (const byte*)"\xb6\x6d\x02" "ev",
+        (const byte*)"\x4b\xa0\x07" "_update",
+        (const byte*)"\xc0\x68\x08" "_enqueue",
+        (const byte*)"\x50\x54\x03" "idx",
+        (const byte*)"\x51\x4b\x05" "entry",
+        (const byte*)"\x95\x6d\x02" "dt",
+        (const byte*)"\x33\x6e\x02" "aw",
+        (const byte*)"\xfc\x7b\x09" "main_task",
+        (const byte*)"\xd1\xb5\x01" "t",
+        (const byte*)"\x9a\x7d\x04" "sgen",
+        (const byte*)"\x83\xcc\x0c" "_exc_handler",
+        (const byte*)"\xcc\x61\x0b" "run_forever",
+        (const byte*)"\xa8\x14\x15" "set_exception_handler",
+        (const byte*)"\xbc\xec\x15" "get_exception_handler",
+        (const byte*)"\x41\xb3\x19" "default_exception_handler",
+        (const byte*)"\xdd\x5d\x07" "handler",
+        (const byte*)"\x3a\x59\x07" "future:",
+        (const byte*)"\x09\x52\x05" "coro=",
+        (const byte*)"\x39\x24\x04" "loop",
+        (const byte*)"\xfa\xd8\x07" "context",
+        (const byte*)"\x25\xce\x08" "runq_len",
+        (const byte*)"\x87\x55\x09" "waitq_len",
+        (const byte*)"\x17\x30\x08" "wheel_ms",
+        (const byte*)"\xfe\x2b\x0b" "wheel_slots",
+        (const byte*)"\xb1\xa7\x14" "uasyncio/datagram.py",
+        (const byte*)"\x26\x80\x05" "_Send",
+        (const byte*)"\xd0\x37\x0e" "DatagramStream",
+        (const byte*)"\x1b\x6f\x16" "open_datagram_endpoint",
+        (const byte*)"\xb6\x7a\x04" "addr",
+        (const byte*)"\xe3\x72\x0b" "wait_closed",
+        (const byte*)"\xfb\xfd\x0a" "_recv_into",
+        (const byte*)"\x0d\x3c\x0e" "_recvfrom_into",
+        (const byte*)"\x80\x36\x0e" "recv_into_many",
+        (const byte*)"\x21\x1e\x03" "_ri",
+        (const byte*)"\x87\xe3\x04" "_rfi",
+        (const byte*)"\x46\xdc\x05" "_send",
+        (const byte*)"\xfc\xcb\x08" "exc_type",
+        (const byte*)"\x93\x6f\x02" "tb",
+        (const byte*)"\xcb\xb5\x01" "n",
+        (const byte*)"\x87\x77\x04" "bufs",
+        (const byte*)"\x53\x49\x05" "sizes",
+        (const byte*)"\x05\xd1\x05" "addrs",
+        (const byte*)"\xa4\x7e\x0a" "local_addr",
+        (const byte*)"\xed\xe0\x0b" "remote_addr",
+        (const byte*)"\x21\x02\x0f" "uasyncio/dns.py",
+        (const byte*)"\xcb\x61\x0b" "wait_for_ms",
+        (const byte*)"\x3f\xee\x07" "_server",
+        (const byte*)"\xa3\x7a\x05" "_port",
+        (const byte*)"\x76\xe9\x06" "_cache",
+        (const byte*)"\xe4\xfe\x0a" "/etc/hosts",
+        (const byte*)"\x96\x3a\x05" "HOSTS",
+        (const byte*)"\x02\xbc\x09" "CACHE_MAX",
+        (const byte*)"\x95\xce\x0c" "NEGATIVE_TTL",
+        (const byte*)"\xff\x8a\x0a" "TIMEOUT_MS",
+        (const byte*)"\x6b\x9c\x07" "RETRIES",
+        (const byte*)"\x9d\x04\x0a" "set_server",
+        (const byte*)"\xc5\xad\x0c" "_find_server",
+        (const byte*)"\x34\xbb\x0b" "_is_numeric",
+        (const byte*)"\x69\xd9\x06" "_hosts",
+        (const byte*)"\x5f\x5d\x0a" "_cache_get",
+        (const byte*)"\x98\x92\x0a" "_cache_put",
+        (const byte*)"\x30\x9f\x06" "_query",
+        (const byte*)"\xe3\x83\x0a" "_skip_name",
+        (const byte*)"\x0f\xe8\x06" "_parse",
+        (const byte*)"\x18\x59\x05" "_recv",
+        (const byte*)"\x8e\x79\x08" "_resolve",
+        (const byte*)"\x5c\xd8\x04" "port",
+        (const byte*)"\xe7\x8b\x0a" "nameserver",
+        (const byte*)"\x8b\xb5\x01" ".",
+        (const byte*)"\x25\x35\x04" "host",
+        (const byte*)"\x49\x60\x03" "ttl",
+        (const byte*)"\xdb\x72\x07" ">HHHHHH",
+        (const byte*)"\xcc\xb5\x01" "i",
+        (const byte*)"\x1b\xc9\x05" ">HHHH",
+        (const byte*)"\x7a\xc9\x05" ">HHIH",
+        (const byte*)"\x22\x6e\x02" "af",
+        (const byte*)"\xd4\xe4\x11" "uasyncio/event.py",
+        (const byte*)"\x56\x25\x0e" "ThreadSafeFlag",
+        (const byte*)"\xc2\xe4\x06" "is_set",
+        (const byte*)"\x8e\x55\x04" "wait",
+        (const byte*)"\xee\x79\x07" "waiting",
+        (const byte*)"\x96\x10\x05" "_flag",
+        (const byte*)"\x63\x8b\x03" "req",
+        (const byte*)"\xfa\x8f\x05" "flags",
+        (const byte*)"\xff\x87\x14" "uasyncio/executor.py",
+        (const byte*)"\x02\xa1\x05" "_Wake",
+        (const byte*)"\x9d\x86\x04" "_Job",
+        (const byte*)"\x4c\xf1\x07" "_Worker",
+        (const byte*)"\xbd\x4b\x09" "_executor",
+        (const byte*)"\xcc\xef\x0f" "run_in_executor",
+        (const byte*)"\x48\x75\x02" "_r",
+        (const byte*)"\x4d\x75\x02" "_w",
+        (const byte*)"\x4d\x6e\x02" "fn",
+        (const byte*)"\x66\x8b\x03" "ret",
+        (const byte*)"\xf9\xec\x06" "waiter",
+        (const byte*)"\xa2\x67\x03" "job",
+        (const byte*)"\xdb\xc4\x05" "_work",
+        (const byte*)"\x48\x59\x05" "_read",
+        (const byte*)"\xee\xe7\x07" "_submit",
+        (const byte*)"\xed\x80\x08" "shutdown",
+        (const byte*)"\x9f\xf9\x08" "_workers",
+        (const byte*)"\x89\xd1\x09" "_nthreads",
+        (const byte*)"\x4b\x42\x06" "_mutex",
+        (const byte*)"\x5e\x76\x05" "_idle",
+        (const byte*)"\x65\xa3\x08" "_pending",
+        (const byte*)"\xba\x4f\x05" "_done",
+        (const byte*)"\x1d\x96\x05" "_nrun",
+        (const byte*)"\x22\xfd\x05" "_wake",
+        (const byte*)"\xbf\xc7\x07" "_reader",
+        (const byte*)"\x80\xfc\x07" "workers",
+        (const byte*)"\xd2\xb5\x01" "w",
+        (const byte*)"\xb5\x5f\x11" "uasyncio/funcs.py",
+        (const byte*)"\x7c\x91\x07" "_Remove",
+        (const byte*)"\xd4\xb9\x11" "return_exceptions",
+        (const byte*)"\x3e\x54\x07" "timeout",
+        (const byte*)"\xf5\x5b\x06" "runner",
+        (const byte*)"\xb2\x6d\x02" "er",
+        (const byte*)"\x93\x27\x10" "uasyncio/lock.py",
+        (const byte*)"\x29\x0e\x11" "uasyncio/queue.py",
+        (const byte*)"\xb1\x8d\x05" "qsize",
+        (const byte*)"\xb0\xdf\x05" "empty",
+        (const byte*)"\xd6\x68\x04" "full",
+        (const byte*)"\xe1\xec\x0a" "put_nowait",
+        (const byte*)"\x86\x41\x0a" "get_nowait",
+        (const byte*)"\x74\x70\x03" "put",
+        (const byte*)"\x37\x3a\x09" "task_done",
+        (const byte*)"\xab\x25\x04" "_buf",
+        (const byte*)"\x12\xf5\x05" "_head",
+        (const byte*)"\x54\x75\x02" "_n",
+        (const byte*)"\x93\x71\x0b" "_unfinished",
+        (const byte*)"\x3c\xf2\x08" "_getters",
+        (const byte*)"\x7b\x4c\x08" "_putters",
+        (const byte*)"\xfc\xfe\x08" "_joiners",
+        (const byte*)"\x90\x21\x04" "item",
+        (const byte*)"\x84\xde\x12" "uasyncio/stream.py",
+        (const byte*)"\xe5\x05\x05" "_SCAN",
+        (const byte*)"\x5f\xfc\x0b" "_BACKOFF_MS",
+        (const byte*)"\x39\xd8\x06" "Stream",
+        (const byte*)"\x9c\x9a\x0c" "StreamReader",
+        (const byte*)"\x36\x8b\x0c" "StreamWriter",
+        (const byte*)"\xd8\x63\x0f" "open_connection",
+        (const byte*)"\xa0\x0b\x06" "Server",
+        (const byte*)"\x76\xae\x0a" "_serve_one",
+        (const byte*)"\xda\x1b\x0b" "_PoolStream",
+        (const byte*)"\x62\x19\x08" "_Handler",
+        (const byte*)"\xbf\xf8\x0c" "start_server",
+        (const byte*)"\x5a\xe8\x0d" "stream_awrite",
+        (const byte*)"\x52\x60\x06" "aclose",
+        (const byte*)"\xf9\xc1\x06" "awrite",
+        (const byte*)"\xec\x0a\x09" "awritestr",
+        (const byte*)"\xc7\x40\x0e" "get_extra_info",
+        (const byte*)"\x78\x0c\x0a" "set_buffer",
+        (const byte*)"\x35\x1e\x05" "_fill",
+        (const byte*)"\xc1\xb1\x05" "_take",
+        (const byte*)"\x82\xb2\x0a" "_readuntil",
+        (const byte*)"\xc9\x5c\x0b" "readexactly",
+        (const byte*)"\x9d\x87\x09" "readuntil",
+        (const byte*)"\x65\x43\x0a" "writelines",
+        (const byte*)"\x75\x49\x05" "drain",
+        (const byte*)"\x85\x75\x07" "out_buf",
+        (const byte*)"\x66\xeb\x04" "rbuf",
+        (const byte*)"\xbb\xc2\x04" "rpos",
+        (const byte*)"\x98\xfa\x04" "rend",
+        (const byte*)"\x51\xa0\x07" "bufsize",
+        (const byte*)"\xd3\xb5\x01" "v",
+        (const byte*)"\xad\xd8\x06" "_serve",
+        (const byte*)"\x80\x20\x08" "peername",
+        (const byte*)"\xe4\x6e\x02" "cb",
+        (const byte*)"\x6a\xa9\x07" "backlog",
+        (const byte*)"\xb9\xd9\x04" "pool",
+        (const byte*)"\xe5\x70\x02" "ss",
+        (const byte*)"\xb3\xe5\x04" "_run",
+        (const byte*)"\x12\x8d\x03" "srv",
+    },
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__NotFoundError
+STATIC const byte fun_data_upip__lt_module_gt__NotFoundError[23] = {
+    0x00, 0x0e,
+    MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x8c, 0x1c, 0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__NotFoundError = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__NotFoundError,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 23,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_NotFoundError,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__NotFoundError + 6,
+        .opcodes = fun_data_upip__lt_module_gt__NotFoundError + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__op_split
+STATIC const byte fun_data_upip__lt_module_gt__op_split[82] = {
+    0x31, 0x1e,
+    MP_QSTR_op_split & 0xff, MP_QSTR_op_split >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x20, 0x28, 0x29, 0x2b, 0x2b, 0x27, 0x24, 0x24, 0x24, 0x00,
+    0xb0, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xd9, 
+    0x44, 0x09, 0x80, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x2a, 0x02, 
+    0x63, 
+    0xb0, 
+    0x14, MP_QSTR_rsplit & 0xff, MP_QSTR_rsplit >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x81, 
+    0x36, 0x02, 
+    0xc1, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x81, 
+    0xd9, 
+    0x44, 0x07, 0x80, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xb0, 
+    0x2a, 0x02, 
+    0x63, 
+    0xb1, 
+    0x80, 
+    0x55, 
+    0xc2, 
+    0xb2, 
+    0x43, 0x04, 0x80, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xc2, 
+    0xb2, 
+    0xb1, 
+    0x81, 
+    0x55, 
+    0x2a, 0x02, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__op_split[1] = {
+    MP_ROM_QSTR(MP_QSTR_path),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__op_split = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__op_split,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__op_split,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 82,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_op_split,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__op_split + 6,
+        .opcodes = fun_data_upip__lt_module_gt__op_split + 17,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__op_basename
+STATIC const byte fun_data_upip__lt_module_gt__op_basename[18] = {
+    0x11, 0x0e,
+    MP_QSTR_op_basename & 0xff, MP_QSTR_op_basename >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x2c, 0x00,
+    0x12, MP_QSTR_op_split & 0xff, MP_QSTR_op_split >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x81, 
+    0x55, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__op_basename[1] = {
+    MP_ROM_QSTR(MP_QSTR_path),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__op_basename = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__op_basename,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__op_basename,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_op_basename,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__op_basename + 6,
+        .opcodes = fun_data_upip__lt_module_gt__op_basename + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt___makedirs
+STATIC const byte fun_data_upip__lt_module_gt___makedirs[175] = {
+    0x82, 0x13, 0x2c,
+    MP_QSTR__makedirs & 0xff, MP_QSTR__makedirs >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x31, 0x22, 0x24, 0x37, 0x2a, 0x24, 0x26, 0x2e, 0x26, 0x24, 0x23, 0x2a, 0x51, 0x3c, 0x22, 0x2f, 0x00,
+    0x50, 
+    0xc2, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xc3, 
+    0xb0, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x36, 0x01, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x36, 0x01, 
+    0x51, 
+    0x7f, 
+    0x2e, 0x02, 
+    0x55, 
+    0xc4, 
+    0xb4, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xd9, 
+    0x44, 0x04, 0x80, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xc3, 
+    0xb4, 
+    0x5f, 
+    0x4b, 0x64, 0x00, 
+    0xc5, 
+    0xb3, 
+    0x44, 0x10, 0x80, 
+    0xb3, 
+    0x7f, 
+    0x55, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xdc, 
+    0x44, 0x06, 0x80, 
+    0xb3, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xe5, 
+    0xc3, 
+    0xb3, 
+    0xb5, 
+    0xe5, 
+    0xc3, 
+    0x48, 0x0f, 0x00, 
+    0x12, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x14, MP_QSTR_mkdir & 0xff, MP_QSTR_mkdir >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x59, 
+    0x52, 
+    0xc2, 
+    0x4a, 0x36, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x2d, 0x80, 
+    0xc6, 
+    0x49, 0x21, 0x00, 
+    0xb6, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x13, MP_QSTR_EEXIST & 0xff, MP_QSTR_EEXIST >> 8, 
+    0xdc, 
+    0x44, 0x10, 0x80, 
+    0xb6, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x13, MP_QSTR_EISDIR & 0xff, MP_QSTR_EISDIR >> 8, 
+    0xdc, 
+    0x44, 0x02, 0x80, 
+    0xb6, 
+    0x65, 
+    0x50, 
+    0xc2, 
+    0x51, 
+    0x51, 
+    0xc6, 
+    0x28, 0x06, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x42, 0x99, 0x7f, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt___makedirs[2] = {
+    MP_ROM_QSTR(MP_QSTR_name),
+    MP_ROM_QSTR(MP_QSTR_mode),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt___makedirs = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt___makedirs,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt___makedirs,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 175,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 17,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR__makedirs,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt___makedirs + 7,
+        .opcodes = fun_data_upip__lt_module_gt___makedirs + 25,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__save_file
+STATIC const byte fun_data_upip__lt_module_gt__save_file[64] = {
+    0x4e, 0x1a,
+    MP_QSTR_save_file & 0xff, MP_QSTR_save_file >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x45, 0x20, 0x2d, 0x20, 0x2a, 0x24, 0x23, 0x00,
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb0, 
+    0x10, MP_QSTR_wb & 0xff, MP_QSTR_wb >> 8, 
+    0x34, 0x02, 
+    0x47, 0x21, 0x00, 
+    0xc2, 
+    0xb1, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0x12, MP_QSTR_file_buf & 0xff, MP_QSTR_file_buf >> 8, 
+    0x36, 0x01, 
+    0xc3, 
+    0xb3, 
+    0x43, 0x03, 0x80, 
+    0x42, 0x0e, 0x80, 
+    0xb2, 
+    0x14, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0x12, MP_QSTR_file_buf & 0xff, MP_QSTR_file_buf >> 8, 
+    0xb3, 
+    0x36, 0x02, 
+    0x59, 
+    0x42, 0xe1, 0x7f, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__save_file[2] = {
+    MP_ROM_QSTR(MP_QSTR_fname),
+    MP_ROM_QSTR(MP_QSTR_subf),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__save_file = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__save_file,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__save_file,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 64,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_save_file,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__save_file + 6,
+        .opcodes = fun_data_upip__lt_module_gt__save_file + 15,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__install_tar
+STATIC const byte fun_data_upip__lt_module_gt__install_tar[245] = {
+    0x9e, 0x10, 0x3c,
+    MP_QSTR_install_tar & 0xff, MP_QSTR_install_tar >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x4f, 0x23, 0x46, 0x25, 0x23, 0x5d, 0x48, 0x22, 0x50, 0x32, 0x2b, 0x31, 0x22, 0x26, 0x2a, 0x4a, 0x24, 0x24, 0x2e, 0x26, 0x2a, 0x27, 0x28, 0x2b, 0x00,
+    0x2c, 0x00, 
+    0xc2, 
+    0xb0, 
+    0x5f, 
+    0x4b, 0xca, 0x00, 
+    0xc3, 
+    0xb3, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0xc4, 
+    0x48, 0x14, 0x00, 
+    0xb4, 
+    0xb4, 
+    0x14, MP_QSTR_index & 0xff, MP_QSTR_index >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x36, 0x01, 
+    0x81, 
+    0xf2, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0xc4, 
+    0x4a, 0x11, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0xdf, 
+    0x44, 0x08, 0x80, 
+    0x59, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xc4, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x52, 
+    0xc5, 
+    0x10, MP_QSTR_setup_dot_ & 0xff, MP_QSTR_setup_dot_ >> 8, 
+    0x10, MP_QSTR_PKG_hyphen_INFO & 0xff, MP_QSTR_PKG_hyphen_INFO >> 8, 
+    0x10, MP_QSTR_README & 0xff, MP_QSTR_README >> 8, 
+    0x2a, 0x03, 
+    0x5f, 
+    0x4b, 0x4b, 0x00, 
+    0xc6, 
+    0xb4, 
+    0x14, MP_QSTR_startswith & 0xff, MP_QSTR_startswith >> 8, 
+    0xb6, 
+    0x36, 0x01, 
+    0x43, 0x08, 0x80, 
+    0x10, MP_QSTR__dot_egg_hyphen_info & 0xff, MP_QSTR__dot_egg_hyphen_info >> 8, 
+    0xb4, 
+    0xdd, 
+    0x44, 0x35, 0x80, 
+    0xb4, 
+    0x14, MP_QSTR_endswith & 0xff, MP_QSTR_endswith >> 8, 
+    0x23, 0x02, 
+    0x36, 0x01, 
+    0x44, 0x11, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x36, 0x00, 
+    0xb2, 
+    0x10, MP_QSTR_deps & 0xff, MP_QSTR_deps >> 8, 
+    0x56, 
+    0x50, 
+    0xc5, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x10, MP_QSTR_Skipping & 0xff, MP_QSTR_Skipping >> 8, 
+    0xb4, 
+    0x34, 0x02, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x42, 0x03, 0x80, 
+    0x42, 0xb2, 0x7f, 
+    0xb5, 
+    0x44, 0x39, 0x80, 
+    0xb1, 
+    0xb4, 
+    0xf2, 
+    0xc7, 
+    0xb3, 
+    0x13, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0x12, MP_QSTR_tarfile & 0xff, MP_QSTR_tarfile >> 8, 
+    0x13, MP_QSTR_DIRTYPE & 0xff, MP_QSTR_DIRTYPE >> 8, 
+    0xdc, 
+    0x44, 0x27, 0x80, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x03, 
+    0xb7, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR__makedirs & 0xff, MP_QSTR__makedirs >> 8, 
+    0xb7, 
+    0x34, 0x01, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0xc8, 
+    0x12, MP_QSTR_save_file & 0xff, MP_QSTR_save_file >> 8, 
+    0xb7, 
+    0xb8, 
+    0x34, 0x02, 
+    0x59, 
+    0x42, 0x33, 0x7f, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_tar_0 = {{&mp_type_str}, 36962, 13, (const byte*)"\x2f\x72\x65\x71\x75\x69\x72\x65\x73\x2e\x74\x78\x74"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_tar_1 = {{&mp_type_str}, 56712, 11, (const byte*)"\x45\x78\x74\x72\x61\x63\x74\x69\x6e\x67\x20"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__install_tar[4] = {
+    MP_ROM_QSTR(MP_QSTR_f),
+    MP_ROM_QSTR(MP_QSTR_prefix),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_tar_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_tar_1),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__install_tar = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__install_tar,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__install_tar,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 245,
+    .n_obj = 2,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 20,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_install_tar,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__install_tar + 7,
+        .opcodes = fun_data_upip__lt_module_gt__install_tar + 33,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__expandhome
+STATIC const byte fun_data_upip__lt_module_gt__expandhome[49] = {
+    0x31, 0x14,
+    MP_QSTR_expandhome & 0xff, MP_QSTR_expandhome >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x6f, 0x28, 0x2c, 0x2f, 0x00,
+    0x10, MP_QSTR__tilde__slash_ & 0xff, MP_QSTR__tilde__slash_ >> 8, 
+    0xb0, 
+    0xdd, 
+    0x44, 0x1b, 0x80, 
+    0x12, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x14, MP_QSTR_getenv & 0xff, MP_QSTR_getenv >> 8, 
+    0x10, MP_QSTR_HOME & 0xff, MP_QSTR_HOME >> 8, 
+    0x36, 0x01, 
+    0xc1, 
+    0xb0, 
+    0x14, MP_QSTR_replace & 0xff, MP_QSTR_replace >> 8, 
+    0x10, MP_QSTR__tilde__slash_ & 0xff, MP_QSTR__tilde__slash_ >> 8, 
+    0xb1, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xf2, 
+    0x36, 0x02, 
+    0xc0, 
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__expandhome[1] = {
+    MP_ROM_QSTR(MP_QSTR_s),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__expandhome = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__expandhome,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__expandhome,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 49,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_expandhome,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__expandhome + 6,
+        .opcodes = fun_data_upip__lt_module_gt__expandhome + 12,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__url_open
+STATIC const byte fun_data_upip__lt_module_gt__url_open[381] = {
+    0x91, 0x12, 0x56,
+    MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x7c, 0x40, 0x26, 0x47, 0x30, 0x23, 0x24, 0x28, 0x2d, 0x27, 0x1f, 0x42, 0x55, 0x44, 0x32, 0x43, 0x4a, 0x28, 0x2f, 0x26, 0x2a, 0x64, 0x2f, 0x27, 0x2d, 0x27, 0x2e, 0x28, 0x27, 0x20, 0x27, 0x24, 0x28, 0x27, 0x55, 0x27, 0x4c, 0x00,
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x07, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x83, 
+    0x36, 0x02, 
+    0x30, 0x04, 
+    0xc1, 
+    0xc2, 
+    0xc3, 
+    0xc4, 
+    0x48, 0x35, 0x00, 
+    0x22, 0x83, 0x3b, 
+    0xc5, 
+    0x10, MP_QSTR__colon_ & 0xff, MP_QSTR__colon_ >> 8, 
+    0xb3, 
+    0xdd, 
+    0x44, 0x14, 0x80, 
+    0xb3, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__colon_ & 0xff, MP_QSTR__colon_ >> 8, 
+    0x36, 0x01, 
+    0x30, 0x02, 
+    0xc3, 
+    0xc5, 
+    0x12, MP_QSTR_int & 0xff, MP_QSTR_int >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0xc5, 
+    0x12, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x14, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0xb3, 
+    0xb5, 
+    0x80, 
+    0x12, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x13, MP_QSTR_SOCK_STREAM & 0xff, MP_QSTR_SOCK_STREAM >> 8, 
+    0x36, 0x04, 
+    0xc6, 
+    0x4a, 0x21, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x18, 0x80, 
+    0xc7, 
+    0x49, 0x0c, 0x00, 
+    0x12, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x23, 0x01, 
+    0xb3, 
+    0xf8, 
+    0xb7, 
+    0x34, 0x02, 
+    0x59, 
+    0x51, 
+    0x51, 
+    0xc7, 
+    0x28, 0x07, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb6, 
+    0x80, 
+    0x55, 
+    0xc6, 
+    0x12, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x14, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0xb6, 
+    0x80, 
+    0x55, 
+    0xb6, 
+    0x81, 
+    0x55, 
+    0xb6, 
+    0x82, 
+    0x55, 
+    0x36, 0x03, 
+    0xc8, 
+    0x48, 0x9f, 0x00, 
+    0xb8, 
+    0x14, MP_QSTR_connect & 0xff, MP_QSTR_connect >> 8, 
+    0xb6, 
+    0x7f, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0xb1, 
+    0x10, MP_QSTR_https_colon_ & 0xff, MP_QSTR_https_colon_ >> 8, 
+    0xd9, 
+    0x44, 0x23, 0x80, 
+    0x12, MP_QSTR_ussl & 0xff, MP_QSTR_ussl >> 8, 
+    0x14, MP_QSTR_wrap_socket & 0xff, MP_QSTR_wrap_socket >> 8, 
+    0xb8, 
+    0x10, MP_QSTR_server_hostname & 0xff, MP_QSTR_server_hostname >> 8, 
+    0xb3, 
+    0x36, 0x82, 0x01, 
+    0xc8, 
+    0x12, MP_QSTR_warn_ussl & 0xff, MP_QSTR_warn_ussl >> 8, 
+    0x44, 0x0e, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0xb3, 
+    0xf8, 
+    0x34, 0x01, 
+    0x59, 
+    0x50, 
+    0x17, MP_QSTR_warn_ussl & 0xff, MP_QSTR_warn_ussl >> 8, 
+    0xb8, 
+    0x14, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0x23, 0x03, 
+    0xb4, 
+    0xb3, 
+    0xb5, 
+    0x2a, 0x03, 
+    0xf8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb8, 
+    0x14, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x36, 0x00, 
+    0xc9, 
+    0xb9, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x51, 
+    0x82, 
+    0x36, 0x02, 
+    0x30, 0x03, 
+    0xca, 
+    0xcb, 
+    0xcc, 
+    0xbb, 
+    0x23, 0x04, 
+    0xdc, 
+    0x44, 0x1d, 0x80, 
+    0xbb, 
+    0x23, 0x05, 
+    0xd9, 
+    0x43, 0x07, 0x80, 
+    0xbb, 
+    0x23, 0x06, 
+    0xd9, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x23, 0x07, 
+    0x34, 0x01, 
+    0x65, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0xbb, 
+    0x34, 0x01, 
+    0x65, 
+    0xb8, 
+    0x14, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x36, 0x00, 
+    0xc9, 
+    0xb9, 
+    0x43, 0x08, 0x80, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0x23, 0x08, 
+    0x34, 0x01, 
+    0x65, 
+    0xb9, 
+    0x23, 0x09, 
+    0xd9, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x03, 0x80, 
+    0x42, 0xe0, 0x7f, 
+    0x4a, 0x1f, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0xdf, 
+    0x44, 0x16, 0x80, 
+    0xc7, 
+    0x49, 0x0a, 0x00, 
+    0xb8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb7, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc7, 
+    0x28, 0x07, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb8, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_0 = {{&mp_type_str}, 10889, 35, (const byte*)"\x55\x6e\x61\x62\x6c\x65\x20\x74\x6f\x20\x72\x65\x73\x6f\x6c\x76\x65\x20\x25\x73\x20\x28\x6e\x6f\x20\x49\x6e\x74\x65\x72\x6e\x65\x74\x3f\x29"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_1 = {{&mp_type_str}, 51159, 44, (const byte*)"\x57\x61\x72\x6e\x69\x6e\x67\x3a\x20\x25\x73\x20\x53\x53\x4c\x20\x63\x65\x72\x74\x69\x66\x69\x63\x61\x74\x65\x20\x69\x73\x20\x6e\x6f\x74\x20\x76\x61\x6c\x69\x64\x61\x74\x65\x64"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_2 = {{&mp_type_str}, 65109, 33, (const byte*)"\x47\x45\x54\x20\x2f\x25\x73\x20\x48\x54\x54\x50\x2f\x31\x2e\x30\x0d\x0a\x48\x6f\x73\x74\x3a\x20\x25\x73\x3a\x25\x73\x0d\x0a\x0d\x0a"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_3 = {{&mp_type_bytes}, 28951, 3, (const byte*)"\x32\x30\x30"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_4 = {{&mp_type_bytes}, 22421, 3, (const byte*)"\x34\x30\x34"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_5 = {{&mp_type_bytes}, 29975, 3, (const byte*)"\x33\x30\x31"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_6 = {{&mp_type_str}, 48284, 17, (const byte*)"\x50\x61\x63\x6b\x61\x67\x65\x20\x6e\x6f\x74\x20\x66\x6f\x75\x6e\x64"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_7 = {{&mp_type_str}, 39199, 30, (const byte*)"\x55\x6e\x65\x78\x70\x65\x63\x74\x65\x64\x20\x45\x4f\x46\x20\x69\x6e\x20\x48\x54\x54\x50\x20\x68\x65\x61\x64\x65\x72\x73"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_8 = {{&mp_type_bytes}, 27298, 2, (const byte*)"\x0d\x0a"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__url_open[10] = {
+    MP_ROM_QSTR(MP_QSTR_url),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_1),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_2),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_3),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_4),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_5),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_6),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_7),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_8),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__url_open = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__url_open,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__url_open,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 381,
+    .n_obj = 9,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 19,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_url_open,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__url_open + 7,
+        .opcodes = fun_data_upip__lt_module_gt__url_open + 46,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__get_pkg_metadata
+STATIC const byte fun_data_upip__lt_module_gt__get_pkg_metadata[96] = {
+    0x65, 0x1c,
+    MP_QSTR_get_pkg_metadata & 0xff, MP_QSTR_get_pkg_metadata >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xae, 0x28, 0x23, 0x5a, 0x28, 0x23, 0x4b, 0x2b, 0x00,
+    0x12, MP_QSTR_index_urls & 0xff, MP_QSTR_index_urls >> 8, 
+    0x5f, 
+    0x4b, 0x3f, 0x00, 
+    0xc1, 
+    0x48, 0x11, 0x00, 
+    0x12, MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8, 
+    0x10, MP_QSTR__percent_s_slash__percent_s_slash_json & 0xff, MP_QSTR__percent_s_slash__percent_s_slash_json >> 8, 
+    0xb1, 
+    0xb0, 
+    0x2a, 0x02, 
+    0xf8, 
+    0x34, 0x01, 
+    0xc2, 
+    0x4a, 0x11, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0xdf, 
+    0x44, 0x08, 0x80, 
+    0x59, 
+    0x40, 0xdc, 0x7f, 0x01, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x49, 0x0b, 0x00, 
+    0x12, MP_QSTR_json & 0xff, MP_QSTR_json >> 8, 
+    0x14, MP_QSTR_load & 0xff, MP_QSTR_load >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x63, 
+    0x51, 
+    0xb2, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x5d, 
+    0x42, 0xbe, 0x7f, 
+    0x12, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x23, 0x01, 
+    0x34, 0x01, 
+    0x65, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__get_pkg_metadata_0 = {{&mp_type_str}, 48284, 17, (const byte*)"\x50\x61\x63\x6b\x61\x67\x65\x20\x6e\x6f\x74\x20\x66\x6f\x75\x6e\x64"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__get_pkg_metadata[2] = {
+    MP_ROM_QSTR(MP_QSTR_name),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__get_pkg_metadata_0),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__get_pkg_metadata = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__get_pkg_metadata,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__get_pkg_metadata,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 96,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 13,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_pkg_metadata,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__get_pkg_metadata + 6,
+        .opcodes = fun_data_upip__lt_module_gt__get_pkg_metadata + 16,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__fatal
+STATIC const byte fun_data_upip__lt_module_gt__fatal[47] = {
+    0xa2, 0x01, 0x14,
+    MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xbb, 0x2a, 0x2a, 0x22, 0x00,
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x10, MP_QSTR_Error_colon_ & 0xff, MP_QSTR_Error_colon_ >> 8, 
+    0xb0, 
+    0x34, 0x02, 
+    0x59, 
+    0xb1, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x02, 0x80, 
+    0xb1, 
+    0x65, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x14, MP_QSTR_exit & 0xff, MP_QSTR_exit >> 8, 
+    0x81, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__fatal[2] = {
+    MP_ROM_QSTR(MP_QSTR_msg),
+    MP_ROM_QSTR(MP_QSTR_exc),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__fatal = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__fatal,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__fatal,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 47,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_fatal,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__fatal + 7,
+        .opcodes = fun_data_upip__lt_module_gt__fatal + 13,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__install_pkg
+STATIC const byte fun_data_upip__lt_module_gt__install_pkg[177] = {
+    0x8e, 0x10, 0x32,
+    MP_QSTR_install_pkg & 0xff, MP_QSTR_install_pkg >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xc2, 0x47, 0x2a, 0x28, 0x22, 0x29, 0x2f, 0x28, 0x2e, 0x27, 0x27, 0x23, 0x2d, 0x2e, 0x49, 0x28, 0x22, 0x22, 0x29, 0x00,
+    0x12, MP_QSTR_get_pkg_metadata & 0xff, MP_QSTR_get_pkg_metadata >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0xc2, 
+    0xb2, 
+    0x10, MP_QSTR_info & 0xff, MP_QSTR_info >> 8, 
+    0x55, 
+    0x10, MP_QSTR_version & 0xff, MP_QSTR_version >> 8, 
+    0x55, 
+    0xc3, 
+    0xb2, 
+    0x10, MP_QSTR_releases & 0xff, MP_QSTR_releases >> 8, 
+    0x55, 
+    0xb3, 
+    0x55, 
+    0xc4, 
+    0x28, 0x02, 
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_collect & 0xff, MP_QSTR_collect >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb4, 
+    0x34, 0x01, 
+    0x81, 
+    0xd9, 
+    0x43, 0x04, 0x80, 
+    0x12, MP_QSTR_AssertionError & 0xff, MP_QSTR_AssertionError >> 8, 
+    0x65, 
+    0xb4, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR_url & 0xff, MP_QSTR_url >> 8, 
+    0x55, 
+    0xc5, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0xb0, 
+    0xb3, 
+    0xb5, 
+    0x2a, 0x03, 
+    0xf8, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_op_basename & 0xff, MP_QSTR_op_basename >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0xc6, 
+    0x12, MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0xc7, 
+    0x49, 0x24, 0x00, 
+    0x12, MP_QSTR_uzlib & 0xff, MP_QSTR_uzlib >> 8, 
+    0x14, MP_QSTR_DecompIO & 0xff, MP_QSTR_DecompIO >> 8, 
+    0xb7, 
+    0x12, MP_QSTR_gzdict_sz & 0xff, MP_QSTR_gzdict_sz >> 8, 
+    0x36, 0x02, 
+    0xc8, 
+    0x12, MP_QSTR_tarfile & 0xff, MP_QSTR_tarfile >> 8, 
+    0x14, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x10, MP_QSTR_fileobj & 0xff, MP_QSTR_fileobj >> 8, 
+    0xb8, 
+    0x36, 0x82, 0x00, 
+    0xc9, 
+    0x12, MP_QSTR_install_tar & 0xff, MP_QSTR_install_tar >> 8, 
+    0xb9, 
+    0xb1, 
+    0x34, 0x02, 
+    0xca, 
+    0x51, 
+    0xb7, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x5d, 
+    0x28, 0x09, 
+    0x28, 0x08, 
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_collect & 0xff, MP_QSTR_collect >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xba, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_pkg_0 = {{&mp_type_str}, 7236, 24, (const byte*)"\x49\x6e\x73\x74\x61\x6c\x6c\x69\x6e\x67\x20\x25\x73\x20\x25\x73\x20\x66\x72\x6f\x6d\x20\x25\x73"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__install_pkg[3] = {
+    MP_ROM_QSTR(MP_QSTR_pkg_spec),
+    MP_ROM_QSTR(MP_QSTR_install_path),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_pkg_0),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__install_pkg = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__install_pkg,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__install_pkg,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 177,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 18,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_install_pkg,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__install_pkg + 7,
+        .opcodes = fun_data_upip__lt_module_gt__install_pkg + 28,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__install
+STATIC const byte fun_data_upip__lt_module_gt__install[299] = {
+    0xfa, 0x03, 0x48,
+    MP_QSTR_install & 0xff, MP_QSTR_install >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xdb, 0x20, 0x32, 0x29, 0x44, 0x26, 0x26, 0x2a, 0x26, 0x2c, 0x24, 0x4a, 0x23, 0x23, 0x23, 0x26, 0x2a, 0x28, 0x26, 0x23, 0x28, 0x28, 0x26, 0x27, 0x32, 0x24, 0x32, 0x5b, 0x23, 0x2c, 0x00,
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_mem_free & 0xff, MP_QSTR_mem_free >> 8, 
+    0x36, 0x00, 
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_mem_alloc & 0xff, MP_QSTR_mem_alloc >> 8, 
+    0x36, 0x00, 
+    0xf2, 
+    0xc2, 
+    0xb2, 
+    0x22, 0x84, 0x80, 0x00, 
+    0xda, 
+    0x44, 0x04, 0x80, 
+    0x9c, 
+    0x17, MP_QSTR_gzdict_sz & 0xff, MP_QSTR_gzdict_sz >> 8, 
+    0xb1, 
+    0x51, 
+    0xde, 
+    0x44, 0x06, 0x80, 
+    0x12, MP_QSTR_get_install_path & 0xff, MP_QSTR_get_install_path >> 8, 
+    0x34, 0x00, 
+    0xc1, 
+    0xb1, 
+    0x7f, 
+    0x55, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xdc, 
+    0x44, 0x06, 0x80, 
+    0xb1, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xe5, 
+    0xc1, 
+    0x12, MP_QSTR_isinstance & 0xff, MP_QSTR_isinstance >> 8, 
+    0xb0, 
+    0x12, MP_QSTR_list & 0xff, MP_QSTR_list >> 8, 
+    0x34, 0x02, 
+    0x43, 0x04, 0x80, 
+    0xb0, 
+    0x2b, 0x01, 
+    0xc0, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0xb1, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0x2b, 0x00, 
+    0xc3, 
+    0x48, 0x78, 0x00, 
+    0x42, 0x6e, 0x80, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x10, MP_QSTR_Queue_colon_ & 0xff, MP_QSTR_Queue_colon_ >> 8, 
+    0xb0, 
+    0x34, 0x02, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_pop & 0xff, MP_QSTR_pop >> 8, 
+    0x80, 
+    0x36, 0x01, 
+    0xc4, 
+    0xb4, 
+    0xb3, 
+    0xdd, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x4d, 0x80, 
+    0x12, MP_QSTR_install_pkg & 0xff, MP_QSTR_install_pkg >> 8, 
+    0xb4, 
+    0xb1, 
+    0x34, 0x02, 
+    0xc5, 
+    0xb3, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb4, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x07, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0x59, 
+    0xb5, 
+    0x14, MP_QSTR_get & 0xff, MP_QSTR_get >> 8, 
+    0x10, MP_QSTR_deps & 0xff, MP_QSTR_deps >> 8, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x36, 0x02, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x36, 0x00, 
+    0xc6, 
+    0xb6, 
+    0x44, 0x1a, 0x80, 
+    0xb6, 
+    0x14, MP_QSTR_decode & 0xff, MP_QSTR_decode >> 8, 
+    0x10, MP_QSTR_utf_hyphen_8 & 0xff, MP_QSTR_utf_hyphen_8 >> 8, 
+    0x36, 0x01, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__0x0a_ & 0xff, MP_QSTR__0x0a_ >> 8, 
+    0x36, 0x01, 
+    0xc6, 
+    0xb0, 
+    0x14, MP_QSTR_extend & 0xff, MP_QSTR_extend >> 8, 
+    0xb6, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x43, 0x8e, 0x7f, 
+    0x4a, 0x2f, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0xdf, 
+    0x44, 0x26, 0x80, 
+    0xc7, 
+    0x49, 0x1a, 0x00, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x03, 
+    0x14, MP_QSTR_format & 0xff, MP_QSTR_format >> 8, 
+    0xb4, 
+    0xb7, 
+    0x36, 0x02, 
+    0x10, MP_QSTR_file & 0xff, MP_QSTR_file >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_stderr & 0xff, MP_QSTR_stderr >> 8, 
+    0x34, 0x82, 0x01, 
+    0x59, 
+    0x51, 
+    0x51, 
+    0xc7, 
+    0x28, 0x07, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_0 = {{&mp_type_str}, 1253, 15, (const byte*)"\x49\x6e\x73\x74\x61\x6c\x6c\x69\x6e\x67\x20\x74\x6f\x3a\x20"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_1 = {{&mp_type_str}, 31671, 62, (const byte*)"\x45\x72\x72\x6f\x72\x20\x69\x6e\x73\x74\x61\x6c\x6c\x69\x6e\x67\x20\x27\x7b\x7d\x27\x3a\x20\x7b\x7d\x2c\x20\x70\x61\x63\x6b\x61\x67\x65\x73\x20\x6d\x61\x79\x20\x62\x65\x20\x70\x61\x72\x74\x69\x61\x6c\x6c\x79\x20\x69\x6e\x73\x74\x61\x6c\x6c\x65\x64"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__install[4] = {
+    MP_ROM_QSTR(MP_QSTR_to_install),
+    MP_ROM_QSTR(MP_QSTR_install_path),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_1),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__install = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__install,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__install,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 299,
+    .n_obj = 2,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 16,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_install,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__install + 7,
+        .opcodes = fun_data_upip__lt_module_gt__install + 39,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__get_install_path
+STATIC const byte fun_data_upip__lt_module_gt__get_install_path[47] = {
+    0x08, 0x16,
+    MP_QSTR_get_install_path & 0xff, MP_QSTR_get_install_path >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x00, 0x20, 0x48, 0x2b, 0x2b, 0x00,
+    0x12, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x0b, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_path & 0xff, MP_QSTR_path >> 8, 
+    0x81, 
+    0x55, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x12, MP_QSTR_expandhome & 0xff, MP_QSTR_expandhome >> 8, 
+    0x12, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x34, 0x01, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x12, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__get_install_path = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__get_install_path,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 47,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_install_path,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__get_install_path + 6,
+        .opcodes = fun_data_upip__lt_module_gt__get_install_path + 13,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__cleanup
+STATIC const byte fun_data_upip__lt_module_gt__cleanup[64] = {
+    0x54, 0x14,
+    MP_QSTR_cleanup & 0xff, MP_QSTR_cleanup >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x09, 0x28, 0x23, 0x56, 0x00,
+    0x12, MP_QSTR_cleanup_files & 0xff, MP_QSTR_cleanup_files >> 8, 
+    0x5f, 
+    0x4b, 0x2b, 0x00, 
+    0xc0, 
+    0x48, 0x0d, 0x00, 
+    0x12, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x14, MP_QSTR_unlink & 0xff, MP_QSTR_unlink >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0x59, 
+    0x4a, 0x17, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x0e, 0x80, 
+    0x59, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x00, 
+    0xb0, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x42, 0xd2, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__cleanup_0 = {{&mp_type_str}, 17877, 23, (const byte*)"\x57\x61\x72\x6e\x69\x6e\x67\x3a\x20\x43\x61\x6e\x6e\x6f\x74\x20\x64\x65\x6c\x65\x74\x65\x20"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__cleanup[1] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__cleanup_0),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__cleanup = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__cleanup,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__cleanup,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 64,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 11,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_cleanup,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__cleanup + 6,
+        .opcodes = fun_data_upip__lt_module_gt__cleanup + 12,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__help
+STATIC const byte fun_data_upip__lt_module_gt__help[48] = {
+    0x18, 0x18,
+    MP_QSTR_help & 0xff, MP_QSTR_help >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x11, 0x23, 0x85, 0x09, 0x30, 0x23, 0x00,
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x00, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x01, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_path & 0xff, MP_QSTR_path >> 8, 
+    0x81, 
+    0x55, 
+    0x34, 0x02, 
+    0x59, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0x34, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__help_0 = {{&mp_type_str}, 14525, 341, (const byte*)"\x75\x70\x69\x70\x20\x2d\x20\x53\x69\x6d\x70\x6c\x65\x20\x50\x79\x50\x49\x20\x70\x61\x63\x6b\x61\x67\x65\x20\x6d\x61\x6e\x61\x67\x65\x72\x20\x66\x6f\x72\x20\x4d\x69\x63\x72\x6f\x50\x79\x74\x68\x6f\x6e\x0a\x55\x73\x61\x67\x65\x3a\x20\x6d\x69\x63\x72\x6f\x70\x79\x74\x68\x6f\x6e\x20\x2d\x6d\x20\x75\x70\x69\x70\x20\x69\x6e\x73\x74\x61\x6c\x6c\x20\x5b\x2d\x70\x20\x3c\x70\x61\x74\x68\x3e\x5d\x20\x3c\x70\x61\x63\x6b\x61\x67\x65\x3e\x2e\x2e\x2e\x20\x7c\x20\x2d\x72\x20\x3c\x72\x65\x71\x75\x69\x72\x65\x6d\x65\x6e\x74\x73\x2e\x74\x78\x74\x3e\x0a\x69\x6d\x70\x6f\x72\x74\x20\x75\x70\x69\x70\x3b\x20\x75\x70\x69\x70\x2e\x69\x6e\x73\x74\x61\x6c\x6c\x28\x70\x61\x63\x6b\x61\x67\x65\x5f\x6f\x72\x5f\x6c\x69\x73\x74\x2c\x20\x5b\x3c\x70\x61\x74\x68\x3e\x5d\x29\x0a\x0a\x49\x66\x20\x3c\x70\x61\x74\x68\x3e\x20\x69\x73\x20\x6e\x6f\x74\x20\x67\x69\x76\x65\x6e\x2c\x20\x70\x61\x63\x6b\x61\x67\x65\x73\x20\x77\x69\x6c\x6c\x20\x62\x65\x20\x69\x6e\x73\x74\x61\x6c\x6c\x65\x64\x20\x69\x6e\x74\x6f\x20\x73\x79\x73\x2e\x70\x61\x74\x68\x5b\x31\x5d\x0a\x28\x63\x61\x6e\x20\x62\x65\x20\x73\x65\x74\x20\x66\x72\x6f\x6d\x20\x4d\x49\x43\x52\x4f\x50\x59\x50\x41\x54\x48\x20\x65\x6e\x76\x69\x72\x6f\x6e\x6d\x65\x6e\x74\x20\x76\x61\x72\x69\x61\x62\x6c\x65\x2c\x20\x69\x66\x20\x63\x75\x72\x72\x65\x6e\x74\x20\x73\x79\x73\x74\x65\x6d\x0a\x73\x75\x70\x70\x6f\x72\x74\x73\x20\x74\x68\x61\x74\x29\x2e"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__help_1 = {{&mp_type_str}, 17177, 29, (const byte*)"\x43\x75\x72\x72\x65\x6e\x74\x20\x76\x61\x6c\x75\x65\x20\x6f\x66\x20\x73\x79\x73\x2e\x70\x61\x74\x68\x5b\x31\x5d\x3a"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__help_2 = {{&mp_type_str}, 34882, 146, (const byte*)"\x0a\x4e\x6f\x74\x65\x3a\x20\x6f\x6e\x6c\x79\x20\x4d\x69\x63\x72\x6f\x50\x79\x74\x68\x6f\x6e\x20\x70\x61\x63\x6b\x61\x67\x65\x73\x20\x28\x75\x73\x75\x61\x6c\x6c\x79\x2c\x20\x6e\x61\x6d\x65\x64\x20\x6d\x69\x63\x72\x6f\x70\x79\x74\x68\x6f\x6e\x2d\x2a\x29\x20\x61\x72\x65\x20\x73\x75\x70\x70\x6f\x72\x74\x65\x64\x0a\x66\x6f\x72\x20\x69\x6e\x73\x74\x61\x6c\x6c\x61\x74\x69\x6f\x6e\x2c\x20\x75\x70\x69\x70\x20\x64\x6f\x65\x73\x20\x6e\x6f\x74\x20\x73\x75\x70\x70\x6f\x72\x74\x20\x61\x72\x62\x69\x74\x72\x61\x72\x79\x20\x63\x6f\x64\x65\x20\x69\x6e\x20\x73\x65\x74\x75\x70\x2e\x70\x79\x2e\x0a"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__help[3] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__help_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__help_1),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__help_2),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__help = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__help,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__help,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 48,
+    .n_obj = 3,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_help,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__help + 6,
+        .opcodes = fun_data_upip__lt_module_gt__help + 14,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__main
+STATIC const byte fun_data_upip__lt_module_gt__main[423] = {
+    0x5c, 0x68,
+    MP_QSTR_main & 0xff, MP_QSTR_main >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x26, 0x20, 0x20, 0x20, 0x44, 0x1f, 0x2f, 0x26, 0x42, 0x2f, 0x48, 0x43, 0x22, 0x23, 0x29, 0x24, 0x30, 0x26, 0x22, 0x28, 0x2b, 0x27, 0x28, 0x29, 0x24, 0x2a, 0x20, 0x27, 0x24, 0x23, 0x2a, 0x23, 0x36, 0x28, 0x2d, 0x27, 0x28, 0x47, 0x1f, 0x4c, 0x32, 0x24, 0x26, 0x42, 0x47, 0x26, 0x00,
+    0x51, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x34, 0x01, 
+    0x82, 
+    0xd7, 
+    0x43, 0x1e, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x81, 
+    0x55, 
+    0x10, MP_QSTR__hyphen_h & 0xff, MP_QSTR__hyphen_h >> 8, 
+    0xd9, 
+    0x43, 0x0f, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x81, 
+    0x55, 
+    0x10, MP_QSTR__hyphen__hyphen_help & 0xff, MP_QSTR__hyphen__hyphen_help >> 8, 
+    0xd9, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x81, 
+    0x55, 
+    0x10, MP_QSTR_install & 0xff, MP_QSTR_install >> 8, 
+    0xdc, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x23, 0x00, 
+    0x34, 0x01, 
+    0x59, 
+    0x2b, 0x00, 
+    0xc0, 
+    0x82, 
+    0xc1, 
+    0x42, 0xc4, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0xc2, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_h & 0xff, MP_QSTR__hyphen_h >> 8, 
+    0xd9, 
+    0x43, 0x08, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen__hyphen_help & 0xff, MP_QSTR__hyphen__hyphen_help >> 8, 
+    0xd9, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_p & 0xff, MP_QSTR__hyphen_p >> 8, 
+    0xd9, 
+    0x44, 0x12, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0x42, 0x85, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_r & 0xff, MP_QSTR__hyphen_r >> 8, 
+    0xd9, 
+    0x44, 0x48, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0xc3, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb3, 
+    0x34, 0x01, 
+    0x47, 0x2d, 0x00, 
+    0xc4, 
+    0xb4, 
+    0x14, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x36, 0x00, 
+    0xc5, 
+    0xb5, 
+    0x43, 0x03, 0x80, 
+    0x42, 0x1d, 0x80, 
+    0xb5, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR__hash_ & 0xff, MP_QSTR__hash_ >> 8, 
+    0xd9, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x0d, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb5, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0xd5, 0x7f, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0x42, 0x35, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_i & 0xff, MP_QSTR__hyphen_i >> 8, 
+    0xd9, 
+    0x44, 0x14, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0x2b, 0x01, 
+    0x17, MP_QSTR_index_urls & 0xff, MP_QSTR_index_urls >> 8, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0x42, 0x19, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen__hyphen_debug & 0xff, MP_QSTR__hyphen__hyphen_debug >> 8, 
+    0xd9, 
+    0x44, 0x07, 0x80, 
+    0x52, 
+    0x17, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x42, 0x0a, 0x80, 
+    0x12, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x23, 0x01, 
+    0xb2, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0xb1, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x34, 0x01, 
+    0xd7, 
+    0x44, 0x11, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR__hyphen_ & 0xff, MP_QSTR__hyphen_ >> 8, 
+    0xd9, 
+    0x43, 0x1b, 0x7f, 
+    0xb0, 
+    0x14, MP_QSTR_extend & 0xff, MP_QSTR_extend >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x43, 0x08, 0x80, 
+    0x12, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_install & 0xff, MP_QSTR_install >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x43, 0x06, 0x80, 
+    0x12, MP_QSTR_cleanup & 0xff, MP_QSTR_cleanup >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__main_0 = {{&mp_type_str}, 50937, 32, (const byte*)"\x4f\x6e\x6c\x79\x20\x27\x69\x6e\x73\x74\x61\x6c\x6c\x27\x20\x63\x6f\x6d\x6d\x61\x6e\x64\x20\x73\x75\x70\x70\x6f\x72\x74\x65\x64"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__main_1 = {{&mp_type_str}, 40302, 28, (const byte*)"\x55\x6e\x6b\x6e\x6f\x77\x6e\x2f\x75\x6e\x73\x75\x70\x70\x6f\x72\x74\x65\x64\x20\x6f\x70\x74\x69\x6f\x6e\x3a\x20"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__main[2] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__main_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__main_1),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__main = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__main,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__main,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 423,
+    .n_obj = 2,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 12,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_main,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__main + 6,
+        .opcodes = fun_data_upip__lt_module_gt__main + 54,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip_<module>
+STATIC const byte fun_data_upip__lt_module_gt_[302] = {
+    0x18, 0x72,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x07, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x48, 0x69, 0x24, 0x29, 0x24, 0x25, 0x44, 0x6b, 0x6e, 0x20, 0x85, 0x0c, 0x65, 0x40, 0x8b, 0x14, 0x85, 0x0a, 0x85, 0x20, 0x85, 0x07, 0x28, 0x48, 0x64, 0x85, 0x32, 0x85, 0x0d, 0x89, 0x07, 0x85, 0x18, 0x89, 0x26, 0x85, 0x09, 0x85, 0x08, 0x85, 0x15, 0x85, 0x37, 0x2a, 0x00,
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x16, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x16, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uos & 0xff, MP_QSTR_uos >> 8, 
+    0x16, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uerrno & 0xff, MP_QSTR_uerrno >> 8, 
+    0x16, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_ujson & 0xff, MP_QSTR_ujson >> 8, 
+    0x16, MP_QSTR_json & 0xff, MP_QSTR_json >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uzlib & 0xff, MP_QSTR_uzlib >> 8, 
+    0x16, MP_QSTR_uzlib & 0xff, MP_QSTR_uzlib >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_upip_utarfile & 0xff, MP_QSTR_upip_utarfile >> 8, 
+    0x16, MP_QSTR_tarfile & 0xff, MP_QSTR_tarfile >> 8, 
+    0x11, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_collect & 0xff, MP_QSTR_collect >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x50, 
+    0x17, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x23, 0x00, 
+    0x23, 0x01, 
+    0x2b, 0x02, 
+    0x17, MP_QSTR_index_urls & 0xff, MP_QSTR_index_urls >> 8, 
+    0x51, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x2b, 0x00, 
+    0x16, MP_QSTR_cleanup_files & 0xff, MP_QSTR_cleanup_files >> 8, 
+    0x9f, 
+    0x17, MP_QSTR_gzdict_sz & 0xff, MP_QSTR_gzdict_sz >> 8, 
+    0x11, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0x22, 0x84, 0x00, 
+    0x34, 0x01, 
+    0x17, MP_QSTR_file_buf & 0xff, MP_QSTR_file_buf >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x11, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_op_split & 0xff, MP_QSTR_op_split >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_op_basename & 0xff, MP_QSTR_op_basename >> 8, 
+    0x22, 0x83, 0x7f, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x05, 
+    0x16, MP_QSTR__makedirs & 0xff, MP_QSTR__makedirs >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR_save_file & 0xff, MP_QSTR_save_file >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_install_tar & 0xff, MP_QSTR_install_tar >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR_expandhome & 0xff, MP_QSTR_expandhome >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_ussl & 0xff, MP_QSTR_ussl >> 8, 
+    0x16, MP_QSTR_ussl & 0xff, MP_QSTR_ussl >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x16, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x52, 
+    0x17, MP_QSTR_warn_ussl & 0xff, MP_QSTR_warn_ussl >> 8, 
+    0x32, 0x09, 
+    0x16, MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8, 
+    0x32, 0x0a, 
+    0x16, MP_QSTR_get_pkg_metadata & 0xff, MP_QSTR_get_pkg_metadata >> 8, 
+    0x51, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0b, 
+    0x16, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x32, 0x0c, 
+    0x16, MP_QSTR_install_pkg & 0xff, MP_QSTR_install_pkg >> 8, 
+    0x51, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0d, 
+    0x16, MP_QSTR_install & 0xff, MP_QSTR_install >> 8, 
+    0x32, 0x0e, 
+    0x16, MP_QSTR_get_install_path & 0xff, MP_QSTR_get_install_path >> 8, 
+    0x32, 0x0f, 
+    0x16, MP_QSTR_cleanup & 0xff, MP_QSTR_cleanup >> 8, 
+    0x32, 0x10, 
+    0x16, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x32, 0x11, 
+    0x16, MP_QSTR_main & 0xff, MP_QSTR_main >> 8, 
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x10, MP_QSTR___main__ & 0xff, MP_QSTR___main__ >> 8, 
+    0xd9, 
+    0x44, 0x06, 0x80, 
+    0x11, MP_QSTR_main & 0xff, MP_QSTR_main >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__0 = {{&mp_type_str}, 58328, 26, (const byte*)"\x68\x74\x74\x70\x73\x3a\x2f\x2f\x6d\x69\x63\x72\x6f\x70\x79\x74\x68\x6f\x6e\x2e\x6f\x72\x67\x2f\x70\x69"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__1 = {{&mp_type_str}, 3759, 21, (const byte*)"\x68\x74\x74\x70\x73\x3a\x2f\x2f\x70\x79\x70\x69\x2e\x6f\x72\x67\x2f\x70\x79\x70\x69"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt_[18] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__1),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__NotFoundError),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__op_split),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__op_basename),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt___makedirs),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__save_file),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__install_tar),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__expandhome),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__url_open),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__get_pkg_metadata),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__fatal),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__install_pkg),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__install),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__get_install_path),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__cleanup),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__help),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__main),
+};
+const mp_raw_code_t raw_code_upip__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 302,
+    .n_obj = 2,
+    .n_raw_code = 16,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt_ + 6,
+        .opcodes = fun_data_upip__lt_module_gt_ + 59,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__roundup
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__roundup[18] = {
+    0x22, 0x0a,
+    MP_QSTR_roundup & 0xff, MP_QSTR_roundup >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0xb1, 
+    0xf2, 
+    0x81, 
+    0xf3, 
+    0xb1, 
+    0x81, 
+    0xf3, 
+    0xd2, 
+    0xef, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__roundup[2] = {
+    MP_ROM_QSTR(MP_QSTR_val),
+    MP_ROM_QSTR(MP_QSTR_align),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__roundup = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__roundup,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__roundup,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_roundup,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__roundup + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__roundup + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection___init__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection___init__[27] = {
+    0xa8, 0x04, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb3, 
+    0xb2, 
+    0xf3, 
+    0xb0, 
+    0x18, MP_QSTR_align & 0xff, MP_QSTR_align >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection___init__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_f),
+    MP_ROM_QSTR(MP_QSTR_content_len),
+    MP_ROM_QSTR(MP_QSTR_aligned_len),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 4,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection___init__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 27,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection___init__ + 7,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection___init__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection_read
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection_read[65] = {
+    0xaa, 0x01, 0x0a,
+    MP_QSTR_read & 0xff, MP_QSTR_read >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0x80, 
+    0xd9, 
+    0x44, 0x03, 0x80, 
+    0x23, 0x02, 
+    0x63, 
+    0xb1, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xd8, 
+    0x44, 0x05, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xc1, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xc1, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb1, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip_utarfile__lt_module_gt__FileSection_read_0 = {{&mp_type_bytes}, 5381, 0, (const byte*)""};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection_read[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_sz),
+    MP_ROM_PTR(&const_obj_upip_utarfile__lt_module_gt__FileSection_read_0),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection_read = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection_read,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection_read,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 65,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_read,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection_read + 7,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection_read + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection_readinto
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection_readinto[71] = {
+    0x2a, 0x0a,
+    MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0x80, 
+    0xd9, 
+    0x44, 0x02, 0x80, 
+    0x80, 
+    0x63, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xd8, 
+    0x44, 0x0f, 0x80, 
+    0x12, MP_QSTR_memoryview & 0xff, MP_QSTR_memoryview >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x51, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0x2e, 0x02, 
+    0x55, 
+    0xc1, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc2, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb2, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection_readinto[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection_readinto = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection_readinto,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection_readinto,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 71,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_readinto,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection_readinto + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection_readinto + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection_skip
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection_skip[61] = {
+    0x39, 0x0a,
+    MP_QSTR_skip & 0xff, MP_QSTR_skip >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_align & 0xff, MP_QSTR_align >> 8, 
+    0xf2, 
+    0xc1, 
+    0xb1, 
+    0x44, 0x26, 0x80, 
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0x90, 
+    0x34, 0x01, 
+    0xc2, 
+    0x42, 0x18, 0x80, 
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0xb1, 
+    0x90, 
+    0x34, 0x02, 
+    0xc3, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0xb2, 
+    0xb3, 
+    0x36, 0x02, 
+    0x59, 
+    0xb1, 
+    0xb3, 
+    0xe6, 
+    0xc1, 
+    0xb1, 
+    0x43, 0xe4, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection_skip[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection_skip = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection_skip,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection_skip,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 61,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_skip,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection_skip + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection_skip + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection[48] = {
+    0x08, 0x0a,
+    MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x22, 0x84, 0x80, 0x00, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x01, 
+    0x16, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_skip & 0xff, MP_QSTR_skip >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection[4] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection___init__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection_read),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection_readinto),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection_skip),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 48,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_FileSection,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarInfo___str__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarInfo___str__[25] = {
+    0x21, 0x0a,
+    MP_QSTR___str__ & 0xff, MP_QSTR___str__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x23, 0x01, 
+    0xb0, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x2a, 0x03, 
+    0xf8, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip_utarfile__lt_module_gt__TarInfo___str___0 = {{&mp_type_str}, 62189, 19, (const byte*)"\x54\x61\x72\x49\x6e\x66\x6f\x28\x25\x72\x2c\x20\x25\x73\x2c\x20\x25\x64\x29"};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarInfo___str__[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_upip_utarfile__lt_module_gt__TarInfo___str___0),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarInfo___str__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarInfo___str__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarInfo___str__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 25,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___str__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarInfo___str__ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarInfo___str__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarInfo
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarInfo[26] = {
+    0x00, 0x0a,
+    MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___str__ & 0xff, MP_QSTR___str__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarInfo[1] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarInfo___str__),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarInfo = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarInfo,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarInfo,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_TarInfo,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarInfo + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarInfo + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile___init__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile___init__[41] = {
+    0xab, 0x80, 0x01, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb2, 
+    0x44, 0x08, 0x80, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x42, 0x0d, 0x80, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_rb & 0xff, MP_QSTR_rb >> 8, 
+    0x34, 0x02, 
+    0xb0, 
+    0x18, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile___init__[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_name),
+    MP_ROM_QSTR(MP_QSTR_fileobj),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile___init__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 41,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile___init__ + 8,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile___init__ + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile_next
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile_next[191] = {
+    0x49, 0x0a,
+    MP_QSTR_next & 0xff, MP_QSTR_next >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x44, 0x0a, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x14, MP_QSTR_skip & 0xff, MP_QSTR_skip >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x22, 0x84, 0x00, 
+    0x36, 0x01, 
+    0xc1, 
+    0xb1, 
+    0x43, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x14, MP_QSTR_struct & 0xff, MP_QSTR_struct >> 8, 
+    0x12, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x14, MP_QSTR_addressof & 0xff, MP_QSTR_addressof >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x12, MP_QSTR_TAR_HEADER & 0xff, MP_QSTR_TAR_HEADER >> 8, 
+    0x12, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_LITTLE_ENDIAN & 0xff, MP_QSTR_LITTLE_ENDIAN >> 8, 
+    0x36, 0x03, 
+    0xc2, 
+    0xb2, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x80, 
+    0x55, 
+    0x80, 
+    0xd9, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x34, 0x00, 
+    0xc3, 
+    0x12, MP_QSTR_str & 0xff, MP_QSTR_str >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x10, MP_QSTR_utf_hyphen_8 & 0xff, MP_QSTR_utf_hyphen_8 >> 8, 
+    0x34, 0x02, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x10, MP_QSTR__0x00_ & 0xff, MP_QSTR__0x00_ >> 8, 
+    0x36, 0x01, 
+    0xb3, 
+    0x18, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x12, MP_QSTR_int & 0xff, MP_QSTR_int >> 8, 
+    0x12, MP_QSTR_bytes & 0xff, MP_QSTR_bytes >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x34, 0x01, 
+    0x88, 
+    0x34, 0x02, 
+    0xb3, 
+    0x18, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x12, MP_QSTR_REGTYPE & 0xff, MP_QSTR_REGTYPE >> 8, 
+    0x12, MP_QSTR_DIRTYPE & 0xff, MP_QSTR_DIRTYPE >> 8, 
+    0x2b, 0x02, 
+    0xb3, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x7f, 
+    0x55, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xd9, 
+    0x55, 
+    0xb3, 
+    0x18, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0x12, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0xb3, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x12, MP_QSTR_roundup & 0xff, MP_QSTR_roundup >> 8, 
+    0xb3, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x22, 0x84, 0x00, 
+    0x34, 0x02, 
+    0x34, 0x03, 
+    0x57, 
+    0xb0, 
+    0x18, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0xb3, 
+    0x18, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0xb3, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile_next[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile_next = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile_next,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile_next,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 191,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_next,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile_next + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile_next + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile___iter__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile___iter__[9] = {
+    0x09, 0x0a,
+    MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile___iter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile___iter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile___iter__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile___iter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___iter__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile___iter__ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile___iter__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile___next__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile___next__[26] = {
+    0x19, 0x0a,
+    MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_next & 0xff, MP_QSTR_next >> 8, 
+    0x36, 0x00, 
+    0xc1, 
+    0xb1, 
+    0x51, 
+    0xde, 
+    0x44, 0x04, 0x80, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0x65, 
+    0xb1, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile___next__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile___next__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile___next__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile___next__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___next__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile___next__ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile___next__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile_extractfile
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile[12] = {
+    0x12, 0x0a,
+    MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x13, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile_extractfile[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_tarinfo),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile_extractfile = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile_extractfile,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 12,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_extractfile,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile[51] = {
+    0x08, 0x0a,
+    MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x51, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_next & 0xff, MP_QSTR_next >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile[5] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile___init__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile_next),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile___iter__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile___next__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile_extractfile),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 51,
+    .n_obj = 0,
+    .n_raw_code = 5,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_TarFile,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile_<module>
+STATIC const byte fun_data_upip_utarfile__lt_module_gt_[120] = {
+    0x18, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x16, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x2c, 0x02, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_ARRAY & 0xff, MP_QSTR_ARRAY >> 8, 
+    0x80, 
+    0xed, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_UINT8 & 0xff, MP_QSTR_UINT8 >> 8, 
+    0x22, 0x80, 0x64, 
+    0xed, 
+    0x2a, 0x02, 
+    0x10, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x62, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_ARRAY & 0xff, MP_QSTR_ARRAY >> 8, 
+    0x22, 0x80, 0x7c, 
+    0xed, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_UINT8 & 0xff, MP_QSTR_UINT8 >> 8, 
+    0x8b, 
+    0xed, 
+    0x2a, 0x02, 
+    0x10, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x62, 
+    0x16, MP_QSTR_TAR_HEADER & 0xff, MP_QSTR_TAR_HEADER >> 8, 
+    0x10, MP_QSTR_dir & 0xff, MP_QSTR_dir >> 8, 
+    0x16, MP_QSTR_DIRTYPE & 0xff, MP_QSTR_DIRTYPE >> 8, 
+    0x10, MP_QSTR_file & 0xff, MP_QSTR_file >> 8, 
+    0x16, MP_QSTR_REGTYPE & 0xff, MP_QSTR_REGTYPE >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR_roundup & 0xff, MP_QSTR_roundup >> 8, 
+    0x54, 
+    0x32, 0x01, 
+    0x10, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x54, 
+    0x32, 0x03, 
+    0x10, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt_[4] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__roundup),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarInfo),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile),
+};
+const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 120,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt_ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/__init__.py, scope uasyncio___init____lt_module_gt____getattr__
+STATIC const byte fun_data_uasyncio___init____lt_module_gt____getattr__[58] = {
+    0x49, 0x0a,
+    MP_QSTR___getattr__ & 0xff, MP_QSTR___getattr__ >> 8,
+    MP_QSTR_uasyncio_slash___init___dot_py & 0xff, MP_QSTR_uasyncio_slash___init___dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR__attrs & 0xff, MP_QSTR__attrs >> 8, 
+    0x14, MP_QSTR_get & 0xff, MP_QSTR_get >> 8, 
+    0xb0, 
+    0x51, 
+    0x36, 0x02, 
+    0xc1, 
+    0xb1, 
+    0x51, 
+    0xde, 
+    0x44, 0x07, 0x80, 
+    0x12, MP_QSTR_AttributeError & 0xff, MP_QSTR_AttributeError >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x65, 
+    0x12, MP_QSTR_getattr & 0xff, MP_QSTR_getattr >> 8, 
+    0x12, MP_QSTR___import__ & 0xff, MP_QSTR___import__ >> 8, 
+    0xb1, 
+    0x51, 
+    0x51, 
+    0x52, 
+    0x81, 
+    0x34, 0x05, 
+    0xb0, 
+    0x34, 0x02, 
+    0xc2, 
+    0xb2, 
+    0x12, MP_QSTR_globals & 0xff, MP_QSTR_globals >> 8, 
+    0x34, 0x00, 
+    0xb0, 
+    0x56, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio___init____lt_module_gt____getattr__[1] = {
+    MP_ROM_QSTR(MP_QSTR_attr),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio___init____lt_module_gt____getattr__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio___init____lt_module_gt____getattr__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio___init____lt_module_gt____getattr__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 58,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___getattr__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash___init___dot_py,
+        .line_info = fun_data_uasyncio___init____lt_module_gt____getattr__ + 6,
+        .opcodes = fun_data_uasyncio___init____lt_module_gt____getattr__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/__init__.py, scope uasyncio___init___<module>
+STATIC const byte fun_data_uasyncio___init____lt_module_gt_[160] = {
+    0x10, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash___init___dot_py & 0xff, MP_QSTR_uasyncio_slash___init___dot_py >> 8,
+    0x00,
+    0x81, 
+    0x10, MP_QSTR__star_ & 0xff, MP_QSTR__star_ >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x69, 
+    0x83, 
+    0x80, 
+    0x80, 
+    0x2a, 0x03, 
+    0x16, MP_QSTR___version__ & 0xff, MP_QSTR___version__ >> 8, 
+    0x2c, 0x13, 
+    0x10, MP_QSTR_funcs & 0xff, MP_QSTR_funcs >> 8, 
+    0x10, MP_QSTR_wait_for & 0xff, MP_QSTR_wait_for >> 8, 
+    0x62, 
+    0x10, MP_QSTR_funcs & 0xff, MP_QSTR_funcs >> 8, 
+    0x23, 0x00, 
+    0x62, 
+    0x10, MP_QSTR_funcs & 0xff, MP_QSTR_funcs >> 8, 
+    0x10, MP_QSTR_gather & 0xff, MP_QSTR_gather >> 8, 
+    0x62, 
+    0x10, MP_QSTR_event & 0xff, MP_QSTR_event >> 8, 
+    0x10, MP_QSTR_Event & 0xff, MP_QSTR_Event >> 8, 
+    0x62, 
+    0x10, MP_QSTR_event & 0xff, MP_QSTR_event >> 8, 
+    0x23, 0x01, 
+    0x62, 
+    0x10, MP_QSTR_lock & 0xff, MP_QSTR_lock >> 8, 
+    0x10, MP_QSTR_Lock & 0xff, MP_QSTR_Lock >> 8, 
+    0x62, 
+    0x10, MP_QSTR_queue & 0xff, MP_QSTR_queue >> 8, 
+    0x10, MP_QSTR_Queue & 0xff, MP_QSTR_Queue >> 8, 
+    0x62, 
+    0x10, MP_QSTR_queue & 0xff, MP_QSTR_queue >> 8, 
+    0x10, MP_QSTR_LifoQueue & 0xff, MP_QSTR_LifoQueue >> 8, 
+    0x62, 
+    0x10, MP_QSTR_queue & 0xff, MP_QSTR_queue >> 8, 
+    0x10, MP_QSTR_QueueEmpty & 0xff, MP_QSTR_QueueEmpty >> 8, 
+    0x62, 
+    0x10, MP_QSTR_queue & 0xff, MP_QSTR_queue >> 8, 
+    0x10, MP_QSTR_QueueFull & 0xff, MP_QSTR_QueueFull >> 8, 
+    0x62, 
+    0x10, MP_QSTR_executor & 0xff, MP_QSTR_executor >> 8, 
+    0x10, MP_QSTR_Executor & 0xff, MP_QSTR_Executor >> 8, 
+    0x62, 
+    0x10, MP_QSTR_executor & 0xff, MP_QSTR_executor >> 8, 
+    0x23, 0x02, 
+    0x62, 
+    0x10, MP_QSTR_dns & 0xff, MP_QSTR_dns >> 8, 
+    0x23, 0x03, 
+    0x62, 
+    0x10, MP_QSTR_stream & 0xff, MP_QSTR_stream >> 8, 
+    0x23, 0x04, 
+    0x62, 
+    0x10, MP_QSTR_stream & 0xff, MP_QSTR_stream >> 8, 
+    0x23, 0x05, 
+    0x62, 
+    0x10, MP_QSTR_stream & 0xff, MP_QSTR_stream >> 8, 
+    0x23, 0x06, 
+    0x62, 
+    0x10, MP_QSTR_stream & 0xff, MP_QSTR_stream >> 8, 
+    0x23, 0x07, 
+    0x62, 
+    0x10, MP_QSTR_datagram & 0xff, MP_QSTR_datagram >> 8, 
+    0x23, 0x08, 
+    0x62, 
+    0x10, MP_QSTR_datagram & 0xff, MP_QSTR_datagram >> 8, 
+    0x23, 0x09, 
+    0x62, 
+    0x16, MP_QSTR__attrs & 0xff, MP_QSTR__attrs >> 8, 
+    0x32, 0x0a, 
+    0x16, MP_QSTR___getattr__ & 0xff, MP_QSTR___getattr__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__0 = {{&mp_type_str}, 25035, 11, (const byte*)"\x77\x61\x69\x74\x5f\x66\x6f\x72\x5f\x6d\x73"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__1 = {{&mp_type_str}, 9558, 14, (const byte*)"\x54\x68\x72\x65\x61\x64\x53\x61\x66\x65\x46\x6c\x61\x67"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__2 = {{&mp_type_str}, 61388, 15, (const byte*)"\x72\x75\x6e\x5f\x69\x6e\x5f\x65\x78\x65\x63\x75\x74\x6f\x72"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__3 = {{&mp_type_str}, 6254, 11, (const byte*)"\x67\x65\x74\x61\x64\x64\x72\x69\x6e\x66\x6f"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__4 = {{&mp_type_str}, 25560, 15, (const byte*)"\x6f\x70\x65\x6e\x5f\x63\x6f\x6e\x6e\x65\x63\x74\x69\x6f\x6e"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__5 = {{&mp_type_str}, 63679, 12, (const byte*)"\x73\x74\x61\x72\x74\x5f\x73\x65\x72\x76\x65\x72"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__6 = {{&mp_type_str}, 39580, 12, (const byte*)"\x53\x74\x72\x65\x61\x6d\x52\x65\x61\x64\x65\x72"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__7 = {{&mp_type_str}, 35638, 12, (const byte*)"\x53\x74\x72\x65\x61\x6d\x57\x72\x69\x74\x65\x72"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__8 = {{&mp_type_str}, 28443, 22, (const byte*)"\x6f\x70\x65\x6e\x5f\x64\x61\x74\x61\x67\x72\x61\x6d\x5f\x65\x6e\x64\x70\x6f\x69\x6e\x74"};
+STATIC const mp_obj_str_t const_obj_uasyncio___init____lt_module_gt__9 = {{&mp_type_str}, 14288, 14, (const byte*)"\x44\x61\x74\x61\x67\x72\x61\x6d\x53\x74\x72\x65\x61\x6d"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio___init____lt_module_gt_[11] = {
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__0),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__1),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__2),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__3),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__4),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__5),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__6),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__7),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__8),
+    MP_ROM_PTR(&const_obj_uasyncio___init____lt_module_gt__9),
+    MP_ROM_PTR(&raw_code_uasyncio___init____lt_module_gt____getattr__),
+};
+const mp_raw_code_t raw_code_uasyncio___init____lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio___init____lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio___init____lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 160,
+    .n_obj = 10,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash___init___dot_py,
+        .line_info = fun_data_uasyncio___init____lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio___init____lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__CancelledError
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__CancelledError[21] = {
+    0x00, 0x0a,
+    MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__CancelledError = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__CancelledError,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 21,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_CancelledError,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__CancelledError + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__CancelledError + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__TimeoutError
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__TimeoutError[21] = {
+    0x00, 0x0a,
+    MP_QSTR_TimeoutError & 0xff, MP_QSTR_TimeoutError >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_TimeoutError & 0xff, MP_QSTR_TimeoutError >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__TimeoutError = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__TimeoutError,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 21,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_TimeoutError,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__TimeoutError + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__TimeoutError + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__SingletonGenerator___init__
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___init__[23] = {
+    0x11, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0x34, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator___init__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__SingletonGenerator___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 23,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___init__ + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__SingletonGenerator___iter__
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___iter__[9] = {
+    0x09, 0x0a,
+    MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator___iter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__SingletonGenerator___iter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___iter__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator___iter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___iter__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___iter__ + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___iter__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__SingletonGenerator___next__
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___next__[55] = {
+    0x21, 0x0a,
+    MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x17, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_sorted & 0xff, MP_QSTR_push_sorted >> 8, 
+    0x12, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x36, 0x02, 
+    0x59, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x51, 
+    0x63, 
+    0x51, 
+    0xb0, 
+    0x13, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x18, MP_QSTR___traceback__ & 0xff, MP_QSTR___traceback__ >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x65, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator___next__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__SingletonGenerator___next__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___next__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator___next__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 55,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___next__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___next__ + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator___next__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__SingletonGenerator
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__SingletonGenerator[36] = {
+    0x00, 0x0a,
+    MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator[3] = {
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__SingletonGenerator___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__SingletonGenerator___iter__),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__SingletonGenerator___next__),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__SingletonGenerator = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__SingletonGenerator,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 36,
+    .n_obj = 0,
+    .n_raw_code = 3,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_SingletonGenerator,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__SingletonGenerator + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOEntry___init__
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOEntry___init__[40] = {
+    0xa8, 0x04, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_q & 0xff, MP_QSTR_q >> 8, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0xb3, 
+    0xb0, 
+    0x18, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOEntry___init__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_q),
+    MP_ROM_QSTR(MP_QSTR_s),
+    MP_ROM_QSTR(MP_QSTR_keep),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOEntry___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOEntry___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOEntry___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 40,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOEntry___init__ + 7,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOEntry___init__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOEntry_remove
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOEntry_remove[83] = {
+    0x22, 0x0a,
+    MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0xb1, 
+    0xde, 
+    0x44, 0x13, 0x80, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_q & 0xff, MP_QSTR_q >> 8, 
+    0x57, 
+    0x13, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0xb1, 
+    0xde, 
+    0x44, 0x13, 0x80, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_q & 0xff, MP_QSTR_q >> 8, 
+    0x57, 
+    0x13, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0x43, 0x0b, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_q & 0xff, MP_QSTR_q >> 8, 
+    0x14, MP_QSTR__update & 0xff, MP_QSTR__update >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOEntry_remove[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_task),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOEntry_remove = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOEntry_remove,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOEntry_remove,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 83,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_remove,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOEntry_remove + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOEntry_remove + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOEntry
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOEntry[31] = {
+    0x00, 0x0a,
+    MP_QSTR_IOEntry & 0xff, MP_QSTR_IOEntry >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_IOEntry & 0xff, MP_QSTR_IOEntry >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOEntry[2] = {
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOEntry___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOEntry_remove),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOEntry = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOEntry,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOEntry,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 31,
+    .n_obj = 0,
+    .n_raw_code = 2,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_IOEntry,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOEntry + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOEntry + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue___init__
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue___init__[32] = {
+    0x11, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x14, MP_QSTR_poll & 0xff, MP_QSTR_poll >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_poller & 0xff, MP_QSTR_poller >> 8, 
+    0x2c, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue___init__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 32,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue___init__ + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue_keep
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue_keep[58] = {
+    0x32, 0x0a,
+    MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x14, MP_QSTR_get & 0xff, MP_QSTR_get >> 8, 
+    0x12, MP_QSTR_id & 0xff, MP_QSTR_id >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x36, 0x01, 
+    0xc2, 
+    0xb2, 
+    0x51, 
+    0xde, 
+    0x44, 0x16, 0x80, 
+    0x12, MP_QSTR_IOEntry & 0xff, MP_QSTR_IOEntry >> 8, 
+    0xb0, 
+    0xb1, 
+    0x52, 
+    0x34, 0x03, 
+    0xb0, 
+    0x13, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x12, MP_QSTR_id & 0xff, MP_QSTR_id >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x56, 
+    0x42, 0x05, 0x80, 
+    0x52, 
+    0xb2, 
+    0x18, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue_keep[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue_keep = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue_keep,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue_keep,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 58,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_keep,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue_keep + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue_keep + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue_discard
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue_discard[97] = {
+    0x52, 0x0a,
+    MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x14, MP_QSTR_pop & 0xff, MP_QSTR_pop >> 8, 
+    0x12, MP_QSTR_id & 0xff, MP_QSTR_id >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x51, 
+    0x36, 0x02, 
+    0xc2, 
+    0xb2, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x40, 0x80, 
+    0xb2, 
+    0x13, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0x2a, 0x02, 
+    0x5f, 
+    0x4b, 0x20, 0x00, 
+    0xc3, 
+    0xb3, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x15, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x42, 0xdd, 0x7f, 
+    0xb2, 
+    0x13, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0x44, 0x0b, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_poller & 0xff, MP_QSTR_poller >> 8, 
+    0x14, MP_QSTR_unregister & 0xff, MP_QSTR_unregister >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue_discard[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue_discard = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue_discard,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue_discard,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 97,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 11,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_discard,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue_discard + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue_discard + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue__enqueue
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue__enqueue[172] = {
+    0x43, 0x0a,
+    MP_QSTR__enqueue & 0xff, MP_QSTR__enqueue >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x14, MP_QSTR_get & 0xff, MP_QSTR_get >> 8, 
+    0x12, MP_QSTR_id & 0xff, MP_QSTR_id >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x36, 0x01, 
+    0xc3, 
+    0xb3, 
+    0x51, 
+    0xde, 
+    0x44, 0x15, 0x80, 
+    0x12, MP_QSTR_IOEntry & 0xff, MP_QSTR_IOEntry >> 8, 
+    0xb0, 
+    0xb1, 
+    0x50, 
+    0x34, 0x03, 
+    0xc3, 
+    0xb3, 
+    0xb0, 
+    0x13, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x12, MP_QSTR_id & 0xff, MP_QSTR_id >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x56, 
+    0xb2, 
+    0x80, 
+    0xd9, 
+    0x44, 0x11, 0x80, 
+    0x12, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0xb3, 
+    0x18, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0x12, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x13, MP_QSTR_POLLIN & 0xff, MP_QSTR_POLLIN >> 8, 
+    0xc4, 
+    0x42, 0x0e, 0x80, 
+    0x12, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0xb3, 
+    0x18, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0x12, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x13, MP_QSTR_POLLOUT & 0xff, MP_QSTR_POLLOUT >> 8, 
+    0xc4, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x81, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0xb3, 
+    0x13, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0x43, 0x14, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_poller & 0xff, MP_QSTR_poller >> 8, 
+    0x14, MP_QSTR_register & 0xff, MP_QSTR_register >> 8, 
+    0xb1, 
+    0xb4, 
+    0x36, 0x02, 
+    0x59, 
+    0xb4, 
+    0xb3, 
+    0x18, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0x42, 0x26, 0x80, 
+    0xb3, 
+    0x13, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0xb4, 
+    0xef, 
+    0x43, 0x1d, 0x80, 
+    0xb3, 
+    0x57, 
+    0x13, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0xb4, 
+    0xe0, 
+    0x5a, 
+    0x18, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_poller & 0xff, MP_QSTR_poller >> 8, 
+    0x14, MP_QSTR_modify & 0xff, MP_QSTR_modify >> 8, 
+    0xb1, 
+    0xb3, 
+    0x13, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0x36, 0x02, 
+    0x59, 
+    0x42, 0x00, 0x80, 
+    0xb3, 
+    0x12, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue__enqueue[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+    MP_ROM_QSTR(MP_QSTR_idx),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue__enqueue = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue__enqueue,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue__enqueue,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 172,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 9,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__enqueue,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue__enqueue + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue__enqueue + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue__update
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue__update[126] = {
+    0x32, 0x0a,
+    MP_QSTR__update & 0xff, MP_QSTR__update >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x13, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x04, 0x80, 
+    0x80, 
+    0x42, 0x06, 0x80, 
+    0x12, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x13, MP_QSTR_POLLIN & 0xff, MP_QSTR_POLLIN >> 8, 
+    0xb1, 
+    0x13, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x04, 0x80, 
+    0x80, 
+    0x42, 0x06, 0x80, 
+    0x12, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x13, MP_QSTR_POLLOUT & 0xff, MP_QSTR_POLLOUT >> 8, 
+    0xed, 
+    0xc2, 
+    0xb2, 
+    0xb1, 
+    0x13, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0xdc, 
+    0x44, 0x29, 0x80, 
+    0xb2, 
+    0x44, 0x12, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_poller & 0xff, MP_QSTR_poller >> 8, 
+    0x14, MP_QSTR_modify & 0xff, MP_QSTR_modify >> 8, 
+    0xb1, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0xb2, 
+    0x36, 0x02, 
+    0x59, 
+    0x42, 0x0e, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_poller & 0xff, MP_QSTR_poller >> 8, 
+    0x14, MP_QSTR_unregister & 0xff, MP_QSTR_unregister >> 8, 
+    0xb1, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb2, 
+    0xb1, 
+    0x18, MP_QSTR_ev & 0xff, MP_QSTR_ev >> 8, 
+    0xb2, 
+    0x43, 0x17, 0x80, 
+    0xb1, 
+    0x13, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0x43, 0x10, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x12, MP_QSTR_id & 0xff, MP_QSTR_id >> 8, 
+    0xb1, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x34, 0x01, 
+    0x53, 
+    0x5b, 
+    0x56, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue__update[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_entry),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue__update = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue__update,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue__update,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 126,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__update,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue__update + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue__update + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue_queue_read
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_read[18] = {
+    0x2a, 0x0a,
+    MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR__enqueue & 0xff, MP_QSTR__enqueue >> 8, 
+    0xb1, 
+    0x80, 
+    0x36, 0x02, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue_queue_read[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue_queue_read = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_read,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue_queue_read,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_queue_read,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_read + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_read + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue_queue_write
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_write[18] = {
+    0x2a, 0x0a,
+    MP_QSTR_queue_write & 0xff, MP_QSTR_queue_write >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR__enqueue & 0xff, MP_QSTR__enqueue >> 8, 
+    0xb1, 
+    0x81, 
+    0x36, 0x02, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue_queue_write[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue_queue_write = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_write,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue_queue_write,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_queue_write,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_write + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue_queue_write + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue_remove
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue_remove[35] = {
+    0x22, 0x0a,
+    MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_isinstance & 0xff, MP_QSTR_isinstance >> 8, 
+    0xb1, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x12, MP_QSTR_IOEntry & 0xff, MP_QSTR_IOEntry >> 8, 
+    0x34, 0x02, 
+    0x44, 0x0b, 0x80, 
+    0xb1, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x14, MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue_remove[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_task),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue_remove = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue_remove,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue_remove,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 35,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_remove,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue_remove + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue_remove + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue_wait_io_event
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue_wait_io_event[169] = {
+    0x62, 0x0a,
+    MP_QSTR_wait_io_event & 0xff, MP_QSTR_wait_io_event >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_poller & 0xff, MP_QSTR_poller >> 8, 
+    0x14, MP_QSTR_ipoll & 0xff, MP_QSTR_ipoll >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x5f, 
+    0x4b, 0x92, 0x00, 
+    0x30, 0x02, 
+    0xc2, 
+    0xc3, 
+    0xb0, 
+    0x13, MP_QSTR_map & 0xff, MP_QSTR_map >> 8, 
+    0x12, MP_QSTR_id & 0xff, MP_QSTR_id >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0x55, 
+    0xc4, 
+    0x50, 
+    0xc5, 
+    0xb3, 
+    0x12, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x13, MP_QSTR_POLLOUT & 0xff, MP_QSTR_POLLOUT >> 8, 
+    0xd2, 
+    0xef, 
+    0x44, 0x29, 0x80, 
+    0xb4, 
+    0x13, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x1f, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb4, 
+    0x13, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0xb4, 
+    0x18, MP_QSTR_rd & 0xff, MP_QSTR_rd >> 8, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x52, 
+    0xc5, 
+    0xb3, 
+    0x12, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x13, MP_QSTR_POLLIN & 0xff, MP_QSTR_POLLIN >> 8, 
+    0xd2, 
+    0xef, 
+    0x44, 0x29, 0x80, 
+    0xb4, 
+    0x13, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x1f, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb4, 
+    0x13, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0xb4, 
+    0x18, MP_QSTR_wr & 0xff, MP_QSTR_wr >> 8, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x52, 
+    0xc5, 
+    0xb5, 
+    0x44, 0x07, 0x80, 
+    0xb4, 
+    0x13, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0x43, 0x08, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__update & 0xff, MP_QSTR__update >> 8, 
+    0xb4, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0x6b, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue_wait_io_event[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_dt),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue_wait_io_event = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue_wait_io_event,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue_wait_io_event,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 169,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 13,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait_io_event,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue_wait_io_event + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue_wait_io_event + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__IOQueue
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__IOQueue[66] = {
+    0x00, 0x0a,
+    MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR__enqueue & 0xff, MP_QSTR__enqueue >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR__update & 0xff, MP_QSTR__update >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR_queue_write & 0xff, MP_QSTR_queue_write >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR_wait_io_event & 0xff, MP_QSTR_wait_io_event >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__IOQueue[9] = {
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue_keep),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue_discard),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue__enqueue),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue__update),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue_queue_read),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue_queue_write),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue_remove),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue_wait_io_event),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__IOQueue = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__IOQueue,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__IOQueue,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 66,
+    .n_obj = 0,
+    .n_raw_code = 9,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_IOQueue,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__IOQueue + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__IOQueue + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt___promote_to_task
+STATIC const byte fun_data_uasyncio_core__lt_module_gt___promote_to_task[28] = {
+    0x19, 0x0a,
+    MP_QSTR__promote_to_task & 0xff, MP_QSTR__promote_to_task >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_isinstance & 0xff, MP_QSTR_isinstance >> 8, 
+    0xb0, 
+    0x12, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x34, 0x02, 
+    0x44, 0x02, 0x80, 
+    0xb0, 
+    0x63, 
+    0x12, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt___promote_to_task[1] = {
+    MP_ROM_QSTR(MP_QSTR_aw),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt___promote_to_task = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt___promote_to_task,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt___promote_to_task,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 28,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__promote_to_task,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt___promote_to_task + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt___promote_to_task + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__create_task
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__create_task[51] = {
+    0x21, 0x0a,
+    MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_hasattr & 0xff, MP_QSTR_hasattr >> 8, 
+    0xb0, 
+    0x10, MP_QSTR_send & 0xff, MP_QSTR_send >> 8, 
+    0x34, 0x02, 
+    0x43, 0x08, 0x80, 
+    0x12, MP_QSTR_TypeError & 0xff, MP_QSTR_TypeError >> 8, 
+    0x23, 0x01, 
+    0x34, 0x01, 
+    0x65, 
+    0x12, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0xb0, 
+    0x12, MP_QSTR_globals & 0xff, MP_QSTR_globals >> 8, 
+    0x34, 0x00, 
+    0x34, 0x02, 
+    0xc1, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0xb1, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_core__lt_module_gt__create_task_0 = {{&mp_type_str}, 50473, 18, (const byte*)"\x63\x6f\x72\x6f\x75\x74\x69\x6e\x65\x20\x65\x78\x70\x65\x63\x74\x65\x64"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__create_task[2] = {
+    MP_ROM_QSTR(MP_QSTR_coro),
+    MP_ROM_PTR(&const_obj_uasyncio_core__lt_module_gt__create_task_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__create_task = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__create_task,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__create_task,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 51,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_create_task,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__create_task + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__create_task + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__run_until_complete
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__run_until_complete[393] = {
+    0xf1, 0x03, 0x0a,
+    MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0x12, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0x2a, 0x02, 
+    0xc1, 
+    0x12, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0x2a, 0x02, 
+    0xc2, 
+    0x81, 
+    0xc3, 
+    0x42, 0x4f, 0x80, 
+    0x7f, 
+    0xc3, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0xc4, 
+    0xb4, 
+    0x44, 0x18, 0x80, 
+    0x12, MP_QSTR_max & 0xff, MP_QSTR_max >> 8, 
+    0x80, 
+    0x12, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0xb4, 
+    0x13, MP_QSTR_ph_key & 0xff, MP_QSTR_ph_key >> 8, 
+    0x12, MP_QSTR_ticks & 0xff, MP_QSTR_ticks >> 8, 
+    0x34, 0x00, 
+    0x34, 0x02, 
+    0x34, 0x02, 
+    0xc3, 
+    0x42, 0x0b, 0x80, 
+    0x12, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x13, MP_QSTR_nwait & 0xff, MP_QSTR_nwait >> 8, 
+    0x43, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_wait_io_event & 0xff, MP_QSTR_wait_io_event >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x59, 
+    0xb3, 
+    0x80, 
+    0xd7, 
+    0x44, 0x0d, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x43, 0x02, 0x80, 
+    0x81, 
+    0xc3, 
+    0xb3, 
+    0x80, 
+    0xd8, 
+    0x43, 0xab, 0x7f, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0xc4, 
+    0xb4, 
+    0x17, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x48, 0x2a, 0x00, 
+    0xb4, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0xc5, 
+    0xb5, 
+    0x43, 0x0e, 0x80, 
+    0xb4, 
+    0x13, MP_QSTR_coro & 0xff, MP_QSTR_coro >> 8, 
+    0x14, MP_QSTR_send & 0xff, MP_QSTR_send >> 8, 
+    0x51, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0x10, 0x80, 
+    0x51, 
+    0xb4, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0xb4, 
+    0x13, MP_QSTR_coro & 0xff, MP_QSTR_coro >> 8, 
+    0x14, MP_QSTR_throw & 0xff, MP_QSTR_throw >> 8, 
+    0xb5, 
+    0x36, 0x01, 
+    0x59, 
+    0x4a, 0xd6, 0x00, 
+    0x57, 
+    0xb1, 
+    0xdf, 
+    0x44, 0xcf, 0x80, 
+    0xc6, 
+    0x49, 0xc3, 0x00, 
+    0xb4, 
+    0xb0, 
+    0xde, 
+    0x44, 0x13, 0x80, 
+    0x12, MP_QSTR_isinstance & 0xff, MP_QSTR_isinstance >> 8, 
+    0xb6, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0x34, 0x02, 
+    0x44, 0x05, 0x80, 
+    0xb6, 
+    0x13, MP_QSTR_value & 0xff, MP_QSTR_value >> 8, 
+    0x63, 
+    0xb6, 
+    0x65, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x44, 0x7a, 0x80, 
+    0x50, 
+    0xc7, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x52, 
+    0xde, 
+    0x44, 0x08, 0x80, 
+    0x51, 
+    0xb4, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x42, 0x47, 0x80, 
+    0x12, MP_QSTR_callable & 0xff, MP_QSTR_callable >> 8, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x34, 0x01, 
+    0x44, 0x13, 0x80, 
+    0xb4, 
+    0x14, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0xb4, 
+    0xb6, 
+    0x36, 0x02, 
+    0x59, 
+    0x50, 
+    0xb4, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x52, 
+    0xc7, 
+    0x42, 0x28, 0x80, 
+    0x42, 0x14, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0x52, 
+    0xc7, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x43, 0xe0, 0x7f, 
+    0x50, 
+    0xb4, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0xb7, 
+    0x43, 0x14, 0x80, 
+    0x12, MP_QSTR_isinstance & 0xff, MP_QSTR_isinstance >> 8, 
+    0xb6, 
+    0xb2, 
+    0x34, 0x02, 
+    0x43, 0x0a, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb4, 
+    0x36, 0x01, 
+    0x59, 
+    0xb6, 
+    0xb4, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x42, 0x28, 0x80, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x1f, 0x80, 
+    0xb5, 
+    0x12, MP_QSTR__exc_context & 0xff, MP_QSTR__exc_context >> 8, 
+    0x10, MP_QSTR_exception & 0xff, MP_QSTR_exception >> 8, 
+    0x56, 
+    0xb4, 
+    0x12, MP_QSTR__exc_context & 0xff, MP_QSTR__exc_context >> 8, 
+    0x10, MP_QSTR_future & 0xff, MP_QSTR_future >> 8, 
+    0x56, 
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x14, MP_QSTR_call_exception_handler & 0xff, MP_QSTR_call_exception_handler >> 8, 
+    0x12, MP_QSTR__exc_context & 0xff, MP_QSTR__exc_context >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0x00, 0x80, 
+    0x51, 
+    0x51, 
+    0xc6, 
+    0x28, 0x06, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x42, 0x93, 0x7e, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__run_until_complete[1] = {
+    MP_ROM_QSTR(MP_QSTR_main_task),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__run_until_complete = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__run_until_complete,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__run_until_complete,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 393,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 15,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_run_until_complete,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__run_until_complete + 7,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__run_until_complete + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__run
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__run[19] = {
+    0x19, 0x0a,
+    MP_QSTR_run & 0xff, MP_QSTR_run >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x12, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__run[1] = {
+    MP_ROM_QSTR(MP_QSTR_coro),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__run = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__run,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__run,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 19,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_run,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__run + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__run + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__sleep_ms
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__sleep_ms[31] = {
+    0xb2, 0x01, 0x0a,
+    MP_QSTR_sleep_ms & 0xff, MP_QSTR_sleep_ms >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x12, MP_QSTR_ticks & 0xff, MP_QSTR_ticks >> 8, 
+    0x34, 0x00, 
+    0x12, MP_QSTR_max & 0xff, MP_QSTR_max >> 8, 
+    0x80, 
+    0xb0, 
+    0x34, 0x02, 
+    0x34, 0x02, 
+    0xb1, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0xb1, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__sleep_ms[2] = {
+    MP_ROM_QSTR(MP_QSTR_t),
+    MP_ROM_QSTR(MP_QSTR_sgen),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__sleep_ms = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__sleep_ms,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__sleep_ms,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 31,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_sleep_ms,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__sleep_ms + 7,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__sleep_ms + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__sleep
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__sleep[23] = {
+    0x21, 0x0a,
+    MP_QSTR_sleep & 0xff, MP_QSTR_sleep >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_sleep_ms & 0xff, MP_QSTR_sleep_ms >> 8, 
+    0x12, MP_QSTR_int & 0xff, MP_QSTR_int >> 8, 
+    0xb0, 
+    0x22, 0x87, 0x68, 
+    0xf4, 
+    0x34, 0x01, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__sleep[1] = {
+    MP_ROM_QSTR(MP_QSTR_t),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__sleep = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__sleep,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__sleep,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 23,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_sleep,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__sleep + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__sleep + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt___stopper
+STATIC const byte fun_data_uasyncio_core__lt_module_gt___stopper[10] = {
+    0x80, 0x40, 0x0a,
+    MP_QSTR__stopper & 0xff, MP_QSTR__stopper >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt___stopper = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt___stopper,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 10,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__stopper,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt___stopper + 7,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt___stopper + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_create_task
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_create_task[14] = {
+    0x11, 0x0a,
+    MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__Loop_create_task[1] = {
+    MP_ROM_QSTR(MP_QSTR_coro),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_create_task = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_create_task,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__Loop_create_task,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_create_task,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_create_task + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_create_task + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_run_forever
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_run_forever[36] = {
+    0x10, 0x0a,
+    MP_QSTR_run_forever & 0xff, MP_QSTR_run_forever >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x12, MP_QSTR__stopper & 0xff, MP_QSTR__stopper >> 8, 
+    0x34, 0x00, 
+    0x12, MP_QSTR_globals & 0xff, MP_QSTR_globals >> 8, 
+    0x34, 0x00, 
+    0x34, 0x02, 
+    0x17, MP_QSTR__stop_task & 0xff, MP_QSTR__stop_task >> 8, 
+    0x12, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x12, MP_QSTR__stop_task & 0xff, MP_QSTR__stop_task >> 8, 
+    0x34, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_run_forever = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_run_forever,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 36,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_run_forever,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_run_forever + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_run_forever + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_run_until_complete
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_run_until_complete[19] = {
+    0x19, 0x0a,
+    MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x12, MP_QSTR__promote_to_task & 0xff, MP_QSTR__promote_to_task >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__Loop_run_until_complete[1] = {
+    MP_ROM_QSTR(MP_QSTR_aw),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_run_until_complete = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_run_until_complete,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__Loop_run_until_complete,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 19,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_run_until_complete,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_run_until_complete + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_run_until_complete + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_stop
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_stop[34] = {
+    0x10, 0x0a,
+    MP_QSTR_stop & 0xff, MP_QSTR_stop >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR__stop_task & 0xff, MP_QSTR__stop_task >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x10, 0x80, 
+    0x12, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0x12, MP_QSTR__stop_task & 0xff, MP_QSTR__stop_task >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x17, MP_QSTR__stop_task & 0xff, MP_QSTR__stop_task >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_stop = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_stop,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 34,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_stop,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_stop + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_stop + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_close
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_close[9] = {
+    0x00, 0x0a,
+    MP_QSTR_close & 0xff, MP_QSTR_close >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_close = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_close,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_close,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_close + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_close + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_set_exception_handler
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_set_exception_handler[16] = {
+    0x11, 0x0a,
+    MP_QSTR_set_exception_handler & 0xff, MP_QSTR_set_exception_handler >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x18, MP_QSTR__exc_handler & 0xff, MP_QSTR__exc_handler >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__Loop_set_exception_handler[1] = {
+    MP_ROM_QSTR(MP_QSTR_handler),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_set_exception_handler = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_set_exception_handler,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__Loop_set_exception_handler,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 16,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_set_exception_handler,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_set_exception_handler + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_set_exception_handler + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_get_exception_handler
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_get_exception_handler[14] = {
+    0x00, 0x0a,
+    MP_QSTR_get_exception_handler & 0xff, MP_QSTR_get_exception_handler >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x13, MP_QSTR__exc_handler & 0xff, MP_QSTR__exc_handler >> 8, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_get_exception_handler = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_get_exception_handler,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_exception_handler,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_get_exception_handler + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_get_exception_handler + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_default_exception_handler
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_default_exception_handler[59] = {
+    0x3a, 0x0a,
+    MP_QSTR_default_exception_handler & 0xff, MP_QSTR_default_exception_handler >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_message & 0xff, MP_QSTR_message >> 8, 
+    0x55, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x10, MP_QSTR_future_colon_ & 0xff, MP_QSTR_future_colon_ >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_future & 0xff, MP_QSTR_future >> 8, 
+    0x55, 
+    0x10, MP_QSTR_coro_equals_ & 0xff, MP_QSTR_coro_equals_ >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_future & 0xff, MP_QSTR_future >> 8, 
+    0x55, 
+    0x13, MP_QSTR_coro & 0xff, MP_QSTR_coro >> 8, 
+    0x34, 0x04, 
+    0x59, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x14, MP_QSTR_print_exception & 0xff, MP_QSTR_print_exception >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_exception & 0xff, MP_QSTR_exception >> 8, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__Loop_default_exception_handler[2] = {
+    MP_ROM_QSTR(MP_QSTR_loop),
+    MP_ROM_QSTR(MP_QSTR_context),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_default_exception_handler = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_default_exception_handler,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__Loop_default_exception_handler,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 59,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_default_exception_handler,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_default_exception_handler + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_default_exception_handler + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop_call_exception_handler
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop_call_exception_handler[31] = {
+    0x19, 0x0a,
+    MP_QSTR_call_exception_handler & 0xff, MP_QSTR_call_exception_handler >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x13, MP_QSTR__exc_handler & 0xff, MP_QSTR__exc_handler >> 8, 
+    0x45, 0x06, 0x80, 
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x13, MP_QSTR_default_exception_handler & 0xff, MP_QSTR_default_exception_handler >> 8, 
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0xb0, 
+    0x34, 0x02, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__Loop_call_exception_handler[1] = {
+    MP_ROM_QSTR(MP_QSTR_context),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop_call_exception_handler = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop_call_exception_handler,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__Loop_call_exception_handler,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 31,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_call_exception_handler,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop_call_exception_handler + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop_call_exception_handler + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__Loop
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__Loop[70] = {
+    0x00, 0x0a,
+    MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x16, MP_QSTR__exc_handler & 0xff, MP_QSTR__exc_handler >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_run_forever & 0xff, MP_QSTR_run_forever >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_stop & 0xff, MP_QSTR_stop >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR_set_exception_handler & 0xff, MP_QSTR_set_exception_handler >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR_get_exception_handler & 0xff, MP_QSTR_get_exception_handler >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_default_exception_handler & 0xff, MP_QSTR_default_exception_handler >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR_call_exception_handler & 0xff, MP_QSTR_call_exception_handler >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__Loop[9] = {
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_create_task),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_run_forever),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_run_until_complete),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_stop),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_close),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_set_exception_handler),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_get_exception_handler),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_default_exception_handler),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop_call_exception_handler),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__Loop = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__Loop,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__Loop,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 70,
+    .n_obj = 0,
+    .n_raw_code = 9,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_Loop,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__Loop + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__Loop + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__get_event_loop
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__get_event_loop[13] = {
+    0x92, 0x80, 0x01, 0x0a,
+    MP_QSTR_get_event_loop & 0xff, MP_QSTR_get_event_loop >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__get_event_loop[2] = {
+    MP_ROM_QSTR(MP_QSTR_runq_len),
+    MP_ROM_QSTR(MP_QSTR_waitq_len),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__get_event_loop = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__get_event_loop,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__get_event_loop,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 13,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR_get_event_loop,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__get_event_loop + 8,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__get_event_loop + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__current_task
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__current_task[11] = {
+    0x00, 0x0a,
+    MP_QSTR_current_task & 0xff, MP_QSTR_current_task >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__current_task = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__current_task,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 11,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_current_task,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__current_task + 6,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__current_task + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core__lt_module_gt__new_event_loop
+STATIC const byte fun_data_uasyncio_core__lt_module_gt__new_event_loop[52] = {
+    0xa2, 0x80, 0x01, 0x0a,
+    MP_QSTR_new_event_loop & 0xff, MP_QSTR_new_event_loop >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x44, 0x13, 0x80, 
+    0x12, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x44, 0x0d, 0x80, 
+    0x12, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0xb0, 
+    0xb1, 
+    0x34, 0x02, 
+    0x17, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x42, 0x08, 0x80, 
+    0x12, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x34, 0x00, 
+    0x17, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x12, MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8, 
+    0x34, 0x00, 
+    0x17, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x12, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt__new_event_loop[2] = {
+    MP_ROM_QSTR(MP_QSTR_wheel_ms),
+    MP_ROM_QSTR(MP_QSTR_wheel_slots),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt__new_event_loop = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt__new_event_loop,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt__new_event_loop,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 52,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR_new_event_loop,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt__new_event_loop + 8,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt__new_event_loop + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/core.py, scope uasyncio_core_<module>
+STATIC const byte fun_data_uasyncio_core__lt_module_gt_[399] = {
+    0xb0, 0x02, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_core_dot_py & 0xff, MP_QSTR_uasyncio_slash_core_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x10, MP_QSTR_ticks_ms & 0xff, MP_QSTR_ticks_ms >> 8, 
+    0x10, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0x10, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x2a, 0x03, 
+    0x1b, MP_QSTR_time & 0xff, MP_QSTR_time >> 8, 
+    0x1c, MP_QSTR_ticks_ms & 0xff, MP_QSTR_ticks_ms >> 8, 
+    0x16, MP_QSTR_ticks & 0xff, MP_QSTR_ticks >> 8, 
+    0x1c, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0x16, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0x1c, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x16, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x59, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x16, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x16, MP_QSTR_select & 0xff, MP_QSTR_select >> 8, 
+    0x48, 0x43, 0x00, 
+    0x80, 
+    0x10, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x10, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x2a, 0x02, 
+    0x1b, MP_QSTR__uasyncio & 0xff, MP_QSTR__uasyncio >> 8, 
+    0x1c, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x16, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x1c, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x16, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x59, 
+    0x48, 0x13, 0x00, 
+    0x80, 
+    0x10, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR__uasyncio & 0xff, MP_QSTR__uasyncio >> 8, 
+    0x1c, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x16, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x59, 
+    0x4a, 0x11, 0x00, 
+    0x57, 
+    0x11, MP_QSTR_ImportError & 0xff, MP_QSTR_ImportError >> 8, 
+    0xdf, 
+    0x44, 0x08, 0x80, 
+    0x59, 
+    0x51, 
+    0x16, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x4a, 0x27, 0x00, 
+    0x59, 
+    0x81, 
+    0x10, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x10, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x10, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x2a, 0x03, 
+    0x1b, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0x1c, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x16, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x1c, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x16, MP_QSTR_Task & 0xff, MP_QSTR_Task >> 8, 
+    0x1c, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x16, MP_QSTR_TimerWheel & 0xff, MP_QSTR_TimerWheel >> 8, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x54, 
+    0x32, 0x01, 
+    0x10, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0x11, MP_QSTR_BaseException & 0xff, MP_QSTR_BaseException >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR_TimeoutError & 0xff, MP_QSTR_TimeoutError >> 8, 
+    0x11, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_TimeoutError & 0xff, MP_QSTR_TimeoutError >> 8, 
+    0x2c, 0x03, 
+    0x23, 0x00, 
+    0x10, MP_QSTR_message & 0xff, MP_QSTR_message >> 8, 
+    0x62, 
+    0x51, 
+    0x10, MP_QSTR_exception & 0xff, MP_QSTR_exception >> 8, 
+    0x62, 
+    0x51, 
+    0x10, MP_QSTR_future & 0xff, MP_QSTR_future >> 8, 
+    0x62, 
+    0x16, MP_QSTR__exc_context & 0xff, MP_QSTR__exc_context >> 8, 
+    0x54, 
+    0x32, 0x03, 
+    0x10, MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8, 
+    0x54, 
+    0x32, 0x04, 
+    0x10, MP_QSTR_IOEntry & 0xff, MP_QSTR_IOEntry >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_IOEntry & 0xff, MP_QSTR_IOEntry >> 8, 
+    0x54, 
+    0x32, 0x05, 
+    0x10, MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR__promote_to_task & 0xff, MP_QSTR__promote_to_task >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0x51, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x08, 
+    0x16, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x32, 0x09, 
+    0x16, MP_QSTR_run & 0xff, MP_QSTR_run >> 8, 
+    0x48, 0x25, 0x00, 
+    0x80, 
+    0x10, MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8, 
+    0x10, MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8, 
+    0x10, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x2a, 0x03, 
+    0x1b, MP_QSTR__uasyncio & 0xff, MP_QSTR__uasyncio >> 8, 
+    0x1c, MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8, 
+    0x16, MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8, 
+    0x1c, MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8, 
+    0x16, MP_QSTR_IOQueue & 0xff, MP_QSTR_IOQueue >> 8, 
+    0x1c, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x16, MP_QSTR_run_until_complete & 0xff, MP_QSTR_run_until_complete >> 8, 
+    0x59, 
+    0x4a, 0x0d, 0x00, 
+    0x57, 
+    0x11, MP_QSTR_ImportError & 0xff, MP_QSTR_ImportError >> 8, 
+    0xdf, 
+    0x44, 0x04, 0x80, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x11, MP_QSTR_SingletonGenerator & 0xff, MP_QSTR_SingletonGenerator >> 8, 
+    0x34, 0x00, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0a, 
+    0x16, MP_QSTR_sleep_ms & 0xff, MP_QSTR_sleep_ms >> 8, 
+    0x32, 0x0b, 
+    0x16, MP_QSTR_sleep & 0xff, MP_QSTR_sleep >> 8, 
+    0x32, 0x0c, 
+    0x16, MP_QSTR__stopper & 0xff, MP_QSTR__stopper >> 8, 
+    0x51, 
+    0x17, MP_QSTR__stop_task & 0xff, MP_QSTR__stop_task >> 8, 
+    0x54, 
+    0x32, 0x0d, 
+    0x10, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x80, 
+    0x80, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x0e, 
+    0x16, MP_QSTR_get_event_loop & 0xff, MP_QSTR_get_event_loop >> 8, 
+    0x32, 0x0f, 
+    0x16, MP_QSTR_current_task & 0xff, MP_QSTR_current_task >> 8, 
+    0x80, 
+    0x22, 0x80, 0x40, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x10, 
+    0x16, MP_QSTR_new_event_loop & 0xff, MP_QSTR_new_event_loop >> 8, 
+    0x11, MP_QSTR_new_event_loop & 0xff, MP_QSTR_new_event_loop >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_core__lt_module_gt__0 = {{&mp_type_str}, 64973, 31, (const byte*)"\x54\x61\x73\x6b\x20\x65\x78\x63\x65\x70\x74\x69\x6f\x6e\x20\x77\x61\x73\x6e\x27\x74\x20\x72\x65\x74\x72\x69\x65\x76\x65\x64"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_core__lt_module_gt_[17] = {
+    MP_ROM_PTR(&const_obj_uasyncio_core__lt_module_gt__0),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__CancelledError),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__TimeoutError),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__SingletonGenerator),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOEntry),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__IOQueue),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt___promote_to_task),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__create_task),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__run_until_complete),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__run),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__sleep_ms),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__sleep),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt___stopper),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__Loop),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__get_event_loop),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__current_task),
+    MP_ROM_PTR(&raw_code_uasyncio_core__lt_module_gt__new_event_loop),
+};
+const mp_raw_code_t raw_code_uasyncio_core__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_core__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_core__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 399,
+    .n_obj = 1,
+    .n_raw_code = 16,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_core_dot_py,
+        .line_info = fun_data_uasyncio_core__lt_module_gt_ + 7,
+        .opcodes = fun_data_uasyncio_core__lt_module_gt_ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt___Send___init__
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt___Send___init__[33] = {
+    0x1a, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_addr & 0xff, MP_QSTR_addr >> 8, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0x34, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt___Send___init__[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt___Send___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt___Send___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt___Send___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 33,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt___Send___init__ + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt___Send___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt___Send___iter__
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt___Send___iter__[9] = {
+    0x09, 0x0a,
+    MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt___Send___iter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt___Send___iter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt___Send___iter__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt___Send___iter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___iter__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt___Send___iter__ + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt___Send___iter__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt___Send___next__
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt___Send___next__[136] = {
+    0xb9, 0x02, 0x0a,
+    MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x48, 0x2f, 0x00, 
+    0xb0, 
+    0x13, MP_QSTR_addr & 0xff, MP_QSTR_addr >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x11, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_send & 0xff, MP_QSTR_send >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0x12, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_sendto & 0xff, MP_QSTR_sendto >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_addr & 0xff, MP_QSTR_addr >> 8, 
+    0x36, 0x02, 
+    0x59, 
+    0x4a, 0x3a, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x31, 0x80, 
+    0xc1, 
+    0x49, 0x25, 0x00, 
+    0xb1, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0xd9, 
+    0x44, 0x12, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_write & 0xff, MP_QSTR_queue_write >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0xb1, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc1, 
+    0x28, 0x01, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0x51, 
+    0xb0, 
+    0x13, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x18, MP_QSTR___traceback__ & 0xff, MP_QSTR___traceback__ >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x65, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt___Send___next__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt___Send___next__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt___Send___next__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt___Send___next__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 136,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___next__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt___Send___next__ + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt___Send___next__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt___Send_throw
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt___Send_throw[16] = {
+    0x1a, 0x0a,
+    MP_QSTR_throw & 0xff, MP_QSTR_throw >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0xb1, 
+    0x65, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt___Send_throw[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_exc),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt___Send_throw = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt___Send_throw,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt___Send_throw,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 16,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_throw,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt___Send_throw + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt___Send_throw + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt___Send_close
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt___Send_close[14] = {
+    0x11, 0x0a,
+    MP_QSTR_close & 0xff, MP_QSTR_close >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt___Send_close[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt___Send_close = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt___Send_close,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt___Send_close,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_close,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt___Send_close + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt___Send_close + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt___Send
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt___Send[46] = {
+    0x00, 0x0a,
+    MP_QSTR__Send & 0xff, MP_QSTR__Send >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__Send & 0xff, MP_QSTR__Send >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_throw & 0xff, MP_QSTR_throw >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt___Send[5] = {
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt___Send___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt___Send___iter__),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt___Send___next__),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt___Send_throw),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt___Send_close),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt___Send = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt___Send,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt___Send,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 46,
+    .n_obj = 0,
+    .n_raw_code = 5,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__Send,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt___Send + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt___Send + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream___init__
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___init__[51] = {
+    0x2a, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x12, MP_QSTR_getattr & 0xff, MP_QSTR_getattr >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_recv_into & 0xff, MP_QSTR_recv_into >> 8, 
+    0x51, 
+    0x34, 0x03, 
+    0xb0, 
+    0x18, MP_QSTR__ri & 0xff, MP_QSTR__ri >> 8, 
+    0x12, MP_QSTR_getattr & 0xff, MP_QSTR_getattr >> 8, 
+    0xb1, 
+    0x23, 0x02, 
+    0x51, 
+    0x34, 0x03, 
+    0xb0, 
+    0x18, MP_QSTR__rfi & 0xff, MP_QSTR__rfi >> 8, 
+    0x12, MP_QSTR__Send & 0xff, MP_QSTR__Send >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xb0, 
+    0x18, MP_QSTR__send & 0xff, MP_QSTR__send >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_datagram__lt_module_gt__DatagramStream___init___0 = {{&mp_type_str}, 42578, 13, (const byte*)"\x72\x65\x63\x76\x66\x72\x6f\x6d\x5f\x69\x6e\x74\x6f"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream___init__[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+    MP_ROM_PTR(&const_obj_uasyncio_datagram__lt_module_gt__DatagramStream___init___0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 51,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___init__ + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream___aenter__
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__[10] = {
+    0x89, 0x40, 0x0a,
+    MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 10,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aenter__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__ + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream___aexit__
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__[20] = {
+    0xa8, 0x44, 0x0a,
+    MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_exc_type),
+    MP_ROM_QSTR(MP_QSTR_exc),
+    MP_ROM_QSTR(MP_QSTR_tb),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 20,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aexit__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__ + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream_close
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_close[9] = {
+    0x09, 0x0a,
+    MP_QSTR_close & 0xff, MP_QSTR_close >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_close[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_close = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_close,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_close,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_close,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_close + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_close + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed[36] = {
+    0x99, 0x40, 0x0a,
+    MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 36,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait_closed,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream__recv_into
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into[101] = {
+    0xca, 0x02, 0x0a,
+    MP_QSTR__recv_into & 0xff, MP_QSTR__recv_into >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x48, 0x22, 0x00, 
+    0xb0, 
+    0x13, MP_QSTR__ri & 0xff, MP_QSTR__ri >> 8, 
+    0x44, 0x08, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__ri & 0xff, MP_QSTR__ri >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x63, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_recv & 0xff, MP_QSTR_recv >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x36, 0x01, 
+    0xc2, 
+    0x4a, 0x25, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x1c, 0x80, 
+    0xc3, 
+    0x49, 0x10, 0x00, 
+    0xb3, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0xd9, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0xb3, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc3, 
+    0x28, 0x03, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb2, 
+    0xb1, 
+    0x51, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0x2e, 0x02, 
+    0x56, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 101,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__recv_into,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into[107] = {
+    0xd2, 0x02, 0x0a,
+    MP_QSTR__recvfrom_into & 0xff, MP_QSTR__recvfrom_into >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x48, 0x25, 0x00, 
+    0xb0, 
+    0x13, MP_QSTR__rfi & 0xff, MP_QSTR__rfi >> 8, 
+    0x44, 0x08, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__rfi & 0xff, MP_QSTR__rfi >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x63, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_recvfrom & 0xff, MP_QSTR_recvfrom >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x36, 0x01, 
+    0x30, 0x02, 
+    0xc2, 
+    0xc3, 
+    0x4a, 0x25, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x1c, 0x80, 
+    0xc4, 
+    0x49, 0x10, 0x00, 
+    0xb4, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0xd9, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0xb4, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc4, 
+    0x28, 0x04, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb2, 
+    0xb1, 
+    0x51, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0x2e, 0x02, 
+    0x56, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xb3, 
+    0x2a, 0x02, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 107,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 11,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__recvfrom_into,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream_recv_into
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into[47] = {
+    0xaa, 0x40, 0x0a,
+    MP_QSTR_recv_into & 0xff, MP_QSTR_recv_into >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR__recv_into & 0xff, MP_QSTR__recv_into >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc2, 
+    0xb2, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x02, 0x80, 
+    0xb2, 
+    0x63, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x42, 0xdb, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 47,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_recv_into,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into[47] = {
+    0xaa, 0x40, 0x0a,
+    MP_QSTR_recvfrom_into & 0xff, MP_QSTR_recvfrom_into >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR__recvfrom_into & 0xff, MP_QSTR__recvfrom_into >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc2, 
+    0xb2, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x02, 0x80, 
+    0xb2, 
+    0x63, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x42, 0xdb, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 47,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_recvfrom_into,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom[44] = {
+    0xba, 0x40, 0x0a,
+    MP_QSTR_recvfrom & 0xff, MP_QSTR_recvfrom >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xc2, 
+    0xb0, 
+    0x14, MP_QSTR_recvfrom_into & 0xff, MP_QSTR_recvfrom_into >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x30, 0x02, 
+    0xc1, 
+    0xc3, 
+    0x12, MP_QSTR_bytes & 0xff, MP_QSTR_bytes >> 8, 
+    0xb2, 
+    0x51, 
+    0xb1, 
+    0x2e, 0x02, 
+    0x55, 
+    0x34, 0x01, 
+    0xb3, 
+    0x2a, 0x02, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_n),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 44,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_recvfrom,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many[116] = {
+    0xd8, 0x45, 0x0a,
+    MP_QSTR_recv_into_many & 0xff, MP_QSTR_recv_into_many >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0xc4, 
+    0x80, 
+    0xc5, 
+    0x42, 0x3e, 0x80, 
+    0xb3, 
+    0x51, 
+    0xde, 
+    0x44, 0x16, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__recv_into & 0xff, MP_QSTR__recv_into >> 8, 
+    0xb1, 
+    0xb5, 
+    0x55, 
+    0x36, 0x01, 
+    0xc6, 
+    0xb6, 
+    0x51, 
+    0xde, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x30, 0x80, 
+    0x42, 0x1a, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__recvfrom_into & 0xff, MP_QSTR__recvfrom_into >> 8, 
+    0xb1, 
+    0xb5, 
+    0x55, 
+    0x36, 0x01, 
+    0xc7, 
+    0xb7, 
+    0x51, 
+    0xde, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x1a, 0x80, 
+    0xb7, 
+    0x30, 0x02, 
+    0xc6, 
+    0xb3, 
+    0xb5, 
+    0x56, 
+    0xb6, 
+    0xb2, 
+    0xb5, 
+    0x56, 
+    0xb5, 
+    0x81, 
+    0xe5, 
+    0xc5, 
+    0xb5, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xd7, 
+    0x43, 0xb7, 0x7f, 
+    0xb5, 
+    0x44, 0x02, 0x80, 
+    0xb5, 
+    0x63, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb4, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x42, 0x9d, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_bufs),
+    MP_ROM_QSTR(MP_QSTR_sizes),
+    MP_ROM_QSTR(MP_QSTR_addrs),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 116,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 12,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_recv_into_many,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream_sendto
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_sendto[45] = {
+    0xab, 0x01, 0x0a,
+    MP_QSTR_sendto & 0xff, MP_QSTR_sendto >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__send & 0xff, MP_QSTR__send >> 8, 
+    0xc3, 
+    0xb3, 
+    0x13, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR__Send & 0xff, MP_QSTR__Send >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x34, 0x01, 
+    0xc3, 
+    0xb1, 
+    0xb3, 
+    0x18, MP_QSTR_buf & 0xff, MP_QSTR_buf >> 8, 
+    0xb2, 
+    0xb3, 
+    0x18, MP_QSTR_addr & 0xff, MP_QSTR_addr >> 8, 
+    0xb3, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_sendto[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+    MP_ROM_QSTR(MP_QSTR_addr),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_sendto = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_sendto,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream_sendto,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 45,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_sendto,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_sendto + 7,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream_sendto + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__DatagramStream
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__DatagramStream[89] = {
+    0x08, 0x0a,
+    MP_QSTR_DatagramStream & 0xff, MP_QSTR_DatagramStream >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_DatagramStream & 0xff, MP_QSTR_DatagramStream >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR__recv_into & 0xff, MP_QSTR__recv_into >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR__recvfrom_into & 0xff, MP_QSTR__recvfrom_into >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_recv_into & 0xff, MP_QSTR_recv_into >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR_recvfrom_into & 0xff, MP_QSTR_recvfrom_into >> 8, 
+    0x32, 0x09, 
+    0x16, MP_QSTR_recvfrom & 0xff, MP_QSTR_recvfrom >> 8, 
+    0x51, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0a, 
+    0x16, MP_QSTR_recv_into_many & 0xff, MP_QSTR_recv_into_many >> 8, 
+    0x51, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0b, 
+    0x16, MP_QSTR_sendto & 0xff, MP_QSTR_sendto >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream[12] = {
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream___aenter__),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream___aexit__),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_close),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_wait_closed),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream__recv_into),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream__recvfrom_into),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom_into),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recvfrom),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_recv_into_many),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream_sendto),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__DatagramStream = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__DatagramStream,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 89,
+    .n_obj = 0,
+    .n_raw_code = 12,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_DatagramStream,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__DatagramStream + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram__lt_module_gt__open_datagram_endpoint
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt__open_datagram_endpoint[177] = {
+    0xe6, 0xc0, 0x01, 0x0a,
+    MP_QSTR_open_datagram_endpoint & 0xff, MP_QSTR_open_datagram_endpoint >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0xc2, 
+    0x81, 
+    0x10, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_dns & 0xff, MP_QSTR_dns >> 8, 
+    0x1c, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0xc3, 
+    0x59, 
+    0xb2, 
+    0x13, MP_QSTR_AF_INET & 0xff, MP_QSTR_AF_INET >> 8, 
+    0xc4, 
+    0xb1, 
+    0x44, 0x18, 0x80, 
+    0xb3, 
+    0xb1, 
+    0x80, 
+    0x55, 
+    0xb1, 
+    0x81, 
+    0x55, 
+    0x80, 
+    0xb2, 
+    0x13, MP_QSTR_SOCK_DGRAM & 0xff, MP_QSTR_SOCK_DGRAM >> 8, 
+    0x34, 0x04, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x80, 
+    0x55, 
+    0xc5, 
+    0xb5, 
+    0x80, 
+    0x55, 
+    0xc4, 
+    0xb0, 
+    0x44, 0x18, 0x80, 
+    0xb3, 
+    0xb0, 
+    0x80, 
+    0x55, 
+    0xb0, 
+    0x81, 
+    0x55, 
+    0x80, 
+    0xb2, 
+    0x13, MP_QSTR_SOCK_DGRAM & 0xff, MP_QSTR_SOCK_DGRAM >> 8, 
+    0x34, 0x04, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x80, 
+    0x55, 
+    0xc6, 
+    0xb6, 
+    0x80, 
+    0x55, 
+    0xc4, 
+    0xb2, 
+    0x14, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0xb4, 
+    0xb2, 
+    0x13, MP_QSTR_SOCK_DGRAM & 0xff, MP_QSTR_SOCK_DGRAM >> 8, 
+    0x36, 0x02, 
+    0xc7, 
+    0x48, 0x27, 0x00, 
+    0xb7, 
+    0x14, MP_QSTR_setblocking & 0xff, MP_QSTR_setblocking >> 8, 
+    0x50, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x44, 0x0a, 0x80, 
+    0xb7, 
+    0x14, MP_QSTR_bind & 0xff, MP_QSTR_bind >> 8, 
+    0xb6, 
+    0x7f, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0xb1, 
+    0x44, 0x0a, 0x80, 
+    0xb7, 
+    0x14, MP_QSTR_connect & 0xff, MP_QSTR_connect >> 8, 
+    0xb5, 
+    0x7f, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0x4a, 0x0d, 0x00, 
+    0x59, 
+    0xb7, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x64, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0xb7, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_DatagramStream & 0xff, MP_QSTR_DatagramStream >> 8, 
+    0xb7, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt__open_datagram_endpoint[2] = {
+    MP_ROM_QSTR(MP_QSTR_local_addr),
+    MP_ROM_QSTR(MP_QSTR_remote_addr),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt__open_datagram_endpoint = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt__open_datagram_endpoint,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt__open_datagram_endpoint,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 177,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 13,
+        .n_exc_stack = 1,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR_open_datagram_endpoint,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt__open_datagram_endpoint + 8,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt__open_datagram_endpoint + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/datagram.py, scope uasyncio_datagram_<module>
+STATIC const byte fun_data_uasyncio_datagram__lt_module_gt_[73] = {
+    0x10, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_datagram_dot_py & 0xff, MP_QSTR_uasyncio_slash_datagram_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x10, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_uerrno & 0xff, MP_QSTR_uerrno >> 8, 
+    0x1c, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0x16, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0x59, 
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x54, 
+    0x32, 0x00, 
+    0x10, MP_QSTR__Send & 0xff, MP_QSTR__Send >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR__Send & 0xff, MP_QSTR__Send >> 8, 
+    0x54, 
+    0x32, 0x01, 
+    0x10, MP_QSTR_DatagramStream & 0xff, MP_QSTR_DatagramStream >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_DatagramStream & 0xff, MP_QSTR_DatagramStream >> 8, 
+    0x51, 
+    0x51, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x02, 
+    0x16, MP_QSTR_open_datagram_endpoint & 0xff, MP_QSTR_open_datagram_endpoint >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_datagram__lt_module_gt_[3] = {
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt___Send),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__DatagramStream),
+    MP_ROM_PTR(&raw_code_uasyncio_datagram__lt_module_gt__open_datagram_endpoint),
+};
+const mp_raw_code_t raw_code_uasyncio_datagram__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_datagram__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_datagram__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 73,
+    .n_obj = 0,
+    .n_raw_code = 3,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_datagram_dot_py,
+        .line_info = fun_data_uasyncio_datagram__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_datagram__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt__set_server
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt__set_server[18] = {
+    0x92, 0x01, 0x0a,
+    MP_QSTR_set_server & 0xff, MP_QSTR_set_server >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x17, MP_QSTR__server & 0xff, MP_QSTR__server >> 8, 
+    0xb1, 
+    0x17, MP_QSTR__port & 0xff, MP_QSTR__port >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt__set_server[2] = {
+    MP_ROM_QSTR(MP_QSTR_addr),
+    MP_ROM_QSTR(MP_QSTR_port),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt__set_server = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt__set_server,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt__set_server,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_set_server,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt__set_server + 7,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt__set_server + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___find_server
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___find_server[97] = {
+    0xd0, 0x02, 0x0a,
+    MP_QSTR__find_server & 0xff, MP_QSTR__find_server >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x48, 0x45, 0x00, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0x23, 0x00, 
+    0x34, 0x01, 
+    0x47, 0x36, 0x00, 
+    0xc0, 
+    0xb0, 
+    0x5f, 
+    0x4b, 0x2f, 0x00, 
+    0xc1, 
+    0xb1, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x36, 0x00, 
+    0xc1, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x82, 
+    0xdb, 
+    0x44, 0x19, 0x80, 
+    0xb1, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR_nameserver & 0xff, MP_QSTR_nameserver >> 8, 
+    0xd9, 
+    0x44, 0x0f, 0x80, 
+    0x10, MP_QSTR__colon_ & 0xff, MP_QSTR__colon_ >> 8, 
+    0xb1, 
+    0x81, 
+    0x55, 
+    0xdd, 
+    0xd3, 
+    0x44, 0x04, 0x80, 
+    0xb1, 
+    0x81, 
+    0x55, 
+    0x63, 
+    0x42, 0xce, 0x7f, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0x4a, 0x0d, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x04, 0x80, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_dns__lt_module_gt___find_server_0 = {{&mp_type_str}, 57324, 16, (const byte*)"\x2f\x65\x74\x63\x2f\x72\x65\x73\x6f\x6c\x76\x2e\x63\x6f\x6e\x66"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___find_server[1] = {
+    MP_ROM_PTR(&const_obj_uasyncio_dns__lt_module_gt___find_server_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___find_server = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___find_server,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___find_server,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 97,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 11,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__find_server,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___find_server + 7,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___find_server + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___is_numeric_<genexpr>
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_[29] = {
+    0xb9, 0x40, 0x0a,
+    MP_QSTR__lt_genexpr_gt_ & 0xff, MP_QSTR__lt_genexpr_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x53, 
+    0xb0, 
+    0x53, 
+    0x53, 
+    0x4b, 0x0c, 0x00, 
+    0xc1, 
+    0xb1, 
+    0x14, MP_QSTR_isdigit & 0xff, MP_QSTR_isdigit >> 8, 
+    0x36, 0x00, 
+    0x67, 
+    0x59, 
+    0x42, 0xf1, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_[1] = {
+    MP_ROM_QSTR(MP_QSTR__star_),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 29,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_genexpr_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_ + 7,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___is_numeric
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___is_numeric[40] = {
+    0x21, 0x0a,
+    MP_QSTR__is_numeric & 0xff, MP_QSTR__is_numeric >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__dot_ & 0xff, MP_QSTR__dot_ >> 8, 
+    0x36, 0x01, 
+    0xc1, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x84, 
+    0xd9, 
+    0x46, 0x0b, 0x80, 
+    0x12, MP_QSTR_all & 0xff, MP_QSTR_all >> 8, 
+    0x32, 0x01, 
+    0xb1, 
+    0x5e, 
+    0x34, 0x01, 
+    0x34, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___is_numeric[2] = {
+    MP_ROM_QSTR(MP_QSTR_host),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___is_numeric__lt_genexpr_gt_),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___is_numeric = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___is_numeric,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___is_numeric,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 40,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__is_numeric,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___is_numeric + 6,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___is_numeric + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___hosts
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___hosts[117] = {
+    0xe9, 0x02, 0x0a,
+    MP_QSTR__hosts & 0xff, MP_QSTR__hosts >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x2b, 0x00, 
+    0xc1, 
+    0x48, 0x58, 0x00, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0x12, MP_QSTR_HOSTS & 0xff, MP_QSTR_HOSTS >> 8, 
+    0x34, 0x01, 
+    0x47, 0x48, 0x00, 
+    0xc2, 
+    0xb2, 
+    0x5f, 
+    0x4b, 0x41, 0x00, 
+    0xc3, 
+    0xb3, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__hash_ & 0xff, MP_QSTR__hash_ >> 8, 
+    0x81, 
+    0x36, 0x02, 
+    0x80, 
+    0x55, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x36, 0x00, 
+    0xc3, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb3, 
+    0x34, 0x01, 
+    0x82, 
+    0xdb, 
+    0x44, 0x20, 0x80, 
+    0x10, MP_QSTR__colon_ & 0xff, MP_QSTR__colon_ >> 8, 
+    0xb3, 
+    0x80, 
+    0x55, 
+    0xdd, 
+    0xd3, 
+    0x44, 0x15, 0x80, 
+    0xb0, 
+    0xb3, 
+    0x81, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0xdd, 
+    0x44, 0x0a, 0x80, 
+    0xb1, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb3, 
+    0x80, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0xbc, 0x7f, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0x4a, 0x0d, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x04, 0x80, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb1, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___hosts[1] = {
+    MP_ROM_QSTR(MP_QSTR_host),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___hosts = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___hosts,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___hosts,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 117,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 14,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__hosts,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___hosts + 7,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___hosts + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___cache_get
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___cache_get[55] = {
+    0x21, 0x0a,
+    MP_QSTR__cache_get & 0xff, MP_QSTR__cache_get >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0x14, MP_QSTR_get & 0xff, MP_QSTR_get >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0xc1, 
+    0xb1, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x1d, 0x80, 
+    0x12, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0xb1, 
+    0x80, 
+    0x55, 
+    0x12, MP_QSTR_ticks & 0xff, MP_QSTR_ticks >> 8, 
+    0x34, 0x00, 
+    0x34, 0x02, 
+    0x80, 
+    0xd8, 
+    0x44, 0x04, 0x80, 
+    0xb1, 
+    0x81, 
+    0x55, 
+    0x63, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0xb0, 
+    0x53, 
+    0x5b, 
+    0x56, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___cache_get[1] = {
+    MP_ROM_QSTR(MP_QSTR_host),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___cache_get = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___cache_get,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___cache_get,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 55,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__cache_get,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___cache_get + 6,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___cache_get + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___cache_put
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___cache_put[127] = {
+    0x4b, 0x0a,
+    MP_QSTR__cache_put & 0xff, MP_QSTR__cache_put >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x43, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0xb0, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0xdd, 
+    0xd3, 
+    0x44, 0x48, 0x80, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0x34, 0x01, 
+    0x12, MP_QSTR_CACHE_MAX & 0xff, MP_QSTR_CACHE_MAX >> 8, 
+    0xdb, 
+    0x44, 0x39, 0x80, 
+    0x12, MP_QSTR_list & 0xff, MP_QSTR_list >> 8, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0x34, 0x01, 
+    0x5f, 
+    0x4b, 0x0b, 0x00, 
+    0xc3, 
+    0x12, MP_QSTR__cache_get & 0xff, MP_QSTR__cache_get >> 8, 
+    0xb3, 
+    0x34, 0x01, 
+    0x59, 
+    0x42, 0xf2, 0x7f, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0x34, 0x01, 
+    0x12, MP_QSTR_CACHE_MAX & 0xff, MP_QSTR_CACHE_MAX >> 8, 
+    0xdb, 
+    0x44, 0x13, 0x80, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0x12, MP_QSTR_next & 0xff, MP_QSTR_next >> 8, 
+    0x12, MP_QSTR_iter & 0xff, MP_QSTR_iter >> 8, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0x34, 0x01, 
+    0x34, 0x01, 
+    0x53, 
+    0x5b, 
+    0x56, 
+    0x12, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x12, MP_QSTR_ticks & 0xff, MP_QSTR_ticks >> 8, 
+    0x34, 0x00, 
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0xb1, 
+    0x22, 0x9c, 0x10, 
+    0x34, 0x02, 
+    0x22, 0x87, 0x68, 
+    0xf4, 
+    0x34, 0x02, 
+    0xb2, 
+    0x2a, 0x02, 
+    0x12, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0xb0, 
+    0x56, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___cache_put[3] = {
+    MP_ROM_QSTR(MP_QSTR_host),
+    MP_ROM_QSTR(MP_QSTR_ttl),
+    MP_ROM_QSTR(MP_QSTR_addrs),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___cache_put = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___cache_put,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___cache_put,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 127,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__cache_put,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___cache_put + 6,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___cache_put + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___query
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___query[82] = {
+    0x6a, 0x0a,
+    MP_QSTR__query & 0xff, MP_QSTR__query >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0x12, MP_QSTR_struct & 0xff, MP_QSTR_struct >> 8, 
+    0x14, MP_QSTR_pack & 0xff, MP_QSTR_pack >> 8, 
+    0x10, MP_QSTR__gt_HHHHHH & 0xff, MP_QSTR__gt_HHHHHH >> 8, 
+    0xb0, 
+    0x22, 0x82, 0x00, 
+    0x81, 
+    0x80, 
+    0x80, 
+    0x80, 
+    0x36, 0x07, 
+    0x34, 0x01, 
+    0xc2, 
+    0xb1, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__dot_ & 0xff, MP_QSTR__dot_ >> 8, 
+    0x36, 0x01, 
+    0x5f, 
+    0x4b, 0x1e, 0x00, 
+    0xc3, 
+    0xb3, 
+    0x44, 0x16, 0x80, 
+    0xb2, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb3, 
+    0x34, 0x01, 
+    0x36, 0x01, 
+    0x59, 
+    0xb2, 
+    0xb3, 
+    0x14, MP_QSTR_encode & 0xff, MP_QSTR_encode >> 8, 
+    0x36, 0x00, 
+    0xe5, 
+    0xc2, 
+    0x42, 0xdf, 0x7f, 
+    0xb2, 
+    0x23, 0x02, 
+    0xe5, 
+    0xc2, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_dns__lt_module_gt___query_0 = {{&mp_type_bytes}, 64485, 5, (const byte*)"\x00\x00\x01\x00\x01"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___query[3] = {
+    MP_ROM_QSTR(MP_QSTR_id),
+    MP_ROM_QSTR(MP_QSTR_host),
+    MP_ROM_PTR(&const_obj_uasyncio_dns__lt_module_gt___query_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___query = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___query,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___query,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 82,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 14,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__query,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___query + 6,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___query + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___skip_name
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___skip_name[42] = {
+    0x22, 0x0a,
+    MP_QSTR__skip_name & 0xff, MP_QSTR__skip_name >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x42, 0x16, 0x80, 
+    0xb0, 
+    0xb1, 
+    0x55, 
+    0x22, 0x81, 0x40, 
+    0xef, 
+    0x44, 0x04, 0x80, 
+    0xb1, 
+    0x82, 
+    0xf2, 
+    0x63, 
+    0xb1, 
+    0xb0, 
+    0xb1, 
+    0x55, 
+    0x81, 
+    0xf2, 
+    0xe5, 
+    0xc1, 
+    0xb0, 
+    0xb1, 
+    0x55, 
+    0x43, 0xe4, 0x7f, 
+    0xb1, 
+    0x81, 
+    0xf2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___skip_name[2] = {
+    MP_ROM_QSTR(MP_QSTR_r),
+    MP_ROM_QSTR(MP_QSTR_i),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___skip_name = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___skip_name,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___skip_name,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 42,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__skip_name,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___skip_name + 6,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___skip_name + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___parse
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___parse[231] = {
+    0xc2, 0x10, 0x0a,
+    MP_QSTR__parse & 0xff, MP_QSTR__parse >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x8c, 
+    0xd7, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_struct & 0xff, MP_QSTR_struct >> 8, 
+    0x14, MP_QSTR_unpack_from & 0xff, MP_QSTR_unpack_from >> 8, 
+    0x10, MP_QSTR__gt_HHHH & 0xff, MP_QSTR__gt_HHHH >> 8, 
+    0xb0, 
+    0x80, 
+    0x36, 0x03, 
+    0x30, 0x04, 
+    0xc2, 
+    0xc3, 
+    0xc4, 
+    0xc5, 
+    0xb2, 
+    0xb1, 
+    0xdc, 
+    0x43, 0x09, 0x80, 
+    0xb3, 
+    0x22, 0x82, 0x80, 0x00, 
+    0xef, 
+    0x43, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0xb3, 
+    0x8f, 
+    0xef, 
+    0x44, 0x06, 0x80, 
+    0x80, 
+    0x2b, 0x00, 
+    0x2a, 0x02, 
+    0x63, 
+    0x8c, 
+    0xc6, 
+    0xb4, 
+    0x80, 
+    0x42, 0x0e, 0x80, 
+    0x57, 
+    0xc7, 
+    0x12, MP_QSTR__skip_name & 0xff, MP_QSTR__skip_name >> 8, 
+    0xb0, 
+    0xb6, 
+    0x34, 0x02, 
+    0x84, 
+    0xf2, 
+    0xc6, 
+    0x81, 
+    0xe5, 
+    0x58, 
+    0x5a, 
+    0xd7, 
+    0x43, 0xec, 0x7f, 
+    0x59, 
+    0x59, 
+    0x80, 
+    0xc8, 
+    0x2b, 0x00, 
+    0xc9, 
+    0xb5, 
+    0x80, 
+    0x42, 0x6e, 0x80, 
+    0x57, 
+    0xc7, 
+    0x12, MP_QSTR__skip_name & 0xff, MP_QSTR__skip_name >> 8, 
+    0xb0, 
+    0xb6, 
+    0x34, 0x02, 
+    0xc6, 
+    0x12, MP_QSTR_struct & 0xff, MP_QSTR_struct >> 8, 
+    0x14, MP_QSTR_unpack_from & 0xff, MP_QSTR_unpack_from >> 8, 
+    0x10, MP_QSTR__gt_HHIH & 0xff, MP_QSTR__gt_HHIH >> 8, 
+    0xb0, 
+    0xb6, 
+    0x36, 0x03, 
+    0x30, 0x04, 
+    0xca, 
+    0xcb, 
+    0xcc, 
+    0xcd, 
+    0xb6, 
+    0x8a, 
+    0xe5, 
+    0xc6, 
+    0xba, 
+    0x81, 
+    0xd9, 
+    0x44, 0x41, 0x80, 
+    0xbb, 
+    0x81, 
+    0xd9, 
+    0x44, 0x3b, 0x80, 
+    0xbd, 
+    0x84, 
+    0xd9, 
+    0x44, 0x35, 0x80, 
+    0xb9, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0x23, 0x02, 
+    0xb0, 
+    0xb6, 
+    0x55, 
+    0xb0, 
+    0xb6, 
+    0x81, 
+    0xf2, 
+    0x55, 
+    0xb0, 
+    0xb6, 
+    0x82, 
+    0xf2, 
+    0x55, 
+    0xb0, 
+    0xb6, 
+    0x83, 
+    0xf2, 
+    0x55, 
+    0x2a, 0x04, 
+    0xf8, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb9, 
+    0x34, 0x01, 
+    0x81, 
+    0xd9, 
+    0x44, 0x04, 0x80, 
+    0xbc, 
+    0x42, 0x07, 0x80, 
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0xb8, 
+    0xbc, 
+    0x34, 0x02, 
+    0xc8, 
+    0xb6, 
+    0xbd, 
+    0xe5, 
+    0xc6, 
+    0x81, 
+    0xe5, 
+    0x58, 
+    0x5a, 
+    0xd7, 
+    0x43, 0x8c, 0x7f, 
+    0x59, 
+    0x59, 
+    0xb8, 
+    0xb9, 
+    0x2a, 0x02, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_dns__lt_module_gt___parse_0 = {{&mp_type_str}, 30603, 11, (const byte*)"\x25\x64\x2e\x25\x64\x2e\x25\x64\x2e\x25\x64"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___parse[3] = {
+    MP_ROM_QSTR(MP_QSTR_r),
+    MP_ROM_QSTR(MP_QSTR_id),
+    MP_ROM_PTR(&const_obj_uasyncio_dns__lt_module_gt___parse_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___parse = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___parse,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___parse,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 231,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 25,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__parse,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___parse + 7,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___parse + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___recv
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___recv[81] = {
+    0xd6, 0x40, 0x0a,
+    MP_QSTR__recv & 0xff, MP_QSTR__recv >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x48, 0x13, 0x00, 
+    0x12, MP_QSTR__parse & 0xff, MP_QSTR__parse >> 8, 
+    0xb0, 
+    0x14, MP_QSTR_recv & 0xff, MP_QSTR_recv >> 8, 
+    0x22, 0x84, 0x00, 
+    0x36, 0x01, 
+    0xb1, 
+    0x34, 0x02, 
+    0xc2, 
+    0x4a, 0x17, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0x12, MP_QSTR_IndexError & 0xff, MP_QSTR_IndexError >> 8, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0x2a, 0x03, 
+    0xdf, 
+    0x44, 0x06, 0x80, 
+    0x59, 
+    0x51, 
+    0xc2, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb2, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x02, 0x80, 
+    0xb2, 
+    0x63, 
+    0x42, 0xb9, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___recv[2] = {
+    MP_ROM_QSTR(MP_QSTR_s),
+    MP_ROM_QSTR(MP_QSTR_id),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___recv = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___recv,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___recv,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 81,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 11,
+        .n_exc_stack = 1,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__recv,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___recv + 7,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___recv + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt___resolve
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt___resolve[239] = {
+    0x91, 0x52, 0x0a,
+    MP_QSTR__resolve & 0xff, MP_QSTR__resolve >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR__server & 0xff, MP_QSTR__server >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR__find_server & 0xff, MP_QSTR__find_server >> 8, 
+    0x34, 0x00, 
+    0x17, MP_QSTR__server & 0xff, MP_QSTR__server >> 8, 
+    0x12, MP_QSTR__server & 0xff, MP_QSTR__server >> 8, 
+    0x43, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x48, 0x18, 0x00, 
+    0x12, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x14, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x12, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x13, MP_QSTR_AF_INET & 0xff, MP_QSTR_AF_INET >> 8, 
+    0x12, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x13, MP_QSTR_SOCK_DGRAM & 0xff, MP_QSTR_SOCK_DGRAM >> 8, 
+    0x36, 0x02, 
+    0xc1, 
+    0x4a, 0x0f, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x06, 0x80, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x49, 0x85, 0x00, 
+    0xb1, 
+    0x14, MP_QSTR_setblocking & 0xff, MP_QSTR_setblocking >> 8, 
+    0x50, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x14, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0x12, MP_QSTR__server & 0xff, MP_QSTR__server >> 8, 
+    0x12, MP_QSTR__port & 0xff, MP_QSTR__port >> 8, 
+    0x36, 0x02, 
+    0x80, 
+    0x55, 
+    0x7f, 
+    0x55, 
+    0xc2, 
+    0x12, MP_QSTR_getrandbits & 0xff, MP_QSTR_getrandbits >> 8, 
+    0x90, 
+    0x34, 0x01, 
+    0xc3, 
+    0x12, MP_QSTR__query & 0xff, MP_QSTR__query >> 8, 
+    0xb3, 
+    0xb0, 
+    0x34, 0x02, 
+    0xc4, 
+    0x12, MP_QSTR_RETRIES & 0xff, MP_QSTR_RETRIES >> 8, 
+    0x80, 
+    0x42, 0x3d, 0x80, 
+    0x57, 
+    0xc5, 
+    0xb1, 
+    0x14, MP_QSTR_sendto & 0xff, MP_QSTR_sendto >> 8, 
+    0xb4, 
+    0xb2, 
+    0x36, 0x02, 
+    0x59, 
+    0x48, 0x1d, 0x00, 
+    0x12, MP_QSTR_wait_for_ms & 0xff, MP_QSTR_wait_for_ms >> 8, 
+    0x12, MP_QSTR__recv & 0xff, MP_QSTR__recv >> 8, 
+    0xb1, 
+    0xb3, 
+    0x34, 0x02, 
+    0x12, MP_QSTR_TIMEOUT_MS & 0xff, MP_QSTR_TIMEOUT_MS >> 8, 
+    0x34, 0x02, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x30, 0x02, 
+    0xc6, 
+    0xc7, 
+    0x40, 0x2a, 0x80, 0x01, 
+    0x4a, 0x10, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_TimeoutError & 0xff, MP_QSTR_TimeoutError >> 8, 
+    0xdf, 
+    0x44, 0x04, 0x80, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x81, 
+    0xe5, 
+    0x58, 
+    0x5a, 
+    0xd7, 
+    0x43, 0xbd, 0x7f, 
+    0x59, 
+    0x59, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0x12, MP_QSTR_ETIMEDOUT & 0xff, MP_QSTR_ETIMEDOUT >> 8, 
+    0x34, 0x01, 
+    0x65, 
+    0x42, 0x02, 0x80, 
+    0x59, 
+    0x59, 
+    0x51, 
+    0xb1, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x5d, 
+    0x12, MP_QSTR__cache_put & 0xff, MP_QSTR__cache_put >> 8, 
+    0xb0, 
+    0xb7, 
+    0x44, 0x04, 0x80, 
+    0xb6, 
+    0x42, 0x03, 0x80, 
+    0x12, MP_QSTR_NEGATIVE_TTL & 0xff, MP_QSTR_NEGATIVE_TTL >> 8, 
+    0xb7, 
+    0x34, 0x03, 
+    0x59, 
+    0xb7, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt___resolve[1] = {
+    MP_ROM_QSTR(MP_QSTR_host),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt___resolve = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt___resolve,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt___resolve,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 239,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 19,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__resolve,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt___resolve + 7,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt___resolve + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns__lt_module_gt__getaddrinfo
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt__getaddrinfo[116] = {
+    0x90, 0xd4, 0x01, 0x0a,
+    MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x51, 
+    0xc4, 
+    0x12, MP_QSTR__is_numeric & 0xff, MP_QSTR__is_numeric >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x43, 0x2e, 0x80, 
+    0xb2, 
+    0x80, 
+    0x12, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x13, MP_QSTR_AF_INET & 0xff, MP_QSTR_AF_INET >> 8, 
+    0x2a, 0x02, 
+    0xdd, 
+    0x44, 0x20, 0x80, 
+    0x12, MP_QSTR__hosts & 0xff, MP_QSTR__hosts >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x45, 0x06, 0x80, 
+    0x12, MP_QSTR__cache_get & 0xff, MP_QSTR__cache_get >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0xc4, 
+    0xb4, 
+    0x51, 
+    0xde, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR__resolve & 0xff, MP_QSTR__resolve >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0xc4, 
+    0xb4, 
+    0x43, 0x0d, 0x80, 
+    0x12, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x14, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0xb0, 
+    0xb1, 
+    0xb2, 
+    0xb3, 
+    0x36, 0x04, 
+    0x63, 
+    0x2b, 0x00, 
+    0xc5, 
+    0xb4, 
+    0x5f, 
+    0x4b, 0x17, 0x00, 
+    0xc6, 
+    0xb5, 
+    0x14, MP_QSTR_extend & 0xff, MP_QSTR_extend >> 8, 
+    0x12, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x14, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0xb6, 
+    0xb1, 
+    0xb2, 
+    0xb3, 
+    0x36, 0x04, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0xe6, 0x7f, 
+    0xb5, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt__getaddrinfo[4] = {
+    MP_ROM_QSTR(MP_QSTR_host),
+    MP_ROM_QSTR(MP_QSTR_port),
+    MP_ROM_QSTR(MP_QSTR_af),
+    MP_ROM_QSTR(MP_QSTR_type),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt__getaddrinfo = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt__getaddrinfo,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt__getaddrinfo,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 116,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 19,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR_getaddrinfo,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt__getaddrinfo + 8,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt__getaddrinfo + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/dns.py, scope uasyncio_dns_<module>
+STATIC const byte fun_data_uasyncio_dns__lt_module_gt_[231] = {
+    0x18, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_dns_dot_py & 0xff, MP_QSTR_uasyncio_slash_dns_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x10, MP_QSTR_ticks_ms & 0xff, MP_QSTR_ticks_ms >> 8, 
+    0x10, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0x10, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x2a, 0x03, 
+    0x1b, MP_QSTR_time & 0xff, MP_QSTR_time >> 8, 
+    0x1c, MP_QSTR_ticks_ms & 0xff, MP_QSTR_ticks_ms >> 8, 
+    0x16, MP_QSTR_ticks & 0xff, MP_QSTR_ticks >> 8, 
+    0x1c, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0x16, MP_QSTR_ticks_diff & 0xff, MP_QSTR_ticks_diff >> 8, 
+    0x1c, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x16, MP_QSTR_ticks_add & 0xff, MP_QSTR_ticks_add >> 8, 
+    0x59, 
+    0x80, 
+    0x10, MP_QSTR_ETIMEDOUT & 0xff, MP_QSTR_ETIMEDOUT >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_uerrno & 0xff, MP_QSTR_uerrno >> 8, 
+    0x1c, MP_QSTR_ETIMEDOUT & 0xff, MP_QSTR_ETIMEDOUT >> 8, 
+    0x16, MP_QSTR_ETIMEDOUT & 0xff, MP_QSTR_ETIMEDOUT >> 8, 
+    0x59, 
+    0x80, 
+    0x10, MP_QSTR_getrandbits & 0xff, MP_QSTR_getrandbits >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_urandom & 0xff, MP_QSTR_urandom >> 8, 
+    0x1c, MP_QSTR_getrandbits & 0xff, MP_QSTR_getrandbits >> 8, 
+    0x16, MP_QSTR_getrandbits & 0xff, MP_QSTR_getrandbits >> 8, 
+    0x59, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_ustruct & 0xff, MP_QSTR_ustruct >> 8, 
+    0x16, MP_QSTR_struct & 0xff, MP_QSTR_struct >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x16, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x81, 
+    0x10, MP_QSTR_wait_for_ms & 0xff, MP_QSTR_wait_for_ms >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_funcs & 0xff, MP_QSTR_funcs >> 8, 
+    0x1c, MP_QSTR_wait_for_ms & 0xff, MP_QSTR_wait_for_ms >> 8, 
+    0x16, MP_QSTR_wait_for_ms & 0xff, MP_QSTR_wait_for_ms >> 8, 
+    0x59, 
+    0x51, 
+    0x17, MP_QSTR__server & 0xff, MP_QSTR__server >> 8, 
+    0x22, 0x35, 
+    0x17, MP_QSTR__port & 0xff, MP_QSTR__port >> 8, 
+    0x2c, 0x00, 
+    0x16, MP_QSTR__cache & 0xff, MP_QSTR__cache >> 8, 
+    0x10, MP_QSTR__slash_etc_slash_hosts & 0xff, MP_QSTR__slash_etc_slash_hosts >> 8, 
+    0x16, MP_QSTR_HOSTS & 0xff, MP_QSTR_HOSTS >> 8, 
+    0x88, 
+    0x16, MP_QSTR_CACHE_MAX & 0xff, MP_QSTR_CACHE_MAX >> 8, 
+    0x8a, 
+    0x16, MP_QSTR_NEGATIVE_TTL & 0xff, MP_QSTR_NEGATIVE_TTL >> 8, 
+    0x22, 0x8f, 0x50, 
+    0x16, MP_QSTR_TIMEOUT_MS & 0xff, MP_QSTR_TIMEOUT_MS >> 8, 
+    0x83, 
+    0x16, MP_QSTR_RETRIES & 0xff, MP_QSTR_RETRIES >> 8, 
+    0x22, 0x35, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x00, 
+    0x16, MP_QSTR_set_server & 0xff, MP_QSTR_set_server >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR__find_server & 0xff, MP_QSTR__find_server >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR__is_numeric & 0xff, MP_QSTR__is_numeric >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR__hosts & 0xff, MP_QSTR__hosts >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR__cache_get & 0xff, MP_QSTR__cache_get >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR__cache_put & 0xff, MP_QSTR__cache_put >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR__query & 0xff, MP_QSTR__query >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR__skip_name & 0xff, MP_QSTR__skip_name >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR__parse & 0xff, MP_QSTR__parse >> 8, 
+    0x32, 0x09, 
+    0x16, MP_QSTR__recv & 0xff, MP_QSTR__recv >> 8, 
+    0x32, 0x0a, 
+    0x16, MP_QSTR__resolve & 0xff, MP_QSTR__resolve >> 8, 
+    0x80, 
+    0x80, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x0b, 
+    0x16, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_dns__lt_module_gt_[12] = {
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt__set_server),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___find_server),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___is_numeric),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___hosts),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___cache_get),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___cache_put),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___query),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___skip_name),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___parse),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___recv),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt___resolve),
+    MP_ROM_PTR(&raw_code_uasyncio_dns__lt_module_gt__getaddrinfo),
+};
+const mp_raw_code_t raw_code_uasyncio_dns__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_dns__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_dns__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 231,
+    .n_obj = 0,
+    .n_raw_code = 12,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_dns_dot_py,
+        .line_info = fun_data_uasyncio_dns__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_dns__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__Event___init__
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__Event___init__[26] = {
+    0x11, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x50, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__Event___init__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__Event___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__Event___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__Event___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__Event___init__ + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__Event___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__Event_is_set
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__Event_is_set[12] = {
+    0x09, 0x0a,
+    MP_QSTR_is_set & 0xff, MP_QSTR_is_set >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__Event_is_set[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__Event_is_set = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__Event_is_set,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__Event_is_set,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 12,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_is_set,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__Event_is_set + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__Event_is_set + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__Event_set
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__Event_set[50] = {
+    0x21, 0x0a,
+    MP_QSTR_set & 0xff, MP_QSTR_set >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x42, 0x15, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x43, 0xdf, 0x7f, 
+    0x52, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__Event_set[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__Event_set = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__Event_set,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__Event_set,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 50,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_set,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__Event_set + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__Event_set + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__Event_clear
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__Event_clear[14] = {
+    0x11, 0x0a,
+    MP_QSTR_clear & 0xff, MP_QSTR_clear >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x50, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__Event_clear[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__Event_clear = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__Event_clear,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__Event_clear,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_clear,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__Event_clear + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__Event_clear + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__Event_wait
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__Event_wait[49] = {
+    0x99, 0x40, 0x0a,
+    MP_QSTR_wait & 0xff, MP_QSTR_wait >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x43, 0x20, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0x52, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__Event_wait[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__Event_wait = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__Event_wait,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__Event_wait,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 49,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__Event_wait + 7,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__Event_wait + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__Event
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__Event[46] = {
+    0x00, 0x0a,
+    MP_QSTR_Event & 0xff, MP_QSTR_Event >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_Event & 0xff, MP_QSTR_Event >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_is_set & 0xff, MP_QSTR_is_set >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_set & 0xff, MP_QSTR_set >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_clear & 0xff, MP_QSTR_clear >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_wait & 0xff, MP_QSTR_wait >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__Event[5] = {
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__Event___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__Event_is_set),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__Event_set),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__Event_clear),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__Event_wait),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__Event = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__Event,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__Event,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 46,
+    .n_obj = 0,
+    .n_raw_code = 5,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_Event,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__Event + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__Event + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__ThreadSafeFlag___init__
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__[14] = {
+    0x11, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__flag & 0xff, MP_QSTR__flag >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__ + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl[22] = {
+    0x23, 0x0a,
+    MP_QSTR_ioctl & 0xff, MP_QSTR_ioctl >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x83, 
+    0xd9, 
+    0x44, 0x07, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__flag & 0xff, MP_QSTR__flag >> 8, 
+    0xb2, 
+    0xf4, 
+    0x63, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_req),
+    MP_ROM_QSTR(MP_QSTR_flags),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 22,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_ioctl,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__ThreadSafeFlag_set
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_set[14] = {
+    0x11, 0x0a,
+    MP_QSTR_set & 0xff, MP_QSTR_set >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x81, 
+    0xb0, 
+    0x18, MP_QSTR__flag & 0xff, MP_QSTR__flag >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_set[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag_set = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_set,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_set,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_set,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_set + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_set + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__ThreadSafeFlag_wait
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait[36] = {
+    0x99, 0x40, 0x0a,
+    MP_QSTR_wait & 0xff, MP_QSTR_wait >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__flag & 0xff, MP_QSTR__flag >> 8, 
+    0x43, 0x0e, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__flag & 0xff, MP_QSTR__flag >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 36,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait + 7,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event__lt_module_gt__ThreadSafeFlag
+STATIC const byte fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag[41] = {
+    0x00, 0x0a,
+    MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_ioctl & 0xff, MP_QSTR_ioctl >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_set & 0xff, MP_QSTR_set >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_wait & 0xff, MP_QSTR_wait >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag[4] = {
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag_ioctl),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag_set),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag_wait),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt__ThreadSafeFlag,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 41,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_ThreadSafeFlag,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt__ThreadSafeFlag + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/event.py, scope uasyncio_event_<module>
+STATIC const byte fun_data_uasyncio_event__lt_module_gt_[80] = {
+    0x2c, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_event_dot_py & 0xff, MP_QSTR_uasyncio_slash_event_dot_py >> 8,
+    0x00,
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x54, 
+    0x32, 0x00, 
+    0x10, MP_QSTR_Event & 0xff, MP_QSTR_Event >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_Event & 0xff, MP_QSTR_Event >> 8, 
+    0x48, 0x1c, 0x00, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uio & 0xff, MP_QSTR_uio >> 8, 
+    0x16, MP_QSTR_uio & 0xff, MP_QSTR_uio >> 8, 
+    0x54, 
+    0x32, 0x01, 
+    0x10, MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8, 
+    0x11, MP_QSTR_uio & 0xff, MP_QSTR_uio >> 8, 
+    0x13, MP_QSTR_IOBase & 0xff, MP_QSTR_IOBase >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8, 
+    0x4a, 0x0d, 0x00, 
+    0x57, 
+    0x11, MP_QSTR_ImportError & 0xff, MP_QSTR_ImportError >> 8, 
+    0xdf, 
+    0x44, 0x04, 0x80, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_event__lt_module_gt_[2] = {
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__Event),
+    MP_ROM_PTR(&raw_code_uasyncio_event__lt_module_gt__ThreadSafeFlag),
+};
+const mp_raw_code_t raw_code_uasyncio_event__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_event__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_event__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 80,
+    .n_obj = 0,
+    .n_raw_code = 2,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_event_dot_py,
+        .line_info = fun_data_uasyncio_event__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_event__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Wake___init__
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Wake___init__[60] = {
+    0x29, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_pipe & 0xff, MP_QSTR_pipe >> 8, 
+    0x34, 0x00, 
+    0x30, 0x02, 
+    0xc1, 
+    0xc2, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_rb & 0xff, MP_QSTR_rb >> 8, 
+    0x34, 0x02, 
+    0xb0, 
+    0x18, MP_QSTR__r & 0xff, MP_QSTR__r >> 8, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb2, 
+    0x10, MP_QSTR_wb & 0xff, MP_QSTR_wb >> 8, 
+    0x34, 0x02, 
+    0xb0, 
+    0x18, MP_QSTR__w & 0xff, MP_QSTR__w >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__r & 0xff, MP_QSTR__r >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Wake___init__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Wake___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Wake___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Wake___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 60,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Wake___init__ + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Wake___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Wake_set
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Wake_set[21] = {
+    0x19, 0x0a,
+    MP_QSTR_set & 0xff, MP_QSTR_set >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__w & 0xff, MP_QSTR__w >> 8, 
+    0x14, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0x23, 0x01, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_executor__lt_module_gt___Wake_set_0 = {{&mp_type_bytes}, 46501, 1, (const byte*)"\x00"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Wake_set[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_uasyncio_executor__lt_module_gt___Wake_set_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Wake_set = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Wake_set,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Wake_set,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 21,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_set,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Wake_set + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Wake_set + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Wake_wait
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Wake_wait[38] = {
+    0x99, 0x40, 0x0a,
+    MP_QSTR_wait & 0xff, MP_QSTR_wait >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__r & 0xff, MP_QSTR__r >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__r & 0xff, MP_QSTR__r >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x81, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Wake_wait[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Wake_wait = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Wake_wait,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Wake_wait,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 38,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Wake_wait + 7,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Wake_wait + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Wake_close
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Wake_close[45] = {
+    0x19, 0x0a,
+    MP_QSTR_close & 0xff, MP_QSTR_close >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__r & 0xff, MP_QSTR__r >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__r & 0xff, MP_QSTR__r >> 8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__w & 0xff, MP_QSTR__w >> 8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Wake_close[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Wake_close = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Wake_close,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Wake_close,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 45,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_close,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Wake_close + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Wake_close + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Wake
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Wake[41] = {
+    0x00, 0x0a,
+    MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_set & 0xff, MP_QSTR_set >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_wait & 0xff, MP_QSTR_wait >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Wake[4] = {
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Wake___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Wake_set),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Wake_wait),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Wake_close),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Wake = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Wake,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Wake,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 41,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__Wake,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Wake + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Wake + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Wake2_close
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Wake2_close[9] = {
+    0x09, 0x0a,
+    MP_QSTR_close & 0xff, MP_QSTR_close >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Wake2_close[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Wake2_close = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Wake2_close,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Wake2_close,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_close,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Wake2_close + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Wake2_close + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Wake
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Wake2[26] = {
+    0x00, 0x0a,
+    MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Wake2[1] = {
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Wake2_close),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Wake2 = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Wake2,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Wake2,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__Wake,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Wake2 + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Wake2 + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Job___init__
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Job___init__[34] = {
+    0x23, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_fn & 0xff, MP_QSTR_fn >> 8, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_args & 0xff, MP_QSTR_args >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_ret & 0xff, MP_QSTR_ret >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_waiter & 0xff, MP_QSTR_waiter >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Job___init__[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_fn),
+    MP_ROM_QSTR(MP_QSTR_args),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Job___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Job___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Job___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 34,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Job___init__ + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Job___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Job_remove
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Job_remove[14] = {
+    0x1a, 0x0a,
+    MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_waiter & 0xff, MP_QSTR_waiter >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Job_remove[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_task),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Job_remove = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Job_remove,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Job_remove,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_remove,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Job_remove + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Job_remove + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Job
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Job[31] = {
+    0x00, 0x0a,
+    MP_QSTR__Job & 0xff, MP_QSTR__Job >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__Job & 0xff, MP_QSTR__Job >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Job[2] = {
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Job___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Job_remove),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Job = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Job,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Job,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 31,
+    .n_obj = 0,
+    .n_raw_code = 2,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__Job,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Job + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Job + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Worker___init__
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Worker___init__[26] = {
+    0x1a, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_job & 0xff, MP_QSTR_job >> 8, 
+    0x12, MP_QSTR__thread & 0xff, MP_QSTR__thread >> 8, 
+    0x14, MP_QSTR_allocate_lock & 0xff, MP_QSTR_allocate_lock >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_lock & 0xff, MP_QSTR_lock >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Worker___init__[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_job),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Worker___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Worker___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Worker___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Worker___init__ + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Worker___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt___Worker
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt___Worker[26] = {
+    0x00, 0x0a,
+    MP_QSTR__Worker & 0xff, MP_QSTR__Worker >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__Worker & 0xff, MP_QSTR__Worker >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt___Worker[1] = {
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Worker___init__),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt___Worker = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt___Worker,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt___Worker,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__Worker,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt___Worker + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt___Worker + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__Executor___init__
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__Executor___init__[65] = {
+    0x9a, 0x01, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR__workers & 0xff, MP_QSTR__workers >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__nthreads & 0xff, MP_QSTR__nthreads >> 8, 
+    0x12, MP_QSTR__thread & 0xff, MP_QSTR__thread >> 8, 
+    0x14, MP_QSTR_allocate_lock & 0xff, MP_QSTR_allocate_lock >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__mutex & 0xff, MP_QSTR__mutex >> 8, 
+    0x2b, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x2b, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__pending & 0xff, MP_QSTR__pending >> 8, 
+    0x2b, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__done & 0xff, MP_QSTR__done >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__nrun & 0xff, MP_QSTR__nrun >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR__reader & 0xff, MP_QSTR__reader >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__Executor___init__[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_workers),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__Executor___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__Executor___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__Executor___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 65,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__Executor___init__ + 7,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__Executor___init__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__Executor__work
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__Executor__work[157] = {
+    0xca, 0x02, 0x0a,
+    MP_QSTR__work & 0xff, MP_QSTR__work >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x13, MP_QSTR_lock & 0xff, MP_QSTR_lock >> 8, 
+    0x14, MP_QSTR_acquire & 0xff, MP_QSTR_acquire >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb1, 
+    0x13, MP_QSTR_job & 0xff, MP_QSTR_job >> 8, 
+    0xc2, 
+    0xb2, 
+    0x51, 
+    0xde, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x42, 0x72, 0x80, 
+    0x48, 0x12, 0x00, 
+    0xb2, 
+    0x14, MP_QSTR_fn & 0xff, MP_QSTR_fn >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_args & 0xff, MP_QSTR_args >> 8, 
+    0x53, 
+    0x37, 0x00, 
+    0xb2, 
+    0x18, MP_QSTR_ret & 0xff, MP_QSTR_ret >> 8, 
+    0x4a, 0x1b, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_BaseException & 0xff, MP_QSTR_BaseException >> 8, 
+    0xdf, 
+    0x44, 0x12, 0x80, 
+    0xc3, 
+    0x49, 0x06, 0x00, 
+    0xb3, 
+    0xb2, 
+    0x18, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x51, 
+    0x51, 
+    0xc3, 
+    0x28, 0x03, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb0, 
+    0x13, MP_QSTR__mutex & 0xff, MP_QSTR__mutex >> 8, 
+    0x47, 0x2f, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__done & 0xff, MP_QSTR__done >> 8, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__pending & 0xff, MP_QSTR__pending >> 8, 
+    0x44, 0x0e, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__pending & 0xff, MP_QSTR__pending >> 8, 
+    0x14, MP_QSTR_pop & 0xff, MP_QSTR_pop >> 8, 
+    0x80, 
+    0x36, 0x01, 
+    0xc2, 
+    0x42, 0x0d, 0x80, 
+    0x51, 
+    0xc2, 
+    0xb0, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0xb0, 
+    0x13, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x14, MP_QSTR_set & 0xff, MP_QSTR_set >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb2, 
+    0x43, 0x8a, 0x7f, 
+    0x42, 0x6d, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__Executor__work[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_w),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__Executor__work = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__Executor__work,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__Executor__work,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 157,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__work,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__Executor__work + 7,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__Executor__work + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__Executor__read
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__Executor__read[103] = {
+    0xcd, 0x40, 0x0a,
+    MP_QSTR__read & 0xff, MP_QSTR__read >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x42, 0x4e, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x14, MP_QSTR_wait & 0xff, MP_QSTR_wait >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__mutex & 0xff, MP_QSTR__mutex >> 8, 
+    0x47, 0x0d, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__done & 0xff, MP_QSTR__done >> 8, 
+    0xc1, 
+    0x2b, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__done & 0xff, MP_QSTR__done >> 8, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0xb1, 
+    0x5f, 
+    0x4b, 0x26, 0x00, 
+    0xc2, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR__nrun & 0xff, MP_QSTR__nrun >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR__nrun & 0xff, MP_QSTR__nrun >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_waiter & 0xff, MP_QSTR_waiter >> 8, 
+    0x44, 0x10, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_waiter & 0xff, MP_QSTR_waiter >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0xd7, 0x7f, 
+    0xb0, 
+    0x13, MP_QSTR__nrun & 0xff, MP_QSTR__nrun >> 8, 
+    0x43, 0xab, 0x7f, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR__reader & 0xff, MP_QSTR__reader >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__Executor__read[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__Executor__read = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__Executor__read,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__Executor__read,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 103,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 1,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__read,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__Executor__read + 7,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__Executor__read + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__Executor__submit
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__Executor__submit[167] = {
+    0x3e, 0x0a,
+    MP_QSTR__submit & 0xff, MP_QSTR__submit >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR__nrun & 0xff, MP_QSTR__nrun >> 8, 
+    0x81, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR__nrun & 0xff, MP_QSTR__nrun >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__reader & 0xff, MP_QSTR__reader >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x24, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x09, 0x80, 
+    0x12, MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8, 
+    0x34, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0xb0, 
+    0x14, MP_QSTR__read & 0xff, MP_QSTR__read >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0xb0, 
+    0x18, MP_QSTR__reader & 0xff, MP_QSTR__reader >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__mutex & 0xff, MP_QSTR__mutex >> 8, 
+    0x47, 0x48, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x44, 0x1b, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x14, MP_QSTR_pop & 0xff, MP_QSTR_pop >> 8, 
+    0x36, 0x00, 
+    0xc2, 
+    0xb1, 
+    0xb2, 
+    0x18, MP_QSTR_job & 0xff, MP_QSTR_job >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_lock & 0xff, MP_QSTR_lock >> 8, 
+    0x14, MP_QSTR_release & 0xff, MP_QSTR_release >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0xb0, 
+    0x13, MP_QSTR__nthreads & 0xff, MP_QSTR__nthreads >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__workers & 0xff, MP_QSTR__workers >> 8, 
+    0xd9, 
+    0x44, 0x0d, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__pending & 0xff, MP_QSTR__pending >> 8, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR__nthreads & 0xff, MP_QSTR__nthreads >> 8, 
+    0x81, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR__nthreads & 0xff, MP_QSTR__nthreads >> 8, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0x12, MP_QSTR__thread & 0xff, MP_QSTR__thread >> 8, 
+    0x14, MP_QSTR_start_new_thread & 0xff, MP_QSTR_start_new_thread >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__work & 0xff, MP_QSTR__work >> 8, 
+    0x12, MP_QSTR__Worker & 0xff, MP_QSTR__Worker >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x2a, 0x01, 
+    0x36, 0x02, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__Executor__submit[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_job),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__Executor__submit = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__Executor__submit,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__Executor__submit,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 167,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__submit,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__Executor__submit + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__Executor__submit + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__Executor_run
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__Executor_run[66] = {
+    0xb2, 0xc0, 0x80, 0x40, 0x0a,
+    MP_QSTR_run & 0xff, MP_QSTR_run >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR__Job & 0xff, MP_QSTR__Job >> 8, 
+    0xb1, 
+    0xb2, 
+    0x34, 0x02, 
+    0xc3, 
+    0xb0, 
+    0x14, MP_QSTR__submit & 0xff, MP_QSTR__submit >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0xb3, 
+    0x18, MP_QSTR_waiter & 0xff, MP_QSTR_waiter >> 8, 
+    0xb3, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0xb3, 
+    0x13, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x44, 0x05, 0x80, 
+    0xb3, 
+    0x13, MP_QSTR_exc & 0xff, MP_QSTR_exc >> 8, 
+    0x65, 
+    0xb3, 
+    0x13, MP_QSTR_ret & 0xff, MP_QSTR_ret >> 8, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__Executor_run[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_fn),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__Executor_run = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x05,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__Executor_run,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__Executor_run,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 66,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 5,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_run,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__Executor_run + 9,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__Executor_run + 10,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__Executor_shutdown
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__Executor_shutdown[95] = {
+    0x4d, 0x0a,
+    MP_QSTR_shutdown & 0xff, MP_QSTR_shutdown >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__nrun & 0xff, MP_QSTR__nrun >> 8, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_RuntimeError & 0xff, MP_QSTR_RuntimeError >> 8, 
+    0x23, 0x01, 
+    0x34, 0x01, 
+    0x65, 
+    0xb0, 
+    0x13, MP_QSTR__mutex & 0xff, MP_QSTR__mutex >> 8, 
+    0x47, 0x28, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x5f, 
+    0x4b, 0x13, 0x00, 
+    0xc1, 
+    0x51, 
+    0xb1, 
+    0x18, MP_QSTR_job & 0xff, MP_QSTR_job >> 8, 
+    0xb1, 
+    0x13, MP_QSTR_lock & 0xff, MP_QSTR_lock >> 8, 
+    0x14, MP_QSTR_release & 0xff, MP_QSTR_release >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x42, 0xea, 0x7f, 
+    0x2b, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__nthreads & 0xff, MP_QSTR__nthreads >> 8, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0xb0, 
+    0x13, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x44, 0x0f, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR__wake & 0xff, MP_QSTR__wake >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_executor__lt_module_gt__Executor_shutdown_0 = {{&mp_type_str}, 27510, 12, (const byte*)"\x6a\x6f\x62\x73\x20\x72\x75\x6e\x6e\x69\x6e\x67"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__Executor_shutdown[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_uasyncio_executor__lt_module_gt__Executor_shutdown_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__Executor_shutdown = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__Executor_shutdown,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__Executor_shutdown,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 95,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_shutdown,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__Executor_shutdown + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__Executor_shutdown + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__Executor
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__Executor[55] = {
+    0x08, 0x0a,
+    MP_QSTR_Executor & 0xff, MP_QSTR_Executor >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_Executor & 0xff, MP_QSTR_Executor >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x82, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR__work & 0xff, MP_QSTR__work >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR__read & 0xff, MP_QSTR__read >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR__submit & 0xff, MP_QSTR__submit >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_run & 0xff, MP_QSTR_run >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR_shutdown & 0xff, MP_QSTR_shutdown >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__Executor[6] = {
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__Executor___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__Executor__work),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__Executor__read),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__Executor__submit),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__Executor_run),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__Executor_shutdown),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__Executor = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__Executor,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__Executor,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 55,
+    .n_obj = 0,
+    .n_raw_code = 6,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_Executor,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__Executor + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__Executor + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor__lt_module_gt__run_in_executor
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt__run_in_executor[38] = {
+    0xb1, 0x80, 0x80, 0x40, 0x0a,
+    MP_QSTR_run_in_executor & 0xff, MP_QSTR_run_in_executor >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR__executor & 0xff, MP_QSTR__executor >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_Executor & 0xff, MP_QSTR_Executor >> 8, 
+    0x34, 0x00, 
+    0x17, MP_QSTR__executor & 0xff, MP_QSTR__executor >> 8, 
+    0x12, MP_QSTR__executor & 0xff, MP_QSTR__executor >> 8, 
+    0x14, MP_QSTR_run & 0xff, MP_QSTR_run >> 8, 
+    0xb0, 
+    0xb1, 
+    0x53, 
+    0x37, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt__run_in_executor[1] = {
+    MP_ROM_QSTR(MP_QSTR_fn),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt__run_in_executor = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x04,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt__run_in_executor,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt__run_in_executor,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 38,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 4,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_run_in_executor,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt__run_in_executor + 9,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt__run_in_executor + 10,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/executor.py, scope uasyncio_executor_<module>
+STATIC const byte fun_data_uasyncio_executor__lt_module_gt_[164] = {
+    0x2c, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_executor_dot_py & 0xff, MP_QSTR_uasyncio_slash_executor_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR__thread & 0xff, MP_QSTR__thread >> 8, 
+    0x16, MP_QSTR__thread & 0xff, MP_QSTR__thread >> 8, 
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x48, 0x13, 0x00, 
+    0x80, 
+    0x10, MP_QSTR_pipe & 0xff, MP_QSTR_pipe >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_uos & 0xff, MP_QSTR_uos >> 8, 
+    0x1c, MP_QSTR_pipe & 0xff, MP_QSTR_pipe >> 8, 
+    0x16, MP_QSTR_pipe & 0xff, MP_QSTR_pipe >> 8, 
+    0x59, 
+    0x4a, 0x11, 0x00, 
+    0x57, 
+    0x11, MP_QSTR_ImportError & 0xff, MP_QSTR_ImportError >> 8, 
+    0xdf, 
+    0x44, 0x08, 0x80, 
+    0x59, 
+    0x51, 
+    0x16, MP_QSTR_pipe & 0xff, MP_QSTR_pipe >> 8, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x11, MP_QSTR_pipe & 0xff, MP_QSTR_pipe >> 8, 
+    0x44, 0x0e, 0x80, 
+    0x54, 
+    0x32, 0x00, 
+    0x10, MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8, 
+    0x42, 0x1e, 0x80, 
+    0x81, 
+    0x10, MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_event & 0xff, MP_QSTR_event >> 8, 
+    0x1c, MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8, 
+    0x16, MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8, 
+    0x59, 
+    0x54, 
+    0x32, 0x01, 
+    0x10, MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8, 
+    0x11, MP_QSTR_ThreadSafeFlag & 0xff, MP_QSTR_ThreadSafeFlag >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR__Wake & 0xff, MP_QSTR__Wake >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR__Job & 0xff, MP_QSTR__Job >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR__Job & 0xff, MP_QSTR__Job >> 8, 
+    0x54, 
+    0x32, 0x03, 
+    0x10, MP_QSTR__Worker & 0xff, MP_QSTR__Worker >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR__Worker & 0xff, MP_QSTR__Worker >> 8, 
+    0x54, 
+    0x32, 0x04, 
+    0x10, MP_QSTR_Executor & 0xff, MP_QSTR_Executor >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_Executor & 0xff, MP_QSTR_Executor >> 8, 
+    0x51, 
+    0x17, MP_QSTR__executor & 0xff, MP_QSTR__executor >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR_run_in_executor & 0xff, MP_QSTR_run_in_executor >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_executor__lt_module_gt_[6] = {
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Wake),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Wake2),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Job),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt___Worker),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__Executor),
+    MP_ROM_PTR(&raw_code_uasyncio_executor__lt_module_gt__run_in_executor),
+};
+const mp_raw_code_t raw_code_uasyncio_executor__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_executor__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_executor__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 164,
+    .n_obj = 0,
+    .n_raw_code = 6,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_executor_dot_py,
+        .line_info = fun_data_uasyncio_executor__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_executor__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt__wait_for_runner
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt__wait_for_runner[65] = {
+    0xd8, 0x46, 0x0a,
+    MP_QSTR_runner & 0xff, MP_QSTR_runner >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00,
+    0x48, 0x0b, 0x00, 
+    0xb3, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x27, 0x01, 
+    0x52, 
+    0xc4, 
+    0x4a, 0x18, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_BaseException & 0xff, MP_QSTR_BaseException >> 8, 
+    0xdf, 
+    0x44, 0x0f, 0x80, 
+    0xc5, 
+    0x49, 0x03, 0x00, 
+    0xb5, 
+    0xc4, 
+    0x51, 
+    0x51, 
+    0xc5, 
+    0x28, 0x05, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x25, 0x00, 
+    0x51, 
+    0xde, 
+    0x44, 0x0a, 0x80, 
+    0xb4, 
+    0x27, 0x00, 
+    0xb2, 
+    0x14, MP_QSTR_cancel & 0xff, MP_QSTR_cancel >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt__wait_for_runner[4] = {
+    MP_ROM_QSTR(MP_QSTR__star_),
+    MP_ROM_QSTR(MP_QSTR__star_),
+    MP_ROM_QSTR(MP_QSTR_waiter),
+    MP_ROM_QSTR(MP_QSTR_aw),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt__wait_for_runner = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt__wait_for_runner,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt__wait_for_runner,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 65,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 12,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_runner,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt__wait_for_runner + 7,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt__wait_for_runner + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt__wait_for
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt__wait_for[161] = {
+    0xeb, 0x43, 0x8a, 0x01,
+    MP_QSTR_wait_for & 0xff, MP_QSTR_wait_for >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00, 0x06, 0x07,
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR__promote_to_task & 0xff, MP_QSTR__promote_to_task >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0xc0, 
+    0xb1, 
+    0x51, 
+    0xde, 
+    0x44, 0x05, 0x80, 
+    0xb0, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x63, 
+    0xb6, 
+    0xb7, 
+    0x20, 0x03, 0x02, 
+    0xc3, 
+    0x51, 
+    0x27, 0x06, 
+    0x51, 
+    0x27, 0x07, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0xb3, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0xb0, 
+    0x34, 0x02, 
+    0x36, 0x01, 
+    0xc4, 
+    0x48, 0x0b, 0x00, 
+    0xb2, 
+    0xb1, 
+    0x34, 0x01, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x4a, 0x3c, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0xdf, 
+    0x44, 0x30, 0x80, 
+    0xc5, 
+    0x49, 0x24, 0x00, 
+    0x25, 0x06, 
+    0x52, 
+    0xde, 
+    0x44, 0x03, 0x80, 
+    0x25, 0x07, 
+    0x63, 
+    0x25, 0x06, 
+    0x51, 
+    0xde, 
+    0x44, 0x0f, 0x80, 
+    0x52, 
+    0x27, 0x06, 
+    0xb4, 
+    0x14, MP_QSTR_cancel & 0xff, MP_QSTR_cancel >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb5, 
+    0x65, 
+    0x42, 0x03, 0x80, 
+    0x25, 0x06, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc5, 
+    0x28, 0x05, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x52, 
+    0x27, 0x06, 
+    0xb4, 
+    0x14, MP_QSTR_cancel & 0xff, MP_QSTR_cancel >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb4, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_TimeoutError & 0xff, MP_QSTR_TimeoutError >> 8, 
+    0x65, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt__wait_for[4] = {
+    MP_ROM_QSTR(MP_QSTR_aw),
+    MP_ROM_QSTR(MP_QSTR_timeout),
+    MP_ROM_QSTR(MP_QSTR_sleep),
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt__wait_for_runner),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt__wait_for = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt__wait_for,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt__wait_for,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 161,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 14,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_wait_for,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt__wait_for + 8,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt__wait_for + 11,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt__wait_for_ms
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt__wait_for_ms[21] = {
+    0x2a, 0x0a,
+    MP_QSTR_wait_for_ms & 0xff, MP_QSTR_wait_for_ms >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_wait_for & 0xff, MP_QSTR_wait_for >> 8, 
+    0xb0, 
+    0xb1, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_sleep_ms & 0xff, MP_QSTR_sleep_ms >> 8, 
+    0x34, 0x03, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt__wait_for_ms[2] = {
+    MP_ROM_QSTR(MP_QSTR_aw),
+    MP_ROM_QSTR(MP_QSTR_timeout),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt__wait_for_ms = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt__wait_for_ms,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt__wait_for_ms,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 21,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait_for_ms,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt__wait_for_ms + 6,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt__wait_for_ms + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt___Remove_remove
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt___Remove_remove[9] = {
+    0x09, 0x0a,
+    MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00,
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt___Remove_remove[1] = {
+    MP_ROM_QSTR(MP_QSTR_t),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt___Remove_remove = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt___Remove_remove,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt___Remove_remove,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_remove,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt___Remove_remove + 6,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt___Remove_remove + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt___Remove
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt___Remove[31] = {
+    0x08, 0x0a,
+    MP_QSTR__Remove & 0xff, MP_QSTR__Remove >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__Remove & 0xff, MP_QSTR__Remove >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x11, MP_QSTR_staticmethod & 0xff, MP_QSTR_staticmethod >> 8, 
+    0x32, 0x00, 
+    0x34, 0x01, 
+    0x16, MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt___Remove[1] = {
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt___Remove_remove),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt___Remove = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt___Remove,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt___Remove,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 31,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__Remove,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt___Remove + 6,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt___Remove + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt__gather_done
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt__gather_done[85] = {
+    0xc2, 0x04, 0x0a,
+    MP_QSTR_done & 0xff, MP_QSTR_done >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00,
+    0x25, 0x00, 
+    0x43, 0x0d, 0x80, 
+    0x12, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0xde, 
+    0x44, 0x10, 0x80, 
+    0x25, 0x02, 
+    0x81, 
+    0xe6, 
+    0x27, 0x02, 
+    0x25, 0x02, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x42, 0x0f, 0x80, 
+    0x25, 0x03, 
+    0x51, 
+    0xde, 
+    0x44, 0x06, 0x80, 
+    0xb5, 
+    0x27, 0x03, 
+    0x42, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x25, 0x01, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x12, MP_QSTR__Remove & 0xff, MP_QSTR__Remove >> 8, 
+    0xde, 
+    0x44, 0x0e, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0x25, 0x01, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt__gather_done[6] = {
+    MP_ROM_QSTR(MP_QSTR__star_),
+    MP_ROM_QSTR(MP_QSTR__star_),
+    MP_ROM_QSTR(MP_QSTR__star_),
+    MP_ROM_QSTR(MP_QSTR__star_),
+    MP_ROM_QSTR(MP_QSTR_t),
+    MP_ROM_QSTR(MP_QSTR_er),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt__gather_done = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 6,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt__gather_done,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt__gather_done,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 85,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 9,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 6,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_done,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt__gather_done + 7,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt__gather_done + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt__gather_<listcomp>
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_[30] = {
+    0x49, 0x0a,
+    MP_QSTR__lt_listcomp_gt_ & 0xff, MP_QSTR__lt_listcomp_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00,
+    0x2b, 0x00, 
+    0xb0, 
+    0x5f, 
+    0x4b, 0x0f, 0x00, 
+    0xc1, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR__promote_to_task & 0xff, MP_QSTR__promote_to_task >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x2f, 0x14, 
+    0x42, 0xee, 0x7f, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_[1] = {
+    MP_ROM_QSTR(MP_QSTR__star_),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 30,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_listcomp_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_ + 6,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs__lt_module_gt__gather
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt__gather[304] = {
+    0x80, 0xda, 0x80, 0xc0, 0x40, 0x8a, 0x80, 0x01,
+    MP_QSTR_gather & 0xff, MP_QSTR_gather >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00, 0x00, 0x08, 0x09, 0x0a,
+    0xb0, 
+    0xb8, 
+    0xb9, 
+    0xba, 
+    0x20, 0x02, 0x04, 
+    0xc2, 
+    0x32, 0x03, 
+    0xb1, 
+    0x34, 0x01, 
+    0xc3, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x27, 0x08, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb3, 
+    0x34, 0x01, 
+    0x27, 0x09, 
+    0x51, 
+    0x27, 0x0a, 
+    0xb3, 
+    0x5f, 
+    0x4b, 0x5c, 0x00, 
+    0xc4, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0xc5, 
+    0xb5, 
+    0x52, 
+    0xde, 
+    0x44, 0x08, 0x80, 
+    0xb2, 
+    0xb4, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x42, 0x45, 0x80, 
+    0xb5, 
+    0x43, 0x31, 0x80, 
+    0x50, 
+    0xb4, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x25, 0x00, 
+    0x43, 0x1e, 0x80, 
+    0x12, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0xb4, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x34, 0x01, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0xde, 
+    0xd3, 
+    0x44, 0x0d, 0x80, 
+    0xb4, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x27, 0x0a, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x42, 0x1c, 0x80, 
+    0x25, 0x09, 
+    0x81, 
+    0xe6, 
+    0x27, 0x09, 
+    0x42, 0x10, 0x80, 
+    0x12, MP_QSTR_RuntimeError & 0xff, MP_QSTR_RuntimeError >> 8, 
+    0x23, 0x01, 
+    0x34, 0x01, 
+    0x27, 0x0a, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x42, 0x03, 0x80, 
+    0x42, 0xa1, 0x7f, 
+    0x25, 0x0a, 
+    0x51, 
+    0xde, 
+    0x44, 0x32, 0x80, 
+    0x25, 0x09, 
+    0x44, 0x2d, 0x80, 
+    0x12, MP_QSTR__Remove & 0xff, MP_QSTR__Remove >> 8, 
+    0x25, 0x08, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x48, 0x06, 0x00, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0x4a, 0x1c, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0xdf, 
+    0x44, 0x10, 0x80, 
+    0xc6, 
+    0x49, 0x04, 0x00, 
+    0xb6, 
+    0x27, 0x0a, 
+    0x51, 
+    0x51, 
+    0xc6, 
+    0x28, 0x06, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb3, 
+    0x34, 0x01, 
+    0x80, 
+    0x42, 0x45, 0x80, 
+    0x57, 
+    0xc7, 
+    0xb3, 
+    0xb7, 
+    0x55, 
+    0xc4, 
+    0xb4, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0xc5, 
+    0xb5, 
+    0xb2, 
+    0xde, 
+    0x43, 0x06, 0x80, 
+    0xb5, 
+    0x52, 
+    0xde, 
+    0x44, 0x0f, 0x80, 
+    0x52, 
+    0xb4, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0xb4, 
+    0x14, MP_QSTR_cancel & 0xff, MP_QSTR_cancel >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x42, 0x1d, 0x80, 
+    0xb4, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0xc6, 
+    0x12, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0xb6, 
+    0x34, 0x01, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0xde, 
+    0x44, 0x07, 0x80, 
+    0xb6, 
+    0x13, MP_QSTR_value & 0xff, MP_QSTR_value >> 8, 
+    0x42, 0x01, 0x80, 
+    0xb6, 
+    0xb3, 
+    0xb7, 
+    0x56, 
+    0x81, 
+    0xe5, 
+    0x58, 
+    0x5a, 
+    0xd7, 
+    0x43, 0xb5, 0x7f, 
+    0x59, 
+    0x59, 
+    0x25, 0x0a, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x03, 0x80, 
+    0x25, 0x0a, 
+    0x65, 
+    0xb3, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_funcs__lt_module_gt__gather_0 = {{&mp_type_str}, 4535, 12, (const byte*)"\x63\x61\x6e\x27\x74\x20\x67\x61\x74\x68\x65\x72"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt__gather[4] = {
+    MP_ROM_QSTR(MP_QSTR_return_exceptions),
+    MP_ROM_PTR(&const_obj_uasyncio_funcs__lt_module_gt__gather_0),
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt__gather_done),
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt__gather__lt_listcomp_gt_),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt__gather = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x0d,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt__gather,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt__gather,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 304,
+    .n_obj = 1,
+    .n_raw_code = 2,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 17,
+        .n_exc_stack = 2,
+        .scope_flags = 13,
+        .n_pos_args = 0,
+        .n_kwonly_args = 1,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_gather,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt__gather + 12,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt__gather + 17,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/funcs.py, scope uasyncio_funcs_<module>
+STATIC const byte fun_data_uasyncio_funcs__lt_module_gt_[68] = {
+    0x18, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_funcs_dot_py & 0xff, MP_QSTR_uasyncio_slash_funcs_dot_py >> 8,
+    0x00,
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x11, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_sleep & 0xff, MP_QSTR_sleep >> 8, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x00, 
+    0x16, MP_QSTR_wait_for & 0xff, MP_QSTR_wait_for >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_wait_for_ms & 0xff, MP_QSTR_wait_for_ms >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR__Remove & 0xff, MP_QSTR__Remove >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR__Remove & 0xff, MP_QSTR__Remove >> 8, 
+    0x53, 
+    0x2c, 0x00, 
+    0x50, 
+    0x10, MP_QSTR_return_exceptions & 0xff, MP_QSTR_return_exceptions >> 8, 
+    0x62, 
+    0x33, 0x03, 
+    0x16, MP_QSTR_gather & 0xff, MP_QSTR_gather >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_funcs__lt_module_gt_[4] = {
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt__wait_for),
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt__wait_for_ms),
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt___Remove),
+    MP_ROM_PTR(&raw_code_uasyncio_funcs__lt_module_gt__gather),
+};
+const mp_raw_code_t raw_code_uasyncio_funcs__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_funcs__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_funcs__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 68,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_funcs_dot_py,
+        .line_info = fun_data_uasyncio_funcs__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_funcs__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock__lt_module_gt__Lock___init__
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt__Lock___init__[26] = {
+    0x11, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt__Lock___init__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt__Lock___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt__Lock___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt__Lock___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt__Lock___init__ + 6,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt__Lock___init__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock__lt_module_gt__Lock_locked
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt__Lock_locked[14] = {
+    0x11, 0x0a,
+    MP_QSTR_locked & 0xff, MP_QSTR_locked >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x81, 
+    0xd9, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt__Lock_locked[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt__Lock_locked = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt__Lock_locked,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt__Lock_locked,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_locked,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt__Lock_locked + 6,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt__Lock_locked + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock__lt_module_gt__Lock_release
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt__Lock_release[75] = {
+    0x19, 0x0a,
+    MP_QSTR_release & 0xff, MP_QSTR_release >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x81, 
+    0xdc, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_RuntimeError & 0xff, MP_QSTR_RuntimeError >> 8, 
+    0x23, 0x01, 
+    0x34, 0x01, 
+    0x65, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x44, 0x20, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0x05, 0x80, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_lock__lt_module_gt__Lock_release_0 = {{&mp_type_str}, 43943, 17, (const byte*)"\x4c\x6f\x63\x6b\x20\x6e\x6f\x74\x20\x61\x63\x71\x75\x69\x72\x65\x64"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt__Lock_release[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_uasyncio_lock__lt_module_gt__Lock_release_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt__Lock_release = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt__Lock_release,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt__Lock_release,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 75,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_release,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt__Lock_release + 6,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt__Lock_release + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock__lt_module_gt__Lock_acquire
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt__Lock_acquire[115] = {
+    0xb9, 0x42, 0x0a,
+    MP_QSTR_acquire & 0xff, MP_QSTR_acquire >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x80, 
+    0xdc, 
+    0x44, 0x5b, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_waiting & 0xff, MP_QSTR_waiting >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x48, 0x06, 0x00, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0x4a, 0x35, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0xdf, 
+    0x44, 0x29, 0x80, 
+    0xc1, 
+    0x49, 0x1d, 0x00, 
+    0xb0, 
+    0x13, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0xd9, 
+    0x44, 0x0c, 0x80, 
+    0x81, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0xb0, 
+    0x14, MP_QSTR_release & 0xff, MP_QSTR_release >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb1, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc1, 
+    0x28, 0x01, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x81, 
+    0xb0, 
+    0x18, MP_QSTR_state & 0xff, MP_QSTR_state >> 8, 
+    0x52, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt__Lock_acquire[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt__Lock_acquire = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt__Lock_acquire,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt__Lock_acquire,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 115,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_acquire,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt__Lock_acquire + 7,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt__Lock_acquire + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock__lt_module_gt__Lock___aenter__
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt__Lock___aenter__[18] = {
+    0x91, 0x40, 0x0a,
+    MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_acquire & 0xff, MP_QSTR_acquire >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt__Lock___aenter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt__Lock___aenter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt__Lock___aenter__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt__Lock___aenter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aenter__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt__Lock___aenter__ + 7,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt__Lock___aenter__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock__lt_module_gt__Lock___aexit__
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt__Lock___aexit__[15] = {
+    0xa8, 0x44, 0x0a,
+    MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_release & 0xff, MP_QSTR_release >> 8, 
+    0x36, 0x00, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt__Lock___aexit__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_exc_type),
+    MP_ROM_QSTR(MP_QSTR_exc),
+    MP_ROM_QSTR(MP_QSTR_tb),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt__Lock___aexit__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt__Lock___aexit__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt__Lock___aexit__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 15,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aexit__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt__Lock___aexit__ + 7,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt__Lock___aexit__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock__lt_module_gt__Lock
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt__Lock[51] = {
+    0x00, 0x0a,
+    MP_QSTR_Lock & 0xff, MP_QSTR_Lock >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_Lock & 0xff, MP_QSTR_Lock >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_locked & 0xff, MP_QSTR_locked >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_release & 0xff, MP_QSTR_release >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_acquire & 0xff, MP_QSTR_acquire >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt__Lock[6] = {
+    MP_ROM_PTR(&raw_code_uasyncio_lock__lt_module_gt__Lock___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_lock__lt_module_gt__Lock_locked),
+    MP_ROM_PTR(&raw_code_uasyncio_lock__lt_module_gt__Lock_release),
+    MP_ROM_PTR(&raw_code_uasyncio_lock__lt_module_gt__Lock_acquire),
+    MP_ROM_PTR(&raw_code_uasyncio_lock__lt_module_gt__Lock___aenter__),
+    MP_ROM_PTR(&raw_code_uasyncio_lock__lt_module_gt__Lock___aexit__),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt__Lock = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt__Lock,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt__Lock,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 51,
+    .n_obj = 0,
+    .n_raw_code = 6,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_Lock,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt__Lock + 6,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt__Lock + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/lock.py, scope uasyncio_lock_<module>
+STATIC const byte fun_data_uasyncio_lock__lt_module_gt_[36] = {
+    0x10, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_lock_dot_py & 0xff, MP_QSTR_uasyncio_slash_lock_dot_py >> 8,
+    0x00,
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x54, 
+    0x32, 0x00, 
+    0x10, MP_QSTR_Lock & 0xff, MP_QSTR_Lock >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_Lock & 0xff, MP_QSTR_Lock >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_lock__lt_module_gt_[1] = {
+    MP_ROM_PTR(&raw_code_uasyncio_lock__lt_module_gt__Lock),
+};
+const mp_raw_code_t raw_code_uasyncio_lock__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_lock__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_lock__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 36,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_lock_dot_py,
+        .line_info = fun_data_uasyncio_lock__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_lock__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__QueueEmpty
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__QueueEmpty[21] = {
+    0x00, 0x0a,
+    MP_QSTR_QueueEmpty & 0xff, MP_QSTR_QueueEmpty >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_QueueEmpty & 0xff, MP_QSTR_QueueEmpty >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__QueueEmpty = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__QueueEmpty,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 21,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_QueueEmpty,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__QueueEmpty + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__QueueEmpty + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__QueueFull
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__QueueFull[21] = {
+    0x00, 0x0a,
+    MP_QSTR_QueueFull & 0xff, MP_QSTR_QueueFull >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_QueueFull & 0xff, MP_QSTR_QueueFull >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__QueueFull = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__QueueFull,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 21,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_QueueFull,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__QueueFull + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__QueueFull + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue___init__
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue___init__[85] = {
+    0xa2, 0x01, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_maxsize & 0xff, MP_QSTR_maxsize >> 8, 
+    0x51, 
+    0x2b, 0x01, 
+    0xb1, 
+    0x80, 
+    0xd8, 
+    0x44, 0x04, 0x80, 
+    0xb1, 
+    0x42, 0x01, 0x80, 
+    0x84, 
+    0xf4, 
+    0xb0, 
+    0x18, MP_QSTR__buf & 0xff, MP_QSTR__buf >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__getters & 0xff, MP_QSTR__getters >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_TaskQueue & 0xff, MP_QSTR_TaskQueue >> 8, 
+    0x36, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__joiners & 0xff, MP_QSTR__joiners >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue___init__[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_maxsize),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 85,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue___init__ + 7,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue___init__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_qsize
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_qsize[12] = {
+    0x09, 0x0a,
+    MP_QSTR_qsize & 0xff, MP_QSTR_qsize >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_qsize[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_qsize = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_qsize,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_qsize,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 12,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_qsize,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_qsize + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_qsize + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_empty
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_empty[13] = {
+    0x09, 0x0a,
+    MP_QSTR_empty & 0xff, MP_QSTR_empty >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xd3, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_empty[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_empty = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_empty,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_empty,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 13,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_empty,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_empty + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_empty + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_full
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_full[29] = {
+    0x19, 0x0a,
+    MP_QSTR_full & 0xff, MP_QSTR_full >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x80, 
+    0xb0, 
+    0x13, MP_QSTR_maxsize & 0xff, MP_QSTR_maxsize >> 8, 
+    0x57, 
+    0x5b, 
+    0xd7, 
+    0x46, 0x08, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xda, 
+    0x42, 0x02, 0x80, 
+    0x5a, 
+    0x59, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_full[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_full = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_full,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_full,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 29,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_full,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_full + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_full + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_put_nowait
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_put_nowait[146] = {
+    0x42, 0x0a,
+    MP_QSTR_put_nowait & 0xff, MP_QSTR_put_nowait >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__buf & 0xff, MP_QSTR__buf >> 8, 
+    0xc2, 
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xc3, 
+    0xb3, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xd9, 
+    0x44, 0x31, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_maxsize & 0xff, MP_QSTR_maxsize >> 8, 
+    0x80, 
+    0xd8, 
+    0x44, 0x04, 0x80, 
+    0x12, MP_QSTR_QueueFull & 0xff, MP_QSTR_QueueFull >> 8, 
+    0x65, 
+    0xb2, 
+    0xb0, 
+    0x13, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0xb2, 
+    0x51, 
+    0xb0, 
+    0x13, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0x2e, 0x02, 
+    0x55, 
+    0xf2, 
+    0x51, 
+    0x2b, 0x01, 
+    0xb3, 
+    0xf4, 
+    0xf2, 
+    0x57, 
+    0xc2, 
+    0xb0, 
+    0x18, MP_QSTR__buf & 0xff, MP_QSTR__buf >> 8, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0xb1, 
+    0xb2, 
+    0xb0, 
+    0x13, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0xb3, 
+    0xf2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xf8, 
+    0x56, 
+    0xb3, 
+    0x81, 
+    0xf2, 
+    0xb0, 
+    0x18, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0x81, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__getters & 0xff, MP_QSTR__getters >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x44, 0x15, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__getters & 0xff, MP_QSTR__getters >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_put_nowait[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_item),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_put_nowait = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_put_nowait,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_put_nowait,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 146,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 9,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_put_nowait,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_put_nowait + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_put_nowait + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_get_nowait
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_get_nowait[96] = {
+    0x39, 0x0a,
+    MP_QSTR_get_nowait & 0xff, MP_QSTR_get_nowait >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x43, 0x04, 0x80, 
+    0x12, MP_QSTR_QueueEmpty & 0xff, MP_QSTR_QueueEmpty >> 8, 
+    0x65, 
+    0xb0, 
+    0x13, MP_QSTR__buf & 0xff, MP_QSTR__buf >> 8, 
+    0xc1, 
+    0xb0, 
+    0x13, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0xc2, 
+    0xb1, 
+    0xb2, 
+    0x55, 
+    0xc3, 
+    0x51, 
+    0xb1, 
+    0xb2, 
+    0x56, 
+    0xb2, 
+    0x81, 
+    0xf2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xf8, 
+    0xb0, 
+    0x18, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x44, 0x15, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0xb3, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_get_nowait[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_get_nowait = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_get_nowait,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_get_nowait,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 96,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_nowait,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_get_nowait + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_get_nowait + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_put
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_put[152] = {
+    0xca, 0x42, 0x0a,
+    MP_QSTR_put & 0xff, MP_QSTR_put >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x42, 0x6b, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x48, 0x06, 0x00, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0x4a, 0x45, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0xdf, 
+    0x44, 0x39, 0x80, 
+    0xc2, 
+    0x49, 0x2d, 0x00, 
+    0xb0, 
+    0x14, MP_QSTR_full & 0xff, MP_QSTR_full >> 8, 
+    0x36, 0x00, 
+    0x43, 0x21, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x44, 0x15, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0xb2, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc2, 
+    0x28, 0x02, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x80, 
+    0xb0, 
+    0x13, MP_QSTR_maxsize & 0xff, MP_QSTR_maxsize >> 8, 
+    0x57, 
+    0x5b, 
+    0xd7, 
+    0x46, 0x08, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xda, 
+    0x42, 0x02, 0x80, 
+    0x5a, 
+    0x59, 
+    0x43, 0x7d, 0x7f, 
+    0xb0, 
+    0x14, MP_QSTR_put_nowait & 0xff, MP_QSTR_put_nowait >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_put[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_item),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_put = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_put,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_put,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 152,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_put,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_put + 7,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_put + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_get
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_get[130] = {
+    0xc1, 0x42, 0x0a,
+    MP_QSTR_get & 0xff, MP_QSTR_get >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x42, 0x69, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__getters & 0xff, MP_QSTR__getters >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__getters & 0xff, MP_QSTR__getters >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x48, 0x06, 0x00, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0x4a, 0x43, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0xdf, 
+    0x44, 0x37, 0x80, 
+    0xc1, 
+    0x49, 0x2b, 0x00, 
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x44, 0x21, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__getters & 0xff, MP_QSTR__getters >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x44, 0x15, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__getters & 0xff, MP_QSTR__getters >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0xb1, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc1, 
+    0x28, 0x01, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x44, 0x90, 0x7f, 
+    0xb0, 
+    0x14, MP_QSTR_get_nowait & 0xff, MP_QSTR_get_nowait >> 8, 
+    0x36, 0x00, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_get[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_get = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_get,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_get,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 130,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 9,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_get + 7,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_get + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_task_done
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_task_done[78] = {
+    0x21, 0x0a,
+    MP_QSTR_task_done & 0xff, MP_QSTR_task_done >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0x43, 0x08, 0x80, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0x23, 0x01, 
+    0x34, 0x01, 
+    0x65, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0x43, 0x24, 0x80, 
+    0x42, 0x15, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__joiners & 0xff, MP_QSTR__joiners >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__joiners & 0xff, MP_QSTR__joiners >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x43, 0xdf, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_queue__lt_module_gt__Queue_task_done_0 = {{&mp_type_str}, 27164, 33, (const byte*)"\x74\x61\x73\x6b\x5f\x64\x6f\x6e\x65\x28\x29\x20\x63\x61\x6c\x6c\x65\x64\x20\x74\x6f\x6f\x20\x6d\x61\x6e\x79\x20\x74\x69\x6d\x65\x73"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_task_done[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_uasyncio_queue__lt_module_gt__Queue_task_done_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_task_done = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_task_done,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_task_done,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 78,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_task_done,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_task_done + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_task_done + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue_join
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue_join[49] = {
+    0x99, 0x40, 0x0a,
+    MP_QSTR_join & 0xff, MP_QSTR_join >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__unfinished & 0xff, MP_QSTR__unfinished >> 8, 
+    0x44, 0x20, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__joiners & 0xff, MP_QSTR__joiners >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__joiners & 0xff, MP_QSTR__joiners >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue_join[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue_join = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue_join,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue_join,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 49,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_join,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue_join + 7,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue_join + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__Queue
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__Queue[75] = {
+    0x08, 0x0a,
+    MP_QSTR_Queue & 0xff, MP_QSTR_Queue >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_Queue & 0xff, MP_QSTR_Queue >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x80, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_qsize & 0xff, MP_QSTR_qsize >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_empty & 0xff, MP_QSTR_empty >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_full & 0xff, MP_QSTR_full >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_put_nowait & 0xff, MP_QSTR_put_nowait >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR_get_nowait & 0xff, MP_QSTR_get_nowait >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR_put & 0xff, MP_QSTR_put >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_get & 0xff, MP_QSTR_get >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR_task_done & 0xff, MP_QSTR_task_done >> 8, 
+    0x32, 0x09, 
+    0x16, MP_QSTR_join & 0xff, MP_QSTR_join >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__Queue[10] = {
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_qsize),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_empty),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_full),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_put_nowait),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_get_nowait),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_put),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_get),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_task_done),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue_join),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__Queue = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__Queue,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__Queue,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 75,
+    .n_obj = 0,
+    .n_raw_code = 10,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_Queue,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__Queue + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__Queue + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__LifoQueue_get_nowait
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait[94] = {
+    0x39, 0x0a,
+    MP_QSTR_get_nowait & 0xff, MP_QSTR_get_nowait >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x43, 0x04, 0x80, 
+    0x12, MP_QSTR_QueueEmpty & 0xff, MP_QSTR_QueueEmpty >> 8, 
+    0x65, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0x81, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__buf & 0xff, MP_QSTR__buf >> 8, 
+    0xc1, 
+    0xb0, 
+    0x13, MP_QSTR__head & 0xff, MP_QSTR__head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__n & 0xff, MP_QSTR__n >> 8, 
+    0xf2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xf8, 
+    0xc2, 
+    0xb1, 
+    0xb2, 
+    0x55, 
+    0xc3, 
+    0x51, 
+    0xb1, 
+    0xb2, 
+    0x56, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x14, MP_QSTR_peek & 0xff, MP_QSTR_peek >> 8, 
+    0x36, 0x00, 
+    0x44, 0x15, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR__putters & 0xff, MP_QSTR__putters >> 8, 
+    0x14, MP_QSTR_pop_head & 0xff, MP_QSTR_pop_head >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0xb3, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 94,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_nowait,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue__lt_module_gt__LifoQueue
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt__LifoQueue[26] = {
+    0x00, 0x0a,
+    MP_QSTR_LifoQueue & 0xff, MP_QSTR_LifoQueue >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_LifoQueue & 0xff, MP_QSTR_LifoQueue >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR_get_nowait & 0xff, MP_QSTR_get_nowait >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt__LifoQueue[1] = {
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__LifoQueue_get_nowait),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt__LifoQueue = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt__LifoQueue,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt__LifoQueue,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_LifoQueue,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt__LifoQueue + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt__LifoQueue + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/queue.py, scope uasyncio_queue_<module>
+STATIC const byte fun_data_uasyncio_queue__lt_module_gt_[78] = {
+    0x18, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_queue_dot_py & 0xff, MP_QSTR_uasyncio_slash_queue_dot_py >> 8,
+    0x00,
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x54, 
+    0x32, 0x00, 
+    0x10, MP_QSTR_QueueEmpty & 0xff, MP_QSTR_QueueEmpty >> 8, 
+    0x11, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_QueueEmpty & 0xff, MP_QSTR_QueueEmpty >> 8, 
+    0x54, 
+    0x32, 0x01, 
+    0x10, MP_QSTR_QueueFull & 0xff, MP_QSTR_QueueFull >> 8, 
+    0x11, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_QueueFull & 0xff, MP_QSTR_QueueFull >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR_Queue & 0xff, MP_QSTR_Queue >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_Queue & 0xff, MP_QSTR_Queue >> 8, 
+    0x54, 
+    0x32, 0x03, 
+    0x10, MP_QSTR_LifoQueue & 0xff, MP_QSTR_LifoQueue >> 8, 
+    0x11, MP_QSTR_Queue & 0xff, MP_QSTR_Queue >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_LifoQueue & 0xff, MP_QSTR_LifoQueue >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_queue__lt_module_gt_[4] = {
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__QueueEmpty),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__QueueFull),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__Queue),
+    MP_ROM_PTR(&raw_code_uasyncio_queue__lt_module_gt__LifoQueue),
+};
+const mp_raw_code_t raw_code_uasyncio_queue__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_queue__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_queue__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 78,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_queue_dot_py,
+        .line_info = fun_data_uasyncio_queue__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_queue__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream___init__
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream___init__[57] = {
+    0xb0, 0x84, 0x01, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_e & 0xff, MP_QSTR_e >> 8, 
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0x34, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR_out_buf & 0xff, MP_QSTR_out_buf >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x80, 
+    0x57, 
+    0xb0, 
+    0x18, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x18, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb3, 
+    0x44, 0x08, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR_set_buffer & 0xff, MP_QSTR_set_buffer >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream___init__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+    MP_ROM_QSTR(MP_QSTR_e),
+    MP_ROM_QSTR(MP_QSTR_bufsize),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 57,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream___init__ + 8,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream___init__ + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_get_extra_info
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_get_extra_info[14] = {
+    0x1a, 0x0a,
+    MP_QSTR_get_extra_info & 0xff, MP_QSTR_get_extra_info >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_e & 0xff, MP_QSTR_e >> 8, 
+    0xb1, 
+    0x55, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_get_extra_info[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_v),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_get_extra_info = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_get_extra_info,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_get_extra_info,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 14,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_extra_info,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_get_extra_info + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_get_extra_info + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream___aenter__
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream___aenter__[10] = {
+    0x89, 0x40, 0x0a,
+    MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream___aenter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream___aenter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream___aenter__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream___aenter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 10,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aenter__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream___aenter__ + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream___aenter__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream___aexit__
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream___aexit__[27] = {
+    0xa8, 0x44, 0x0a,
+    MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream___aexit__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_exc_type),
+    MP_ROM_QSTR(MP_QSTR_exc),
+    MP_ROM_QSTR(MP_QSTR_tb),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream___aexit__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream___aexit__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream___aexit__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 27,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aexit__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream___aexit__ + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream___aexit__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_close
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_close[9] = {
+    0x09, 0x0a,
+    MP_QSTR_close & 0xff, MP_QSTR_close >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_close[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_close = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_close,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_close,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_close,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_close + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_close + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_wait_closed
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_wait_closed[36] = {
+    0x99, 0x40, 0x0a,
+    MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_wait_closed[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_wait_closed = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_wait_closed,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_wait_closed,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 36,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait_closed,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_wait_closed + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_wait_closed + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_set_buffer
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_set_buffer[33] = {
+    0x22, 0x0a,
+    MP_QSTR_set_buffer & 0xff, MP_QSTR_set_buffer >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x0f, 0x80, 
+    0x12, MP_QSTR_memoryview & 0xff, MP_QSTR_memoryview >> 8, 
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x34, 0x01, 
+    0xb0, 
+    0x18, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_set_buffer[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_bufsize),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_set_buffer = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_set_buffer,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_set_buffer,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 33,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_set_buffer,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_set_buffer + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_set_buffer + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream__fill
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream__fill[154] = {
+    0xb9, 0x40, 0x0a,
+    MP_QSTR__fill & 0xff, MP_QSTR__fill >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0xc1, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xd9, 
+    0x44, 0x0d, 0x80, 
+    0x80, 
+    0x57, 
+    0xb0, 
+    0x18, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x18, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0x42, 0x37, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xd9, 
+    0x44, 0x29, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xf3, 
+    0xc2, 
+    0xb1, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0x2e, 0x02, 
+    0x55, 
+    0xb1, 
+    0x51, 
+    0xb2, 
+    0x2e, 0x02, 
+    0x56, 
+    0x80, 
+    0xb0, 
+    0x18, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0x42, 0x00, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0xb1, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0x36, 0x01, 
+    0xc2, 
+    0xb2, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x0d, 0x80, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb2, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb2, 
+    0x63, 
+    0x42, 0xc5, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream__fill[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream__fill = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream__fill,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream__fill,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 154,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__fill,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream__fill + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream__fill + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream__take
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream__take[59] = {
+    0x3a, 0x0a,
+    MP_QSTR__take & 0xff, MP_QSTR__take >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0xb1, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xf3, 
+    0x34, 0x02, 
+    0xc1, 
+    0x12, MP_QSTR_bytes & 0xff, MP_QSTR_bytes >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb1, 
+    0xf2, 
+    0x2e, 0x02, 
+    0x55, 
+    0x34, 0x01, 
+    0xc2, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb1, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream__take[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_n),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream__take = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream__take,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream__take,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 59,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__take,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream__take + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream__take + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream__readuntil
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream__readuntil[194] = {
+    0xea, 0x40, 0x0a,
+    MP_QSTR__readuntil & 0xff, MP_QSTR__readuntil >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0xc2, 
+    0x23, 0x02, 
+    0xc3, 
+    0x80, 
+    0xc4, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb4, 
+    0xf2, 
+    0xc5, 
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0xb5, 
+    0x12, MP_QSTR__SCAN & 0xff, MP_QSTR__SCAN >> 8, 
+    0xf2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xf2, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0x34, 0x02, 
+    0xc6, 
+    0x12, MP_QSTR_bytes & 0xff, MP_QSTR_bytes >> 8, 
+    0xb2, 
+    0xb5, 
+    0xb6, 
+    0x2e, 0x02, 
+    0x55, 
+    0x34, 0x01, 
+    0x14, MP_QSTR_find & 0xff, MP_QSTR_find >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc7, 
+    0xb7, 
+    0x80, 
+    0xdb, 
+    0x44, 0x13, 0x80, 
+    0xb3, 
+    0xb0, 
+    0x14, MP_QSTR__take & 0xff, MP_QSTR__take >> 8, 
+    0xb4, 
+    0xb7, 
+    0xf2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xf2, 
+    0x36, 0x01, 
+    0xf2, 
+    0x63, 
+    0x12, MP_QSTR_max & 0xff, MP_QSTR_max >> 8, 
+    0xb4, 
+    0xb6, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xf3, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xf3, 
+    0x81, 
+    0xf2, 
+    0x34, 0x02, 
+    0xc4, 
+    0xb6, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xd7, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x41, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0x80, 
+    0xd9, 
+    0x44, 0x1a, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xd9, 
+    0x44, 0x0c, 0x80, 
+    0xb3, 
+    0xb0, 
+    0x14, MP_QSTR__take & 0xff, MP_QSTR__take >> 8, 
+    0xb4, 
+    0x36, 0x01, 
+    0xe5, 
+    0xc3, 
+    0x80, 
+    0xc4, 
+    0xb0, 
+    0x14, MP_QSTR__fill & 0xff, MP_QSTR__fill >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x43, 0x12, 0x80, 
+    0xb3, 
+    0xb0, 
+    0x14, MP_QSTR__take & 0xff, MP_QSTR__take >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xf3, 
+    0x36, 0x01, 
+    0xf2, 
+    0x63, 
+    0x42, 0x52, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_stream__lt_module_gt__Stream__readuntil_0 = {{&mp_type_bytes}, 5381, 0, (const byte*)""};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream__readuntil[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_sep),
+    MP_ROM_PTR(&const_obj_uasyncio_stream__lt_module_gt__Stream__readuntil_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream__readuntil = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream__readuntil,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream__readuntil,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 194,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 14,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__readuntil,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream__readuntil + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream__readuntil + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_read
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_read[122] = {
+    0xaa, 0x40, 0x0a,
+    MP_QSTR_read & 0xff, MP_QSTR_read >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x4c, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xd7, 
+    0x43, 0x26, 0x80, 
+    0x80, 
+    0xb1, 
+    0x57, 
+    0x5b, 
+    0xda, 
+    0x46, 0x0d, 0x80, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x34, 0x01, 
+    0xd7, 
+    0x42, 0x02, 0x80, 
+    0x5a, 
+    0x59, 
+    0x44, 0x26, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__fill & 0xff, MP_QSTR__fill >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x44, 0x1a, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__take & 0xff, MP_QSTR__take >> 8, 
+    0xb1, 
+    0x80, 
+    0xdb, 
+    0x44, 0x04, 0x80, 
+    0xb1, 
+    0x42, 0x09, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xf3, 
+    0x36, 0x01, 
+    0x63, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_read[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_n),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_read = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_read,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_read,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 122,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_read,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_read + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_read + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_readinto
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_readinto[146] = {
+    0xb2, 0x40, 0x0a,
+    MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x64, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xd7, 
+    0x43, 0x1f, 0x80, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x34, 0x01, 
+    0xd7, 
+    0x44, 0x45, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__fill & 0xff, MP_QSTR__fill >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x44, 0x39, 0x80, 
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xf3, 
+    0x34, 0x02, 
+    0xc2, 
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb2, 
+    0xf2, 
+    0x2e, 0x02, 
+    0x55, 
+    0xb1, 
+    0x51, 
+    0xb2, 
+    0x2e, 0x02, 
+    0x56, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb2, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb2, 
+    0x63, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_readinto[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_readinto = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_readinto,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_readinto,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 146,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_readinto,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_readinto + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_readinto + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_readexactly
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_readexactly[291] = {
+    0xda, 0x40, 0x0a,
+    MP_QSTR_readexactly & 0xff, MP_QSTR_readexactly >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0xc8, 0x80, 
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xc2, 
+    0x12, MP_QSTR_memoryview & 0xff, MP_QSTR_memoryview >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xc3, 
+    0x80, 
+    0xc4, 
+    0x42, 0xa8, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xd9, 
+    0x44, 0x3d, 0x80, 
+    0xb1, 
+    0xb4, 
+    0xf3, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x34, 0x01, 
+    0xdb, 
+    0x44, 0x2d, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0xb3, 
+    0xb4, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0x36, 0x01, 
+    0xc5, 
+    0xb5, 
+    0x51, 
+    0xde, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x62, 0x80, 
+    0x42, 0x53, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xd7, 
+    0x43, 0x0c, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__fill & 0xff, MP_QSTR__fill >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x44, 0x39, 0x80, 
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0xb1, 
+    0xb4, 
+    0xf3, 
+    0xb0, 
+    0x13, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xf3, 
+    0x34, 0x02, 
+    0xc5, 
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb5, 
+    0xf2, 
+    0x2e, 0x02, 
+    0x55, 
+    0xb3, 
+    0xb4, 
+    0xb4, 
+    0xb5, 
+    0xf2, 
+    0x2e, 0x02, 
+    0x56, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb5, 
+    0xe5, 
+    0x5a, 
+    0x18, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0x42, 0x02, 0x80, 
+    0x80, 
+    0xc5, 
+    0xb5, 
+    0x43, 0x04, 0x80, 
+    0x12, MP_QSTR_EOFError & 0xff, MP_QSTR_EOFError >> 8, 
+    0x65, 
+    0xb4, 
+    0xb5, 
+    0xe5, 
+    0xc4, 
+    0xb4, 
+    0xb1, 
+    0xd7, 
+    0x43, 0x52, 0x7f, 
+    0x12, MP_QSTR_bytes & 0xff, MP_QSTR_bytes >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0x63, 
+    0x23, 0x02, 
+    0xc2, 
+    0x42, 0x3d, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc6, 
+    0xb6, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x1a, 0x80, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb6, 
+    0x34, 0x01, 
+    0x43, 0x04, 0x80, 
+    0x12, MP_QSTR_EOFError & 0xff, MP_QSTR_EOFError >> 8, 
+    0x65, 
+    0xb2, 
+    0xb6, 
+    0xe5, 
+    0xc2, 
+    0xb1, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb6, 
+    0x34, 0x01, 
+    0xe6, 
+    0xc1, 
+    0xb1, 
+    0x43, 0xbf, 0x7f, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_stream__lt_module_gt__Stream_readexactly_0 = {{&mp_type_bytes}, 5381, 0, (const byte*)""};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_readexactly[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_n),
+    MP_ROM_PTR(&const_obj_uasyncio_stream__lt_module_gt__Stream_readexactly_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_readexactly = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_readexactly,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_readexactly,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 291,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 12,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_readexactly,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_readexactly + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_readexactly + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_readline
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_readline[83] = {
+    0xa9, 0x40, 0x0a,
+    MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x0c, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__readuntil & 0xff, MP_QSTR__readuntil >> 8, 
+    0x23, 0x01, 
+    0x36, 0x01, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x63, 
+    0x23, 0x02, 
+    0xc1, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x36, 0x00, 
+    0xc2, 
+    0xb1, 
+    0xb2, 
+    0xe5, 
+    0xc1, 
+    0xb2, 
+    0x44, 0x08, 0x80, 
+    0xb1, 
+    0x7f, 
+    0x55, 
+    0x8a, 
+    0xd9, 
+    0x44, 0x02, 0x80, 
+    0xb1, 
+    0x63, 
+    0x42, 0xd0, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_stream__lt_module_gt__Stream_readline_0 = {{&mp_type_bytes}, 46511, 1, (const byte*)"\x0a"};
+STATIC const mp_obj_str_t const_obj_uasyncio_stream__lt_module_gt__Stream_readline_1 = {{&mp_type_bytes}, 5381, 0, (const byte*)""};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_readline[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_uasyncio_stream__lt_module_gt__Stream_readline_0),
+    MP_ROM_PTR(&const_obj_uasyncio_stream__lt_module_gt__Stream_readline_1),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_readline = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_readline,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_readline,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 83,
+    .n_obj = 2,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_readline,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_readline + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_readline + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_readuntil
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_readuntil[135] = {
+    0xb2, 0x41, 0x0a,
+    MP_QSTR_readuntil & 0xff, MP_QSTR_readuntil >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_rbuf & 0xff, MP_QSTR_rbuf >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x0e, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR__readuntil & 0xff, MP_QSTR__readuntil >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0xc2, 
+    0x42, 0x57, 0x80, 
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0x34, 0x00, 
+    0xc2, 
+    0x51, 
+    0xc3, 
+    0x42, 0x34, 0x80, 
+    0xb3, 
+    0x51, 
+    0xde, 
+    0x44, 0x11, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x81, 
+    0x36, 0x01, 
+    0xc3, 
+    0xb3, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x0b, 0x80, 
+    0xb3, 
+    0x43, 0x03, 0x80, 
+    0x42, 0x15, 0x80, 
+    0xb2, 
+    0xb3, 
+    0xe5, 
+    0xc2, 
+    0xb2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xd1, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0xb1, 
+    0xdc, 
+    0x43, 0xbb, 0x7f, 
+    0x12, MP_QSTR_bytes & 0xff, MP_QSTR_bytes >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xc2, 
+    0xb2, 
+    0x14, MP_QSTR_endswith & 0xff, MP_QSTR_endswith >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x43, 0x04, 0x80, 
+    0x12, MP_QSTR_EOFError & 0xff, MP_QSTR_EOFError >> 8, 
+    0x65, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_readuntil[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_sep),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_readuntil = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_readuntil,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_readuntil,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 135,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_readuntil,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_readuntil + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_readuntil + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_write
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_write[20] = {
+    0x22, 0x0a,
+    MP_QSTR_write & 0xff, MP_QSTR_write >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_out_buf & 0xff, MP_QSTR_out_buf >> 8, 
+    0x14, MP_QSTR_extend & 0xff, MP_QSTR_extend >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_write[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_write = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_write,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_write,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 20,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_write,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_write + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_write + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_writelines
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_writelines[29] = {
+    0x4a, 0x0a,
+    MP_QSTR_writelines & 0xff, MP_QSTR_writelines >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x5f, 
+    0x4b, 0x0f, 0x00, 
+    0xc2, 
+    0xb0, 
+    0x13, MP_QSTR_out_buf & 0xff, MP_QSTR_out_buf >> 8, 
+    0x14, MP_QSTR_extend & 0xff, MP_QSTR_extend >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0xee, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_writelines[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_bufs),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_writelines = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_writelines,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_writelines,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 29,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_writelines,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_writelines + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_writelines + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream_drain
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream_drain[119] = {
+    0xc9, 0x40, 0x0a,
+    MP_QSTR_drain & 0xff, MP_QSTR_drain >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_out_buf & 0xff, MP_QSTR_out_buf >> 8, 
+    0xc1, 
+    0x80, 
+    0xc2, 
+    0x50, 
+    0xc3, 
+    0x42, 0x3d, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0xb2, 
+    0x44, 0x0e, 0x80, 
+    0x12, MP_QSTR_memoryview & 0xff, MP_QSTR_memoryview >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xb2, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0x42, 0x01, 0x80, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc4, 
+    0xb4, 
+    0x51, 
+    0xde, 
+    0x44, 0x16, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_write & 0xff, MP_QSTR_queue_write >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x52, 
+    0xc3, 
+    0x42, 0x04, 0x80, 
+    0xb2, 
+    0xb4, 
+    0xe5, 
+    0xc2, 
+    0xb2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xd7, 
+    0x43, 0xb8, 0x7f, 
+    0x23, 0x01, 
+    0xb1, 
+    0x51, 
+    0x51, 
+    0x2e, 0x02, 
+    0x56, 
+    0xb3, 
+    0x43, 0x0d, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_sleep_ms & 0xff, MP_QSTR_sleep_ms >> 8, 
+    0x80, 
+    0x36, 0x01, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_stream__lt_module_gt__Stream_drain_0 = {{&mp_type_bytes}, 5381, 0, (const byte*)""};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream_drain[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_uasyncio_stream__lt_module_gt__Stream_drain_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream_drain = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream_drain,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream_drain,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 119,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_drain,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream_drain + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream_drain + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Stream
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Stream[122] = {
+    0x08, 0x0a,
+    MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x2c, 0x00, 
+    0x80, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x01, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_get_extra_info & 0xff, MP_QSTR_get_extra_info >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8, 
+    0x32, 0x05, 
+    0x16, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_set_buffer & 0xff, MP_QSTR_set_buffer >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR__fill & 0xff, MP_QSTR__fill >> 8, 
+    0x32, 0x09, 
+    0x16, MP_QSTR__take & 0xff, MP_QSTR__take >> 8, 
+    0x32, 0x0a, 
+    0x16, MP_QSTR__readuntil & 0xff, MP_QSTR__readuntil >> 8, 
+    0x32, 0x0b, 
+    0x16, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x32, 0x0c, 
+    0x16, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0x32, 0x0d, 
+    0x16, MP_QSTR_readexactly & 0xff, MP_QSTR_readexactly >> 8, 
+    0x32, 0x0e, 
+    0x16, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x23, 0x00, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0f, 
+    0x16, MP_QSTR_readuntil & 0xff, MP_QSTR_readuntil >> 8, 
+    0x32, 0x10, 
+    0x16, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0x32, 0x11, 
+    0x16, MP_QSTR_writelines & 0xff, MP_QSTR_writelines >> 8, 
+    0x32, 0x12, 
+    0x16, MP_QSTR_drain & 0xff, MP_QSTR_drain >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_stream__lt_module_gt__Stream_0 = {{&mp_type_bytes}, 46511, 1, (const byte*)"\x0a"};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Stream[19] = {
+    MP_ROM_PTR(&const_obj_uasyncio_stream__lt_module_gt__Stream_0),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_get_extra_info),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream___aenter__),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream___aexit__),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_close),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_wait_closed),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_set_buffer),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream__fill),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream__take),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream__readuntil),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_read),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_readinto),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_readexactly),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_readline),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_readuntil),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_write),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_writelines),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream_drain),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Stream = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Stream,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Stream,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 122,
+    .n_obj = 1,
+    .n_raw_code = 18,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_Stream,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Stream + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Stream + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__open_connection
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__open_connection[205] = {
+    0xff, 0x43, 0x0a,
+    MP_QSTR_open_connection & 0xff, MP_QSTR_open_connection >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x10, MP_QSTR_EINPROGRESS & 0xff, MP_QSTR_EINPROGRESS >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_uerrno & 0xff, MP_QSTR_uerrno >> 8, 
+    0x1c, MP_QSTR_EINPROGRESS & 0xff, MP_QSTR_EINPROGRESS >> 8, 
+    0xc3, 
+    0x59, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0xc4, 
+    0x81, 
+    0x10, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_dns & 0xff, MP_QSTR_dns >> 8, 
+    0x1c, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0xc5, 
+    0x59, 
+    0xb5, 
+    0xb0, 
+    0xb1, 
+    0x80, 
+    0xb4, 
+    0x13, MP_QSTR_SOCK_STREAM & 0xff, MP_QSTR_SOCK_STREAM >> 8, 
+    0x34, 0x04, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x80, 
+    0x55, 
+    0xc6, 
+    0xb4, 
+    0x14, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0xb6, 
+    0x80, 
+    0x55, 
+    0xb6, 
+    0x81, 
+    0x55, 
+    0xb6, 
+    0x82, 
+    0x55, 
+    0x36, 0x03, 
+    0xc7, 
+    0xb7, 
+    0x14, MP_QSTR_setblocking & 0xff, MP_QSTR_setblocking >> 8, 
+    0x50, 
+    0x36, 0x01, 
+    0x59, 
+    0x48, 0x42, 0x00, 
+    0x48, 0x0d, 0x00, 
+    0xb7, 
+    0x14, MP_QSTR_connect & 0xff, MP_QSTR_connect >> 8, 
+    0xb6, 
+    0x7f, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0x4a, 0x21, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x18, 0x80, 
+    0xc8, 
+    0x49, 0x0c, 0x00, 
+    0xb8, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0xb3, 
+    0xdc, 
+    0x44, 0x02, 0x80, 
+    0xb8, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc8, 
+    0x28, 0x08, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_write & 0xff, MP_QSTR_queue_write >> 8, 
+    0xb7, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x4a, 0x1a, 0x00, 
+    0x59, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb7, 
+    0x36, 0x01, 
+    0x59, 
+    0xb7, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x64, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x12, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0xb7, 
+    0x2c, 0x00, 
+    0xb2, 
+    0x34, 0x03, 
+    0xc9, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0xb7, 
+    0x36, 0x01, 
+    0x59, 
+    0xb9, 
+    0xb9, 
+    0x2a, 0x02, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__open_connection[3] = {
+    MP_ROM_QSTR(MP_QSTR_host),
+    MP_ROM_QSTR(MP_QSTR_port),
+    MP_ROM_QSTR(MP_QSTR_bufsize),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__open_connection = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__open_connection,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__open_connection,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 205,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 16,
+        .n_exc_stack = 3,
+        .scope_flags = 1,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_open_connection,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__open_connection + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__open_connection + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Server___aenter__
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Server___aenter__[10] = {
+    0x89, 0x40, 0x0a,
+    MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Server___aenter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Server___aenter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Server___aenter__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Server___aenter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 10,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aenter__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Server___aenter__ + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Server___aenter__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Server___aexit__
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Server___aexit__[27] = {
+    0xa8, 0x44, 0x0a,
+    MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Server___aexit__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_exc_type),
+    MP_ROM_QSTR(MP_QSTR_exc),
+    MP_ROM_QSTR(MP_QSTR_tb),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Server___aexit__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Server___aexit__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Server___aexit__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 27,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___aexit__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Server___aexit__ + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Server___aexit__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Server_close
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Server_close[19] = {
+    0x11, 0x0a,
+    MP_QSTR_close & 0xff, MP_QSTR_close >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0x14, MP_QSTR_cancel & 0xff, MP_QSTR_cancel >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Server_close[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Server_close = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Server_close,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Server_close,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 19,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_close,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Server_close + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Server_close + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Server_wait_closed
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Server_wait_closed[18] = {
+    0x91, 0x40, 0x0a,
+    MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Server_wait_closed[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Server_wait_closed = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Server_wait_closed,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Server_wait_closed,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait_closed,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Server_wait_closed + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Server_wait_closed + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Server__serve
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Server__serve[315] = {
+    0xc2, 0x56, 0x0a,
+    MP_QSTR__serve & 0xff, MP_QSTR__serve >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x2b, 0x00, 
+    0xb0, 
+    0x18, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x80, 
+    0xc6, 
+    0x50, 
+    0xc7, 
+    0x48, 0x26, 0x00, 
+    0xb7, 
+    0x44, 0x11, 0x80, 
+    0x50, 
+    0xc7, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_sleep_ms & 0xff, MP_QSTR_sleep_ms >> 8, 
+    0x12, MP_QSTR__BACKOFF_MS & 0xff, MP_QSTR__BACKOFF_MS >> 8, 
+    0x36, 0x01, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_queue_read & 0xff, MP_QSTR_queue_read >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x67, 
+    0x59, 
+    0x4a, 0x43, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_CancelledError & 0xff, MP_QSTR_CancelledError >> 8, 
+    0xdf, 
+    0x44, 0x37, 0x80, 
+    0x59, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0xb1, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0xc8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0xb8, 
+    0x5f, 
+    0x4b, 0x0e, 0x00, 
+    0xc9, 
+    0xb9, 
+    0x13, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0x14, MP_QSTR_cancel & 0xff, MP_QSTR_cancel >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x42, 0xef, 0x7f, 
+    0x51, 
+    0x63, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb3, 
+    0x80, 
+    0x42, 0xab, 0x80, 
+    0x57, 
+    0xca, 
+    0x48, 0x0d, 0x00, 
+    0xb1, 
+    0x14, MP_QSTR_accept & 0xff, MP_QSTR_accept >> 8, 
+    0x36, 0x00, 
+    0x30, 0x02, 
+    0xcb, 
+    0xcc, 
+    0x4a, 0x3a, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x31, 0x80, 
+    0xcd, 
+    0x49, 0x25, 0x00, 
+    0xbd, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0xd9, 
+    0x44, 0x04, 0x80, 
+    0x40, 0x85, 0x80, 0x02, 
+    0xbd, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_ECONNABORTED & 0xff, MP_QSTR_ECONNABORTED >> 8, 
+    0xd9, 
+    0x44, 0x04, 0x80, 
+    0x40, 0x6e, 0x80, 0x02, 
+    0x52, 
+    0xc7, 
+    0x40, 0x70, 0x80, 0x02, 
+    0x51, 
+    0x51, 
+    0xcd, 
+    0x28, 0x0d, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xbb, 
+    0x14, MP_QSTR_setblocking & 0xff, MP_QSTR_setblocking >> 8, 
+    0x50, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x44, 0x14, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x14, MP_QSTR_pop & 0xff, MP_QSTR_pop >> 8, 
+    0x36, 0x00, 
+    0x14, MP_QSTR_start & 0xff, MP_QSTR_start >> 8, 
+    0xbb, 
+    0xbc, 
+    0x36, 0x02, 
+    0x59, 
+    0x42, 0x3a, 0x80, 
+    0xb6, 
+    0xb5, 
+    0xd7, 
+    0x44, 0x17, 0x80, 
+    0xb6, 
+    0x81, 
+    0xe5, 
+    0xc6, 
+    0x12, MP_QSTR__Handler & 0xff, MP_QSTR__Handler >> 8, 
+    0xb0, 
+    0xb2, 
+    0xb4, 
+    0x34, 0x03, 
+    0x14, MP_QSTR_start & 0xff, MP_QSTR_start >> 8, 
+    0xbb, 
+    0xbc, 
+    0x36, 0x02, 
+    0x59, 
+    0x42, 0x1d, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0x12, MP_QSTR__serve_one & 0xff, MP_QSTR__serve_one >> 8, 
+    0xb2, 
+    0x12, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0xbb, 
+    0x2c, 0x01, 
+    0xbc, 
+    0x10, MP_QSTR_peername & 0xff, MP_QSTR_peername >> 8, 
+    0x62, 
+    0xb4, 
+    0x34, 0x03, 
+    0x34, 0x02, 
+    0x36, 0x01, 
+    0x59, 
+    0x81, 
+    0xe5, 
+    0x58, 
+    0x5a, 
+    0xd7, 
+    0x43, 0x4f, 0x7f, 
+    0x59, 
+    0x59, 
+    0x42, 0xd9, 0x7e, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Server__serve[6] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+    MP_ROM_QSTR(MP_QSTR_cb),
+    MP_ROM_QSTR(MP_QSTR_backlog),
+    MP_ROM_QSTR(MP_QSTR_bufsize),
+    MP_ROM_QSTR(MP_QSTR_pool),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Server__serve = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 6,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Server__serve,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Server__serve,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 315,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 25,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 6,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__serve,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Server__serve + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Server__serve + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__Server
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__Server[46] = {
+    0x00, 0x0a,
+    MP_QSTR_Server & 0xff, MP_QSTR_Server >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_Server & 0xff, MP_QSTR_Server >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___aenter__ & 0xff, MP_QSTR___aenter__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR___aexit__ & 0xff, MP_QSTR___aexit__ >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR__serve & 0xff, MP_QSTR__serve >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__Server[5] = {
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Server___aenter__),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Server___aexit__),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Server_close),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Server_wait_closed),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Server__serve),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__Server = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__Server,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__Server,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 46,
+    .n_obj = 0,
+    .n_raw_code = 5,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_Server,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__Server + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__Server + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___serve_one
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___serve_one[55] = {
+    0xc6, 0x40, 0x0a,
+    MP_QSTR__serve_one & 0xff, MP_QSTR__serve_one >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0xc2, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x59, 
+    0x49, 0x0a, 0x00, 
+    0xb0, 
+    0xb1, 
+    0xb1, 
+    0x34, 0x02, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x51, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x59, 
+    0x5d, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___serve_one[2] = {
+    MP_ROM_QSTR(MP_QSTR_cb),
+    MP_ROM_QSTR(MP_QSTR_ss),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___serve_one = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___serve_one,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___serve_one,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 55,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 9,
+        .n_exc_stack = 1,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__serve_one,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___serve_one + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___serve_one + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___PoolStream_wait_closed
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___PoolStream_wait_closed[51] = {
+    0x99, 0x40, 0x0a,
+    MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x1f, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___PoolStream_wait_closed[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___PoolStream_wait_closed = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 1,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___PoolStream_wait_closed,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___PoolStream_wait_closed,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 51,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_wait_closed,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___PoolStream_wait_closed + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___PoolStream_wait_closed + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___PoolStream
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___PoolStream[32] = {
+    0x00, 0x0a,
+    MP_QSTR__PoolStream & 0xff, MP_QSTR__PoolStream >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__PoolStream & 0xff, MP_QSTR__PoolStream >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x11, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x16, MP_QSTR_aclose & 0xff, MP_QSTR_aclose >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___PoolStream[1] = {
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___PoolStream_wait_closed),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___PoolStream = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___PoolStream,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___PoolStream,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 32,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__PoolStream,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___PoolStream + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___PoolStream + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___Handler___init__
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___Handler___init__[52] = {
+    0xc0, 0x04, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_srv & 0xff, MP_QSTR_srv >> 8, 
+    0x12, MP_QSTR__PoolStream & 0xff, MP_QSTR__PoolStream >> 8, 
+    0x51, 
+    0x2c, 0x01, 
+    0x51, 
+    0x10, MP_QSTR_peername & 0xff, MP_QSTR_peername >> 8, 
+    0x62, 
+    0xb3, 
+    0x34, 0x03, 
+    0xb0, 
+    0x18, MP_QSTR_ss & 0xff, MP_QSTR_ss >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0xb0, 
+    0x14, MP_QSTR__run & 0xff, MP_QSTR__run >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x36, 0x01, 
+    0xb0, 
+    0x18, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___Handler___init__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_srv),
+    MP_ROM_QSTR(MP_QSTR_cb),
+    MP_ROM_QSTR(MP_QSTR_bufsize),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___Handler___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___Handler___init__,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___Handler___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 52,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 9,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___Handler___init__ + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___Handler___init__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___Handler_start
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___Handler_start[69] = {
+    0x33, 0x0a,
+    MP_QSTR_start & 0xff, MP_QSTR_start >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_ss & 0xff, MP_QSTR_ss >> 8, 
+    0xc3, 
+    0xb1, 
+    0xb3, 
+    0x18, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0xb2, 
+    0xb3, 
+    0x13, MP_QSTR_e & 0xff, MP_QSTR_e >> 8, 
+    0x10, MP_QSTR_peername & 0xff, MP_QSTR_peername >> 8, 
+    0x56, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0x13, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0xb0, 
+    0xde, 
+    0x44, 0x10, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__task_queue & 0xff, MP_QSTR__task_queue >> 8, 
+    0x14, MP_QSTR_push_head & 0xff, MP_QSTR_push_head >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___Handler_start[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_s),
+    MP_ROM_QSTR(MP_QSTR_addr),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___Handler_start = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___Handler_start,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___Handler_start,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 69,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_start,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___Handler_start + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___Handler_start + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___Handler_remove
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___Handler_remove[9] = {
+    0x12, 0x0a,
+    MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___Handler_remove[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_task),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___Handler_remove = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___Handler_remove,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___Handler_remove,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_remove,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___Handler_remove + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___Handler_remove + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___Handler__run
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___Handler__run[210] = {
+    0xca, 0x42, 0x0a,
+    MP_QSTR__run & 0xff, MP_QSTR__run >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_ss & 0xff, MP_QSTR_ss >> 8, 
+    0xc2, 
+    0x48, 0x0c, 0x00, 
+    0xb1, 
+    0xb2, 
+    0xb2, 
+    0x34, 0x02, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x4a, 0x43, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0xdf, 
+    0x44, 0x3a, 0x80, 
+    0xc3, 
+    0x49, 0x2e, 0x00, 
+    0xb3, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__exc_context & 0xff, MP_QSTR__exc_context >> 8, 
+    0x10, MP_QSTR_exception & 0xff, MP_QSTR_exception >> 8, 
+    0x56, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__exc_context & 0xff, MP_QSTR__exc_context >> 8, 
+    0x10, MP_QSTR_future & 0xff, MP_QSTR_future >> 8, 
+    0x56, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_Loop & 0xff, MP_QSTR_Loop >> 8, 
+    0x14, MP_QSTR_call_exception_handler & 0xff, MP_QSTR_call_exception_handler >> 8, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__exc_context & 0xff, MP_QSTR__exc_context >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x51, 
+    0xc3, 
+    0x28, 0x03, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb2, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x51, 
+    0xde, 
+    0xd3, 
+    0x44, 0x1f, 0x80, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_discard & 0xff, MP_QSTR_discard >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb2, 
+    0x13, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x51, 
+    0xb2, 
+    0x18, MP_QSTR_s & 0xff, MP_QSTR_s >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_out_buf & 0xff, MP_QSTR_out_buf >> 8, 
+    0x44, 0x0b, 0x80, 
+    0x23, 0x02, 
+    0xb2, 
+    0x13, MP_QSTR_out_buf & 0xff, MP_QSTR_out_buf >> 8, 
+    0x51, 
+    0x51, 
+    0x2e, 0x02, 
+    0x56, 
+    0x80, 
+    0x57, 
+    0xb2, 
+    0x18, MP_QSTR_rpos & 0xff, MP_QSTR_rpos >> 8, 
+    0xb2, 
+    0x18, MP_QSTR_rend & 0xff, MP_QSTR_rend >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_srv & 0xff, MP_QSTR_srv >> 8, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0xb0, 
+    0x13, MP_QSTR_srv & 0xff, MP_QSTR_srv >> 8, 
+    0x13, MP_QSTR__idle & 0xff, MP_QSTR__idle >> 8, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR_cur_task & 0xff, MP_QSTR_cur_task >> 8, 
+    0x18, MP_QSTR_data & 0xff, MP_QSTR_data >> 8, 
+    0x51, 
+    0x67, 
+    0x59, 
+    0x42, 0x3d, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_uasyncio_stream__lt_module_gt___Handler__run_0 = {{&mp_type_bytes}, 5381, 0, (const byte*)""};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___Handler__run[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_cb),
+    MP_ROM_PTR(&const_obj_uasyncio_stream__lt_module_gt___Handler__run_0),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___Handler__run = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 2,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___Handler__run,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___Handler__run,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 210,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 2,
+        .scope_flags = 1,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__run,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___Handler__run + 7,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___Handler__run + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt___Handler
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt___Handler[41] = {
+    0x00, 0x0a,
+    MP_QSTR__Handler & 0xff, MP_QSTR__Handler >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR__Handler & 0xff, MP_QSTR__Handler >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_start & 0xff, MP_QSTR_start >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_remove & 0xff, MP_QSTR_remove >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR__run & 0xff, MP_QSTR__run >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt___Handler[4] = {
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___Handler___init__),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___Handler_start),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___Handler_remove),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___Handler__run),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt___Handler = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt___Handler,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt___Handler,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 41,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__Handler,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt___Handler + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt___Handler + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__start_server
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__start_server[133] = {
+    0x92, 0xd5, 0x01, 0x0a,
+    MP_QSTR_start_server & 0xff, MP_QSTR_start_server >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0xc6, 
+    0x81, 
+    0x10, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_dns & 0xff, MP_QSTR_dns >> 8, 
+    0x1c, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0xc7, 
+    0x59, 
+    0xb7, 
+    0xb1, 
+    0xb2, 
+    0x34, 0x02, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x80, 
+    0x55, 
+    0xc1, 
+    0xb6, 
+    0x14, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0x36, 0x00, 
+    0xc8, 
+    0xb8, 
+    0x14, MP_QSTR_setblocking & 0xff, MP_QSTR_setblocking >> 8, 
+    0x50, 
+    0x36, 0x01, 
+    0x59, 
+    0xb8, 
+    0x14, MP_QSTR_setsockopt & 0xff, MP_QSTR_setsockopt >> 8, 
+    0xb6, 
+    0x13, MP_QSTR_SOL_SOCKET & 0xff, MP_QSTR_SOL_SOCKET >> 8, 
+    0xb6, 
+    0x13, MP_QSTR_SO_REUSEADDR & 0xff, MP_QSTR_SO_REUSEADDR >> 8, 
+    0x81, 
+    0x36, 0x03, 
+    0x59, 
+    0xb8, 
+    0x14, MP_QSTR_bind & 0xff, MP_QSTR_bind >> 8, 
+    0xb1, 
+    0x7f, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0xb8, 
+    0x14, MP_QSTR_listen & 0xff, MP_QSTR_listen >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x13, MP_QSTR__io_queue & 0xff, MP_QSTR__io_queue >> 8, 
+    0x14, MP_QSTR_keep & 0xff, MP_QSTR_keep >> 8, 
+    0xb8, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_Server & 0xff, MP_QSTR_Server >> 8, 
+    0x34, 0x00, 
+    0xc9, 
+    0x12, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x14, MP_QSTR_create_task & 0xff, MP_QSTR_create_task >> 8, 
+    0xb9, 
+    0x14, MP_QSTR__serve & 0xff, MP_QSTR__serve >> 8, 
+    0xb8, 
+    0xb0, 
+    0xb3, 
+    0xb4, 
+    0xb5, 
+    0x36, 0x05, 
+    0x36, 0x01, 
+    0xb9, 
+    0x18, MP_QSTR_task & 0xff, MP_QSTR_task >> 8, 
+    0xb9, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__start_server[6] = {
+    MP_ROM_QSTR(MP_QSTR_cb),
+    MP_ROM_QSTR(MP_QSTR_host),
+    MP_ROM_QSTR(MP_QSTR_port),
+    MP_ROM_QSTR(MP_QSTR_backlog),
+    MP_ROM_QSTR(MP_QSTR_bufsize),
+    MP_ROM_QSTR(MP_QSTR_pool),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__start_server = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 6,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__start_server,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__start_server,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 133,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 19,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 6,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 3,
+        .qstr_block_name = MP_QSTR_start_server,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__start_server + 8,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__start_server + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream__lt_module_gt__stream_awrite
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt__stream_awrite[70] = {
+    0xb8, 0xc4, 0x01, 0x0a,
+    MP_QSTR_stream_awrite & 0xff, MP_QSTR_stream_awrite >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0xb2, 
+    0x80, 
+    0xdc, 
+    0x43, 0x06, 0x80, 
+    0xb3, 
+    0x7f, 
+    0xdc, 
+    0x44, 0x1d, 0x80, 
+    0x12, MP_QSTR_memoryview & 0xff, MP_QSTR_memoryview >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xc1, 
+    0xb3, 
+    0x7f, 
+    0xd9, 
+    0x44, 0x07, 0x80, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xc3, 
+    0xb1, 
+    0xb2, 
+    0xb2, 
+    0xb3, 
+    0xf2, 
+    0x2e, 0x02, 
+    0x55, 
+    0xc1, 
+    0xb0, 
+    0x14, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_drain & 0xff, MP_QSTR_drain >> 8, 
+    0x36, 0x00, 
+    0x5e, 
+    0x51, 
+    0x68, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt__stream_awrite[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+    MP_ROM_QSTR(MP_QSTR_off),
+    MP_ROM_QSTR(MP_QSTR_sz),
+};
+STATIC const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt__stream_awrite = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x01,
+    .n_pos_args = 4,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt__stream_awrite,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt__stream_awrite,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 70,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 1,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR_stream_awrite,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt__stream_awrite + 8,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt__stream_awrite + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file uasyncio/stream.py, scope uasyncio_stream_<module>
+STATIC const byte fun_data_uasyncio_stream__lt_module_gt_[186] = {
+    0x18, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_uasyncio_slash_stream_dot_py & 0xff, MP_QSTR_uasyncio_slash_stream_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x10, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0x10, MP_QSTR_ECONNABORTED & 0xff, MP_QSTR_ECONNABORTED >> 8, 
+    0x2a, 0x02, 
+    0x1b, MP_QSTR_uerrno & 0xff, MP_QSTR_uerrno >> 8, 
+    0x1c, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0x16, MP_QSTR_EAGAIN & 0xff, MP_QSTR_EAGAIN >> 8, 
+    0x1c, MP_QSTR_ECONNABORTED & 0xff, MP_QSTR_ECONNABORTED >> 8, 
+    0x16, MP_QSTR_ECONNABORTED & 0xff, MP_QSTR_ECONNABORTED >> 8, 
+    0x59, 
+    0x81, 
+    0x10, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x2a, 0x01, 
+    0x1b, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x1c, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x16, MP_QSTR_core & 0xff, MP_QSTR_core >> 8, 
+    0x59, 
+    0x22, 0x80, 0x40, 
+    0x16, MP_QSTR__SCAN & 0xff, MP_QSTR__SCAN >> 8, 
+    0x22, 0x80, 0x64, 
+    0x16, MP_QSTR__BACKOFF_MS & 0xff, MP_QSTR__BACKOFF_MS >> 8, 
+    0x54, 
+    0x32, 0x00, 
+    0x10, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x11, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x16, MP_QSTR_StreamReader & 0xff, MP_QSTR_StreamReader >> 8, 
+    0x11, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x16, MP_QSTR_StreamWriter & 0xff, MP_QSTR_StreamWriter >> 8, 
+    0x80, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x01, 
+    0x16, MP_QSTR_open_connection & 0xff, MP_QSTR_open_connection >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR_Server & 0xff, MP_QSTR_Server >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_Server & 0xff, MP_QSTR_Server >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR__serve_one & 0xff, MP_QSTR__serve_one >> 8, 
+    0x54, 
+    0x32, 0x04, 
+    0x10, MP_QSTR__PoolStream & 0xff, MP_QSTR__PoolStream >> 8, 
+    0x11, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR__PoolStream & 0xff, MP_QSTR__PoolStream >> 8, 
+    0x54, 
+    0x32, 0x05, 
+    0x10, MP_QSTR__Handler & 0xff, MP_QSTR__Handler >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR__Handler & 0xff, MP_QSTR__Handler >> 8, 
+    0x85, 
+    0x80, 
+    0x80, 
+    0x2a, 0x03, 
+    0x53, 
+    0x33, 0x06, 
+    0x16, MP_QSTR_start_server & 0xff, MP_QSTR_start_server >> 8, 
+    0x80, 
+    0x7f, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x07, 
+    0x16, MP_QSTR_stream_awrite & 0xff, MP_QSTR_stream_awrite >> 8, 
+    0x11, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x13, MP_QSTR_wait_closed & 0xff, MP_QSTR_wait_closed >> 8, 
+    0x11, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x18, MP_QSTR_aclose & 0xff, MP_QSTR_aclose >> 8, 
+    0x11, MP_QSTR_stream_awrite & 0xff, MP_QSTR_stream_awrite >> 8, 
+    0x11, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x18, MP_QSTR_awrite & 0xff, MP_QSTR_awrite >> 8, 
+    0x11, MP_QSTR_stream_awrite & 0xff, MP_QSTR_stream_awrite >> 8, 
+    0x11, MP_QSTR_Stream & 0xff, MP_QSTR_Stream >> 8, 
+    0x18, MP_QSTR_awritestr & 0xff, MP_QSTR_awritestr >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_uasyncio_stream__lt_module_gt_[8] = {
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Stream),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__open_connection),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__Server),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___serve_one),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___PoolStream),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt___Handler),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__start_server),
+    MP_ROM_PTR(&raw_code_uasyncio_stream__lt_module_gt__stream_awrite),
+};
+const mp_raw_code_t raw_code_uasyncio_stream__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_uasyncio_stream__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_uasyncio_stream__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 186,
+    .n_obj = 0,
+    .n_raw_code = 8,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_uasyncio_slash_stream_dot_py,
+        .line_info = fun_data_uasyncio_stream__lt_module_gt_ + 6,
+        .opcodes = fun_data_uasyncio_stream__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+const char mp_frozen_mpy_names[] = {
+"upip.py\0"
+"upip_utarfile.py\0"
+"uasyncio/__init__.py\0"
+"uasyncio/core.py\0"
+"uasyncio/datagram.py\0"
+"uasyncio/dns.py\0"
+"uasyncio/event.py\0"
+"uasyncio/executor.py\0"
+"uasyncio/funcs.py\0"
+"uasyncio/lock.py\0"
+"uasyncio/queue.py\0"
+"uasyncio/stream.py\0"
+"\0"};
+const mp_raw_code_t *const mp_frozen_mpy_content[] = {
+    &raw_code_upip__lt_module_gt_,
+    &raw_code_upip_utarfile__lt_module_gt_,
+    &raw_code_uasyncio___init____lt_module_gt_,
+    &raw_code_uasyncio_core__lt_module_gt_,
+    &raw_code_uasyncio_datagram__lt_module_gt_,
+    &raw_code_uasyncio_dns__lt_module_gt_,
+    &raw_code_uasyncio_event__lt_module_gt_,
+    &raw_code_uasyncio_executor__lt_module_gt_,
+    &raw_code_uasyncio_funcs__lt_module_gt_,
+    &raw_code_uasyncio_lock__lt_module_gt_,
+    &raw_code_uasyncio_queue__lt_module_gt_,
+    &raw_code_uasyncio_stream__lt_module_gt_,
+};
+#ifdef MICROPY_FROZEN_LIST_ITEM
+MICROPY_FROZEN_LIST_ITEM("upip", "upip.py")
+MICROPY_FROZEN_LIST_ITEM("upip_utarfile", "upip_utarfile.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio", "uasyncio/__init__.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/core", "uasyncio/core.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/datagram", "uasyncio/datagram.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/dns", "uasyncio/dns.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/event", "uasyncio/event.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/executor", "uasyncio/executor.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/funcs", "uasyncio/funcs.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/lock", "uasyncio/lock.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/queue", "uasyncio/queue.py")
+MICROPY_FROZEN_LIST_ITEM("uasyncio/stream", "uasyncio/stream.py")
+#endif
@@ -0,0 +1,222 @@
+#define MP_MAX_UNCOMPRESSED_TEXT_LEN (73)
+MP_COMPRESSED_DATA("can'\364'%q\247objec\364functio\356argument\363argumen\364forma\364no\364mus\364keywor\344'%s\247specifie\362t\357conver\364strin\347require\344typ\345fo\362positiona\354b\345inde\370o\346attribut\345%\344ar\347empt\371implemente\344isn'\364multipl\345wit\350assignmen\364invali\344outsid\345\341generato\362i\356supporte\344lengt\350expecte\344fro\355comple\370doesn'\364erro\362missin\347n\357rang\345unsupporte\344conversio\356identifie\362synta\370bu\364expectin\347ha\363in\364nam\345a\356fiel\344foun\344give\356need\363nonloca\354sequenc\345tupl\345allowe\344defaul\364indice\363ou\364struct\272unknow\356%\361dic\364i\363lis\364o\362zer\357impor\364numbe\362shoul\344specificatio\356value\363incompatibl\345issubclass(\251%\363afte\362an\344byte\363clas\363loca\354non-keywor\344stor\345take\363valu\345allocatio\356expressio\356implicitl\371incomplet\345unexpecte\344automati\343hav\345hea\360integers\254numberin\347operatio\356redefine\344sel\346overflo\367failed\254go\364intege\362se\364suppor\364to\357befor\345binar\371buffe\362divid\345inden\364manua\354memor\371mktim\345modul\345retur\356switc\350unpac\353*\370asyn\343a\364extr\341")
+MP_MATCH_COMPRESSED("%c needs int or char", "\377%c\273\265\311char")
+MP_MATCH_COMPRESSED("%q index out of range", "\377\305\224\302\225\255")
+MP_MATCH_COMPRESSED("%q indices must be integers, not %s", "\377\305\301\210\223\344\207\322")
+MP_MATCH_COMPRESSED("%q() takes %d positional arguments but %d were given", "\377%q()\332\227\222\204\262\227were\272")
+MP_MATCH_COMPRESSED("'%q' argument required", "\377\201\205\217")
+MP_MATCH_COMPRESSED("'%s' object doesn't support item assignment", "\377\212\202\251\356item\236")
+MP_MATCH_COMPRESSED("'%s' object doesn't support item deletion", "\377\212\202\251\356item deletion")
+MP_MATCH_COMPRESSED("'%s' object has no attribute '%q'", "\377\212\202\264\254\226\201")
+MP_MATCH_COMPRESSED("'%s' object isn't an iterator", "\377\212\202\233\267iterator")
+MP_MATCH_COMPRESSED("'%s' object isn't callable", "\377\212\202\233callable")
+MP_MATCH_COMPRESSED("'%s' object isn't iterable", "\377\212\202\233iterable")
+MP_MATCH_COMPRESSED("'%s' object isn't subscriptable", "\377\212\202\233subscriptable")
+MP_MATCH_COMPRESSED("'=' alignment not allowed in string format specifier", "\377'=' alignment\207\277\243\216\206\213")
+MP_MATCH_COMPRESSED("'await' outside function", "\377'await'\240\203")
+MP_MATCH_COMPRESSED("'break'/'continue' outside loop", "\377'break'/'continue'\240loop")
+MP_MATCH_COMPRESSED("'return' outside function", "\377'return'\240\203")
+MP_MATCH_COMPRESSED("'yield' outside function", "\377'yield'\240\203")
+MP_MATCH_COMPRESSED("*x must be assignment target", "\377\374\210\223\236target")
+MP_MATCH_COMPRESSED("0.0 to a complex power", "\3770.0\214\241\250power")
+MP_MATCH_COMPRESSED("I/O operation on closed file", "\377I/O\346on closed file")
+MP_MATCH_COMPRESSED("LHS of keyword arg must be an id", "\377LHS\225\211\230\210\223\267id")
+MP_MATCH_COMPRESSED("[addrinfo error %d]", "\377[addrinfo\252%d]")
+MP_MATCH_COMPRESSED("__init__() should return None, not '%s'", "\377__init__()\315\371None,\207\212")
+MP_MATCH_COMPRESSED("abort() called", "abort() called")
+MP_MATCH_COMPRESSED("address %08x is not aligned to %d bytes", "\377address %08x\307\207aligned\214\227\325")
+MP_MATCH_COMPRESSED("annotation must be an identifier", "\377annotation\210\223\267\260")
+MP_MATCH_COMPRESSED("arg is an empty sequence", "\377\230\307\267\231\275")
+MP_MATCH_COMPRESSED("arg must be user-type", "\377\230\210\223user-type")
+MP_MATCH_COMPRESSED("argument name reused", "\377\205\266reused")
+MP_MATCH_COMPRESSED("argument num/types mismatch", "\377\205num/types mismatch")
+MP_MATCH_COMPRESSED("argument should be a '%q' not a '%q'", "\377\205\315\223\241\201\207\241\201")
+MP_MATCH_COMPRESSED("array/bytes required on right side", "\377array/bytes\217on right side")
+MP_MATCH_COMPRESSED("async for/with outside async function", "\377\375for/with\240\375\203")
+MP_MATCH_COMPRESSED("attributes not supported yet", "\377attributes\207\244yet")
+MP_MATCH_COMPRESSED("bad compile mode", "bad compile mode")
+MP_MATCH_COMPRESSED("bad typecode", "bad typecode")
+MP_MATCH_COMPRESSED("binary op %q not implemented", "\377\361op\305\207\232")
+MP_MATCH_COMPRESSED("bits must be 32 or less", "\377bits\210\22332\311less")
+MP_MATCH_COMPRESSED("buffer too small", "\377\362\357small")
+MP_MATCH_COMPRESSED("bytes value out of range", "\377\325\333\302\225\255")
+MP_MATCH_COMPRESSED("can't add special method to already-subclassed class", "\377\200add special method\214already-subclassed\326")
+MP_MATCH_COMPRESSED("can't assign to expression", "\377\200assign\214\335")
+MP_MATCH_COMPRESSED("can't cancel self", "\377\200cancel\350")
+MP_MATCH_COMPRESSED("can't convert %s to complex", "\377\200\215\322\214\250")
+MP_MATCH_COMPRESSED("can't convert %s to float", "\377\200\215\322\214float")
+MP_MATCH_COMPRESSED("can't convert %s to int", "\377\200\215\322\214\265")
+MP_MATCH_COMPRESSED("can't convert '%q' object to %q implicitly", "\377\200\215\201\202\214\305\336")
+MP_MATCH_COMPRESSED("can't convert NaN to int", "\377\200\215NaN\214\265")
+MP_MATCH_COMPRESSED("can't convert inf to int", "\377\200\215inf\214\265")
+MP_MATCH_COMPRESSED("can't create '%q' instances", "\377\200create\201instances")
+MP_MATCH_COMPRESSED("can't declare nonlocal in outer code", "\377\200declare\274\243outer code")
+MP_MATCH_COMPRESSED("can't delete expression", "\377\200delete\335")
+MP_MATCH_COMPRESSED("can't do binary op between '%q' and '%q'", "\377\200do\361op between\201\324\201")
+MP_MATCH_COMPRESSED("can't have multiple **x", "\377\200\342\234**x")
+MP_MATCH_COMPRESSED("can't have multiple *x", "\377\200\342\234\374")
+MP_MATCH_COMPRESSED("can't implicitly convert '%q' to 'bool'", "\377\200\336\215\201\214'bool'")
+MP_MATCH_COMPRESSED("can't import name %q", "\377\200\313\266\305")
+MP_MATCH_COMPRESSED("can't load from '%q'", "\377\200load\247\201")
+MP_MATCH_COMPRESSED("can't load with '%q' index", "\377\200load\235\201\224")
+MP_MATCH_COMPRESSED("can't perform relative import", "\377\200perform relative\313")
+MP_MATCH_COMPRESSED("can't send non-None value to a just-started generator", "\377\200send non-None\333\214\241just-started\242")
+MP_MATCH_COMPRESSED("can't set attribute", "\377\200\355\226")
+MP_MATCH_COMPRESSED("can't store '%q'", "\377\200\331\201")
+MP_MATCH_COMPRESSED("can't store to '%q'", "\377\200\331\214\201")
+MP_MATCH_COMPRESSED("can't store with '%q' index", "\377\200\331\235\201\224")
+MP_MATCH_COMPRESSED("can't switch from automatic field numbering to manual field specification", "\377\200\372\247\341\270\345\214\365\270\316")
+MP_MATCH_COMPRESSED("can't switch from manual field specification to automatic field numbering", "\377\200\372\247\365\270\316\214\341\270\345")
+MP_MATCH_COMPRESSED("can't truncate-divide a complex number", "\377\200truncate-divide\241\250\314")
+MP_MATCH_COMPRESSED("can't unambiguously get sizeof scalar", "\377\200unambiguously get sizeof scalar")
+MP_MATCH_COMPRESSED("can't wait", "\377\200wait")
+MP_MATCH_COMPRESSED("casting", "casting")
+MP_MATCH_COMPRESSED("chr() arg not in range(0x110000)", "\377chr()\230\207\243range(0x110000)")
+MP_MATCH_COMPRESSED("comparison of int and uint", "\377comparison\225\265\324uint")
+MP_MATCH_COMPRESSED("complex divide by zero", "\377\250\363by\312")
+MP_MATCH_COMPRESSED("compression header", "compression header")
+MP_MATCH_COMPRESSED("conversion to object", "\377\257\214\202")
+MP_MATCH_COMPRESSED("default 'except' must be last", "\377\300'except'\210\223last")
+MP_MATCH_COMPRESSED("dict update sequence has wrong length", "\377\306update\275\264wrong\245")
+MP_MATCH_COMPRESSED("div/mod not implemented for uint", "\377div/mod\207\232\221uint")
+MP_MATCH_COMPRESSED("divide by zero", "\377\363by\312")
+MP_MATCH_COMPRESSED("empty", "\377\231")
+MP_MATCH_COMPRESSED("empty heap", "\377\231\343")
+MP_MATCH_COMPRESSED("empty separator", "\377\231separator")
+MP_MATCH_COMPRESSED("end of format while looking for conversion specifier", "\377end\225\206while looking\221\257\213")
+MP_MATCH_COMPRESSED("error in regex", "\377\252\243regex")
+MP_MATCH_COMPRESSED("exceptions must derive from BaseException", "\377exceptions\210derive\247BaseException")
+MP_MATCH_COMPRESSED("expected ':' after format specifier", "\377\246':'\323\206\213")
+MP_MATCH_COMPRESSED("expecting a dict for keyword args", "\377\263\241\306\221\211args")
+MP_MATCH_COMPRESSED("expecting just a value for set", "\377\263just\241\333\221\355")
+MP_MATCH_COMPRESSED("expecting key:value for dict", "\377\263key:value\221\306")
+MP_MATCH_COMPRESSED("extra keyword arguments given", "\377\377\211\204\272")
+MP_MATCH_COMPRESSED("extra positional arguments given", "\377\377\222\204\272")
+MP_MATCH_COMPRESSED("format needs a dict", "\377\206\273\241\306")
+MP_MATCH_COMPRESSED("format string didn't convert all arguments", "\377\206\216didn't\215all\204")
+MP_MATCH_COMPRESSED("format string needs more arguments", "\377\206\216\273more\204")
+MP_MATCH_COMPRESSED("full", "full")
+MP_MATCH_COMPRESSED("function doesn't take keyword arguments", "\377\203\251take\211\204")
+MP_MATCH_COMPRESSED("function expected at most %d arguments, got %d", "\377\203\246\376most\227arguments,\353\227")
+MP_MATCH_COMPRESSED("function got multiple values for argument '%q'", "\377\203\353\234\317\221\205\201")
+MP_MATCH_COMPRESSED("function missing %d required positional arguments", "\377\203\253\227\217\222\204")
+MP_MATCH_COMPRESSED("function missing keyword-only argument", "\377\203\253keyword-only\205")
+MP_MATCH_COMPRESSED("function missing required keyword argument '%q'", "\377\203\253\217\211\205\201")
+MP_MATCH_COMPRESSED("function missing required positional argument #%d", "\377\203\253\217\222\205#%d")
+MP_MATCH_COMPRESSED("function takes %d positional arguments but %d were given", "\377\203\332\227\222\204\262\227were\272")
+MP_MATCH_COMPRESSED("generator already executing", "\377\242already executing")
+MP_MATCH_COMPRESSED("generator ignored GeneratorExit", "\377\242ignored GeneratorExit")
+MP_MATCH_COMPRESSED("generator raised StopIteration", "\377\242raised StopIteration")
+MP_MATCH_COMPRESSED("hash is final", "\377hash\307final")
+MP_MATCH_COMPRESSED("heap must be a list", "\377\343\210\223\241\310")
+MP_MATCH_COMPRESSED("identifier redefined as global", "\377\260\347as global")
+MP_MATCH_COMPRESSED("identifier redefined as nonlocal", "\377\260\347as\274")
+MP_MATCH_COMPRESSED("import * not at module level", "\377\313*\207\376\370level")
+MP_MATCH_COMPRESSED("incompatible .mpy arch", "\377\320.mpy arch")
+MP_MATCH_COMPRESSED("incompatible .mpy file", "\377\320.mpy file")
+MP_MATCH_COMPRESSED("incomplete format", "\377\337\206")
+MP_MATCH_COMPRESSED("incomplete format key", "\377\337\206key")
+MP_MATCH_COMPRESSED("incorrect padding", "incorrect padding")
+MP_MATCH_COMPRESSED("int() arg 2 must be >= 2 and <= 36", "\377int()\2302\210\223>= 2\324<= 36")
+MP_MATCH_COMPRESSED("integer needed", "\377\354needed")
+MP_MATCH_COMPRESSED("invalid format specifier", "\377\237\206\213")
+MP_MATCH_COMPRESSED("invalid micropython decorator", "\377\237micropython decorator")
+MP_MATCH_COMPRESSED("invalid mktime usage", "\377\237\367usage")
+MP_MATCH_COMPRESSED("invalid syntax", "\377\237\261")
+MP_MATCH_COMPRESSED("invalid syntax for number", "\377\237\261\221\314")
+MP_MATCH_COMPRESSED("issubclass() arg 1 must be a class", "\377\321\2301\210\223\241\326")
+MP_MATCH_COMPRESSED("issubclass() arg 2 must be a class or a tuple of classes", "\377\321\2302\210\223\241\326\311\241\276\225classes")
+MP_MATCH_COMPRESSED("join expects a list of str/bytes objects consistent with self object", "\377join expects\241\310\225str/bytes objects consistent\235\350\202")
+MP_MATCH_COMPRESSED("keyword argument(s) not yet implemented - use normal args instead", "\377\211argument(s)\207yet\232- use normal args instead")
+MP_MATCH_COMPRESSED("lhs and rhs should be compatible", "\377lhs\324rhs\315\223compatible")
+MP_MATCH_COMPRESSED("local '%q' has type '%q' but source is '%q'", "\377\327\201\264\220\201\262source\307\201")
+MP_MATCH_COMPRESSED("local '%q' used before type known", "\377\327\201used\360\220known")
+MP_MATCH_COMPRESSED("local variable referenced before assignment", "\377\327variable referenced\360\236")
+MP_MATCH_COMPRESSED("malformed f-string", "malformed f-string")
+MP_MATCH_COMPRESSED("math domain error", "\377math domain\252")
+MP_MATCH_COMPRESSED("memory allocation failed, allocating %u bytes", "\377\366\334\352allocating %u\325")
+MP_MATCH_COMPRESSED("memory allocation failed, heap is locked", "\377\366\334\352\343\307locked")
+MP_MATCH_COMPRESSED("mktime needs a tuple of length 8 or 9", "\377\367\273\241\276\225\2458\3119")
+MP_MATCH_COMPRESSED("multiple *x in assignment", "\377\234\374\243\236")
+MP_MATCH_COMPRESSED("multiple bases have instance lay-out conflict", "\377\234bases\342instance lay-out conflict")
+MP_MATCH_COMPRESSED("must raise an object", "\377\210raise\267\202")
+MP_MATCH_COMPRESSED("must use keyword argument for key function", "\377\210use\211\205\221key\203")
+MP_MATCH_COMPRESSED("name '%q' isn't defined", "\377\266\201\233defined")
+MP_MATCH_COMPRESSED("name too long", "\377\266\357long")
+MP_MATCH_COMPRESSED("native yield", "native yield")
+MP_MATCH_COMPRESSED("need more than %d values to unpack", "\377need more than\227\317\214\373")
+MP_MATCH_COMPRESSED("negative shift count", "negative shift count")
+MP_MATCH_COMPRESSED("no active exception to reraise", "\377\254active exception\214reraise")
+MP_MATCH_COMPRESSED("no binding for nonlocal found", "\377\254binding\221\274\271")
+MP_MATCH_COMPRESSED("no default seed", "\377\254\300seed")
+MP_MATCH_COMPRESSED("no module named '%q'", "\377\254\370named\201")
+MP_MATCH_COMPRESSED("no such attribute", "\377\254such\226")
+MP_MATCH_COMPRESSED("non-default argument follows default argument", "\377non-default\205follows\300\205")
+MP_MATCH_COMPRESSED("non-hex digit found", "\377non-hex digit\271")
+MP_MATCH_COMPRESSED("non-keyword arg after */**", "\377\330\230\323*/**")
+MP_MATCH_COMPRESSED("non-keyword arg after keyword arg", "\377\330\230\323\211\230")
+MP_MATCH_COMPRESSED("not attached", "\377\207attached")
+MP_MATCH_COMPRESSED("object '%s' isn't a tuple or list", "\377\202\212\233\241\276\311\310")
+MP_MATCH_COMPRESSED("object not in sequence", "\377\202\207\243\275")
+MP_MATCH_COMPRESSED("object of type '%s' has no len()", "\377\202\225\220\212\264\254len()")
+MP_MATCH_COMPRESSED("object with buffer protocol required", "\377\202\235\362protocol\217")
+MP_MATCH_COMPRESSED("odd-length string", "\377odd-length\216")
+MP_MATCH_COMPRESSED("only slices with step=1 (aka None) are supported", "\377only slices\235step=1 (aka None) are\244")
+MP_MATCH_COMPRESSED("opcode", "opcode")
+MP_MATCH_COMPRESSED("ord() expected a character, but string of length %d found", "\377ord()\246\241character,\262\216\225\245\227\271")
+MP_MATCH_COMPRESSED("overflow converting long int to machine word", "\377\351converting long\265\214machine word")
+MP_MATCH_COMPRESSED("pop from an empty set", "\377pop\247\267\231\355")
+MP_MATCH_COMPRESSED("pop from empty list", "\377pop\247\231\310")
+MP_MATCH_COMPRESSED("popitem(): dictionary is empty", "\377popitem(): dictionary\307\231")
+MP_MATCH_COMPRESSED("pow() with 3 arguments requires integers", "\377pow()\2353\204requires integers")
+MP_MATCH_COMPRESSED("queue overflow", "\377queue\351")
+MP_MATCH_COMPRESSED("raw f-strings are not supported", "\377raw f-strings are\207\244")
+MP_MATCH_COMPRESSED("requested length %d but object has length %d", "\377requested\245\227\262\202\264\245\227")
+MP_MATCH_COMPRESSED("return expected '%q' but got '%q'", "\377\371\246\201\262\353\201")
+MP_MATCH_COMPRESSED("rsplit(None,n)", "rsplit(None,n)")
+MP_MATCH_COMPRESSED("schedule queue full", "schedule queue full")
+MP_MATCH_COMPRESSED("sign not allowed in string format specifier", "\377sign\207\277\243\216\206\213")
+MP_MATCH_COMPRESSED("sign not allowed with integer format specifier 'c'", "\377sign\207\277\235\354\206\213'c'")
+MP_MATCH_COMPRESSED("single '}' encountered in format string", "\377single '}' encountered\243\206\216")
+MP_MATCH_COMPRESSED("slice step can't be zero", "\377slice step\200\223\312")
+MP_MATCH_COMPRESSED("splitting with sub-captures", "\377splitting\235sub-captures")
+MP_MATCH_COMPRESSED("start/end indices", "\377start/end\301")
+MP_MATCH_COMPRESSED("stream operation not supported", "\377stream\346\207\244")
+MP_MATCH_COMPRESSED("string index out of range", "\377\216\224\302\225\255")
+MP_MATCH_COMPRESSED("string indices must be integers, not %s", "\377\216\301\210\223\344\207\322")
+MP_MATCH_COMPRESSED("struct: can't index", "\377\303\200\224")
+MP_MATCH_COMPRESSED("struct: index out of range", "\377\303\224\302\225\255")
+MP_MATCH_COMPRESSED("struct: no fields", "\377\303\254fields")
+MP_MATCH_COMPRESSED("substring not found", "\377substring\207\271")
+MP_MATCH_COMPRESSED("super() can't find self", "\377super()\200find\350")
+MP_MATCH_COMPRESSED("syntax error in JSON", "\377\261\252\243JSON")
+MP_MATCH_COMPRESSED("syntax error in uctypes descriptor", "\377\261\252\243uctypes descriptor")
+MP_MATCH_COMPRESSED("too many values to unpack (expected %d)", "\377\357many\317\214\373(expected %d)")
+MP_MATCH_COMPRESSED("tuple index out of range", "\377\276\224\302\225\255")
+MP_MATCH_COMPRESSED("type '%q' isn't an acceptable base type", "\377\220\201\233\267acceptable base\220")
+MP_MATCH_COMPRESSED("type object '%q' has no attribute '%q'", "\377\220\202\201\264\254\226\201")
+MP_MATCH_COMPRESSED("type takes 1 or 3 arguments", "\377\220\3321\3113\204")
+MP_MATCH_COMPRESSED("unary op %q not implemented", "\377unary op\305\207\232")
+MP_MATCH_COMPRESSED("unexpected indent", "\377\340\364")
+MP_MATCH_COMPRESSED("unexpected keyword argument '%q'", "\377\340\211\205\201")
+MP_MATCH_COMPRESSED("unicode name escapes", "\377unicode\266escapes")
+MP_MATCH_COMPRESSED("unindent doesn't match any outer indent level", "\377unindent\251match any outer\364level")
+MP_MATCH_COMPRESSED("unknown conversion specifier %c", "\377\304\257\213%c")
+MP_MATCH_COMPRESSED("unknown format code '%c' for object of type '%s'", "\377\304\206code '%c'\221\202\225\220\212")
+MP_MATCH_COMPRESSED("unknown type '%q'", "\377\304\220\201")
+MP_MATCH_COMPRESSED("unmatched '{' in format", "\377unmatched '{'\243\206")
+MP_MATCH_COMPRESSED("unreadable attribute", "\377unreadable\226")
+MP_MATCH_COMPRESSED("unsupported format character '%c' (0x%x) at index %d", "\377\256\206character '%c' (0x%x)\376\224\227")
+MP_MATCH_COMPRESSED("unsupported type for %q: '%s'", "\377\256\220\221%q:\212")
+MP_MATCH_COMPRESSED("unsupported types for %q: '%s', '%s'", "\377\256types\221%q: '%s',\212")
+MP_MATCH_COMPRESSED("wrong number of arguments", "\377wrong\314\225\204")
+MP_MATCH_COMPRESSED("zero step", "\377\312step")
+// Total input length:      6395
+// Total compressed length: 2982
+// Total data length:       1151
+// Predicted saving:        2262
+
+// gzip length:             3521
+// Percentage of gzip:      117.4%
+// zlib length:             3509
+// Percentage of zlib:      117.8%
@@ -0,0 +1,13 @@
+// Automatically generated by makemoduledefs.py.
+
+#if (MICROPY_PY_ARRAY)
+    extern const struct _mp_obj_module_t mp_module_uarray;
+    #define MODULE_DEF_MP_QSTR_UARRAY { MP_ROM_QSTR(MP_QSTR_uarray), MP_ROM_PTR(&mp_module_uarray) },
+#else
+    #define MODULE_DEF_MP_QSTR_UARRAY
+#endif
+
+
+#define MICROPY_REGISTERED_MODULES \
+    MODULE_DEF_MP_QSTR_UARRAY \
+// MICROPY_REGISTERED_MODULES
@@ -0,0 +1,2523 @@
+Q(AF_INET)
+
+Q(AF_INET6)
+
+Q(AF_UNIX)
+
+Q(ARRAY)
+
+Q(ArithmeticError)
+
+Q(ArithmeticError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AttributeError)
+
+Q(AttributeError)
+
+Q(B115200)
+
+Q(B57600)
+
+Q(B9600)
+
+Q(BFINT16)
+
+Q(BFINT32)
+
+Q(BFINT8)
+
+Q(BFUINT16)
+
+Q(BFUINT32)
+
+Q(BFUINT8)
+
+Q(BF_LEN)
+
+Q(BF_POS)
+
+Q(BIG_ENDIAN)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(BytesIO)
+
+Q(BytesIO)
+
+Q(CancelledError)
+
+Q(CancelledError)
+
+Q(DecompIO)
+
+Q(DecompIO)
+
+Q(EACCES)
+
+Q(EACCES)
+
+Q(EADDRINUSE)
+
+Q(EADDRINUSE)
+
+Q(EAGAIN)
+
+Q(EAGAIN)
+
+Q(EALREADY)
+
+Q(EALREADY)
+
+Q(EBADF)
+
+Q(EBADF)
+
+Q(ECONNABORTED)
+
+Q(ECONNABORTED)
+
+Q(ECONNREFUSED)
+
+Q(ECONNREFUSED)
+
+Q(ECONNRESET)
+
+Q(ECONNRESET)
+
+Q(EEXIST)
+
+Q(EEXIST)
+
+Q(EHOSTUNREACH)
+
+Q(EHOSTUNREACH)
+
+Q(EINPROGRESS)
+
+Q(EINPROGRESS)
+
+Q(EINVAL)
+
+Q(EINVAL)
+
+Q(EIO)
+
+Q(EIO)
+
+Q(EISDIR)
+
+Q(EISDIR)
+
+Q(ENOBUFS)
+
+Q(ENOBUFS)
+
+Q(ENODEV)
+
+Q(ENODEV)
+
+Q(ENOENT)
+
+Q(ENOENT)
+
+Q(ENOMEM)
+
+Q(ENOMEM)
+
+Q(ENOTCONN)
+
+Q(ENOTCONN)
+
+Q(EOFError)
+
+Q(EOFError)
+
+Q(EOPNOTSUPP)
+
+Q(EOPNOTSUPP)
+
+Q(EPERM)
+
+Q(EPERM)
+
+Q(ETIMEDOUT)
+
+Q(ETIMEDOUT)
+
+Q(Ellipsis)
+
+Q(Ellipsis)
+
+Q(Exception)
+
+Q(Exception)
+
+Q(FLOAT32)
+
+Q(FLOAT64)
+
+Q(FileIO)
+
+Q(FileIO)
+
+Q(FileIO)
+
+Q(FileIO)
+
+Q(GeneratorExit)
+
+Q(GeneratorExit)
+
+Q(INT)
+
+Q(INT16)
+
+Q(INT32)
+
+Q(INT64)
+
+Q(INT8)
+
+Q(IOBase)
+
+Q(IOBase)
+
+Q(IOEntry)
+
+Q(IOQueue)
+
+Q(IOQueue)
+
+Q(ImportError)
+
+Q(ImportError)
+
+Q(IndentationError)
+
+Q(IndentationError)
+
+Q(IndexError)
+
+Q(IndexError)
+
+Q(KeyError)
+
+Q(KeyError)
+
+Q(KeyboardInterrupt)
+
+Q(KeyboardInterrupt)
+
+Q(LITTLE_ENDIAN)
+
+Q(LONG)
+
+Q(LONGLONG)
+
+Q(LockType)
+
+Q(LookupError)
+
+Q(LookupError)
+
+Q(Loop)
+
+Q(MSG_DONTROUTE)
+
+Q(MSG_DONTWAIT)
+
+Q(MemoryError)
+
+Q(MemoryError)
+
+Q(NATIVE)
+
+Q(NameError)
+
+Q(NameError)
+
+Q(None)
+
+Q(NoneType)
+
+Q(NotImplemented)
+
+Q(NotImplemented)
+
+Q(NotImplementedError)
+
+Q(NotImplementedError)
+
+Q(OSError)
+
+Q(OSError)
+
+Q(OrderedDict)
+
+Q(OrderedDict)
+
+Q(OrderedDict)
+
+Q(OverflowError)
+
+Q(OverflowError)
+
+Q(POLLERR)
+
+Q(POLLHUP)
+
+Q(POLLIN)
+
+Q(POLLOUT)
+
+Q(PTR)
+
+Q(PinBase)
+
+Q(PinBase)
+
+Q(RuntimeError)
+
+Q(RuntimeError)
+
+Q(SHORT)
+
+Q(SOCK_DGRAM)
+
+Q(SOCK_RAW)
+
+Q(SOCK_STREAM)
+
+Q(SOL_SOCKET)
+
+Q(SO_BROADCAST)
+
+Q(SO_ERROR)
+
+Q(SO_KEEPALIVE)
+
+Q(SO_LINGER)
+
+Q(SO_REUSEADDR)
+
+Q(Signal)
+
+Q(Signal)
+
+Q(SingletonGenerator)
+
+Q(SingletonGenerator)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopIteration)
+
+Q(StopIteration)
+
+Q(StringIO)
+
+Q(StringIO)
+
+Q(SyntaxError)
+
+Q(SyntaxError)
+
+Q(SystemExit)
+
+Q(SystemExit)
+
+Q(TCSANOW)
+
+Q(Task)
+
+Q(Task)
+
+Q(TaskQueue)
+
+Q(TaskQueue)
+
+Q(TextIOWrapper)
+
+Q(TextIOWrapper)
+
+Q(TextIOWrapper)
+
+Q(TextIOWrapper)
+
+Q(TimerWheel)
+
+Q(TimerWheel)
+
+Q(TypeError)
+
+Q(TypeError)
+
+Q(UINT)
+
+Q(UINT16)
+
+Q(UINT32)
+
+Q(UINT64)
+
+Q(UINT8)
+
+Q(ULONG)
+
+Q(ULONGLONG)
+
+Q(USHORT)
+
+Q(UnicodeError)
+
+Q(UnicodeError)
+
+Q(VOID)
+
+Q(ValueError)
+
+Q(ValueError)
+
+Q(VfsFat)
+
+Q(VfsFat)
+
+Q(VfsLfs1)
+
+Q(VfsLfs2)
+
+Q(VfsLfs2)
+
+Q(VfsPosix)
+
+Q(VfsPosix)
+
+Q(ViperTypeError)
+
+Q(ViperTypeError)
+
+Q(ZeroDivisionError)
+
+Q(ZeroDivisionError)
+
+Q(_)
+
+Q(_0x0a_)
+
+Q(__abs__)
+
+Q(__add__)
+
+Q(__aenter__)
+
+Q(__aenter__)
+
+Q(__aexit__)
+
+Q(__aexit__)
+
+Q(__aiter__)
+
+Q(__and__)
+
+Q(__anext__)
+
+Q(__bases__)
+
+Q(__bool__)
+
+Q(__build_class__)
+
+Q(__build_class__)
+
+Q(__call__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__contains__)
+
+Q(__contains__)
+
+Q(__contains__)
+
+Q(__del__)
+
+Q(__del__)
+
+Q(__del__)
+
+Q(__del__)
+
+Q(__delattr__)
+
+Q(__delattr__)
+
+Q(__delattr__)
+
+Q(__delattr__)
+
+Q(__delete__)
+
+Q(__delete__)
+
+Q(__delitem__)
+
+Q(__delitem__)
+
+Q(__dict__)
+
+Q(__dict__)
+
+Q(__dir__)
+
+Q(__divmod__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__eq__)
+
+Q(__eq__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__file__)
+
+Q(__file__)
+
+Q(__file__)
+
+Q(__file__)
+
+Q(__floordiv__)
+
+Q(__ge__)
+
+Q(__get__)
+
+Q(__get__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__globals__)
+
+Q(__gt__)
+
+Q(__hash__)
+
+Q(__iadd__)
+
+Q(__import__)
+
+Q(__import__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__int__)
+
+Q(__invert__)
+
+Q(__isub__)
+
+Q(__iter__)
+
+Q(__le__)
+
+Q(__len__)
+
+Q(__lshift__)
+
+Q(__lt__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__matmul__)
+
+Q(__mod__)
+
+Q(__module__)
+
+Q(__mul__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__ne__)
+
+Q(__neg__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__or__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__pos__)
+
+Q(__pow__)
+
+Q(__qualname__)
+
+Q(__radd__)
+
+Q(__rand__)
+
+Q(__repl_print__)
+
+Q(__repl_print__)
+
+Q(__repr__)
+
+Q(__repr__)
+
+Q(__reversed__)
+
+Q(__rfloordiv__)
+
+Q(__rlshift__)
+
+Q(__rmatmul__)
+
+Q(__rmod__)
+
+Q(__rmul__)
+
+Q(__ror__)
+
+Q(__rpow__)
+
+Q(__rrshift__)
+
+Q(__rshift__)
+
+Q(__rsub__)
+
+Q(__rtruediv__)
+
+Q(__rxor__)
+
+Q(__set__)
+
+Q(__set__)
+
+Q(__setattr__)
+
+Q(__setattr__)
+
+Q(__setattr__)
+
+Q(__setattr__)
+
+Q(__setitem__)
+
+Q(__setitem__)
+
+Q(__str__)
+
+Q(__sub__)
+
+Q(__traceback__)
+
+Q(__truediv__)
+
+Q(__xor__)
+
+Q(_brace_open__colon__hash_b_brace_close_)
+
+Q(_exc_context)
+
+Q(_io_queue)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_stdin_gt_)
+
+Q(_lt_stdin_gt_)
+
+Q(_lt_stdin_gt_)
+
+Q(_lt_string_gt_)
+
+Q(_percent__hash_o)
+
+Q(_percent__hash_x)
+
+Q(_slash_)
+
+Q(_slash_)
+
+Q(_slash_)
+
+Q(_slash_)
+
+Q(_slash_)
+
+Q(_slash_)
+
+Q(_slash_)
+
+Q(_space_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(_task_queue)
+
+Q(_task_queue)
+
+Q(_task_queue)
+
+Q(_task_queue)
+
+Q(_task_queue)
+
+Q(_thread)
+
+Q(_thread)
+
+Q(_uasyncio)
+
+Q(_uasyncio)
+
+Q(a2b_base64)
+
+Q(abs)
+
+Q(abs_tol)
+
+Q(accept)
+
+Q(acos)
+
+Q(acosh)
+
+Q(acquire)
+
+Q(add)
+
+Q(addressof)
+
+Q(all)
+
+Q(allocate_lock)
+
+Q(any)
+
+Q(append)
+
+Q(append)
+
+Q(append)
+
+Q(args)
+
+Q(argv)
+
+Q(array)
+
+Q(array)
+
+Q(asin)
+
+Q(asinh)
+
+Q(atan)
+
+Q(atan2)
+
+Q(atanh)
+
+Q(atexit)
+
+Q(attach)
+
+Q(available)
+
+Q(b2a_base64)
+
+Q(bin)
+
+Q(bind)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bound_method)
+
+Q(buffering)
+
+Q(builtins)
+
+Q(builtins)
+
+Q(bytearray)
+
+Q(bytearray)
+
+Q(bytearray_at)
+
+Q(bytecode)
+
+Q(byteorder)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(bytes_at)
+
+Q(calcsize)
+
+Q(call)
+
+Q(call_exception_handler)
+
+Q(callable)
+
+Q(cancel)
+
+Q(ceil)
+
+Q(center)
+
+Q(center)
+
+Q(chdir)
+
+Q(chdir)
+
+Q(chdir)
+
+Q(chdir)
+
+Q(chdir)
+
+Q(chdir)
+
+Q(choice)
+
+Q(chr)
+
+Q(classmethod)
+
+Q(classmethod)
+
+Q(clear)
+
+Q(clear)
+
+Q(clear)
+
+Q(clock)
+
+Q(close)
+
+Q(close)
+
+Q(close)
+
+Q(close)
+
+Q(close)
+
+Q(close)
+
+Q(close)
+
+Q(close)
+
+Q(closure)
+
+Q(cmath)
+
+Q(cmath)
+
+Q(co_code)
+
+Q(co_consts)
+
+Q(co_filename)
+
+Q(co_firstlineno)
+
+Q(co_lnotab)
+
+Q(co_name)
+
+Q(co_names)
+
+Q(code)
+
+Q(code)
+
+Q(collect)
+
+Q(compile)
+
+Q(compile)
+
+Q(complex)
+
+Q(complex)
+
+Q(connect)
+
+Q(const)
+
+Q(copy)
+
+Q(copy)
+
+Q(copy)
+
+Q(copy)
+
+Q(copysign)
+
+Q(coro)
+
+Q(cos)
+
+Q(cos)
+
+Q(cosh)
+
+Q(count)
+
+Q(count)
+
+Q(count)
+
+Q(count)
+
+Q(count)
+
+Q(crc32)
+
+Q(cur_task)
+
+Q(cur_task)
+
+Q(cur_task)
+
+Q(cur_task)
+
+Q(cur_task)
+
+Q(data)
+
+Q(data)
+
+Q(decode)
+
+Q(decode)
+
+Q(decompress)
+
+Q(default)
+
+Q(degrees)
+
+Q(delattr)
+
+Q(deleter)
+
+Q(deque)
+
+Q(deque)
+
+Q(dict)
+
+Q(dict)
+
+Q(dict_view)
+
+Q(difference)
+
+Q(difference)
+
+Q(difference_update)
+
+Q(digest)
+
+Q(dir)
+
+Q(disable)
+
+Q(discard)
+
+Q(discard)
+
+Q(divmod)
+
+Q(doc)
+
+Q(done)
+
+Q(dump)
+
+Q(dumps)
+
+Q(e)
+
+Q(e)
+
+Q(enable)
+
+Q(encode)
+
+Q(encoding)
+
+Q(encoding)
+
+Q(end)
+
+Q(endswith)
+
+Q(endswith)
+
+Q(enumerate)
+
+Q(enumerate)
+
+Q(erf)
+
+Q(erfc)
+
+Q(errno)
+
+Q(errno)
+
+Q(errno)
+
+Q(errno)
+
+Q(errorcode)
+
+Q(eval)
+
+Q(eval)
+
+Q(exc_info)
+
+Q(exception)
+
+Q(exception)
+
+Q(exec)
+
+Q(exec)
+
+Q(exit)
+
+Q(exit)
+
+Q(exp)
+
+Q(exp)
+
+Q(expm1)
+
+Q(extend)
+
+Q(extend)
+
+Q(f_back)
+
+Q(f_code)
+
+Q(f_globals)
+
+Q(f_lasti)
+
+Q(f_lineno)
+
+Q(fabs)
+
+Q(file)
+
+Q(file)
+
+Q(file)
+
+Q(file)
+
+Q(fileno)
+
+Q(fileno)
+
+Q(filter)
+
+Q(filter)
+
+Q(find)
+
+Q(find)
+
+Q(float)
+
+Q(float)
+
+Q(floor)
+
+Q(flush)
+
+Q(flush)
+
+Q(flush)
+
+Q(flush)
+
+Q(fmod)
+
+Q(format)
+
+Q(format)
+
+Q(frame)
+
+Q(frexp)
+
+Q(from_bytes)
+
+Q(fromkeys)
+
+Q(frozenset)
+
+Q(frozenset)
+
+Q(fs_hook)
+
+Q(fs_poll)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(future)
+
+Q(gamma)
+
+Q(gc)
+
+Q(gc)
+
+Q(generator)
+
+Q(generator)
+
+Q(generator)
+
+Q(get)
+
+Q(get_ident)
+
+Q(getaddrinfo)
+
+Q(getattr)
+
+Q(getcwd)
+
+Q(getcwd)
+
+Q(getcwd)
+
+Q(getcwd)
+
+Q(getcwd)
+
+Q(getenv)
+
+Q(getenv)
+
+Q(getrandbits)
+
+Q(getter)
+
+Q(getvalue)
+
+Q(globals)
+
+Q(gmtime)
+
+Q(group)
+
+Q(hasattr)
+
+Q(hash)
+
+Q(heap_lock)
+
+Q(heap_unlock)
+
+Q(heapify)
+
+Q(heappop)
+
+Q(heappush)
+
+Q(help)
+
+Q(hex)
+
+Q(hexlify)
+
+Q(id)
+
+Q(idle)
+
+Q(ilistdir)
+
+Q(ilistdir)
+
+Q(ilistdir)
+
+Q(ilistdir)
+
+Q(ilistdir)
+
+Q(ilistdir)
+
+Q(ilistdir)
+
+Q(imag)
+
+Q(implementation)
+
+Q(index)
+
+Q(index)
+
+Q(index)
+
+Q(index)
+
+Q(indices)
+
+Q(inet_ntop)
+
+Q(inet_pton)
+
+Q(input)
+
+Q(insert)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(intersection)
+
+Q(intersection)
+
+Q(intersection_update)
+
+Q(invert)
+
+Q(ioctl)
+
+Q(ioctl)
+
+Q(ioctl)
+
+Q(ipoll)
+
+Q(ipoll)
+
+Q(isalpha)
+
+Q(isalpha)
+
+Q(isclose)
+
+Q(isdigit)
+
+Q(isdigit)
+
+Q(isdisjoint)
+
+Q(isdisjoint)
+
+Q(isenabled)
+
+Q(isfinite)
+
+Q(isinf)
+
+Q(isinstance)
+
+Q(islower)
+
+Q(islower)
+
+Q(isnan)
+
+Q(isspace)
+
+Q(isspace)
+
+Q(issubclass)
+
+Q(issubset)
+
+Q(issubset)
+
+Q(issuperset)
+
+Q(issuperset)
+
+Q(isupper)
+
+Q(isupper)
+
+Q(items)
+
+Q(iter)
+
+Q(iterable)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(join)
+
+Q(join)
+
+Q(kbd_intr)
+
+Q(keep)
+
+Q(keepends)
+
+Q(key)
+
+Q(key)
+
+Q(keys)
+
+Q(keys)
+
+Q(ldexp)
+
+Q(len)
+
+Q(lgamma)
+
+Q(line)
+
+Q(list)
+
+Q(list)
+
+Q(listdir)
+
+Q(listen)
+
+Q(little)
+
+Q(little)
+
+Q(little)
+
+Q(little)
+
+Q(load)
+
+Q(loads)
+
+Q(locals)
+
+Q(localtime)
+
+Q(lock)
+
+Q(locked)
+
+Q(log)
+
+Q(log)
+
+Q(log10)
+
+Q(log10)
+
+Q(log2)
+
+Q(lookahead)
+
+Q(lower)
+
+Q(lower)
+
+Q(lstrip)
+
+Q(lstrip)
+
+Q(makefile)
+
+Q(map)
+
+Q(map)
+
+Q(map)
+
+Q(match)
+
+Q(match)
+
+Q(match)
+
+Q(math)
+
+Q(math)
+
+Q(max)
+
+Q(maximum_space_recursion_space_depth_space_exceeded)
+
+Q(maxsize)
+
+Q(mem)
+
+Q(mem16)
+
+Q(mem32)
+
+Q(mem8)
+
+Q(mem_alloc)
+
+Q(mem_current)
+
+Q(mem_free)
+
+Q(mem_info)
+
+Q(mem_peak)
+
+Q(mem_total)
+
+Q(memoryview)
+
+Q(memoryview)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(min)
+
+Q(mkdir)
+
+Q(mkdir)
+
+Q(mkdir)
+
+Q(mkdir)
+
+Q(mkdir)
+
+Q(mkdir)
+
+Q(mkfs)
+
+Q(mkfs)
+
+Q(mkfs)
+
+Q(mktime)
+
+Q(mode)
+
+Q(mode)
+
+Q(mode)
+
+Q(mode)
+
+Q(modf)
+
+Q(modify)
+
+Q(modify)
+
+Q(modify)
+
+Q(module)
+
+Q(modules)
+
+Q(modules)
+
+Q(mount)
+
+Q(mount)
+
+Q(mount)
+
+Q(mount)
+
+Q(mount)
+
+Q(mount)
+
+Q(mpy)
+
+Q(mtime)
+
+Q(name)
+
+Q(namedtuple)
+
+Q(native)
+
+Q(next)
+
+Q(nwait)
+
+Q(nwait)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(oct)
+
+Q(off)
+
+Q(on)
+
+Q(opcode)
+
+Q(open)
+
+Q(open)
+
+Q(open)
+
+Q(open)
+
+Q(open)
+
+Q(open)
+
+Q(opt_level)
+
+Q(ord)
+
+Q(pack)
+
+Q(pack_into)
+
+Q(partition)
+
+Q(partition)
+
+Q(path)
+
+Q(peek)
+
+Q(peek)
+
+Q(peektime)
+
+Q(pend_throw)
+
+Q(ph_key)
+
+Q(phase)
+
+Q(pi)
+
+Q(pi)
+
+Q(pipe)
+
+Q(pipe)
+
+Q(platform)
+
+Q(polar)
+
+Q(poll)
+
+Q(poll)
+
+Q(poll)
+
+Q(poll)
+
+Q(poller)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop_head)
+
+Q(pop_head)
+
+Q(popitem)
+
+Q(popleft)
+
+Q(pow)
+
+Q(pow)
+
+Q(print)
+
+Q(print_exception)
+
+Q(progsize)
+
+Q(property)
+
+Q(property)
+
+Q(ptr)
+
+Q(ptr)
+
+Q(ptr16)
+
+Q(ptr16)
+
+Q(ptr32)
+
+Q(ptr32)
+
+Q(ptr8)
+
+Q(ptr8)
+
+Q(push)
+
+Q(push_head)
+
+Q(push_head)
+
+Q(push_sorted)
+
+Q(push_sorted)
+
+Q(putenv)
+
+Q(putenv)
+
+Q(qstr_info)
+
+Q(queue_read)
+
+Q(queue_write)
+
+Q(r)
+
+Q(r)
+
+Q(r)
+
+Q(radians)
+
+Q(randint)
+
+Q(random)
+
+Q(randrange)
+
+Q(range)
+
+Q(range)
+
+Q(range)
+
+Q(rb)
+
+Q(rb)
+
+Q(rb)
+
+Q(read)
+
+Q(read)
+
+Q(read)
+
+Q(read)
+
+Q(read)
+
+Q(read)
+
+Q(read)
+
+Q(read)
+
+Q(readblocks)
+
+Q(readinto)
+
+Q(readinto)
+
+Q(readinto)
+
+Q(readinto)
+
+Q(readinto)
+
+Q(readinto)
+
+Q(readinto)
+
+Q(readinto)
+
+Q(readline)
+
+Q(readline)
+
+Q(readline)
+
+Q(readline)
+
+Q(readline)
+
+Q(readline)
+
+Q(readline)
+
+Q(readlines)
+
+Q(readlines)
+
+Q(readlines)
+
+Q(readonly)
+
+Q(readsize)
+
+Q(real)
+
+Q(reboot)
+
+Q(rect)
+
+Q(recv)
+
+Q(recv_into)
+
+Q(recvfrom)
+
+Q(recvfrom_into)
+
+Q(register)
+
+Q(register)
+
+Q(rel_tol)
+
+Q(release)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(remove)
+
+Q(rename)
+
+Q(rename)
+
+Q(rename)
+
+Q(rename)
+
+Q(rename)
+
+Q(rename)
+
+Q(replace)
+
+Q(replace)
+
+Q(repr)
+
+Q(return)
+
+Q(reverse)
+
+Q(reverse)
+
+Q(reversed)
+
+Q(reversed)
+
+Q(rfind)
+
+Q(rfind)
+
+Q(rindex)
+
+Q(rindex)
+
+Q(rmdir)
+
+Q(rmdir)
+
+Q(rmdir)
+
+Q(rmdir)
+
+Q(rmdir)
+
+Q(rmdir)
+
+Q(round)
+
+Q(rpartition)
+
+Q(rpartition)
+
+Q(rsplit)
+
+Q(rsplit)
+
+Q(rstrip)
+
+Q(rstrip)
+
+Q(run_until_complete)
+
+Q(schedule)
+
+Q(search)
+
+Q(search)
+
+Q(seed)
+
+Q(seek)
+
+Q(seek)
+
+Q(seek)
+
+Q(seek)
+
+Q(send)
+
+Q(send)
+
+Q(send)
+
+Q(send)
+
+Q(sendto)
+
+Q(sep)
+
+Q(sep)
+
+Q(separators)
+
+Q(set)
+
+Q(set)
+
+Q(set_blocking)
+
+Q(set_blocking)
+
+Q(setattr)
+
+Q(setblocking)
+
+Q(setblocking)
+
+Q(setdefault)
+
+Q(setmode)
+
+Q(setraw)
+
+Q(setsockopt)
+
+Q(setter)
+
+Q(settimeout)
+
+Q(settrace)
+
+Q(sha256)
+
+Q(sha256)
+
+Q(sin)
+
+Q(sin)
+
+Q(single)
+
+Q(sinh)
+
+Q(sizeof)
+
+Q(sleep)
+
+Q(sleep_ms)
+
+Q(sleep_us)
+
+Q(slice)
+
+Q(slice)
+
+Q(sockaddr)
+
+Q(socket)
+
+Q(socket)
+
+Q(sort)
+
+Q(sorted)
+
+Q(split)
+
+Q(split)
+
+Q(split)
+
+Q(splitlines)
+
+Q(splitlines)
+
+Q(sqrt)
+
+Q(sqrt)
+
+Q(stack_size)
+
+Q(stack_use)
+
+Q(start)
+
+Q(start)
+
+Q(start)
+
+Q(start_new_thread)
+
+Q(startswith)
+
+Q(startswith)
+
+Q(stat)
+
+Q(stat)
+
+Q(stat)
+
+Q(stat)
+
+Q(stat)
+
+Q(stat)
+
+Q(stat)
+
+Q(state)
+
+Q(state)
+
+Q(state)
+
+Q(staticmethod)
+
+Q(staticmethod)
+
+Q(statvfs)
+
+Q(statvfs)
+
+Q(statvfs)
+
+Q(statvfs)
+
+Q(statvfs)
+
+Q(statvfs)
+
+Q(stderr)
+
+Q(stdin)
+
+Q(stdout)
+
+Q(step)
+
+Q(step)
+
+Q(stop)
+
+Q(stop)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(strip)
+
+Q(strip)
+
+Q(struct)
+
+Q(struct)
+
+Q(sum)
+
+Q(super)
+
+Q(super)
+
+Q(super)
+
+Q(symmetric_difference)
+
+Q(symmetric_difference)
+
+Q(symmetric_difference_update)
+
+Q(sync)
+
+Q(sys)
+
+Q(system)
+
+Q(system)
+
+Q(tan)
+
+Q(tanh)
+
+Q(tcgetattr)
+
+Q(tcsetattr)
+
+Q(tell)
+
+Q(tell)
+
+Q(tell)
+
+Q(tell)
+
+Q(termios)
+
+Q(termios)
+
+Q(threshold)
+
+Q(throw)
+
+Q(throw)
+
+Q(ticks_add)
+
+Q(ticks_cpu)
+
+Q(ticks_diff)
+
+Q(ticks_ms)
+
+Q(ticks_us)
+
+Q(time)
+
+Q(time_ns)
+
+Q(time_pulse_us)
+
+Q(to_bytes)
+
+Q(trunc)
+
+Q(tuple)
+
+Q(tuple)
+
+Q(tuple)
+
+Q(type)
+
+Q(type)
+
+Q(uarray)
+
+Q(uarray)
+
+Q(ubinascii)
+
+Q(ubinascii)
+
+Q(ucollections)
+
+Q(ucollections)
+
+Q(uctypes)
+
+Q(uctypes)
+
+Q(uctypes)
+
+Q(uerrno)
+
+Q(uerrno)
+
+Q(uhashlib)
+
+Q(uhashlib)
+
+Q(uheapq)
+
+Q(uheapq)
+
+Q(uint)
+
+Q(uint)
+
+Q(uio)
+
+Q(uio)
+
+Q(ujson)
+
+Q(ujson)
+
+Q(umachine)
+
+Q(umachine)
+
+Q(umount)
+
+Q(umount)
+
+Q(umount)
+
+Q(umount)
+
+Q(umount)
+
+Q(unhexlify)
+
+Q(uniform)
+
+Q(union)
+
+Q(union)
+
+Q(unlink)
+
+Q(unpack)
+
+Q(unpack_from)
+
+Q(unregister)
+
+Q(unregister)
+
+Q(unregister)
+
+Q(unregister)
+
+Q(unsetenv)
+
+Q(unsetenv)
+
+Q(uos)
+
+Q(uos)
+
+Q(uos_vfs)
+
+Q(update)
+
+Q(update)
+
+Q(update)
+
+Q(upper)
+
+Q(upper)
+
+Q(urandom)
+
+Q(urandom)
+
+Q(ure)
+
+Q(ure)
+
+Q(ure)
+
+Q(uselect)
+
+Q(uselect)
+
+Q(uselect)
+
+Q(usocket)
+
+Q(usocket)
+
+Q(ustruct)
+
+Q(ustruct)
+
+Q(usys)
+
+Q(utf_hyphen_8)
+
+Q(utf_hyphen_8)
+
+Q(utime)
+
+Q(utime)
+
+Q(utimeq)
+
+Q(utimeq)
+
+Q(utimeq)
+
+Q(utimeq)
+
+Q(uwebsocket)
+
+Q(uwebsocket)
+
+Q(uzlib)
+
+Q(uzlib)
+
+Q(value)
+
+Q(value)
+
+Q(value)
+
+Q(value)
+
+Q(values)
+
+Q(version)
+
+Q(version)
+
+Q(version_info)
+
+Q(viper)
+
+Q(wait_io_event)
+
+Q(wait_io_event)
+
+Q(wb)
+
+Q(wb)
+
+Q(websocket)
+
+Q(websocket)
+
+Q(webusb)
+
+Q(webusb)
+
+Q(write)
+
+Q(write)
+
+Q(write)
+
+Q(write)
+
+Q(write)
+
+Q(write)
+
+Q(write)
+
+Q(write_available)
+
+Q(writeblocks)
+
+Q(zip)
+
+Q(zip)
+
+Q(zip)
@@ -0,0 +1,3374 @@
+//
+// Content for MICROPY_MODULE_FROZEN_STR
+//
+#include <stdint.h>
+const char mp_frozen_str_names[] = {
+"\0"};
+const uint32_t mp_frozen_str_sizes[] = {
+0};
+const char mp_frozen_str_content[] = {
+"\0"};
+//
+// Content for MICROPY_MODULE_FROZEN_MPY
+//
+#include "py/mpconfig.h"
+#include "py/objint.h"
+#include "py/objstr.h"
+#include "py/emitglue.h"
+#include "py/nativeglue.h"
+
+#if MICROPY_LONGINT_IMPL != 2
+#error "incompatible MICROPY_LONGINT_IMPL"
+#endif
+
+#if MPZ_DIG_SIZE != 16
+#error "incompatible MPZ_DIG_SIZE"
+#endif
+
+#if MICROPY_PY_BUILTINS_FLOAT
+typedef struct _mp_obj_float_t {
+    mp_obj_base_t base;
+    mp_float_t value;
+} mp_obj_float_t;
+#endif
+
+#if MICROPY_PY_BUILTINS_COMPLEX
+typedef struct _mp_obj_complex_t {
+    mp_obj_base_t base;
+    mp_float_t real;
+    mp_float_t imag;
+} mp_obj_complex_t;
+#endif
+
+enum {
+    MP_QSTR_upip_dot_py = MP_QSTRnumber_of,
+    MP_QSTR_os,
+    MP_QSTR_json,
+    MP_QSTR_upip_utarfile,
+    MP_QSTR_tarfile,
+    MP_QSTR_debug,
+    MP_QSTR_index_urls,
+    MP_QSTR_install_path,
+    MP_QSTR_cleanup_files,
+    MP_QSTR_gzdict_sz,
+    MP_QSTR_file_buf,
+    MP_QSTR_NotFoundError,
+    MP_QSTR_op_split,
+    MP_QSTR_op_basename,
+    MP_QSTR__makedirs,
+    MP_QSTR_save_file,
+    MP_QSTR_install_tar,
+    MP_QSTR_expandhome,
+    MP_QSTR_ussl,
+    MP_QSTR_warn_ussl,
+    MP_QSTR_url_open,
+    MP_QSTR_get_pkg_metadata,
+    MP_QSTR_fatal,
+    MP_QSTR_install_pkg,
+    MP_QSTR_install,
+    MP_QSTR_get_install_path,
+    MP_QSTR_cleanup,
+    MP_QSTR_wb,
+    MP_QSTR_fname,
+    MP_QSTR_subf,
+    MP_QSTR_setup_dot_,
+    MP_QSTR_PKG_hyphen_INFO,
+    MP_QSTR_README,
+    MP_QSTR__dot_egg_hyphen_info,
+    MP_QSTR_extractfile,
+    MP_QSTR_deps,
+    MP_QSTR_Skipping,
+    MP_QSTR_DIRTYPE,
+    MP_QSTR_f,
+    MP_QSTR_prefix,
+    MP_QSTR__tilde__slash_,
+    MP_QSTR_HOME,
+    MP_QSTR_s,
+    MP_QSTR__colon_,
+    MP_QSTR_https_colon_,
+    MP_QSTR_wrap_socket,
+    MP_QSTR_server_hostname,
+    MP_QSTR_url,
+    MP_QSTR__percent_s_slash__percent_s_slash_json,
+    MP_QSTR_Error_colon_,
+    MP_QSTR_msg,
+    MP_QSTR_exc,
+    MP_QSTR_info,
+    MP_QSTR_releases,
+    MP_QSTR_TarFile,
+    MP_QSTR_fileobj,
+    MP_QSTR_pkg_spec,
+    MP_QSTR_Queue_colon_,
+    MP_QSTR_to_install,
+    MP_QSTR_unlink,
+    MP_QSTR__hyphen_h,
+    MP_QSTR__hyphen__hyphen_help,
+    MP_QSTR__hyphen_p,
+    MP_QSTR__hyphen_r,
+    MP_QSTR__hash_,
+    MP_QSTR__hyphen_i,
+    MP_QSTR__hyphen__hyphen_debug,
+    MP_QSTR__hyphen_,
+    MP_QSTR_upip_utarfile_dot_py,
+    MP_QSTR_size,
+    MP_QSTR_TAR_HEADER,
+    MP_QSTR_REGTYPE,
+    MP_QSTR_roundup,
+    MP_QSTR_FileSection,
+    MP_QSTR_TarInfo,
+    MP_QSTR_val,
+    MP_QSTR_align,
+    MP_QSTR_skip,
+    MP_QSTR_content_len,
+    MP_QSTR_aligned_len,
+    MP_QSTR_sz,
+    MP_QSTR_buf,
+    MP_QSTR_rb,
+    MP_QSTR__0x00_,
+    MP_QSTR_tarinfo,
+};
+
+#if MICROPY_OPT_QSTR_HASH_INDEX
+static const uint16_t mp_qstr_frozen_const_hash_index[] = {
+    7,
+    9,
+    10,
+    37,
+    11,
+    8,
+    51,
+    26,
+    29,
+    72,
+    48,
+    39,
+    70,
+    79,
+    50,
+    17,
+    81,
+    55,
+    49,
+    73,
+    5,
+    28,
+    13,
+    30,
+    74,
+    84,
+    33,
+    47,
+    60,
+    65,
+    62,
+    63,
+    57,
+    61,
+    1,
+    27,
+    82,
+    80,
+    40,
+    78,
+    41,
+    21,
+    6,
+    75,
+    3,
+    68,
+    53,
+    59,
+    56,
+    66,
+    34,
+    15,
+    0,
+    69,
+    14,
+    31,
+    19,
+    77,
+    52,
+    64,
+    67,
+    43,
+    83,
+    38,
+    42,
+    23,
+    12,
+    4,
+    16,
+    36,
+    22,
+    71,
+    2,
+    24,
+    32,
+    35,
+    46,
+    18,
+    45,
+    58,
+    25,
+    44,
+    20,
+    76,
+    54,
+};
+#endif
+
+extern const qstr_pool_t mp_qstr_const_pool;
+const qstr_pool_t mp_qstr_frozen_const_pool = {
+    (qstr_pool_t*)&mp_qstr_const_pool, // previous pool
+    MP_QSTRnumber_of, // previous pool size
+    10, // allocated entries
+    85, // used entries
+    #if MICROPY_OPT_QSTR_HASH_INDEX
+    0, // hash index is sorted
+    mp_qstr_frozen_const_hash_index,
+    #endif
+    {
+        (const byte*)"\x9e\xa2\x07" "upip.py",
+        (const byte*)"\x79\x6f\x02" "os",
+        (const byte*)"\xfd\xd1\x04" "json",
+        (const byte*)"\x32\x80\x0d" "upip_utarfile",
+        (const byte*)"\x24\xc0\x07" "tarfile",
+        (const byte*)"\xd4\x55\x05" "debug",
+        (const byte*)"\x7c\x79\x0a" "index_urls",
+        (const byte*)"\x56\x0a\x0c" "install_path",
+        (const byte*)"\x8f\x1f\x0d" "cleanup_files",
+        (const byte*)"\x34\x14\x09" "gzdict_sz",
+        (const byte*)"\xed\x15\x08" "file_buf",
+        (const byte*)"\x9e\x1a\x0d" "NotFoundError",
+        (const byte*)"\xd7\xb9\x08" "op_split",
+        (const byte*)"\xb7\x56\x0b" "op_basename",
+        (const byte*)"\xb4\xa9\x09" "_makedirs",
+        (const byte*)"\xbd\xa0\x09" "save_file",
+        (const byte*)"\x7c\xcb\x0b" "install_tar",
+        (const byte*)"\x4c\x47\x0a" "expandhome",
+        (const byte*)"\x1c\xf2\x04" "ussl",
+        (const byte*)"\x49\xae\x09" "warn_ussl",
+        (const byte*)"\xc5\xfa\x08" "url_open",
+        (const byte*)"\xa2\x78\x10" "get_pkg_metadata",
+        (const byte*)"\xdb\xd0\x05" "fatal",
+        (const byte*)"\xa7\xb8\x0b" "install_pkg",
+        (const byte*)"\x04\xdb\x07" "install",
+        (const byte*)"\xdf\xf8\x10" "get_install_path",
+        (const byte*)"\xc5\x2e\x07" "cleanup",
+        (const byte*)"\x70\x70\x02" "wb",
+        (const byte*)"\xe4\x55\x05" "fname",
+        (const byte*)"\x27\x31\x04" "subf",
+        (const byte*)"\x2c\x5b\x06" "setup.",
+        (const byte*)"\xfa\xaa\x08" "PKG-INFO",
+        (const byte*)"\x5f\xeb\x06" "README",
+        (const byte*)"\x2d\x61\x09" ".egg-info",
+        (const byte*)"\xae\x9d\x0b" "extractfile",
+        (const byte*)"\x87\xec\x04" "deps",
+        (const byte*)"\x34\xd0\x08" "Skipping",
+        (const byte*)"\x42\x17\x07" "DIRTYPE",
+        (const byte*)"\xc3\xb5\x01" "f",
+        (const byte*)"\x95\x3e\x06" "prefix",
+        (const byte*)"\x14\x71\x02" "~/",
+        (const byte*)"\x6a\x76\x04" "HOME",
+        (const byte*)"\xd6\xb5\x01" "s",
+        (const byte*)"\x9f\xb5\x01" ":",
+        (const byte*)"\x34\xf9\x06" "https:",
+        (const byte*)"\xcb\xf3\x0b" "wrap_socket",
+        (const byte*)"\x58\xef\x0f" "server_hostname",
+        (const byte*)"\x8e\x63\x03" "url",
+        (const byte*)"\xdd\x3c\x0a" "%s/%s/json",
+        (const byte*)"\x47\x4d\x06" "Error:",
+        (const byte*)"\x7c\x46\x03" "msg",
+        (const byte*)"\xdb\x24\x03" "exc",
+        (const byte*)"\xeb\xb3\x04" "info",
+        (const byte*)"\x1f\x8d\x08" "releases",
+        (const byte*)"\x64\xfd\x07" "TarFile",
+        (const byte*)"\x04\x4c\x07" "fileobj",
+        (const byte*)"\x43\x9a\x08" "pkg_spec",
+        (const byte*)"\x0e\x69\x06" "Queue:",
+        (const byte*)"\x80\xf8\x0a" "to_install",
+        (const byte*)"\xfe\x8f\x06" "unlink",
+        (const byte*)"\xe0\x66\x02" "-h",
+        (const byte*)"\x34\x6e\x06" "--help",
+        (const byte*)"\xf8\x66\x02" "-p",
+        (const byte*)"\xfa\x66\x02" "-r",
+        (const byte*)"\x86\xb5\x01" "#",
+        (const byte*)"\xe1\x66\x02" "-i",
+        (const byte*)"\x34\x9b\x07" "--debug",
+        (const byte*)"\x88\xb5\x01" "-",
+        (const byte*)"\x55\x87\x10" "upip_utarfile.py",
+        (const byte*)"\x20\xa5\x04" "size",
+        (const byte*)"\x82\x45\x0a" "TAR_HEADER",
+        (const byte*)"\xcd\xd1\x07" "REGTYPE",
+        (const byte*)"\x82\x38\x07" "roundup",
+        (const byte*)"\x0a\x55\x0b" "FileSection",
+        (const byte*)"\x4c\x5c\x07" "TarInfo",
+        (const byte*)"\xfe\x7a\x03" "val",
+        (const byte*)"\xa8\xfb\x05" "align",
+        (const byte*)"\x04\xaf\x04" "skip",
+        (const byte*)"\x54\x75\x0b" "content_len",
+        (const byte*)"\xb1\x45\x0b" "aligned_len",
+        (const byte*)"\xec\x70\x02" "sz",
+        (const byte*)"\x74\x49\x03" "buf",
+        (const byte*)"\xd5\x70\x02" "rb",
+        (const byte*)"\xa5\xb5\x01" "\x00",
+        (const byte*)"\x0c\x60\x07" "tarinfo",
+    },
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__NotFoundError
+STATIC const byte fun_data_upip__lt_module_gt__NotFoundError[23] = {
+    0x00, 0x0e,
+    MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x8c, 0x1c, 0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__NotFoundError = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__NotFoundError,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 23,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_NotFoundError,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__NotFoundError + 6,
+        .opcodes = fun_data_upip__lt_module_gt__NotFoundError + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__op_split
+STATIC const byte fun_data_upip__lt_module_gt__op_split[82] = {
+    0x31, 0x1e,
+    MP_QSTR_op_split & 0xff, MP_QSTR_op_split >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x20, 0x28, 0x29, 0x2b, 0x2b, 0x27, 0x24, 0x24, 0x24, 0x00,
+    0xb0, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xd9, 
+    0x44, 0x09, 0x80, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x2a, 0x02, 
+    0x63, 
+    0xb0, 
+    0x14, MP_QSTR_rsplit & 0xff, MP_QSTR_rsplit >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x81, 
+    0x36, 0x02, 
+    0xc1, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x81, 
+    0xd9, 
+    0x44, 0x07, 0x80, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xb0, 
+    0x2a, 0x02, 
+    0x63, 
+    0xb1, 
+    0x80, 
+    0x55, 
+    0xc2, 
+    0xb2, 
+    0x43, 0x04, 0x80, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xc2, 
+    0xb2, 
+    0xb1, 
+    0x81, 
+    0x55, 
+    0x2a, 0x02, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__op_split[1] = {
+    MP_ROM_QSTR(MP_QSTR_path),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__op_split = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__op_split,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__op_split,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 82,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_op_split,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__op_split + 6,
+        .opcodes = fun_data_upip__lt_module_gt__op_split + 17,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__op_basename
+STATIC const byte fun_data_upip__lt_module_gt__op_basename[18] = {
+    0x11, 0x0e,
+    MP_QSTR_op_basename & 0xff, MP_QSTR_op_basename >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x2c, 0x00,
+    0x12, MP_QSTR_op_split & 0xff, MP_QSTR_op_split >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x81, 
+    0x55, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__op_basename[1] = {
+    MP_ROM_QSTR(MP_QSTR_path),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__op_basename = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__op_basename,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__op_basename,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_op_basename,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__op_basename + 6,
+        .opcodes = fun_data_upip__lt_module_gt__op_basename + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt___makedirs
+STATIC const byte fun_data_upip__lt_module_gt___makedirs[175] = {
+    0x82, 0x13, 0x2c,
+    MP_QSTR__makedirs & 0xff, MP_QSTR__makedirs >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x31, 0x22, 0x24, 0x37, 0x2a, 0x24, 0x26, 0x2e, 0x26, 0x24, 0x23, 0x2a, 0x51, 0x3c, 0x22, 0x2f, 0x00,
+    0x50, 
+    0xc2, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xc3, 
+    0xb0, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x36, 0x01, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x36, 0x01, 
+    0x51, 
+    0x7f, 
+    0x2e, 0x02, 
+    0x55, 
+    0xc4, 
+    0xb4, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xd9, 
+    0x44, 0x04, 0x80, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xc3, 
+    0xb4, 
+    0x5f, 
+    0x4b, 0x64, 0x00, 
+    0xc5, 
+    0xb3, 
+    0x44, 0x10, 0x80, 
+    0xb3, 
+    0x7f, 
+    0x55, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xdc, 
+    0x44, 0x06, 0x80, 
+    0xb3, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xe5, 
+    0xc3, 
+    0xb3, 
+    0xb5, 
+    0xe5, 
+    0xc3, 
+    0x48, 0x0f, 0x00, 
+    0x12, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x14, MP_QSTR_mkdir & 0xff, MP_QSTR_mkdir >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x59, 
+    0x52, 
+    0xc2, 
+    0x4a, 0x36, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x2d, 0x80, 
+    0xc6, 
+    0x49, 0x21, 0x00, 
+    0xb6, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x13, MP_QSTR_EEXIST & 0xff, MP_QSTR_EEXIST >> 8, 
+    0xdc, 
+    0x44, 0x10, 0x80, 
+    0xb6, 
+    0x13, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x12, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x13, MP_QSTR_EISDIR & 0xff, MP_QSTR_EISDIR >> 8, 
+    0xdc, 
+    0x44, 0x02, 0x80, 
+    0xb6, 
+    0x65, 
+    0x50, 
+    0xc2, 
+    0x51, 
+    0x51, 
+    0xc6, 
+    0x28, 0x06, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x42, 0x99, 0x7f, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt___makedirs[2] = {
+    MP_ROM_QSTR(MP_QSTR_name),
+    MP_ROM_QSTR(MP_QSTR_mode),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt___makedirs = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt___makedirs,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt___makedirs,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 175,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 17,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR__makedirs,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt___makedirs + 7,
+        .opcodes = fun_data_upip__lt_module_gt___makedirs + 25,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__save_file
+STATIC const byte fun_data_upip__lt_module_gt__save_file[64] = {
+    0x4e, 0x1a,
+    MP_QSTR_save_file & 0xff, MP_QSTR_save_file >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x45, 0x20, 0x2d, 0x20, 0x2a, 0x24, 0x23, 0x00,
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb0, 
+    0x10, MP_QSTR_wb & 0xff, MP_QSTR_wb >> 8, 
+    0x34, 0x02, 
+    0x47, 0x21, 0x00, 
+    0xc2, 
+    0xb1, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0x12, MP_QSTR_file_buf & 0xff, MP_QSTR_file_buf >> 8, 
+    0x36, 0x01, 
+    0xc3, 
+    0xb3, 
+    0x43, 0x03, 0x80, 
+    0x42, 0x0e, 0x80, 
+    0xb2, 
+    0x14, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0x12, MP_QSTR_file_buf & 0xff, MP_QSTR_file_buf >> 8, 
+    0xb3, 
+    0x36, 0x02, 
+    0x59, 
+    0x42, 0xe1, 0x7f, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__save_file[2] = {
+    MP_ROM_QSTR(MP_QSTR_fname),
+    MP_ROM_QSTR(MP_QSTR_subf),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__save_file = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__save_file,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__save_file,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 64,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_save_file,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__save_file + 6,
+        .opcodes = fun_data_upip__lt_module_gt__save_file + 15,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__install_tar
+STATIC const byte fun_data_upip__lt_module_gt__install_tar[245] = {
+    0x9e, 0x10, 0x3c,
+    MP_QSTR_install_tar & 0xff, MP_QSTR_install_tar >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x4f, 0x23, 0x46, 0x25, 0x23, 0x5d, 0x48, 0x22, 0x50, 0x32, 0x2b, 0x31, 0x22, 0x26, 0x2a, 0x4a, 0x24, 0x24, 0x2e, 0x26, 0x2a, 0x27, 0x28, 0x2b, 0x00,
+    0x2c, 0x00, 
+    0xc2, 
+    0xb0, 
+    0x5f, 
+    0x4b, 0xca, 0x00, 
+    0xc3, 
+    0xb3, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0xc4, 
+    0x48, 0x14, 0x00, 
+    0xb4, 
+    0xb4, 
+    0x14, MP_QSTR_index & 0xff, MP_QSTR_index >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x36, 0x01, 
+    0x81, 
+    0xf2, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0xc4, 
+    0x4a, 0x11, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0xdf, 
+    0x44, 0x08, 0x80, 
+    0x59, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0xc4, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x52, 
+    0xc5, 
+    0x10, MP_QSTR_setup_dot_ & 0xff, MP_QSTR_setup_dot_ >> 8, 
+    0x10, MP_QSTR_PKG_hyphen_INFO & 0xff, MP_QSTR_PKG_hyphen_INFO >> 8, 
+    0x10, MP_QSTR_README & 0xff, MP_QSTR_README >> 8, 
+    0x2a, 0x03, 
+    0x5f, 
+    0x4b, 0x4b, 0x00, 
+    0xc6, 
+    0xb4, 
+    0x14, MP_QSTR_startswith & 0xff, MP_QSTR_startswith >> 8, 
+    0xb6, 
+    0x36, 0x01, 
+    0x43, 0x08, 0x80, 
+    0x10, MP_QSTR__dot_egg_hyphen_info & 0xff, MP_QSTR__dot_egg_hyphen_info >> 8, 
+    0xb4, 
+    0xdd, 
+    0x44, 0x35, 0x80, 
+    0xb4, 
+    0x14, MP_QSTR_endswith & 0xff, MP_QSTR_endswith >> 8, 
+    0x23, 0x02, 
+    0x36, 0x01, 
+    0x44, 0x11, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x36, 0x00, 
+    0xb2, 
+    0x10, MP_QSTR_deps & 0xff, MP_QSTR_deps >> 8, 
+    0x56, 
+    0x50, 
+    0xc5, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x10, MP_QSTR_Skipping & 0xff, MP_QSTR_Skipping >> 8, 
+    0xb4, 
+    0x34, 0x02, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x59, 
+    0x42, 0x03, 0x80, 
+    0x42, 0xb2, 0x7f, 
+    0xb5, 
+    0x44, 0x39, 0x80, 
+    0xb1, 
+    0xb4, 
+    0xf2, 
+    0xc7, 
+    0xb3, 
+    0x13, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0x12, MP_QSTR_tarfile & 0xff, MP_QSTR_tarfile >> 8, 
+    0x13, MP_QSTR_DIRTYPE & 0xff, MP_QSTR_DIRTYPE >> 8, 
+    0xdc, 
+    0x44, 0x27, 0x80, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x03, 
+    0xb7, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR__makedirs & 0xff, MP_QSTR__makedirs >> 8, 
+    0xb7, 
+    0x34, 0x01, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8, 
+    0xb3, 
+    0x36, 0x01, 
+    0xc8, 
+    0x12, MP_QSTR_save_file & 0xff, MP_QSTR_save_file >> 8, 
+    0xb7, 
+    0xb8, 
+    0x34, 0x02, 
+    0x59, 
+    0x42, 0x33, 0x7f, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_tar_0 = {{&mp_type_str}, 36962, 13, (const byte*)"\x2f\x72\x65\x71\x75\x69\x72\x65\x73\x2e\x74\x78\x74"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_tar_1 = {{&mp_type_str}, 56712, 11, (const byte*)"\x45\x78\x74\x72\x61\x63\x74\x69\x6e\x67\x20"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__install_tar[4] = {
+    MP_ROM_QSTR(MP_QSTR_f),
+    MP_ROM_QSTR(MP_QSTR_prefix),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_tar_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_tar_1),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__install_tar = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__install_tar,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__install_tar,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 245,
+    .n_obj = 2,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 20,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_install_tar,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__install_tar + 7,
+        .opcodes = fun_data_upip__lt_module_gt__install_tar + 33,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__expandhome
+STATIC const byte fun_data_upip__lt_module_gt__expandhome[49] = {
+    0x31, 0x14,
+    MP_QSTR_expandhome & 0xff, MP_QSTR_expandhome >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x6f, 0x28, 0x2c, 0x2f, 0x00,
+    0x10, MP_QSTR__tilde__slash_ & 0xff, MP_QSTR__tilde__slash_ >> 8, 
+    0xb0, 
+    0xdd, 
+    0x44, 0x1b, 0x80, 
+    0x12, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x14, MP_QSTR_getenv & 0xff, MP_QSTR_getenv >> 8, 
+    0x10, MP_QSTR_HOME & 0xff, MP_QSTR_HOME >> 8, 
+    0x36, 0x01, 
+    0xc1, 
+    0xb0, 
+    0x14, MP_QSTR_replace & 0xff, MP_QSTR_replace >> 8, 
+    0x10, MP_QSTR__tilde__slash_ & 0xff, MP_QSTR__tilde__slash_ >> 8, 
+    0xb1, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xf2, 
+    0x36, 0x02, 
+    0xc0, 
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__expandhome[1] = {
+    MP_ROM_QSTR(MP_QSTR_s),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__expandhome = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__expandhome,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__expandhome,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 49,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 7,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_expandhome,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__expandhome + 6,
+        .opcodes = fun_data_upip__lt_module_gt__expandhome + 12,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__url_open
+STATIC const byte fun_data_upip__lt_module_gt__url_open[381] = {
+    0x91, 0x12, 0x56,
+    MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x7c, 0x40, 0x26, 0x47, 0x30, 0x23, 0x24, 0x28, 0x2d, 0x27, 0x1f, 0x42, 0x55, 0x44, 0x32, 0x43, 0x4a, 0x28, 0x2f, 0x26, 0x2a, 0x64, 0x2f, 0x27, 0x2d, 0x27, 0x2e, 0x28, 0x27, 0x20, 0x27, 0x24, 0x28, 0x27, 0x55, 0x27, 0x4c, 0x00,
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x07, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0x83, 
+    0x36, 0x02, 
+    0x30, 0x04, 
+    0xc1, 
+    0xc2, 
+    0xc3, 
+    0xc4, 
+    0x48, 0x35, 0x00, 
+    0x22, 0x83, 0x3b, 
+    0xc5, 
+    0x10, MP_QSTR__colon_ & 0xff, MP_QSTR__colon_ >> 8, 
+    0xb3, 
+    0xdd, 
+    0x44, 0x14, 0x80, 
+    0xb3, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__colon_ & 0xff, MP_QSTR__colon_ >> 8, 
+    0x36, 0x01, 
+    0x30, 0x02, 
+    0xc3, 
+    0xc5, 
+    0x12, MP_QSTR_int & 0xff, MP_QSTR_int >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0xc5, 
+    0x12, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x14, MP_QSTR_getaddrinfo & 0xff, MP_QSTR_getaddrinfo >> 8, 
+    0xb3, 
+    0xb5, 
+    0x80, 
+    0x12, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x13, MP_QSTR_SOCK_STREAM & 0xff, MP_QSTR_SOCK_STREAM >> 8, 
+    0x36, 0x04, 
+    0xc6, 
+    0x4a, 0x21, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x18, 0x80, 
+    0xc7, 
+    0x49, 0x0c, 0x00, 
+    0x12, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x23, 0x01, 
+    0xb3, 
+    0xf8, 
+    0xb7, 
+    0x34, 0x02, 
+    0x59, 
+    0x51, 
+    0x51, 
+    0xc7, 
+    0x28, 0x07, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb6, 
+    0x80, 
+    0x55, 
+    0xc6, 
+    0x12, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x14, MP_QSTR_socket & 0xff, MP_QSTR_socket >> 8, 
+    0xb6, 
+    0x80, 
+    0x55, 
+    0xb6, 
+    0x81, 
+    0x55, 
+    0xb6, 
+    0x82, 
+    0x55, 
+    0x36, 0x03, 
+    0xc8, 
+    0x48, 0x9f, 0x00, 
+    0xb8, 
+    0x14, MP_QSTR_connect & 0xff, MP_QSTR_connect >> 8, 
+    0xb6, 
+    0x7f, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0xb1, 
+    0x10, MP_QSTR_https_colon_ & 0xff, MP_QSTR_https_colon_ >> 8, 
+    0xd9, 
+    0x44, 0x23, 0x80, 
+    0x12, MP_QSTR_ussl & 0xff, MP_QSTR_ussl >> 8, 
+    0x14, MP_QSTR_wrap_socket & 0xff, MP_QSTR_wrap_socket >> 8, 
+    0xb8, 
+    0x10, MP_QSTR_server_hostname & 0xff, MP_QSTR_server_hostname >> 8, 
+    0xb3, 
+    0x36, 0x82, 0x01, 
+    0xc8, 
+    0x12, MP_QSTR_warn_ussl & 0xff, MP_QSTR_warn_ussl >> 8, 
+    0x44, 0x0e, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0xb3, 
+    0xf8, 
+    0x34, 0x01, 
+    0x59, 
+    0x50, 
+    0x17, MP_QSTR_warn_ussl & 0xff, MP_QSTR_warn_ussl >> 8, 
+    0xb8, 
+    0x14, MP_QSTR_write & 0xff, MP_QSTR_write >> 8, 
+    0x23, 0x03, 
+    0xb4, 
+    0xb3, 
+    0xb5, 
+    0x2a, 0x03, 
+    0xf8, 
+    0x36, 0x01, 
+    0x59, 
+    0xb8, 
+    0x14, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x36, 0x00, 
+    0xc9, 
+    0xb9, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x51, 
+    0x82, 
+    0x36, 0x02, 
+    0x30, 0x03, 
+    0xca, 
+    0xcb, 
+    0xcc, 
+    0xbb, 
+    0x23, 0x04, 
+    0xdc, 
+    0x44, 0x1d, 0x80, 
+    0xbb, 
+    0x23, 0x05, 
+    0xd9, 
+    0x43, 0x07, 0x80, 
+    0xbb, 
+    0x23, 0x06, 
+    0xd9, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x23, 0x07, 
+    0x34, 0x01, 
+    0x65, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0xbb, 
+    0x34, 0x01, 
+    0x65, 
+    0xb8, 
+    0x14, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x36, 0x00, 
+    0xc9, 
+    0xb9, 
+    0x43, 0x08, 0x80, 
+    0x12, MP_QSTR_ValueError & 0xff, MP_QSTR_ValueError >> 8, 
+    0x23, 0x08, 
+    0x34, 0x01, 
+    0x65, 
+    0xb9, 
+    0x23, 0x09, 
+    0xd9, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x03, 0x80, 
+    0x42, 0xe0, 0x7f, 
+    0x4a, 0x1f, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0xdf, 
+    0x44, 0x16, 0x80, 
+    0xc7, 
+    0x49, 0x0a, 0x00, 
+    0xb8, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb7, 
+    0x65, 
+    0x51, 
+    0x51, 
+    0xc7, 
+    0x28, 0x07, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0xb8, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_0 = {{&mp_type_str}, 10889, 35, (const byte*)"\x55\x6e\x61\x62\x6c\x65\x20\x74\x6f\x20\x72\x65\x73\x6f\x6c\x76\x65\x20\x25\x73\x20\x28\x6e\x6f\x20\x49\x6e\x74\x65\x72\x6e\x65\x74\x3f\x29"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_1 = {{&mp_type_str}, 51159, 44, (const byte*)"\x57\x61\x72\x6e\x69\x6e\x67\x3a\x20\x25\x73\x20\x53\x53\x4c\x20\x63\x65\x72\x74\x69\x66\x69\x63\x61\x74\x65\x20\x69\x73\x20\x6e\x6f\x74\x20\x76\x61\x6c\x69\x64\x61\x74\x65\x64"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_2 = {{&mp_type_str}, 65109, 33, (const byte*)"\x47\x45\x54\x20\x2f\x25\x73\x20\x48\x54\x54\x50\x2f\x31\x2e\x30\x0d\x0a\x48\x6f\x73\x74\x3a\x20\x25\x73\x3a\x25\x73\x0d\x0a\x0d\x0a"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_3 = {{&mp_type_bytes}, 28951, 3, (const byte*)"\x32\x30\x30"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_4 = {{&mp_type_bytes}, 22421, 3, (const byte*)"\x34\x30\x34"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_5 = {{&mp_type_bytes}, 29975, 3, (const byte*)"\x33\x30\x31"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_6 = {{&mp_type_str}, 48284, 17, (const byte*)"\x50\x61\x63\x6b\x61\x67\x65\x20\x6e\x6f\x74\x20\x66\x6f\x75\x6e\x64"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_7 = {{&mp_type_str}, 39199, 30, (const byte*)"\x55\x6e\x65\x78\x70\x65\x63\x74\x65\x64\x20\x45\x4f\x46\x20\x69\x6e\x20\x48\x54\x54\x50\x20\x68\x65\x61\x64\x65\x72\x73"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__url_open_8 = {{&mp_type_bytes}, 27298, 2, (const byte*)"\x0d\x0a"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__url_open[10] = {
+    MP_ROM_QSTR(MP_QSTR_url),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_1),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_2),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_3),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_4),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_5),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_6),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_7),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__url_open_8),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__url_open = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__url_open,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__url_open,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 381,
+    .n_obj = 9,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 19,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_url_open,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__url_open + 7,
+        .opcodes = fun_data_upip__lt_module_gt__url_open + 46,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__get_pkg_metadata
+STATIC const byte fun_data_upip__lt_module_gt__get_pkg_metadata[96] = {
+    0x65, 0x1c,
+    MP_QSTR_get_pkg_metadata & 0xff, MP_QSTR_get_pkg_metadata >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xae, 0x28, 0x23, 0x5a, 0x28, 0x23, 0x4b, 0x2b, 0x00,
+    0x12, MP_QSTR_index_urls & 0xff, MP_QSTR_index_urls >> 8, 
+    0x5f, 
+    0x4b, 0x3f, 0x00, 
+    0xc1, 
+    0x48, 0x11, 0x00, 
+    0x12, MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8, 
+    0x10, MP_QSTR__percent_s_slash__percent_s_slash_json & 0xff, MP_QSTR__percent_s_slash__percent_s_slash_json >> 8, 
+    0xb1, 
+    0xb0, 
+    0x2a, 0x02, 
+    0xf8, 
+    0x34, 0x01, 
+    0xc2, 
+    0x4a, 0x11, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0xdf, 
+    0x44, 0x08, 0x80, 
+    0x59, 
+    0x40, 0xdc, 0x7f, 0x01, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x49, 0x0b, 0x00, 
+    0x12, MP_QSTR_json & 0xff, MP_QSTR_json >> 8, 
+    0x14, MP_QSTR_load & 0xff, MP_QSTR_load >> 8, 
+    0xb2, 
+    0x36, 0x01, 
+    0x63, 
+    0x51, 
+    0xb2, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x5d, 
+    0x42, 0xbe, 0x7f, 
+    0x12, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x23, 0x01, 
+    0x34, 0x01, 
+    0x65, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__get_pkg_metadata_0 = {{&mp_type_str}, 48284, 17, (const byte*)"\x50\x61\x63\x6b\x61\x67\x65\x20\x6e\x6f\x74\x20\x66\x6f\x75\x6e\x64"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__get_pkg_metadata[2] = {
+    MP_ROM_QSTR(MP_QSTR_name),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__get_pkg_metadata_0),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__get_pkg_metadata = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip__lt_module_gt__get_pkg_metadata,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__get_pkg_metadata,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 96,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 13,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_pkg_metadata,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__get_pkg_metadata + 6,
+        .opcodes = fun_data_upip__lt_module_gt__get_pkg_metadata + 16,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__fatal
+STATIC const byte fun_data_upip__lt_module_gt__fatal[47] = {
+    0xa2, 0x01, 0x14,
+    MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xbb, 0x2a, 0x2a, 0x22, 0x00,
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x10, MP_QSTR_Error_colon_ & 0xff, MP_QSTR_Error_colon_ >> 8, 
+    0xb0, 
+    0x34, 0x02, 
+    0x59, 
+    0xb1, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x02, 0x80, 
+    0xb1, 
+    0x65, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x14, MP_QSTR_exit & 0xff, MP_QSTR_exit >> 8, 
+    0x81, 
+    0x36, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__fatal[2] = {
+    MP_ROM_QSTR(MP_QSTR_msg),
+    MP_ROM_QSTR(MP_QSTR_exc),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__fatal = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__fatal,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__fatal,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 47,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_fatal,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__fatal + 7,
+        .opcodes = fun_data_upip__lt_module_gt__fatal + 13,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__install_pkg
+STATIC const byte fun_data_upip__lt_module_gt__install_pkg[177] = {
+    0x8e, 0x10, 0x32,
+    MP_QSTR_install_pkg & 0xff, MP_QSTR_install_pkg >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xc2, 0x47, 0x2a, 0x28, 0x22, 0x29, 0x2f, 0x28, 0x2e, 0x27, 0x27, 0x23, 0x2d, 0x2e, 0x49, 0x28, 0x22, 0x22, 0x29, 0x00,
+    0x12, MP_QSTR_get_pkg_metadata & 0xff, MP_QSTR_get_pkg_metadata >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0xc2, 
+    0xb2, 
+    0x10, MP_QSTR_info & 0xff, MP_QSTR_info >> 8, 
+    0x55, 
+    0x10, MP_QSTR_version & 0xff, MP_QSTR_version >> 8, 
+    0x55, 
+    0xc3, 
+    0xb2, 
+    0x10, MP_QSTR_releases & 0xff, MP_QSTR_releases >> 8, 
+    0x55, 
+    0xb3, 
+    0x55, 
+    0xc4, 
+    0x28, 0x02, 
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_collect & 0xff, MP_QSTR_collect >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb4, 
+    0x34, 0x01, 
+    0x81, 
+    0xd9, 
+    0x43, 0x04, 0x80, 
+    0x12, MP_QSTR_AssertionError & 0xff, MP_QSTR_AssertionError >> 8, 
+    0x65, 
+    0xb4, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR_url & 0xff, MP_QSTR_url >> 8, 
+    0x55, 
+    0xc5, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0xb0, 
+    0xb3, 
+    0xb5, 
+    0x2a, 0x03, 
+    0xf8, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_op_basename & 0xff, MP_QSTR_op_basename >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0xc6, 
+    0x12, MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0xc7, 
+    0x49, 0x24, 0x00, 
+    0x12, MP_QSTR_uzlib & 0xff, MP_QSTR_uzlib >> 8, 
+    0x14, MP_QSTR_DecompIO & 0xff, MP_QSTR_DecompIO >> 8, 
+    0xb7, 
+    0x12, MP_QSTR_gzdict_sz & 0xff, MP_QSTR_gzdict_sz >> 8, 
+    0x36, 0x02, 
+    0xc8, 
+    0x12, MP_QSTR_tarfile & 0xff, MP_QSTR_tarfile >> 8, 
+    0x14, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x10, MP_QSTR_fileobj & 0xff, MP_QSTR_fileobj >> 8, 
+    0xb8, 
+    0x36, 0x82, 0x00, 
+    0xc9, 
+    0x12, MP_QSTR_install_tar & 0xff, MP_QSTR_install_tar >> 8, 
+    0xb9, 
+    0xb1, 
+    0x34, 0x02, 
+    0xca, 
+    0x51, 
+    0xb7, 
+    0x14, MP_QSTR_close & 0xff, MP_QSTR_close >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x5d, 
+    0x28, 0x09, 
+    0x28, 0x08, 
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_collect & 0xff, MP_QSTR_collect >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xba, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_pkg_0 = {{&mp_type_str}, 7236, 24, (const byte*)"\x49\x6e\x73\x74\x61\x6c\x6c\x69\x6e\x67\x20\x25\x73\x20\x25\x73\x20\x66\x72\x6f\x6d\x20\x25\x73"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__install_pkg[3] = {
+    MP_ROM_QSTR(MP_QSTR_pkg_spec),
+    MP_ROM_QSTR(MP_QSTR_install_path),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_pkg_0),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__install_pkg = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__install_pkg,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__install_pkg,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 177,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 18,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_install_pkg,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__install_pkg + 7,
+        .opcodes = fun_data_upip__lt_module_gt__install_pkg + 28,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__install
+STATIC const byte fun_data_upip__lt_module_gt__install[299] = {
+    0xfa, 0x03, 0x48,
+    MP_QSTR_install & 0xff, MP_QSTR_install >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0xdb, 0x20, 0x32, 0x29, 0x44, 0x26, 0x26, 0x2a, 0x26, 0x2c, 0x24, 0x4a, 0x23, 0x23, 0x23, 0x26, 0x2a, 0x28, 0x26, 0x23, 0x28, 0x28, 0x26, 0x27, 0x32, 0x24, 0x32, 0x5b, 0x23, 0x2c, 0x00,
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_mem_free & 0xff, MP_QSTR_mem_free >> 8, 
+    0x36, 0x00, 
+    0x12, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_mem_alloc & 0xff, MP_QSTR_mem_alloc >> 8, 
+    0x36, 0x00, 
+    0xf2, 
+    0xc2, 
+    0xb2, 
+    0x22, 0x84, 0x80, 0x00, 
+    0xda, 
+    0x44, 0x04, 0x80, 
+    0x9c, 
+    0x17, MP_QSTR_gzdict_sz & 0xff, MP_QSTR_gzdict_sz >> 8, 
+    0xb1, 
+    0x51, 
+    0xde, 
+    0x44, 0x06, 0x80, 
+    0x12, MP_QSTR_get_install_path & 0xff, MP_QSTR_get_install_path >> 8, 
+    0x34, 0x00, 
+    0xc1, 
+    0xb1, 
+    0x7f, 
+    0x55, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xdc, 
+    0x44, 0x06, 0x80, 
+    0xb1, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xe5, 
+    0xc1, 
+    0x12, MP_QSTR_isinstance & 0xff, MP_QSTR_isinstance >> 8, 
+    0xb0, 
+    0x12, MP_QSTR_list & 0xff, MP_QSTR_list >> 8, 
+    0x34, 0x02, 
+    0x43, 0x04, 0x80, 
+    0xb0, 
+    0x2b, 0x01, 
+    0xc0, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0xb1, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0x2b, 0x00, 
+    0xc3, 
+    0x48, 0x78, 0x00, 
+    0x42, 0x6e, 0x80, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x0a, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x10, MP_QSTR_Queue_colon_ & 0xff, MP_QSTR_Queue_colon_ >> 8, 
+    0xb0, 
+    0x34, 0x02, 
+    0x59, 
+    0xb0, 
+    0x14, MP_QSTR_pop & 0xff, MP_QSTR_pop >> 8, 
+    0x80, 
+    0x36, 0x01, 
+    0xc4, 
+    0xb4, 
+    0xb3, 
+    0xdd, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x4d, 0x80, 
+    0x12, MP_QSTR_install_pkg & 0xff, MP_QSTR_install_pkg >> 8, 
+    0xb4, 
+    0xb1, 
+    0x34, 0x02, 
+    0xc5, 
+    0xb3, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb4, 
+    0x36, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x44, 0x07, 0x80, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0xb5, 
+    0x34, 0x01, 
+    0x59, 
+    0xb5, 
+    0x14, MP_QSTR_get & 0xff, MP_QSTR_get >> 8, 
+    0x10, MP_QSTR_deps & 0xff, MP_QSTR_deps >> 8, 
+    0x10, MP_QSTR_ & 0xff, MP_QSTR_ >> 8, 
+    0x36, 0x02, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x36, 0x00, 
+    0xc6, 
+    0xb6, 
+    0x44, 0x1a, 0x80, 
+    0xb6, 
+    0x14, MP_QSTR_decode & 0xff, MP_QSTR_decode >> 8, 
+    0x10, MP_QSTR_utf_hyphen_8 & 0xff, MP_QSTR_utf_hyphen_8 >> 8, 
+    0x36, 0x01, 
+    0x14, MP_QSTR_split & 0xff, MP_QSTR_split >> 8, 
+    0x10, MP_QSTR__0x0a_ & 0xff, MP_QSTR__0x0a_ >> 8, 
+    0x36, 0x01, 
+    0xc6, 
+    0xb0, 
+    0x14, MP_QSTR_extend & 0xff, MP_QSTR_extend >> 8, 
+    0xb6, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x43, 0x8e, 0x7f, 
+    0x4a, 0x2f, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0xdf, 
+    0x44, 0x26, 0x80, 
+    0xc7, 
+    0x49, 0x1a, 0x00, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x03, 
+    0x14, MP_QSTR_format & 0xff, MP_QSTR_format >> 8, 
+    0xb4, 
+    0xb7, 
+    0x36, 0x02, 
+    0x10, MP_QSTR_file & 0xff, MP_QSTR_file >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_stderr & 0xff, MP_QSTR_stderr >> 8, 
+    0x34, 0x82, 0x01, 
+    0x59, 
+    0x51, 
+    0x51, 
+    0xc7, 
+    0x28, 0x07, 
+    0x5d, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_0 = {{&mp_type_str}, 1253, 15, (const byte*)"\x49\x6e\x73\x74\x61\x6c\x6c\x69\x6e\x67\x20\x74\x6f\x3a\x20"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__install_1 = {{&mp_type_str}, 31671, 62, (const byte*)"\x45\x72\x72\x6f\x72\x20\x69\x6e\x73\x74\x61\x6c\x6c\x69\x6e\x67\x20\x27\x7b\x7d\x27\x3a\x20\x7b\x7d\x2c\x20\x70\x61\x63\x6b\x61\x67\x65\x73\x20\x6d\x61\x79\x20\x62\x65\x20\x70\x61\x72\x74\x69\x61\x6c\x6c\x79\x20\x69\x6e\x73\x74\x61\x6c\x6c\x65\x64"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__install[4] = {
+    MP_ROM_QSTR(MP_QSTR_to_install),
+    MP_ROM_QSTR(MP_QSTR_install_path),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__install_1),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__install = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip__lt_module_gt__install,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__install,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 299,
+    .n_obj = 2,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 16,
+        .n_exc_stack = 2,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_install,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__install + 7,
+        .opcodes = fun_data_upip__lt_module_gt__install + 39,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__get_install_path
+STATIC const byte fun_data_upip__lt_module_gt__get_install_path[47] = {
+    0x08, 0x16,
+    MP_QSTR_get_install_path & 0xff, MP_QSTR_get_install_path >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x00, 0x20, 0x48, 0x2b, 0x2b, 0x00,
+    0x12, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x51, 
+    0xde, 
+    0x44, 0x0b, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_path & 0xff, MP_QSTR_path >> 8, 
+    0x81, 
+    0x55, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x12, MP_QSTR_expandhome & 0xff, MP_QSTR_expandhome >> 8, 
+    0x12, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x34, 0x01, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x12, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x63, 
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__get_install_path = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__get_install_path,
+    .const_table = NULL,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 47,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_get_install_path,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__get_install_path + 6,
+        .opcodes = fun_data_upip__lt_module_gt__get_install_path + 13,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__cleanup
+STATIC const byte fun_data_upip__lt_module_gt__cleanup[64] = {
+    0x54, 0x14,
+    MP_QSTR_cleanup & 0xff, MP_QSTR_cleanup >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x09, 0x28, 0x23, 0x56, 0x00,
+    0x12, MP_QSTR_cleanup_files & 0xff, MP_QSTR_cleanup_files >> 8, 
+    0x5f, 
+    0x4b, 0x2b, 0x00, 
+    0xc0, 
+    0x48, 0x0d, 0x00, 
+    0x12, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x14, MP_QSTR_unlink & 0xff, MP_QSTR_unlink >> 8, 
+    0xb0, 
+    0x36, 0x01, 
+    0x59, 
+    0x4a, 0x17, 0x00, 
+    0x57, 
+    0x12, MP_QSTR_OSError & 0xff, MP_QSTR_OSError >> 8, 
+    0xdf, 
+    0x44, 0x0e, 0x80, 
+    0x59, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x00, 
+    0xb0, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0x4a, 0x01, 0x00, 
+    0x5d, 
+    0x42, 0xd2, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__cleanup_0 = {{&mp_type_str}, 17877, 23, (const byte*)"\x57\x61\x72\x6e\x69\x6e\x67\x3a\x20\x43\x61\x6e\x6e\x6f\x74\x20\x64\x65\x6c\x65\x74\x65\x20"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__cleanup[1] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__cleanup_0),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__cleanup = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__cleanup,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__cleanup,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 64,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 11,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_cleanup,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__cleanup + 6,
+        .opcodes = fun_data_upip__lt_module_gt__cleanup + 12,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__help
+STATIC const byte fun_data_upip__lt_module_gt__help[48] = {
+    0x18, 0x18,
+    MP_QSTR_help & 0xff, MP_QSTR_help >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x11, 0x23, 0x85, 0x09, 0x30, 0x23, 0x00,
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x00, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x01, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_path & 0xff, MP_QSTR_path >> 8, 
+    0x81, 
+    0x55, 
+    0x34, 0x02, 
+    0x59, 
+    0x12, MP_QSTR_print & 0xff, MP_QSTR_print >> 8, 
+    0x23, 0x02, 
+    0x34, 0x01, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__help_0 = {{&mp_type_str}, 14525, 341, (const byte*)"\x75\x70\x69\x70\x20\x2d\x20\x53\x69\x6d\x70\x6c\x65\x20\x50\x79\x50\x49\x20\x70\x61\x63\x6b\x61\x67\x65\x20\x6d\x61\x6e\x61\x67\x65\x72\x20\x66\x6f\x72\x20\x4d\x69\x63\x72\x6f\x50\x79\x74\x68\x6f\x6e\x0a\x55\x73\x61\x67\x65\x3a\x20\x6d\x69\x63\x72\x6f\x70\x79\x74\x68\x6f\x6e\x20\x2d\x6d\x20\x75\x70\x69\x70\x20\x69\x6e\x73\x74\x61\x6c\x6c\x20\x5b\x2d\x70\x20\x3c\x70\x61\x74\x68\x3e\x5d\x20\x3c\x70\x61\x63\x6b\x61\x67\x65\x3e\x2e\x2e\x2e\x20\x7c\x20\x2d\x72\x20\x3c\x72\x65\x71\x75\x69\x72\x65\x6d\x65\x6e\x74\x73\x2e\x74\x78\x74\x3e\x0a\x69\x6d\x70\x6f\x72\x74\x20\x75\x70\x69\x70\x3b\x20\x75\x70\x69\x70\x2e\x69\x6e\x73\x74\x61\x6c\x6c\x28\x70\x61\x63\x6b\x61\x67\x65\x5f\x6f\x72\x5f\x6c\x69\x73\x74\x2c\x20\x5b\x3c\x70\x61\x74\x68\x3e\x5d\x29\x0a\x0a\x49\x66\x20\x3c\x70\x61\x74\x68\x3e\x20\x69\x73\x20\x6e\x6f\x74\x20\x67\x69\x76\x65\x6e\x2c\x20\x70\x61\x63\x6b\x61\x67\x65\x73\x20\x77\x69\x6c\x6c\x20\x62\x65\x20\x69\x6e\x73\x74\x61\x6c\x6c\x65\x64\x20\x69\x6e\x74\x6f\x20\x73\x79\x73\x2e\x70\x61\x74\x68\x5b\x31\x5d\x0a\x28\x63\x61\x6e\x20\x62\x65\x20\x73\x65\x74\x20\x66\x72\x6f\x6d\x20\x4d\x49\x43\x52\x4f\x50\x59\x50\x41\x54\x48\x20\x65\x6e\x76\x69\x72\x6f\x6e\x6d\x65\x6e\x74\x20\x76\x61\x72\x69\x61\x62\x6c\x65\x2c\x20\x69\x66\x20\x63\x75\x72\x72\x65\x6e\x74\x20\x73\x79\x73\x74\x65\x6d\x0a\x73\x75\x70\x70\x6f\x72\x74\x73\x20\x74\x68\x61\x74\x29\x2e"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__help_1 = {{&mp_type_str}, 17177, 29, (const byte*)"\x43\x75\x72\x72\x65\x6e\x74\x20\x76\x61\x6c\x75\x65\x20\x6f\x66\x20\x73\x79\x73\x2e\x70\x61\x74\x68\x5b\x31\x5d\x3a"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__help_2 = {{&mp_type_str}, 34882, 146, (const byte*)"\x0a\x4e\x6f\x74\x65\x3a\x20\x6f\x6e\x6c\x79\x20\x4d\x69\x63\x72\x6f\x50\x79\x74\x68\x6f\x6e\x20\x70\x61\x63\x6b\x61\x67\x65\x73\x20\x28\x75\x73\x75\x61\x6c\x6c\x79\x2c\x20\x6e\x61\x6d\x65\x64\x20\x6d\x69\x63\x72\x6f\x70\x79\x74\x68\x6f\x6e\x2d\x2a\x29\x20\x61\x72\x65\x20\x73\x75\x70\x70\x6f\x72\x74\x65\x64\x0a\x66\x6f\x72\x20\x69\x6e\x73\x74\x61\x6c\x6c\x61\x74\x69\x6f\x6e\x2c\x20\x75\x70\x69\x70\x20\x64\x6f\x65\x73\x20\x6e\x6f\x74\x20\x73\x75\x70\x70\x6f\x72\x74\x20\x61\x72\x62\x69\x74\x72\x61\x72\x79\x20\x63\x6f\x64\x65\x20\x69\x6e\x20\x73\x65\x74\x75\x70\x2e\x70\x79\x2e\x0a"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__help[3] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__help_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__help_1),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__help_2),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__help = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__help,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__help,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 48,
+    .n_obj = 3,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_help,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__help + 6,
+        .opcodes = fun_data_upip__lt_module_gt__help + 14,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip__lt_module_gt__main
+STATIC const byte fun_data_upip__lt_module_gt__main[423] = {
+    0x5c, 0x68,
+    MP_QSTR_main & 0xff, MP_QSTR_main >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x90, 0x26, 0x20, 0x20, 0x20, 0x44, 0x1f, 0x2f, 0x26, 0x42, 0x2f, 0x48, 0x43, 0x22, 0x23, 0x29, 0x24, 0x30, 0x26, 0x22, 0x28, 0x2b, 0x27, 0x28, 0x29, 0x24, 0x2a, 0x20, 0x27, 0x24, 0x23, 0x2a, 0x23, 0x36, 0x28, 0x2d, 0x27, 0x28, 0x47, 0x1f, 0x4c, 0x32, 0x24, 0x26, 0x42, 0x47, 0x26, 0x00,
+    0x51, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x34, 0x01, 
+    0x82, 
+    0xd7, 
+    0x43, 0x1e, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x81, 
+    0x55, 
+    0x10, MP_QSTR__hyphen_h & 0xff, MP_QSTR__hyphen_h >> 8, 
+    0xd9, 
+    0x43, 0x0f, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x81, 
+    0x55, 
+    0x10, MP_QSTR__hyphen__hyphen_help & 0xff, MP_QSTR__hyphen__hyphen_help >> 8, 
+    0xd9, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x81, 
+    0x55, 
+    0x10, MP_QSTR_install & 0xff, MP_QSTR_install >> 8, 
+    0xdc, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x23, 0x00, 
+    0x34, 0x01, 
+    0x59, 
+    0x2b, 0x00, 
+    0xc0, 
+    0x82, 
+    0xc1, 
+    0x42, 0xc4, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0xc2, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_h & 0xff, MP_QSTR__hyphen_h >> 8, 
+    0xd9, 
+    0x43, 0x08, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen__hyphen_help & 0xff, MP_QSTR__hyphen__hyphen_help >> 8, 
+    0xd9, 
+    0x44, 0x08, 0x80, 
+    0x12, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_p & 0xff, MP_QSTR__hyphen_p >> 8, 
+    0xd9, 
+    0x44, 0x12, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0x42, 0x85, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_r & 0xff, MP_QSTR__hyphen_r >> 8, 
+    0xd9, 
+    0x44, 0x48, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0xc3, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb3, 
+    0x34, 0x01, 
+    0x47, 0x2d, 0x00, 
+    0xc4, 
+    0xb4, 
+    0x14, MP_QSTR_readline & 0xff, MP_QSTR_readline >> 8, 
+    0x36, 0x00, 
+    0xc5, 
+    0xb5, 
+    0x43, 0x03, 0x80, 
+    0x42, 0x1d, 0x80, 
+    0xb5, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR__hash_ & 0xff, MP_QSTR__hash_ >> 8, 
+    0xd9, 
+    0x44, 0x03, 0x80, 
+    0x42, 0x0d, 0x80, 
+    0xb0, 
+    0x14, MP_QSTR_append & 0xff, MP_QSTR_append >> 8, 
+    0xb5, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x36, 0x00, 
+    0x36, 0x01, 
+    0x59, 
+    0x42, 0xd5, 0x7f, 
+    0x51, 
+    0x5c, 
+    0x5d, 
+    0x42, 0x35, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen_i & 0xff, MP_QSTR__hyphen_i >> 8, 
+    0xd9, 
+    0x44, 0x14, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0x2b, 0x01, 
+    0x17, MP_QSTR_index_urls & 0xff, MP_QSTR_index_urls >> 8, 
+    0xb1, 
+    0x81, 
+    0xe5, 
+    0xc1, 
+    0x42, 0x19, 0x80, 
+    0xb2, 
+    0x10, MP_QSTR__hyphen__hyphen_debug & 0xff, MP_QSTR__hyphen__hyphen_debug >> 8, 
+    0xd9, 
+    0x44, 0x07, 0x80, 
+    0x52, 
+    0x17, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x42, 0x0a, 0x80, 
+    0x12, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x23, 0x01, 
+    0xb2, 
+    0xf2, 
+    0x34, 0x01, 
+    0x59, 
+    0xb1, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0x34, 0x01, 
+    0xd7, 
+    0x44, 0x11, 0x80, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x55, 
+    0x80, 
+    0x55, 
+    0x10, MP_QSTR__hyphen_ & 0xff, MP_QSTR__hyphen_ >> 8, 
+    0xd9, 
+    0x43, 0x1b, 0x7f, 
+    0xb0, 
+    0x14, MP_QSTR_extend & 0xff, MP_QSTR_extend >> 8, 
+    0x12, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x13, MP_QSTR_argv & 0xff, MP_QSTR_argv >> 8, 
+    0xb1, 
+    0x51, 
+    0x2e, 0x02, 
+    0x55, 
+    0x36, 0x01, 
+    0x59, 
+    0xb0, 
+    0x43, 0x08, 0x80, 
+    0x12, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_install & 0xff, MP_QSTR_install >> 8, 
+    0xb0, 
+    0x34, 0x01, 
+    0x59, 
+    0x12, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x43, 0x06, 0x80, 
+    0x12, MP_QSTR_cleanup & 0xff, MP_QSTR_cleanup >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__main_0 = {{&mp_type_str}, 50937, 32, (const byte*)"\x4f\x6e\x6c\x79\x20\x27\x69\x6e\x73\x74\x61\x6c\x6c\x27\x20\x63\x6f\x6d\x6d\x61\x6e\x64\x20\x73\x75\x70\x70\x6f\x72\x74\x65\x64"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__main_1 = {{&mp_type_str}, 40302, 28, (const byte*)"\x55\x6e\x6b\x6e\x6f\x77\x6e\x2f\x75\x6e\x73\x75\x70\x70\x6f\x72\x74\x65\x64\x20\x6f\x70\x74\x69\x6f\x6e\x3a\x20"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt__main[2] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__main_0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__main_1),
+};
+STATIC const mp_raw_code_t raw_code_upip__lt_module_gt__main = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt__main,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt__main,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 423,
+    .n_obj = 2,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 12,
+        .n_exc_stack = 1,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_main,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt__main + 6,
+        .opcodes = fun_data_upip__lt_module_gt__main + 54,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip.py, scope upip_<module>
+STATIC const byte fun_data_upip__lt_module_gt_[302] = {
+    0x18, 0x72,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_upip_dot_py & 0xff, MP_QSTR_upip_dot_py >> 8,
+    0x80, 0x07, 0x28, 0x28, 0x28, 0x28, 0x28, 0x28, 0x48, 0x69, 0x24, 0x29, 0x24, 0x25, 0x44, 0x6b, 0x6e, 0x20, 0x85, 0x0c, 0x65, 0x40, 0x8b, 0x14, 0x85, 0x0a, 0x85, 0x20, 0x85, 0x07, 0x28, 0x48, 0x64, 0x85, 0x32, 0x85, 0x0d, 0x89, 0x07, 0x85, 0x18, 0x89, 0x26, 0x85, 0x09, 0x85, 0x08, 0x85, 0x15, 0x85, 0x37, 0x2a, 0x00,
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x16, MP_QSTR_sys & 0xff, MP_QSTR_sys >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x16, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uos & 0xff, MP_QSTR_uos >> 8, 
+    0x16, MP_QSTR_os & 0xff, MP_QSTR_os >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uerrno & 0xff, MP_QSTR_uerrno >> 8, 
+    0x16, MP_QSTR_errno & 0xff, MP_QSTR_errno >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_ujson & 0xff, MP_QSTR_ujson >> 8, 
+    0x16, MP_QSTR_json & 0xff, MP_QSTR_json >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uzlib & 0xff, MP_QSTR_uzlib >> 8, 
+    0x16, MP_QSTR_uzlib & 0xff, MP_QSTR_uzlib >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_upip_utarfile & 0xff, MP_QSTR_upip_utarfile >> 8, 
+    0x16, MP_QSTR_tarfile & 0xff, MP_QSTR_tarfile >> 8, 
+    0x11, MP_QSTR_gc & 0xff, MP_QSTR_gc >> 8, 
+    0x14, MP_QSTR_collect & 0xff, MP_QSTR_collect >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0x50, 
+    0x17, MP_QSTR_debug & 0xff, MP_QSTR_debug >> 8, 
+    0x23, 0x00, 
+    0x23, 0x01, 
+    0x2b, 0x02, 
+    0x17, MP_QSTR_index_urls & 0xff, MP_QSTR_index_urls >> 8, 
+    0x51, 
+    0x17, MP_QSTR_install_path & 0xff, MP_QSTR_install_path >> 8, 
+    0x2b, 0x00, 
+    0x16, MP_QSTR_cleanup_files & 0xff, MP_QSTR_cleanup_files >> 8, 
+    0x9f, 
+    0x17, MP_QSTR_gzdict_sz & 0xff, MP_QSTR_gzdict_sz >> 8, 
+    0x11, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0x22, 0x84, 0x00, 
+    0x34, 0x01, 
+    0x17, MP_QSTR_file_buf & 0xff, MP_QSTR_file_buf >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x11, MP_QSTR_Exception & 0xff, MP_QSTR_Exception >> 8, 
+    0x34, 0x03, 
+    0x16, MP_QSTR_NotFoundError & 0xff, MP_QSTR_NotFoundError >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_op_split & 0xff, MP_QSTR_op_split >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_op_basename & 0xff, MP_QSTR_op_basename >> 8, 
+    0x22, 0x83, 0x7f, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x05, 
+    0x16, MP_QSTR__makedirs & 0xff, MP_QSTR__makedirs >> 8, 
+    0x32, 0x06, 
+    0x16, MP_QSTR_save_file & 0xff, MP_QSTR_save_file >> 8, 
+    0x32, 0x07, 
+    0x16, MP_QSTR_install_tar & 0xff, MP_QSTR_install_tar >> 8, 
+    0x32, 0x08, 
+    0x16, MP_QSTR_expandhome & 0xff, MP_QSTR_expandhome >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_ussl & 0xff, MP_QSTR_ussl >> 8, 
+    0x16, MP_QSTR_ussl & 0xff, MP_QSTR_ussl >> 8, 
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x16, MP_QSTR_usocket & 0xff, MP_QSTR_usocket >> 8, 
+    0x52, 
+    0x17, MP_QSTR_warn_ussl & 0xff, MP_QSTR_warn_ussl >> 8, 
+    0x32, 0x09, 
+    0x16, MP_QSTR_url_open & 0xff, MP_QSTR_url_open >> 8, 
+    0x32, 0x0a, 
+    0x16, MP_QSTR_get_pkg_metadata & 0xff, MP_QSTR_get_pkg_metadata >> 8, 
+    0x51, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0b, 
+    0x16, MP_QSTR_fatal & 0xff, MP_QSTR_fatal >> 8, 
+    0x32, 0x0c, 
+    0x16, MP_QSTR_install_pkg & 0xff, MP_QSTR_install_pkg >> 8, 
+    0x51, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x0d, 
+    0x16, MP_QSTR_install & 0xff, MP_QSTR_install >> 8, 
+    0x32, 0x0e, 
+    0x16, MP_QSTR_get_install_path & 0xff, MP_QSTR_get_install_path >> 8, 
+    0x32, 0x0f, 
+    0x16, MP_QSTR_cleanup & 0xff, MP_QSTR_cleanup >> 8, 
+    0x32, 0x10, 
+    0x16, MP_QSTR_help & 0xff, MP_QSTR_help >> 8, 
+    0x32, 0x11, 
+    0x16, MP_QSTR_main & 0xff, MP_QSTR_main >> 8, 
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x10, MP_QSTR___main__ & 0xff, MP_QSTR___main__ >> 8, 
+    0xd9, 
+    0x44, 0x06, 0x80, 
+    0x11, MP_QSTR_main & 0xff, MP_QSTR_main >> 8, 
+    0x34, 0x00, 
+    0x59, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__0 = {{&mp_type_str}, 58328, 26, (const byte*)"\x68\x74\x74\x70\x73\x3a\x2f\x2f\x6d\x69\x63\x72\x6f\x70\x79\x74\x68\x6f\x6e\x2e\x6f\x72\x67\x2f\x70\x69"};
+STATIC const mp_obj_str_t const_obj_upip__lt_module_gt__1 = {{&mp_type_str}, 3759, 21, (const byte*)"\x68\x74\x74\x70\x73\x3a\x2f\x2f\x70\x79\x70\x69\x2e\x6f\x72\x67\x2f\x70\x79\x70\x69"};
+STATIC const mp_rom_obj_t const_table_data_upip__lt_module_gt_[18] = {
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__0),
+    MP_ROM_PTR(&const_obj_upip__lt_module_gt__1),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__NotFoundError),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__op_split),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__op_basename),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt___makedirs),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__save_file),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__install_tar),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__expandhome),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__url_open),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__get_pkg_metadata),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__fatal),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__install_pkg),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__install),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__get_install_path),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__cleanup),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__help),
+    MP_ROM_PTR(&raw_code_upip__lt_module_gt__main),
+};
+const mp_raw_code_t raw_code_upip__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_upip__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 302,
+    .n_obj = 2,
+    .n_raw_code = 16,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_upip_dot_py,
+        .line_info = fun_data_upip__lt_module_gt_ + 6,
+        .opcodes = fun_data_upip__lt_module_gt_ + 59,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__roundup
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__roundup[18] = {
+    0x22, 0x0a,
+    MP_QSTR_roundup & 0xff, MP_QSTR_roundup >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0xb1, 
+    0xf2, 
+    0x81, 
+    0xf3, 
+    0xb1, 
+    0x81, 
+    0xf3, 
+    0xd2, 
+    0xef, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__roundup[2] = {
+    MP_ROM_QSTR(MP_QSTR_val),
+    MP_ROM_QSTR(MP_QSTR_align),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__roundup = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__roundup,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__roundup,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 18,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_roundup,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__roundup + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__roundup + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection___init__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection___init__[27] = {
+    0xa8, 0x04, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0xb0, 
+    0x18, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb3, 
+    0xb2, 
+    0xf3, 
+    0xb0, 
+    0x18, MP_QSTR_align & 0xff, MP_QSTR_align >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection___init__[4] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_f),
+    MP_ROM_QSTR(MP_QSTR_content_len),
+    MP_ROM_QSTR(MP_QSTR_aligned_len),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 4,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection___init__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 27,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 4,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection___init__ + 7,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection___init__ + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection_read
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection_read[65] = {
+    0xaa, 0x01, 0x0a,
+    MP_QSTR_read & 0xff, MP_QSTR_read >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0x80, 
+    0xd9, 
+    0x44, 0x03, 0x80, 
+    0x23, 0x02, 
+    0x63, 
+    0xb1, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xd8, 
+    0x44, 0x05, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xc1, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc2, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb2, 
+    0x34, 0x01, 
+    0xc1, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb1, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip_utarfile__lt_module_gt__FileSection_read_0 = {{&mp_type_bytes}, 5381, 0, (const byte*)""};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection_read[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_sz),
+    MP_ROM_PTR(&const_obj_upip_utarfile__lt_module_gt__FileSection_read_0),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection_read = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection_read,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection_read,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 65,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 1,
+        .qstr_block_name = MP_QSTR_read,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection_read + 7,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection_read + 8,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection_readinto
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection_readinto[71] = {
+    0x2a, 0x0a,
+    MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0x80, 
+    0xd9, 
+    0x44, 0x02, 0x80, 
+    0x80, 
+    0x63, 
+    0x12, MP_QSTR_len & 0xff, MP_QSTR_len >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xd8, 
+    0x44, 0x0f, 0x80, 
+    0x12, MP_QSTR_memoryview & 0xff, MP_QSTR_memoryview >> 8, 
+    0xb1, 
+    0x34, 0x01, 
+    0x51, 
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0x2e, 0x02, 
+    0x55, 
+    0xc1, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0xc2, 
+    0xb0, 
+    0x57, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb2, 
+    0xe6, 
+    0x5a, 
+    0x18, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb2, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection_readinto[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_buf),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection_readinto = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection_readinto,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection_readinto,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 71,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_readinto,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection_readinto + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection_readinto + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection_skip
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection_skip[61] = {
+    0x39, 0x0a,
+    MP_QSTR_skip & 0xff, MP_QSTR_skip >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_content_len & 0xff, MP_QSTR_content_len >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_align & 0xff, MP_QSTR_align >> 8, 
+    0xf2, 
+    0xc1, 
+    0xb1, 
+    0x44, 0x26, 0x80, 
+    0x12, MP_QSTR_bytearray & 0xff, MP_QSTR_bytearray >> 8, 
+    0x90, 
+    0x34, 0x01, 
+    0xc2, 
+    0x42, 0x18, 0x80, 
+    0x12, MP_QSTR_min & 0xff, MP_QSTR_min >> 8, 
+    0xb1, 
+    0x90, 
+    0x34, 0x02, 
+    0xc3, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0xb2, 
+    0xb3, 
+    0x36, 0x02, 
+    0x59, 
+    0xb1, 
+    0xb3, 
+    0xe6, 
+    0xc1, 
+    0xb1, 
+    0x43, 0xe4, 0x7f, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection_skip[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection_skip = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection_skip,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection_skip,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 61,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 8,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_skip,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection_skip + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection_skip + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__FileSection
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__FileSection[48] = {
+    0x08, 0x0a,
+    MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x22, 0x84, 0x80, 0x00, 
+    0x2a, 0x01, 
+    0x53, 
+    0x33, 0x01, 
+    0x16, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR_readinto & 0xff, MP_QSTR_readinto >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR_skip & 0xff, MP_QSTR_skip >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__FileSection[4] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection___init__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection_read),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection_readinto),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection_skip),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__FileSection = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__FileSection,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__FileSection,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 48,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_FileSection,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__FileSection + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__FileSection + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarInfo___str__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarInfo___str__[25] = {
+    0x21, 0x0a,
+    MP_QSTR___str__ & 0xff, MP_QSTR___str__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x23, 0x01, 
+    0xb0, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x2a, 0x03, 
+    0xf8, 
+    0x63, 
+};
+STATIC const mp_obj_str_t const_obj_upip_utarfile__lt_module_gt__TarInfo___str___0 = {{&mp_type_str}, 62189, 19, (const byte*)"\x54\x61\x72\x49\x6e\x66\x6f\x28\x25\x72\x2c\x20\x25\x73\x2c\x20\x25\x64\x29"};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarInfo___str__[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_PTR(&const_obj_upip_utarfile__lt_module_gt__TarInfo___str___0),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarInfo___str__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarInfo___str__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarInfo___str__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 25,
+    .n_obj = 1,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 5,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___str__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarInfo___str__ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarInfo___str__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarInfo
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarInfo[26] = {
+    0x00, 0x0a,
+    MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR___str__ & 0xff, MP_QSTR___str__ >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarInfo[1] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarInfo___str__),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarInfo = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarInfo,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarInfo,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 1,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 1,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_TarInfo,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarInfo + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarInfo + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile___init__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile___init__[41] = {
+    0xab, 0x80, 0x01, 0x0a,
+    MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb2, 
+    0x44, 0x08, 0x80, 
+    0xb2, 
+    0xb0, 
+    0x18, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x42, 0x0d, 0x80, 
+    0x12, MP_QSTR_open & 0xff, MP_QSTR_open >> 8, 
+    0xb1, 
+    0x10, MP_QSTR_rb & 0xff, MP_QSTR_rb >> 8, 
+    0x34, 0x02, 
+    0xb0, 
+    0x18, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x51, 
+    0xb0, 
+    0x18, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile___init__[3] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_name),
+    MP_ROM_QSTR(MP_QSTR_fileobj),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile___init__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 3,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile___init__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile___init__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 41,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 6,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 3,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 2,
+        .qstr_block_name = MP_QSTR___init__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile___init__ + 8,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile___init__ + 9,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile_next
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile_next[191] = {
+    0x49, 0x0a,
+    MP_QSTR_next & 0xff, MP_QSTR_next >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x13, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x44, 0x0a, 0x80, 
+    0xb0, 
+    0x13, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x14, MP_QSTR_skip & 0xff, MP_QSTR_skip >> 8, 
+    0x36, 0x00, 
+    0x59, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0x14, MP_QSTR_read & 0xff, MP_QSTR_read >> 8, 
+    0x22, 0x84, 0x00, 
+    0x36, 0x01, 
+    0xc1, 
+    0xb1, 
+    0x43, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x14, MP_QSTR_struct & 0xff, MP_QSTR_struct >> 8, 
+    0x12, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x14, MP_QSTR_addressof & 0xff, MP_QSTR_addressof >> 8, 
+    0xb1, 
+    0x36, 0x01, 
+    0x12, MP_QSTR_TAR_HEADER & 0xff, MP_QSTR_TAR_HEADER >> 8, 
+    0x12, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_LITTLE_ENDIAN & 0xff, MP_QSTR_LITTLE_ENDIAN >> 8, 
+    0x36, 0x03, 
+    0xc2, 
+    0xb2, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x80, 
+    0x55, 
+    0x80, 
+    0xd9, 
+    0x44, 0x02, 0x80, 
+    0x51, 
+    0x63, 
+    0x12, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x34, 0x00, 
+    0xc3, 
+    0x12, MP_QSTR_str & 0xff, MP_QSTR_str >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x10, MP_QSTR_utf_hyphen_8 & 0xff, MP_QSTR_utf_hyphen_8 >> 8, 
+    0x34, 0x02, 
+    0x14, MP_QSTR_rstrip & 0xff, MP_QSTR_rstrip >> 8, 
+    0x10, MP_QSTR__0x00_ & 0xff, MP_QSTR__0x00_ >> 8, 
+    0x36, 0x01, 
+    0xb3, 
+    0x18, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x12, MP_QSTR_int & 0xff, MP_QSTR_int >> 8, 
+    0x12, MP_QSTR_bytes & 0xff, MP_QSTR_bytes >> 8, 
+    0xb2, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x34, 0x01, 
+    0x88, 
+    0x34, 0x02, 
+    0xb3, 
+    0x18, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x12, MP_QSTR_REGTYPE & 0xff, MP_QSTR_REGTYPE >> 8, 
+    0x12, MP_QSTR_DIRTYPE & 0xff, MP_QSTR_DIRTYPE >> 8, 
+    0x2b, 0x02, 
+    0xb3, 
+    0x13, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x7f, 
+    0x55, 
+    0x10, MP_QSTR__slash_ & 0xff, MP_QSTR__slash_ >> 8, 
+    0xd9, 
+    0x55, 
+    0xb3, 
+    0x18, MP_QSTR_type & 0xff, MP_QSTR_type >> 8, 
+    0x12, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0xb0, 
+    0x13, MP_QSTR_f & 0xff, MP_QSTR_f >> 8, 
+    0xb3, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x12, MP_QSTR_roundup & 0xff, MP_QSTR_roundup >> 8, 
+    0xb3, 
+    0x13, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x22, 0x84, 0x00, 
+    0x34, 0x02, 
+    0x34, 0x03, 
+    0x57, 
+    0xb0, 
+    0x18, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0xb3, 
+    0x18, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0xb3, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile_next[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile_next = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile_next,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile_next,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 191,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 10,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_next,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile_next + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile_next + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile___iter__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile___iter__[9] = {
+    0x09, 0x0a,
+    MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile___iter__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile___iter__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile___iter__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile___iter__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 9,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___iter__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile___iter__ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile___iter__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile___next__
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile___next__[26] = {
+    0x19, 0x0a,
+    MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb0, 
+    0x14, MP_QSTR_next & 0xff, MP_QSTR_next >> 8, 
+    0x36, 0x00, 
+    0xc1, 
+    0xb1, 
+    0x51, 
+    0xde, 
+    0x44, 0x04, 0x80, 
+    0x12, MP_QSTR_StopIteration & 0xff, MP_QSTR_StopIteration >> 8, 
+    0x65, 
+    0xb1, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile___next__[1] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile___next__ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 1,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile___next__,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile___next__,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 26,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 1,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR___next__,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile___next__ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile___next__ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile_extractfile
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile[12] = {
+    0x12, 0x0a,
+    MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0xb1, 
+    0x13, MP_QSTR_subf & 0xff, MP_QSTR_subf >> 8, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile_extractfile[2] = {
+    MP_ROM_QSTR(MP_QSTR_self),
+    MP_ROM_QSTR(MP_QSTR_tarinfo),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile_extractfile = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 2,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile_extractfile,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 12,
+    .n_obj = 0,
+    .n_raw_code = 0,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 3,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 2,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_extractfile,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile_extractfile + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile__lt_module_gt__TarFile
+STATIC const byte fun_data_upip_utarfile__lt_module_gt__TarFile[51] = {
+    0x08, 0x0a,
+    MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x11, MP_QSTR___name__ & 0xff, MP_QSTR___name__ >> 8, 
+    0x16, MP_QSTR___module__ & 0xff, MP_QSTR___module__ >> 8, 
+    0x10, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x16, MP_QSTR___qualname__ & 0xff, MP_QSTR___qualname__ >> 8, 
+    0x51, 
+    0x51, 
+    0x2a, 0x02, 
+    0x53, 
+    0x33, 0x00, 
+    0x16, MP_QSTR___init__ & 0xff, MP_QSTR___init__ >> 8, 
+    0x32, 0x01, 
+    0x16, MP_QSTR_next & 0xff, MP_QSTR_next >> 8, 
+    0x32, 0x02, 
+    0x16, MP_QSTR___iter__ & 0xff, MP_QSTR___iter__ >> 8, 
+    0x32, 0x03, 
+    0x16, MP_QSTR___next__ & 0xff, MP_QSTR___next__ >> 8, 
+    0x32, 0x04, 
+    0x16, MP_QSTR_extractfile & 0xff, MP_QSTR_extractfile >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt__TarFile[5] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile___init__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile_next),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile___iter__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile___next__),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile_extractfile),
+};
+STATIC const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt__TarFile = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt__TarFile,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt__TarFile,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 51,
+    .n_obj = 0,
+    .n_raw_code = 5,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 2,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR_TarFile,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt__TarFile + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt__TarFile + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+// frozen bytecode for file upip_utarfile.py, scope upip_utarfile_<module>
+STATIC const byte fun_data_upip_utarfile__lt_module_gt_[120] = {
+    0x18, 0x0a,
+    MP_QSTR__lt_module_gt_ & 0xff, MP_QSTR__lt_module_gt_ >> 8,
+    MP_QSTR_upip_utarfile_dot_py & 0xff, MP_QSTR_upip_utarfile_dot_py >> 8,
+    0x00,
+    0x80, 
+    0x51, 
+    0x1b, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x16, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x2c, 0x02, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_ARRAY & 0xff, MP_QSTR_ARRAY >> 8, 
+    0x80, 
+    0xed, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_UINT8 & 0xff, MP_QSTR_UINT8 >> 8, 
+    0x22, 0x80, 0x64, 
+    0xed, 
+    0x2a, 0x02, 
+    0x10, MP_QSTR_name & 0xff, MP_QSTR_name >> 8, 
+    0x62, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_ARRAY & 0xff, MP_QSTR_ARRAY >> 8, 
+    0x22, 0x80, 0x7c, 
+    0xed, 
+    0x11, MP_QSTR_uctypes & 0xff, MP_QSTR_uctypes >> 8, 
+    0x13, MP_QSTR_UINT8 & 0xff, MP_QSTR_UINT8 >> 8, 
+    0x8b, 
+    0xed, 
+    0x2a, 0x02, 
+    0x10, MP_QSTR_size & 0xff, MP_QSTR_size >> 8, 
+    0x62, 
+    0x16, MP_QSTR_TAR_HEADER & 0xff, MP_QSTR_TAR_HEADER >> 8, 
+    0x10, MP_QSTR_dir & 0xff, MP_QSTR_dir >> 8, 
+    0x16, MP_QSTR_DIRTYPE & 0xff, MP_QSTR_DIRTYPE >> 8, 
+    0x10, MP_QSTR_file & 0xff, MP_QSTR_file >> 8, 
+    0x16, MP_QSTR_REGTYPE & 0xff, MP_QSTR_REGTYPE >> 8, 
+    0x32, 0x00, 
+    0x16, MP_QSTR_roundup & 0xff, MP_QSTR_roundup >> 8, 
+    0x54, 
+    0x32, 0x01, 
+    0x10, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_FileSection & 0xff, MP_QSTR_FileSection >> 8, 
+    0x54, 
+    0x32, 0x02, 
+    0x10, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_TarInfo & 0xff, MP_QSTR_TarInfo >> 8, 
+    0x54, 
+    0x32, 0x03, 
+    0x10, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x34, 0x02, 
+    0x16, MP_QSTR_TarFile & 0xff, MP_QSTR_TarFile >> 8, 
+    0x51, 
+    0x63, 
+};
+STATIC const mp_rom_obj_t const_table_data_upip_utarfile__lt_module_gt_[4] = {
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__roundup),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__FileSection),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarInfo),
+    MP_ROM_PTR(&raw_code_upip_utarfile__lt_module_gt__TarFile),
+};
+const mp_raw_code_t raw_code_upip_utarfile__lt_module_gt_ = {
+    .kind = MP_CODE_BYTECODE,
+    .scope_flags = 0x00,
+    .n_pos_args = 0,
+    .fun_data = fun_data_upip_utarfile__lt_module_gt_,
+    .const_table = (mp_uint_t*)const_table_data_upip_utarfile__lt_module_gt_,
+    #if MICROPY_PERSISTENT_CODE_SAVE
+    .fun_data_len = 120,
+    .n_obj = 0,
+    .n_raw_code = 4,
+    #if MICROPY_PY_SYS_SETTRACE
+    .prelude = {
+        .n_state = 4,
+        .n_exc_stack = 0,
+        .scope_flags = 0,
+        .n_pos_args = 0,
+        .n_kwonly_args = 0,
+        .n_def_pos_args = 0,
+        .qstr_block_name = MP_QSTR__lt_module_gt_,
+        .qstr_source_file = MP_QSTR_upip_utarfile_dot_py,
+        .line_info = fun_data_upip_utarfile__lt_module_gt_ + 6,
+        .opcodes = fun_data_upip_utarfile__lt_module_gt_ + 7,
+    },
+    .line_of_definition = 0,
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .prelude_offset = 0,
+    .n_qstr = 0,
+    .qstr_link = NULL,
+    #endif
+    #endif
+    #if MICROPY_EMIT_MACHINE_CODE
+    .type_sig = 0,
+    #endif
+};
+
+const char mp_frozen_mpy_names[] = {
+"upip.py\0"
+"upip_utarfile.py\0"
+"\0"};
+const mp_raw_code_t *const mp_frozen_mpy_content[] = {
+    &raw_code_upip__lt_module_gt_,
+    &raw_code_upip_utarfile__lt_module_gt_,
+};
+#ifdef MICROPY_FROZEN_LIST_ITEM
+MICROPY_FROZEN_LIST_ITEM("upip", "upip.py")
+MICROPY_FROZEN_LIST_ITEM("upip_utarfile", "upip_utarfile.py")
+#endif
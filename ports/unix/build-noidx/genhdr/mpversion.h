@@ -0,0 +1,4 @@
+// This file was generated by py/makeversionhdr.py
+#define MICROPY_GIT_TAG "5a7a91b-dirty"
+#define MICROPY_GIT_HASH "5a7a91b-dirty"
+#define MICROPY_BUILD_DATE "2026-10-18"